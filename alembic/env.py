@@ -17,7 +17,11 @@ from infra.entities.ticket import Ticket
 from infra.entities.form import Form
 from infra.entities.chat import Chat
 from infra.entities.message import Message
+from infra.entities.chat_read_pointer import ChatReadPointer
+from infra.entities.notification import Notification
+from infra.entities.outbox import OutboxMessage
 from infra.entities.associations import *  # Todas as tabelas de associação
+from infra.entities.archive import archive_metadata  # Tabelas archive_* (Core)
 
 # Configuração do Alembic
 config = context.config
@@ -32,7 +36,7 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # Metadados para autogenerate
-target_metadata = Base.metadata
+target_metadata = [Base.metadata, archive_metadata]
 
 
 def run_migrations_offline() -> None:
@@ -0,0 +1,29 @@
+"""indices caixa de entrada
+
+Revision ID: 3d9e61c0b7a4
+Revises: 8252d6b65f3b
+Create Date: 2026-10-19 15:05:12.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9e61c0b7a4'
+down_revision: Union[str, None] = '8252d6b65f3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_ticket_attendants_user', 'ticket_attendants', ['user_id', 'ticket_id'])
+    op.create_index('ix_ticket_teams_team', 'ticket_teams', ['team_id', 'ticket_id'])
+    op.create_index('ix_user_ticket_follows_user', 'user_ticket_follows', ['user_id', 'ticket_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_ticket_follows_user', table_name='user_ticket_follows')
+    op.drop_index('ix_ticket_teams_team', table_name='ticket_teams')
+    op.drop_index('ix_ticket_attendants_user', table_name='ticket_attendants')
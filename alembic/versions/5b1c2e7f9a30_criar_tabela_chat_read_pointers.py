@@ -0,0 +1,48 @@
+"""criar tabela chat_read_pointers
+
+Revision ID: 5b1c2e7f9a30
+Revises: 3d9e61c0b7a4
+Create Date: 2026-10-19 15:48:27.613094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1c2e7f9a30'
+down_revision: Union[str, None] = '3d9e61c0b7a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('chat_read_pointers',
+    sa.Column('pointer_chat_id', sa.Integer(), nullable=False),
+    sa.Column('pointer_user_id', sa.Integer(), nullable=False),
+    sa.Column('pointer_last_read_message_id', sa.Integer(), nullable=True),
+    sa.Column('pointer_last_read_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('pointer_unread_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('updated_by', sa.Integer(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.Integer(), nullable=True),
+    sa.Column('active', sa.Enum('ATIVO', 'INATIVO', name='status'), nullable=False),
+    sa.ForeignKeyConstraint(['pointer_chat_id'], ['chats.id'], ondelete='RESTRICT'),
+    sa.ForeignKeyConstraint(['pointer_user_id'], ['users.id'], ondelete='RESTRICT'),
+    sa.ForeignKeyConstraint(['pointer_last_read_message_id'], ['messages.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ux_chat_read_pointers_user_chat', 'chat_read_pointers', ['pointer_user_id', 'pointer_chat_id'], unique=True)
+    op.create_index('ix_chat_read_pointers_chat', 'chat_read_pointers', ['pointer_chat_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_read_pointers_chat', table_name='chat_read_pointers')
+    op.drop_index('ux_chat_read_pointers_user_chat', table_name='chat_read_pointers')
+    op.drop_table('chat_read_pointers')
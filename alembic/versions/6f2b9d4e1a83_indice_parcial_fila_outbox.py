@@ -0,0 +1,41 @@
+"""índice parcial da fila do outbox em ordem de id
+
+Revision ID: 6f2b9d4e1a83
+Revises: a9c4e2f7b318
+Create Date: 2026-10-21 10:04:17.209384
+
+ix_outbox_status_next (outbox_status, outbox_next_attempt_at) não atende
+o ORDER BY id do claim_due: depois da igualdade no status as linhas
+saem ordenadas pela próxima tentativa, e com a tabela cheia de ENVIADO
+o planner do SQLite prefere varrer outbox_messages pela PK.
+
+ix_outbox_status (outbox_status) WHERE active = 'ATIVO' devolve os
+PENDENTE já em ordem de id (rowid no fim da chave); o filtro de
+outbox_next_attempt_at é aplicado nas poucas linhas pendentes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f2b9d4e1a83'
+down_revision: Union[str, None] = 'a9c4e2f7b318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ACTIVE_WHERE = sa.text("active = 'ATIVO'")
+
+
+def upgrade() -> None:
+    op.drop_index('ix_outbox_status_next', table_name='outbox_messages')
+    op.create_index('ix_outbox_status', 'outbox_messages', ['outbox_status'], unique=False,
+                    sqlite_where=ACTIVE_WHERE, postgresql_where=ACTIVE_WHERE)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_status', table_name='outbox_messages')
+    op.create_index('ix_outbox_status_next', 'outbox_messages', ['outbox_status', 'outbox_next_attempt_at'],
+                    unique=False)
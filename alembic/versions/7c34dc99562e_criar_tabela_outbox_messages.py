@@ -0,0 +1,48 @@
+"""criar tabela outbox_messages
+
+Revision ID: 7c34dc99562e
+Revises: a55bb04bb8ff
+Create Date: 2026-10-19 10:03:27.551904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c34dc99562e'
+down_revision: Union[str, None] = 'a55bb04bb8ff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox_messages',
+    sa.Column('outbox_recipient', sa.String(), nullable=False),
+    sa.Column('outbox_subject', sa.String(), nullable=False),
+    sa.Column('outbox_body', sa.String(), nullable=False),
+    sa.Column('outbox_ticket_id', sa.Integer(), nullable=True),
+    sa.Column('outbox_status', sa.Enum('PENDENTE', 'ENVIANDO', 'ENVIADO', 'FALHOU', name='outboxstatus'), nullable=False),
+    sa.Column('outbox_attempts', sa.Integer(), nullable=False),
+    sa.Column('outbox_next_attempt_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('outbox_sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('outbox_last_error', sa.String(), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('updated_by', sa.Integer(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.Integer(), nullable=True),
+    sa.Column('active', sa.Enum('ATIVO', 'INATIVO', name='status'), nullable=False),
+    sa.ForeignKeyConstraint(['outbox_ticket_id'], ['tickets.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_outbox_status_next', 'outbox_messages', ['outbox_status', 'outbox_next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_status_next', table_name='outbox_messages')
+    op.drop_table('outbox_messages')
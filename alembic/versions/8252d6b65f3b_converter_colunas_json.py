@@ -0,0 +1,130 @@
+"""converter colunas JSON para tipo nativo (JSON1/JSONB)
+
+Revision ID: 8252d6b65f3b
+Revises: 86eb851d7fef
+Create Date: 2026-10-19 14:02:41.118204
+
+Colunas convertidas de String para JSON (SQLite) / JSONB (PostgreSQL):
+    tickets.ticket_attachments, tickets.ticket_form_data,
+    messages.message_attachments, users.user_notification_preferences,
+    projects.project_milestones, projects.project_tasks, forms.form_fields
+
+Índices:
+    - users: expressão sobre as chaves 'email' e 'in_app' das preferências
+      (filtradas pelo pipeline de notificações)
+    - PostgreSQL: GIN (jsonb_path_ops) nos arrays de anexos/marcos/tarefas,
+      usado pelo operador @> (BaseRepository.select_by_json_item)
+
+No SQLite, valores que não são JSON válido viram NULL ('[]' em
+form_fields, que é NOT NULL) antes da conversão. No PostgreSQL a
+conversão usa col::jsonb e falha se houver texto inválido.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8252d6b65f3b'
+down_revision: Union[str, None] = '86eb851d7fef'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tabela -> [(coluna, nullable)]
+JSON_COLUMNS = {
+    'tickets': [('ticket_attachments', True), ('ticket_form_data', True)],
+    'messages': [('message_attachments', True)],
+    'users': [('user_notification_preferences', True)],
+    'projects': [('project_milestones', True), ('project_tasks', True)],
+    'forms': [('form_fields', False)],
+}
+
+# Índices GIN (só PostgreSQL): nome -> (tabela, coluna)
+GIN_INDEXES = {
+    'ix_tickets_attachments_gin': ('tickets', 'ticket_attachments'),
+    'ix_messages_attachments_gin': ('messages', 'message_attachments'),
+    'ix_projects_milestones_gin': ('projects', 'project_milestones'),
+    'ix_projects_tasks_gin': ('projects', 'project_tasks'),
+}
+
+# Índices de expressão sobre chaves das preferências: nome -> chave
+PREFERENCE_INDEXES = {
+    'ix_users_pref_email': 'email',
+    'ix_users_pref_in_app': 'in_app',
+}
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        for table, columns in JSON_COLUMNS.items():
+            for column, nullable in columns:
+                op.alter_column(
+                    table, column,
+                    existing_type=sa.String(),
+                    type_=postgresql.JSONB(),
+                    existing_nullable=nullable,
+                    postgresql_using=f'{column}::jsonb'
+                )
+        for name, (table, column) in GIN_INDEXES.items():
+            op.create_index(
+                name, table, [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'jsonb_path_ops'}
+            )
+        for name, key in PREFERENCE_INDEXES.items():
+            op.create_index(name, 'users', [sa.text(f"(user_notification_preferences ->> '{key}')")])
+        return
+
+    for table, columns in JSON_COLUMNS.items():
+        for column, nullable in columns:
+            fallback = 'NULL' if nullable else "'[]'"
+            op.execute(
+                f"UPDATE {table} SET {column} = {fallback} "
+                f"WHERE {column} IS NOT NULL AND json_valid({column}) = 0"
+            )
+        with op.batch_alter_table(table) as batch_op:
+            for column, nullable in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.String(),
+                    type_=sa.JSON(),
+                    existing_nullable=nullable
+                )
+    for name, key in PREFERENCE_INDEXES.items():
+        op.create_index(name, 'users', [sa.text(f"json_extract(user_notification_preferences, '$.{key}')")])
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    for name in PREFERENCE_INDEXES:
+        op.drop_index(name, table_name='users')
+
+    if dialect == 'postgresql':
+        for name, (table, _column) in GIN_INDEXES.items():
+            op.drop_index(name, table_name=table)
+        for table, columns in JSON_COLUMNS.items():
+            for column, nullable in columns:
+                op.alter_column(
+                    table, column,
+                    existing_type=postgresql.JSONB(),
+                    type_=sa.String(),
+                    existing_nullable=nullable,
+                    postgresql_using=f'{column}::text'
+                )
+        return
+
+    for table, columns in JSON_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, nullable in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.JSON(),
+                    type_=sa.String(),
+                    existing_nullable=nullable
+                )
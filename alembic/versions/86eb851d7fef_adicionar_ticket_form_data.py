@@ -0,0 +1,27 @@
+"""adicionar ticket_form_data
+
+Revision ID: 86eb851d7fef
+Revises: 7c34dc99562e
+Create Date: 2026-10-19 11:20:05.417830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '86eb851d7fef'
+down_revision: Union[str, None] = '7c34dc99562e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tickets', sa.Column('ticket_form_data', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.drop_column('ticket_form_data')
@@ -0,0 +1,111 @@
+"""indices parciais sobre registros ativos
+
+Revision ID: 9e4a7c21d5b8
+Revises: 5b1c2e7f9a30
+Create Date: 2026-10-19 16:31:09.402517
+
+Índices de tickets criados com WHERE active = 'ATIVO' (registros
+soft-deleted ficam fora do índice). Estavam declarados na entidade mas
+nenhuma migração os criava; bancos criados por create_all() já têm a
+versão completa, descartada aqui (DROP INDEX IF EXISTS).
+
+Unicidade passa a valer só entre registros ativos (índice único parcial
+no lugar da UNIQUE da coluna): users.user_email, teams.team_name,
+projects.project_name, reports.report_name.
+
+No SQLite as UNIQUE são constraints sem nome da tabela: a remoção recria
+a tabela (batch) e os índices de expressão de users, que a reflexão do
+batch não copia, são recriados em seguida.
+
+O downgrade volta às UNIQUE da coluna e falha se houver duplicados entre
+registros ativos e soft-deleted.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4a7c21d5b8'
+down_revision: Union[str, None] = '5b1c2e7f9a30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ACTIVE_WHERE = sa.text("active = 'ATIVO'")
+
+# nome -> colunas (tabela tickets)
+TICKET_INDEXES = {
+    'ix_tickets_client_status': ['ticket_client_id', 'ticket_status'],
+    'ix_tickets_project': ['ticket_project_id'],
+    'ix_tickets_report': ['ticket_report_id'],
+    'ix_tickets_status_priority': ['ticket_status', 'ticket_priority'],
+}
+
+# nome do índice único parcial -> (tabela, coluna)
+UNIQUE_INDEXES = {
+    'ux_users_email': ('users', 'user_email'),
+    'ux_teams_name': ('teams', 'team_name'),
+    'ux_projects_name': ('projects', 'project_name'),
+    'ux_reports_name': ('reports', 'report_name'),
+}
+
+# Índices de expressão de users (migração 8252d6b65f3b): nome -> chave
+PREFERENCE_INDEXES = {
+    'ix_users_pref_email': 'email',
+    'ix_users_pref_in_app': 'in_app',
+}
+
+# Nomes dados às UNIQUE sem nome do SQLite durante o batch
+SQLITE_NAMING = {'uq': 'uq_%(table_name)s_%(column_0_name)s'}
+
+
+def _create_partial(name: str, table: str, columns: list, unique: bool = False) -> None:
+    op.create_index(
+        name, table, columns, unique=unique,
+        sqlite_where=ACTIVE_WHERE, postgresql_where=ACTIVE_WHERE
+    )
+
+
+def _recreate_preference_indexes() -> None:
+    for name, key in PREFERENCE_INDEXES.items():
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+        op.create_index(name, 'users', [sa.text(f"json_extract(user_notification_preferences, '$.{key}')")])
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    for name, columns in TICKET_INDEXES.items():
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+        _create_partial(name, 'tickets', columns)
+
+    for name, (table, column) in UNIQUE_INDEXES.items():
+        if dialect == 'postgresql':
+            op.drop_constraint(f'{table}_{column}_key', table, type_='unique')
+        else:
+            with op.batch_alter_table(table, naming_convention=SQLITE_NAMING) as batch_op:
+                batch_op.drop_constraint(f'uq_{table}_{column}', type_='unique')
+        _create_partial(name, table, [column], unique=True)
+
+    if dialect == 'sqlite':
+        _recreate_preference_indexes()
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    for name, (table, column) in UNIQUE_INDEXES.items():
+        op.drop_index(name, table_name=table)
+        if dialect == 'postgresql':
+            op.create_unique_constraint(f'{table}_{column}_key', table, [column])
+        else:
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.create_unique_constraint(f'uq_{table}_{column}', [column])
+
+    if dialect == 'sqlite':
+        _recreate_preference_indexes()
+
+    for name in TICKET_INDEXES:
+        op.drop_index(name, table_name='tickets')
@@ -0,0 +1,49 @@
+"""criar tabela notifications
+
+Revision ID: a55bb04bb8ff
+Revises: 0f7149050150
+Create Date: 2026-10-19 09:12:41.208311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a55bb04bb8ff'
+down_revision: Union[str, None] = '0f7149050150'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notifications',
+    sa.Column('notification_user_id', sa.Integer(), nullable=False),
+    sa.Column('notification_type', sa.Enum('STATUS_CHANGE', 'NEW_MESSAGE', 'APPROVAL', 'DIGEST', name='notificationtipo'), nullable=False),
+    sa.Column('notification_entity_type', sa.Enum('TICKET', 'PROJECT', 'REPORT', name='notificationentidade'), nullable=False),
+    sa.Column('notification_entity_id', sa.Integer(), nullable=False),
+    sa.Column('notification_title', sa.String(), nullable=False),
+    sa.Column('notification_content', sa.String(), nullable=True),
+    sa.Column('notification_event_count', sa.Integer(), nullable=False),
+    sa.Column('notification_read_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('updated_by', sa.Integer(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('deleted_by', sa.Integer(), nullable=True),
+    sa.Column('active', sa.Enum('ATIVO', 'INATIVO', name='status'), nullable=False),
+    sa.ForeignKeyConstraint(['notification_user_id'], ['users.id'], ondelete='RESTRICT'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_notifications_user_read', 'notifications', ['notification_user_id', 'notification_read_at'], unique=False)
+    op.create_index('ix_notifications_entity', 'notifications', ['notification_entity_type', 'notification_entity_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_entity', table_name='notifications')
+    op.drop_index('ix_notifications_user_read', table_name='notifications')
+    op.drop_table('notifications')
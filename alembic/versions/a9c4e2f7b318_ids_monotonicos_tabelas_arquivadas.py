@@ -0,0 +1,81 @@
+"""ids monotônicos (AUTOINCREMENT) nas tabelas com arquivo
+
+Revision ID: a9c4e2f7b318
+Revises: d4c7b1e9a352
+Create Date: 2026-10-20 09:12:40.551093
+
+As linhas de tickets, chats, messages, chat_read_pointers e das
+associações do ticket vão para archive_* com o MESMO id como PK. Sem
+AUTOINCREMENT o SQLite reusa o maior id depois que a linha sai da tabela
+quente: o ticket novo ganha o id do arquivado, select_by_id mistura os
+dois e o arquivamento do novo falha com UNIQUE em archive_*.
+
+SQLite: cada tabela é recriada (batch) com AUTOINCREMENT. Os índices
+são recriados a partir do SQL original em sqlite_master (parciais e de
+expressão, que a reflexão do batch não copia fielmente) e sqlite_sequence
+começa no maior id entre a tabela quente e a de arquivo.
+
+PostgreSQL: nada a fazer (sequences nunca voltam atrás).
+
+Ids que já colidiram antes desta migração (linha quente com o id de uma
+arquivada) continuam colidindo e precisam ser resolvidos à mão.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e2f7b318'
+down_revision: Union[str, None] = 'd4c7b1e9a352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = (
+    'tickets', 'chats', 'messages', 'chat_read_pointers',
+    'ticket_attendants', 'ticket_teams', 'user_ticket_follows',
+)
+
+
+def _recreate(table: str, autoincrement: bool) -> None:
+    """Recria a tabela com/sem AUTOINCREMENT preservando os índices como estavam."""
+    bind = op.get_bind()
+    indexes = bind.execute(
+        sa.text("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :table AND sql IS NOT NULL"),
+        {"table": table}
+    ).all()
+
+    table_kwargs = {"sqlite_autoincrement": True} if autoincrement else {}
+    with op.batch_alter_table(table, recreate="always", table_kwargs=table_kwargs):
+        pass
+
+    for name, sql in indexes:
+        op.execute(f'DROP INDEX IF EXISTS "{name}"')
+        op.execute(sql)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    bind = op.get_bind()
+    for table in TABLES:
+        _recreate(table, autoincrement=True)
+        last_id = bind.execute(sa.text(
+            f"SELECT max(coalesce((SELECT max(id) FROM {table}), 0),"
+            f" coalesce((SELECT max(id) FROM archive_{table}), 0))"
+        )).scalar()
+        bind.execute(sa.text("DELETE FROM sqlite_sequence WHERE name = :table"), {"table": table})
+        bind.execute(sa.text("INSERT INTO sqlite_sequence (name, seq) VALUES (:table, :seq)"),
+                     {"table": table, "seq": last_id})
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for table in TABLES:
+        _recreate(table, autoincrement=False)
+        op.get_bind().execute(sa.text("DELETE FROM sqlite_sequence WHERE name = :table"), {"table": table})
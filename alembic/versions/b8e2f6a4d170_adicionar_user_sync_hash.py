@@ -0,0 +1,30 @@
+"""adicionar user_sync_hash (sincronização incremental do RH)
+
+Revision ID: b8e2f6a4d170
+Revises: f3a1c8d5b926
+Create Date: 2026-10-19 20:41:12.264018
+
+Hash do registro do RH aplicado por último em cada usuário
+(infra/jobs/hr_sync.py). Usuários existentes ficam com NULL: são
+usuários locais até a primeira sincronização que os traga no arquivo.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f6a4d170'
+down_revision: Union[str, None] = 'f3a1c8d5b926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('user_sync_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('user_sync_hash')
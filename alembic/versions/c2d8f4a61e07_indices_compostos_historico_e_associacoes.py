@@ -0,0 +1,82 @@
+"""indices compostos de historico do chat e associacoes
+
+Revision ID: c2d8f4a61e07
+Revises: 9e4a7c21d5b8
+Create Date: 2026-10-19 17:12:44.630218
+
+Caminhos de acesso verificados pelo harness (python -m tests.query_plans):
+    - messages (message_chat_id, created_at): histórico do chat já ordenado
+    - associações pelos DOIS lados: (pai, user_id) para "pessoas do ticket/
+      projeto/relatório" e (user_id, pai) para "meus tickets/projetos"
+
+Também cria os índices que as entidades declaravam e nenhuma migração
+criava (users, projects, reports, forms, messages). Ficam de fora:
+    - ix_chats_ticket: a UNIQUE de chats.chat_ticket_id já é indexada
+    - ix_users_status_active, ix_teams_area_status: as colunas user_status
+      e team_status ainda não existem nas tabelas migradas
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d8f4a61e07'
+down_revision: Union[str, None] = '9e4a7c21d5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# nome -> (tabela, colunas)
+INDEXES = {
+    # Histórico do chat
+    'ix_messages_chat_created': ('messages', ['message_chat_id', 'created_at']),
+    'ix_messages_user': ('messages', ['message_user_id']),
+
+    # Associações Ticket
+    'ix_ticket_attendants_ticket': ('ticket_attendants', ['ticket_id', 'user_id']),
+    'ix_ticket_teams_ticket': ('ticket_teams', ['ticket_id', 'team_id']),
+    'ix_user_ticket_follows_ticket': ('user_ticket_follows', ['ticket_id', 'user_id']),
+
+    # Associações Project
+    'ix_project_approvals_project': ('project_approvals', ['project_id', 'approval_order']),
+    'ix_project_approvals_approver': ('project_approvals', ['approver_id', 'project_id']),
+    'ix_project_analysts_project': ('project_analysts', ['project_id', 'user_id']),
+    'ix_project_analysts_user': ('project_analysts', ['user_id', 'project_id']),
+    'ix_project_sponsors_project': ('project_sponsors', ['project_id', 'user_id']),
+    'ix_project_sponsors_user': ('project_sponsors', ['user_id', 'project_id']),
+    'ix_project_owners_project': ('project_owners', ['project_id', 'user_id']),
+    'ix_project_owners_user': ('project_owners', ['user_id', 'project_id']),
+    'ix_project_clients_project': ('project_clients', ['project_id', 'user_id']),
+    'ix_project_clients_user': ('project_clients', ['user_id', 'project_id']),
+    'ix_project_allowed_users_project': ('project_allowed_users', ['project_id', 'user_id']),
+    'ix_project_allowed_users_user': ('project_allowed_users', ['user_id', 'project_id']),
+    'ix_user_project_follows_project': ('user_project_follows', ['project_id', 'user_id']),
+    'ix_user_project_follows_user': ('user_project_follows', ['user_id', 'project_id']),
+
+    # Associações Report
+    'ix_report_allowed_users_report': ('report_allowed_users', ['report_id', 'user_id']),
+    'ix_report_allowed_users_user': ('report_allowed_users', ['user_id', 'report_id']),
+    'ix_user_report_follows_report': ('user_report_follows', ['report_id', 'user_id']),
+    'ix_user_report_follows_user': ('user_report_follows', ['user_id', 'report_id']),
+
+    # Declarados nas entidades, sem migração até aqui
+    'ix_users_team_role': ('users', ['user_team_id', 'user_role']),
+    'ix_projects_team_status': ('projects', ['project_team_responsible_id', 'project_status']),
+    'ix_projects_manager': ('projects', ['project_manager_id']),
+    'ix_projects_dates': ('projects', ['project_start_date', 'project_expected_end_date']),
+    'ix_reports_team_status': ('reports', ['report_team_responsible_id', 'report_status']),
+    'ix_reports_owner': ('reports', ['report_owner_id']),
+    'ix_reports_tags': ('reports', ['report_tags']),
+    'ix_forms_class_type': ('forms', ['form_ticket_class', 'form_type']),
+}
+
+
+def upgrade() -> None:
+    for name, (table, columns) in INDEXES.items():
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, (table, _columns) in reversed(INDEXES.items()):
+        op.drop_index(name, table_name=table)
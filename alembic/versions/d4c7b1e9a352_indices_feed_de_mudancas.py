@@ -0,0 +1,33 @@
+"""índices (updated_at, id) do feed de mudanças
+
+Revision ID: d4c7b1e9a352
+Revises: b8e2f6a4d170
+Create Date: 2026-10-19 21:37:55.107349
+
+Índices changes_index (infra/configs/database.py) usados pelo feed de
+mudanças (infra/exports/change_feed.py). Não parciais: o feed entrega
+também as linhas soft-deleted.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4c7b1e9a352'
+down_revision: Union[str, None] = 'b8e2f6a4d170'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ('tickets', 'projects', 'reports', 'messages', 'teams', 'users')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(f'ix_{table}_updated_id', table, ['updated_at', 'id'])
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_index(f'ix_{table}_updated_id', table_name=table)
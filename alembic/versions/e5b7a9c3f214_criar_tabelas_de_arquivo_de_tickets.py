@@ -0,0 +1,84 @@
+"""criar tabelas de arquivo de tickets
+
+Revision ID: e5b7a9c3f214
+Revises: c2d8f4a61e07
+Create Date: 2026-10-19 17:58:03.915472
+
+Tabelas archive_* (infra/entities/archive.py) para o TicketArchiveJob:
+mesmas colunas da tabela quente (copiadas por reflexão, no estado do
+schema NESTA revisão) + archived_at, sem FKs nem UNIQUE.
+
+Também indexa as duas FKs ON DELETE SET NULL que apontam para o grafo
+arquivado (chat_read_pointers.pointer_last_read_message_id e
+outbox_messages.outbox_ticket_id): sem elas, cada linha removida de
+messages/tickets faz o banco varrer a tabela filha.
+
+Coluna nova numa tabela quente daqui em diante: adicionar também na
+archive_* correspondente, na mesma migração.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7a9c3f214'
+down_revision: Union[str, None] = 'c2d8f4a61e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tabela quente -> índices da tabela de arquivo (além da PK id)
+ARCHIVED = {
+    'tickets': [],
+    'chats': [['chat_ticket_id']],
+    'messages': [['message_chat_id', 'created_at']],
+    'chat_read_pointers': [['pointer_chat_id']],
+    'ticket_attendants': [['ticket_id']],
+    'ticket_teams': [['ticket_id']],
+    'user_ticket_follows': [['ticket_id']],
+}
+
+# FKs (SET NULL) para linhas que o arquivamento remove: nome -> (tabela, colunas)
+FK_INDEXES = {
+    'ix_chat_read_pointers_last_message': ('chat_read_pointers', ['pointer_last_read_message_id']),
+    'ix_outbox_ticket': ('outbox_messages', ['outbox_ticket_id']),
+}
+
+
+def _column_copy(column: sa.Column) -> sa.Column:
+    column_type = column.type
+    if hasattr(column_type, 'create_type'):
+        # ENUM do PostgreSQL: o tipo já existe (criado com a tabela quente)
+        column_type = column_type.copy()
+        column_type.create_type = False
+    return sa.Column(
+        column.name, column_type,
+        primary_key=column.primary_key, autoincrement=False, nullable=column.nullable
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table_name, indexes in ARCHIVED.items():
+        hot = sa.Table(table_name, sa.MetaData(), autoload_with=bind)
+        archive_name = f'archive_{table_name}'
+        op.create_table(
+            archive_name,
+            *[_column_copy(column) for column in hot.columns],
+            sa.Column('archived_at', sa.DateTime(timezone=True),
+                      server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False)
+        )
+        for columns in indexes:
+            op.create_index(f'ix_{archive_name}_{columns[0]}', archive_name, columns)
+
+    for name, (table, columns) in FK_INDEXES.items():
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, (table, _columns) in reversed(FK_INDEXES.items()):
+        op.drop_index(name, table_name=table)
+    for table_name in reversed(ARCHIVED):
+        op.drop_table(f'archive_{table_name}')
@@ -0,0 +1,37 @@
+"""adicionar coluna version (concorrência otimista)
+
+Revision ID: f3a1c8d5b926
+Revises: e5b7a9c3f214
+Create Date: 2026-10-19 19:20:41.508317
+
+Coluna version das entidades Versioned (infra/configs/versioning.py).
+Linhas existentes começam na versão 1 (server_default).
+
+archive_tickets também recebe a coluna: o arquivamento copia os
+tickets coluna a coluna (INSERT ... SELECT).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a1c8d5b926'
+down_revision: Union[str, None] = 'e5b7a9c3f214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ('tickets', 'projects', 'reports', 'archive_tickets')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('version')
@@ -0,0 +1,59 @@
+"""
+Dependências compartilhadas das rotas (FastAPI Depends).
+
+Uso:
+    @router.get("/me")
+    def me(user: dict = Depends(get_current_user)): ...
+"""
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+
+from infra.configs.audit import set_current_user
+from infra.configs.replicas import replica_router
+from infra.entities.user import UserRole
+from infra.repositories import UserRepository
+from infra.security import InvalidTokenError, token_service
+
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+
+
+async def get_token_claims(token: str = Depends(oauth2_scheme)) -> dict:
+    """
+    Claims do access token (cache de claims verificados no TokenService).
+
+    Async de propósito: roda no contexto da requisição, então o
+    bind_session do roteador de réplicas (read-your-writes por usuário)
+    e o usuário da auditoria (created_by/updated_by/deleted_by) valem
+    para a rota inteira.
+    """
+    try:
+        claims = token_service.verify(token)
+    except InvalidTokenError:
+        raise HTTPException(
+            status.HTTP_401_UNAUTHORIZED,
+            "Token inválido ou expirado",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    replica_router.bind_session(f"user:{claims['sub']}")
+    set_current_user(int(claims["sub"]))
+    return claims
+
+
+def get_current_user(claims: dict = Depends(get_token_claims)) -> dict:
+    """Usuário autenticado (via cache de usuários, não select_by_id a cada requisição)."""
+    user = UserRepository().select_cached(int(claims["sub"]))
+    if user is None:
+        raise HTTPException(
+            status.HTTP_401_UNAUTHORIZED,
+            "Usuário inativo ou inexistente",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return user
+
+
+def get_admin_user(user: dict = Depends(get_current_user)) -> dict:
+    """Usuário autenticado com papel ADMINISTRADOR (403 para os demais)."""
+    if user["user_role"] != UserRole.ADMINISTRADOR.value:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Acesso restrito a administradores")
+    return user
@@ -0,0 +1,13 @@
+from .attachment_routes import router as attachment_router
+from .auth_routes import router as auth_router
+from .change_routes import router as change_router
+from .export_routes import router as export_router
+from .inbox_routes import router as inbox_router
+
+__all__ = [
+    'attachment_router',
+    'auth_router',
+    'change_router',
+    'export_router',
+    'inbox_router',
+]
@@ -0,0 +1,158 @@
+"""
+Rotas de anexos de tickets e mensagens.
+
+Upload (multipart/form-data, campo "file"):
+    POST /tickets/{ticket_id}/attachments
+    POST /messages/{message_id}/attachments
+    → 201 com os metadados do anexo (item do array JSON)
+
+Todas exigem usuário autenticado (Bearer token) que participe do ticket:
+quem abriu, atendente, membro de um time atribuído ou ADMINISTRADOR
+(403 para os demais). Anexos de mensagens internas não existem (404) para
+solicitantes nem para o cliente do ticket, como as próprias mensagens.
+
+Tamanho:
+    Uploads com Content-Length acima de ATTACHMENT_MAX_SIZE (+ folga do
+    multipart) recebem 413 antes de o corpo ser lido. Sem Content-Length
+    (chunked), o Starlette ainda grava o multipart inteiro em arquivo
+    temporário antes da rota; o limite exato vale na cópia para o storage.
+
+Download (com suporte a Range / 206 Partial Content):
+    GET /tickets/{ticket_id}/attachments/{sha256}
+    GET /messages/{message_id}/attachments/{sha256}
+
+O download usa FileResponse: o Starlette responde Range/If-Range e,
+em servidores com a extensão ASGI "http.response.pathsend" (ex: Granian),
+entrega o arquivo pelo caminho para o servidor fazer sendfile (zero-copy).
+Nos demais (uvicorn), o arquivo é lido em chunks, sem carregar tudo em memória.
+"""
+from typing import Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, Response
+from fastapi.routing import APIRoute
+
+from api.dependencies import get_current_user
+from infra.configs.settings import settings
+from infra.entities.user import UserRole, UserTipo
+from infra.repositories import MessageRepository, TicketRepository
+from infra.storage import AttachmentTooLarge, attachment_store
+
+# Boundaries e cabeçalhos do multipart além do arquivo em si
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class LimitedUploadRoute(APIRoute):
+    """Rota que recusa (413) um corpo maior que o anexo máximo antes de lê-lo."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def limited(request: Request) -> Response:
+            length = request.headers.get("content-length", "")
+            if length.isdigit() and int(length) > settings.ATTACHMENT_MAX_SIZE + MULTIPART_OVERHEAD:
+                return JSONResponse(
+                    {"detail": f"Anexo excede {settings.ATTACHMENT_MAX_SIZE} bytes"},
+                    status_code=status.HTTP_413_CONTENT_TOO_LARGE
+                )
+            return await handler(request)
+
+        return limited
+
+
+router = APIRouter(tags=["Anexos"], route_class=LimitedUploadRoute)
+
+
+# =========================================================================
+# ACESSO
+# =========================================================================
+
+def _authorize(ticket_id: int, user: dict, internal: bool = False) -> None:
+    """403 se o usuário não participa do ticket; 404 para mensagem interna vista pelo cliente."""
+    if user["user_role"] == UserRole.ADMINISTRADOR.value:
+        return
+    roles = TicketRepository().select_participation(ticket_id, user["id"])
+    if not roles:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Sem acesso a este ticket")
+    if internal and (user["user_tipo"] == UserTipo.SOLICITANTE.value or roles == {"client"}):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Registro não encontrado")
+
+
+async def _ticket_access(ticket_id: int, user: dict) -> None:
+    if not await run_in_threadpool(TicketRepository().exists, ticket_id):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Registro não encontrado")
+    await run_in_threadpool(_authorize, ticket_id, user)
+
+
+async def _message_access(message_id: int, user: dict) -> None:
+    scope = await run_in_threadpool(MessageRepository().select_scope, message_id)
+    if scope is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Registro não encontrado")
+    await run_in_threadpool(_authorize, scope["ticket_id"], user, scope["message_is_internal"])
+
+
+# =========================================================================
+# UPLOAD / DOWNLOAD
+# =========================================================================
+
+async def _upload(repository, owner_id: int, file: UploadFile, user: dict) -> dict:
+    try:
+        stored = await run_in_threadpool(attachment_store.save_file, file.file)
+    except AttachmentTooLarge as error:
+        raise HTTPException(status.HTTP_413_CONTENT_TOO_LARGE, str(error))
+
+    attachment = attachment_store.metadata(stored, file.filename, file.content_type, uploaded_by=user["id"])
+    if not await run_in_threadpool(repository.add_attachment, owner_id, attachment):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Registro não encontrado")
+    return attachment
+
+
+async def _download(repository, owner_id: int, sha256: str) -> FileResponse:
+    attachment = await run_in_threadpool(repository.get_attachment, owner_id, sha256)
+    if attachment is None or not attachment_store.exists(sha256):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Anexo não encontrado")
+
+    return FileResponse(
+        attachment_store.path_for(sha256),
+        media_type=attachment.get("content_type"),
+        filename=attachment.get("name"),
+        # Conteúdo endereçado por hash nunca muda
+        headers={"ETag": f'"{sha256}"', "Cache-Control": "private, max-age=31536000, immutable"}
+    )
+
+
+# =========================================================================
+# TICKETS
+# =========================================================================
+
+@router.post("/tickets/{ticket_id}/attachments", status_code=status.HTTP_201_CREATED)
+async def upload_ticket_attachment(ticket_id: int, file: UploadFile,
+                                   user: dict = Depends(get_current_user)) -> dict:
+    await _ticket_access(ticket_id, user)
+    return await _upload(TicketRepository(), ticket_id, file, user)
+
+
+@router.get("/tickets/{ticket_id}/attachments/{sha256}")
+async def download_ticket_attachment(ticket_id: int, sha256: str,
+                                     user: dict = Depends(get_current_user)) -> FileResponse:
+    await _ticket_access(ticket_id, user)
+    return await _download(TicketRepository(), ticket_id, sha256)
+
+
+# =========================================================================
+# MENSAGENS
+# =========================================================================
+
+@router.post("/messages/{message_id}/attachments", status_code=status.HTTP_201_CREATED)
+async def upload_message_attachment(message_id: int, file: UploadFile,
+                                    user: dict = Depends(get_current_user)) -> dict:
+    await _message_access(message_id, user)
+    return await _upload(MessageRepository(), message_id, file, user)
+
+
+@router.get("/messages/{message_id}/attachments/{sha256}")
+async def download_message_attachment(message_id: int, sha256: str,
+                                      user: dict = Depends(get_current_user)) -> FileResponse:
+    await _message_access(message_id, user)
+    return await _download(MessageRepository(), message_id, sha256)
@@ -0,0 +1,61 @@
+"""
+Rotas de autenticação.
+
+    POST /auth/login     (form OAuth2: username=e-mail, password) → par de tokens
+    POST /auth/refresh   {"refresh_token": "..."} → novo par (rotação)
+    POST /auth/logout    revoga o access token (e o refresh, se enviado)
+    GET  /auth/me        usuário autenticado
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from pydantic import BaseModel
+
+from api.dependencies import get_current_user, oauth2_scheme
+from infra.security import InvalidTokenError, auth_service, token_service
+
+
+router = APIRouter(prefix="/auth", tags=["Autenticação"])
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    refresh_token: str | None = None
+
+
+@router.post("/login")
+async def login(form: OAuth2PasswordRequestForm = Depends()) -> dict:
+    user = await auth_service.authenticate(form.username, form.password)
+    if user is None:
+        raise HTTPException(
+            status.HTTP_401_UNAUTHORIZED,
+            "E-mail ou senha inválidos",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return token_service.issue_pair(user["id"])
+
+
+@router.post("/refresh")
+def refresh(body: RefreshRequest) -> dict:
+    try:
+        return token_service.refresh(body.refresh_token)
+    except InvalidTokenError:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Refresh token inválido ou expirado")
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(body: LogoutRequest | None = None, token: str = Depends(oauth2_scheme),
+           user: dict = Depends(get_current_user)) -> None:
+    token_service.revoke(token)
+    if body and body.refresh_token:
+        try:
+            token_service.revoke(body.refresh_token)
+        except InvalidTokenError:
+            pass
+
+
+@router.get("/me")
+def me(user: dict = Depends(get_current_user)) -> dict:
+    return user
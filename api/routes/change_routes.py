@@ -0,0 +1,44 @@
+"""
+Feed de mudanças (CDC) para sincronização incremental (só ADMINISTRADOR).
+
+    GET /changes/{entity}              entity: tickets | projects | reports | messages | teams | users
+        ?since=<marca d'água>          omitido = desde o início
+        ?limit=500                     linhas por página
+        → {"items": [...], "watermark": "...", "has_more": true}
+    GET /changes/{entity}/stream?since=...
+        → NDJSON com todas as mudanças até o presente (menos a janela de
+          assentamento), cada linha com o próprio _watermark
+
+Cada item traz _deleted (soft delete) e _watermark. O consumidor guarda a
+marca d'água da última linha processada e a envia no próximo pedido.
+Detalhes em infra/exports/change_feed.py.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from api.dependencies import get_admin_user
+from infra.exports import change_feed
+
+
+router = APIRouter(prefix="/changes", tags=["Feed de mudanças"])
+
+
+@router.get("/{entity}")
+def changes(entity: str,
+            since: str | None = None,
+            limit: int = Query(500, ge=1, le=5000),
+            user: dict = Depends(get_admin_user)) -> dict:
+    try:
+        return change_feed.changes(entity, since=since, limit=limit)
+    except ValueError as error:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(error))
+
+
+@router.get("/{entity}/stream")
+def stream_changes(entity: str, since: str | None = None,
+                   user: dict = Depends(get_admin_user)) -> StreamingResponse:
+    try:
+        chunks = change_feed.stream(entity, since=since)
+    except ValueError as error:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(error))
+    return StreamingResponse(chunks, media_type="application/x-ndjson")
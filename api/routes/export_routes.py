@@ -0,0 +1,49 @@
+"""
+Exportações brutas para BI, em streaming (só ADMINISTRADOR).
+
+    GET /exports/{dataset}        dataset: tickets | projects | reports | messages
+        ?format=ndjson            ndjson (padrão) | csv | parquet (requer pyarrow)
+        ?start=2026-01-01         created_at >= start
+        ?end=2026-02-01           created_at < end
+        ?team_id=3                time atribuído/responsável
+        ?status=aberto            status do registro (repetível; não vale para messages)
+        ?include_inactive=true    inclui registros soft-deleted
+
+O corpo é gerado lote a lote (infra/exports): a resposta começa a sair
+antes de a consulta terminar e a memória do servidor não depende do
+tamanho da exportação. Parâmetros inválidos → 400 antes do primeiro byte.
+"""
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from api.dependencies import get_admin_user
+from infra.exports import MEDIA_TYPES, ExportFilters, ExportFormatUnavailable, table_exporter
+
+
+router = APIRouter(prefix="/exports", tags=["Exportações"])
+
+
+@router.get("/{dataset}")
+def export(dataset: str,
+           format: str = Query("ndjson"),
+           start: datetime | None = None,
+           end: datetime | None = None,
+           team_id: int | None = None,
+           status_: list[str] | None = Query(None, alias="status"),
+           include_inactive: bool = False,
+           user: dict = Depends(get_admin_user)) -> StreamingResponse:
+    filters = ExportFilters(start, end, team_id, tuple(status_ or ()), include_inactive)
+    try:
+        chunks = table_exporter.stream(dataset, format, filters)
+    except ExportFormatUnavailable as error:
+        raise HTTPException(status.HTTP_501_NOT_IMPLEMENTED, str(error))
+    except ValueError as error:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(error))
+
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{format}"'}
+    )
@@ -0,0 +1,46 @@
+"""
+Caixa de entrada ("meu trabalho") do usuário autenticado.
+
+    GET  /inbox                      tickets em que o usuário está envolvido
+         ?status=aberto&status=ativo  filtra por TicketStatus (repetível)
+         ?priority=alta               filtra por TicketPriority (repetível)
+         ?role=attendant              client | attendant | follower | team (repetível)
+         ?limit=50&cursor=...         paginação por keyset (next_cursor da página anterior)
+    GET  /inbox/badges?ticket_id=1&ticket_id=2   mensagens não lidas por ticket
+    POST /inbox/{ticket_id}/read     marca notificações e mensagens do ticket como lidas
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from api.dependencies import get_current_user
+from infra.entities.ticket import TicketPriority, TicketStatus
+from infra.repositories import ChatReadPointerRepository, TicketRepository
+
+
+router = APIRouter(prefix="/inbox", tags=["Caixa de entrada"])
+
+
+@router.get("")
+def inbox(status_: list[TicketStatus] | None = Query(None, alias="status"),
+          priority: list[TicketPriority] | None = Query(None),
+          role: list[str] | None = Query(None),
+          limit: int = Query(50, ge=1, le=200),
+          cursor: str | None = None,
+          user: dict = Depends(get_current_user)) -> dict:
+    try:
+        return TicketRepository().select_inbox(
+            user["id"], statuses=status_, priorities=priority, roles=role,
+            limit=limit, cursor=cursor
+        )
+    except ValueError as error:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(error))
+
+
+@router.get("/badges")
+def badges(ticket_id: list[int] = Query(..., max_length=200),
+           user: dict = Depends(get_current_user)) -> dict[int, int]:
+    return ChatReadPointerRepository().select_badges(user["id"], ticket_id)
+
+
+@router.post("/{ticket_id}/read")
+def mark_read(ticket_id: int, user: dict = Depends(get_current_user)) -> dict:
+    return {"marked": TicketRepository().mark_inbox_read(user["id"], ticket_id)}
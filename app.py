@@ -158,7 +158,7 @@ form1_id = form_repo.create(
     form_name='Form Correcao',
     form_ticket_class=FormClasse.RELATORIO,
     form_type=FormTipo.CORRECAO,
-    form_fields='{"fields":[]}'
+    form_fields={"fields": []}
 )
 print(f"  Forms criados: {form1_id}")
 
@@ -0,0 +1,8 @@
+from .visibility_index import VisibilityIndex, visibility_index, REPORT, PROJECT
+
+__all__ = [
+    'VisibilityIndex',
+    'visibility_index',
+    'REPORT',
+    'PROJECT',
+]
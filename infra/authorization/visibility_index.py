@@ -0,0 +1,433 @@
+"""
+Índice de visibilidade por usuário para relatórios e projetos.
+
+Regras (um item ativo é visível para o usuário ativo se):
+    Relatório: usuário ADMINISTRADOR, ou report_public, ou report_owner_id,
+               ou linha ativa em ReportAllowedUser, ou mesmo time
+               (report_team_responsible_id == user_team_id)
+    Projeto:   usuário ADMINISTRADOR, ou project_public, ou project_manager_id,
+               ou linha ativa em ProjectAnalyst / ProjectSponsor / ProjectOwner /
+               ProjectClient / ProjectAllowedUser, ou mesmo time
+
+Por que materializar?
+    Avaliar as regras por requisição exige joins em até 7 tabelas. Aqui
+    cada regra vira um bitmap (int do Python, bit N = item N):
+
+        visíveis(u) = (public | by_team[time(u)] | links[u]) & alive
+
+    São três ORs de inteiros; a listagem vira um único filtro id IN (...)
+    e resultados de busca são filtrados por AND de bitmaps.
+
+Atualização incremental (eventos do SQLAlchemy):
+    - after_flush: captura os valores das linhas novas/alteradas/removidas
+      (Report, Project, User e tabelas de associação)
+    - after_commit: aplica no índice; after_rollback: descarta
+    - UPDATE/DELETE em lote (query.update, soft_delete, update_status...)
+      não passam pelo flush: do_orm_execute marca o segmento como
+      desatualizado e ele é recarregado do banco na próxima leitura
+
+Escritas de OUTROS processos (workers do uvicorn, hr_sync, soft_delete_purge):
+    os eventos acima só veem commits deste processo. Na leitura, no máximo
+    a cada VISIBILITY_CHECK_SECONDS, uma query lê a assinatura de cada
+    tabela observada — (count(*), max(updated_at)) — e o segmento cuja
+    assinatura mudou é recarregado. Casos que a assinatura não distingue:
+        - escrita no mesmo segundo de max(updated_at) (CURRENT_TIMESTAMP do
+          SQLite tem resolução de segundo): assinatura lida a menos de 1 s
+          de max(updated_at) não é confiável → recarrega de novo na próxima
+          verificação
+        - transação longa que grava updated_at antigo e comita depois:
+          coberta por VISIBILITY_MAX_AGE_SECONDS (recarga completa)
+"""
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import event, func, select, true
+from sqlalchemy.orm import Session
+
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.database import Status
+from infra.configs.settings import settings
+from infra.entities.associations import (
+    ProjectAllowedUser, ProjectAnalyst, ProjectClient, ProjectOwner, ProjectSponsor, ReportAllowedUser
+)
+from infra.entities.project import Project
+from infra.entities.report import Report
+from infra.entities.user import User, UserRole
+
+
+REPORT = "report"
+PROJECT = "project"
+USERS = "users"
+
+_PENDING = "visibility_pending"
+
+
+@dataclass(frozen=True)
+class _KindSpec:
+    """Como ler as regras de visibilidade de um tipo de item."""
+    model: type
+    public: str
+    team: str
+    owner: str
+    links: dict  # tabela de associação -> atributo FK do item
+
+
+KINDS = {
+    REPORT: _KindSpec(
+        model=Report, public="report_public", team="report_team_responsible_id",
+        owner="report_owner_id", links={ReportAllowedUser: "report_id"}
+    ),
+    PROJECT: _KindSpec(
+        model=Project, public="project_public", team="project_team_responsible_id",
+        owner="project_manager_id",
+        links={model: "project_id" for model in (
+            ProjectAnalyst, ProjectSponsor, ProjectOwner, ProjectClient, ProjectAllowedUser
+        )}
+    ),
+}
+
+# Classe mapeada -> segmento do índice que ela afeta
+WATCHED = {User: USERS}
+for _kind, _spec in KINDS.items():
+    WATCHED[_spec.model] = _kind
+    WATCHED.update({link: _kind for link in _spec.links})
+
+# Segmento -> tabelas cuja assinatura é conferida no banco
+SEGMENT_TABLES: dict[str, list] = {}
+for _model, _segment in WATCHED.items():
+    SEGMENT_TABLES.setdefault(_segment, []).append(_model.__table__)
+
+# max(updated_at) mais recente que isso (relógio do banco) não é confiável
+_SIGNATURE_SETTLE = timedelta(seconds=1)
+
+
+def iter_bits(bitmap: int):
+    """IDs (posições dos bits ligados) em ordem crescente."""
+    bits = bin(bitmap)[:1:-1]
+    position = bits.find("1")
+    while position != -1:
+        yield position
+        position = bits.find("1", position + 1)
+
+
+def to_bitmap(ids) -> int:
+    bitmap = 0
+    for item_id in ids:
+        bitmap |= 1 << item_id
+    return bitmap
+
+
+class _ItemVisibility:
+    """Bitmaps de um tipo de item (relatórios OU projetos)."""
+
+    def __init__(self):
+        self.alive = 0
+        self.public = 0
+        self.by_team: dict[int, int] = {}
+        self.user_bits: dict[int, int] = {}
+        self._items: dict[int, tuple[bool, bool, int]] = {}   # id -> (alive, public, team)
+        self._links: dict[tuple, tuple[int, int]] = {}         # chave da linha -> (user, item)
+        self._counts: dict[int, Counter] = {}                  # user -> {item: nº de vínculos}
+
+    def set_item(self, item_id: int, alive: bool, public: bool, team: int, owner: int) -> None:
+        self.remove_item(item_id, keep_links=True)
+        bit = 1 << item_id
+        if alive:
+            self.alive |= bit
+        if public:
+            self.public |= bit
+        self.by_team[team] = self.by_team.get(team, 0) | bit
+        self._items[item_id] = (alive, public, team)
+        self.set_link(("owner", item_id), owner, item_id, True)
+
+    def remove_item(self, item_id: int, keep_links: bool = False) -> None:
+        old = self._items.pop(item_id, None)
+        if old is None:
+            return
+        mask = ~(1 << item_id)
+        self.alive &= mask
+        self.public &= mask
+        self.by_team[old[2]] &= mask
+        if not keep_links:
+            self.remove_link(("owner", item_id))
+
+    def set_link(self, key: tuple, user_id: int, item_id: int, active: bool) -> None:
+        self.remove_link(key)
+        if not active or user_id is None:
+            return
+        self._links[key] = (user_id, item_id)
+        counts = self._counts.setdefault(user_id, Counter())
+        counts[item_id] += 1
+        if counts[item_id] == 1:
+            self.user_bits[user_id] = self.user_bits.get(user_id, 0) | (1 << item_id)
+
+    def remove_link(self, key: tuple) -> None:
+        link = self._links.pop(key, None)
+        if link is None:
+            return
+        user_id, item_id = link
+        counts = self._counts[user_id]
+        counts[item_id] -= 1
+        if counts[item_id] == 0:
+            del counts[item_id]
+            self.user_bits[user_id] &= ~(1 << item_id)
+
+
+class _UserDirectory:
+    """Time, papel e status de cada usuário."""
+
+    def __init__(self):
+        self.team: dict[int, int] = {}
+        self.admins: set[int] = set()
+
+    def set_user(self, user_id: int, team: int, admin: bool, active: bool) -> None:
+        self.remove_user(user_id)
+        if not active:
+            return
+        self.team[user_id] = team
+        if admin:
+            self.admins.add(user_id)
+
+    def remove_user(self, user_id: int) -> None:
+        self.team.pop(user_id, None)
+        self.admins.discard(user_id)
+
+
+class VisibilityIndex:
+    """
+    Uso:
+        visibility_index.can_view(REPORT, user_id, report_id)
+        visibility_index.visible_ids(PROJECT, user_id)             # [ids...]
+        visibility_index.filter_ids(REPORT, user_id, search_ids)    # busca
+        query.filter(visibility_index.clause(REPORT, user_id, Report.id))
+    """
+
+    def __init__(self, check_seconds: float | None = None, max_age_seconds: float | None = None):
+        self._lock = threading.RLock()
+        self._segments: dict = {}
+        self._stale: set[str] = {USERS, *KINDS}
+        self._generation: Counter = Counter()
+        self.check_seconds = settings.VISIBILITY_CHECK_SECONDS if check_seconds is None else check_seconds
+        self.max_age_seconds = settings.VISIBILITY_MAX_AGE_SECONDS if max_age_seconds is None else max_age_seconds
+        self._checked_at = float("-inf")
+        self._loaded_at: dict[str, float] = {}
+        self._signatures: dict[str, tuple] = {}   # segmento -> (assinatura, confiável)
+
+    # =========================================================================
+    # CONSULTA
+    # =========================================================================
+
+    def visible_bitmap(self, kind: str, user_id: int) -> int:
+        self._refresh()
+        with self._lock:
+            users, items = self._segments[USERS], self._segments[kind]
+            if user_id not in users.team:
+                return 0
+            if user_id in users.admins:
+                return items.alive
+            team = users.team[user_id]
+            return (items.public | items.by_team.get(team, 0) | items.user_bits.get(user_id, 0)) & items.alive
+
+    def visible_ids(self, kind: str, user_id: int) -> list[int]:
+        return list(iter_bits(self.visible_bitmap(kind, user_id)))
+
+    def can_view(self, kind: str, user_id: int, item_id: int) -> bool:
+        return bool(self.visible_bitmap(kind, user_id) >> item_id & 1)
+
+    def filter_ids(self, kind: str, user_id: int, ids) -> list[int]:
+        """Mantém (na ordem recebida) só os IDs visíveis; ex: resultados de busca."""
+        bitmap = self.visible_bitmap(kind, user_id)
+        return [item_id for item_id in ids if bitmap >> item_id & 1]
+
+    def is_admin(self, user_id: int) -> bool:
+        self._refresh()
+        with self._lock:
+            return user_id in self._segments[USERS].admins
+
+    def clause(self, kind: str, user_id: int, column):
+        """Filtro SQL de visibilidade (admin = sem filtro)."""
+        if self.is_admin(user_id):
+            return true()
+        return column.in_(self.visible_ids(kind, user_id))
+
+    # =========================================================================
+    # CARGA (completa, por segmento)
+    # =========================================================================
+
+    def invalidate(self, segment: str | None = None) -> None:
+        """Força recarga do banco na próxima leitura."""
+        with self._lock:
+            self._stale.update([segment] if segment else [USERS, *KINDS])
+
+    def _refresh(self) -> None:
+        self._check_database()
+        with self._lock:
+            stale = list(self._stale)
+        for segment in stale:
+            with self._lock:
+                generation = self._generation[segment]
+            loaded = self._load_users() if segment == USERS else self._load_kind(KINDS[segment])
+            with self._lock:
+                self._segments[segment] = loaded
+                self._loaded_at[segment] = time.monotonic()
+                # Commits aplicados durante a carga podem não estar nela
+                if self._generation[segment] == generation:
+                    self._stale.discard(segment)
+
+    def _check_database(self) -> None:
+        """Marca como desatualizados os segmentos alterados fora deste processo."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self.check_seconds:
+                return
+            self._checked_at = now
+        signatures, database_now = self._read_signatures()
+        with self._lock:
+            for segment, signature in signatures.items():
+                previous = self._signatures.get(segment)
+                if (previous is None or previous != (signature, True)
+                        or now - self._loaded_at.get(segment, now) > self.max_age_seconds):
+                    self._stale.add(segment)
+                last_update = max((updated for _count, updated in signature if updated is not None), default=None)
+                settled = last_update is None or last_update < database_now - _SIGNATURE_SETTLE
+                self._signatures[segment] = (signature, settled)
+
+    @staticmethod
+    def _read_signatures() -> tuple[dict[str, tuple], object]:
+        """({segmento: ((count, max(updated_at)) por tabela)}, relógio do banco) numa só query."""
+        columns = [func.now()]
+        for tables in SEGMENT_TABLES.values():
+            for table in tables:
+                columns.append(select(func.count()).select_from(table).scalar_subquery())
+                columns.append(select(func.max(table.c.updated_at)).scalar_subquery())
+        with DBConnectionHandler() as db:
+            row = list(db.session.execute(select(*columns)).one())
+        database_now, values = row[0], iter(row[1:])
+        signatures = {
+            segment: tuple((next(values), next(values)) for _table in tables)
+            for segment, tables in SEGMENT_TABLES.items()
+        }
+        return signatures, database_now
+
+    @staticmethod
+    def _load_users() -> _UserDirectory:
+        users = _UserDirectory()
+        with DBConnectionHandler() as db:
+            rows = db.session.execute(select(User.id, User.user_team_id, User.user_role, User.active))
+            for user_id, team, role, active in rows:
+                users.set_user(user_id, team, role == UserRole.ADMINISTRADOR, active == Status.ATIVO)
+        return users
+
+    @staticmethod
+    def _load_kind(spec: _KindSpec) -> _ItemVisibility:
+        items = _ItemVisibility()
+        model = spec.model
+        with DBConnectionHandler() as db:
+            rows = db.session.execute(select(
+                model.id, model.active, getattr(model, spec.public),
+                getattr(model, spec.team), getattr(model, spec.owner)
+            ))
+            for item_id, active, public, team, owner in rows:
+                items.set_item(item_id, active == Status.ATIVO, bool(public), team, owner)
+
+            for link, item_attr in spec.links.items():
+                rows = db.session.execute(select(link.id, link.user_id, getattr(link, item_attr), link.active))
+                for link_id, user_id, item_id, active in rows:
+                    items.set_link((link.__tablename__, link_id), user_id, item_id, active == Status.ATIVO)
+        return items
+
+    # =========================================================================
+    # ATUALIZAÇÃO INCREMENTAL (operações capturadas no flush, aplicadas no commit)
+    # =========================================================================
+
+    @staticmethod
+    def capture(obj, deleted: bool = False) -> tuple | None:
+        """Converte uma linha alterada numa operação (só valores, sem objetos ORM)."""
+        segment = WATCHED.get(type(obj))
+        if segment is None:
+            return None
+        if segment == USERS:
+            if deleted:
+                return (USERS, "remove_user", obj.id)
+            return (USERS, "set_user", obj.id, obj.user_team_id,
+                    obj.user_role == UserRole.ADMINISTRADOR, obj.active == Status.ATIVO)
+
+        spec = KINDS[segment]
+        if type(obj) is spec.model:
+            if deleted:
+                return (segment, "remove_item", obj.id)
+            return (segment, "set_item", obj.id, obj.active == Status.ATIVO,
+                    bool(getattr(obj, spec.public)), getattr(obj, spec.team), getattr(obj, spec.owner))
+
+        key = (obj.__tablename__, obj.id)
+        if deleted:
+            return (segment, "remove_link", key)
+        return (segment, "set_link", key, obj.user_id,
+                getattr(obj, spec.links[type(obj)]), obj.active == Status.ATIVO)
+
+    def apply(self, operations: list[tuple]) -> None:
+        with self._lock:
+            for segment, method, *args in operations:
+                self._generation[segment] += 1
+                if method == "stale":
+                    self._stale.add(segment)
+                elif segment in self._segments:
+                    getattr(self._segments[segment], method)(*args)
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.authorization import visibility_index
+# =========================================================================
+visibility_index = VisibilityIndex()
+
+
+# =========================================================================
+# EVENTOS DE SESSÃO
+# =========================================================================
+
+@event.listens_for(Session, "after_flush")
+def _capture_flush(session, flush_context):
+    operations = session.info.setdefault(_PENDING, [])
+    for obj in list(session.new) + list(session.dirty):
+        operation = VisibilityIndex.capture(obj)
+        if operation:
+            operations.append(operation)
+    for obj in session.deleted:
+        operation = VisibilityIndex.capture(obj, deleted=True)
+        if operation:
+            operations.append(operation)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _capture_bulk(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    segment = WATCHED.get(mapper.class_) if mapper is not None else None
+    if segment:
+        orm_execute_state.session.info.setdefault(_PENDING, []).append((segment, "stale"))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_commit(session):
+    operations = session.info.pop(_PENDING, None)
+    if operations:
+        visibility_index.apply(operations)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rollback(session):
+    session.info.pop(_PENDING, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_savepoint(session, previous_transaction):
+    # Rollback de SAVEPOINT: não dá para saber quais operações sobreviveram;
+    # os segmentos afetados são recarregados do banco após o commit
+    operations = session.info.get(_PENDING)
+    if operations and previous_transaction.nested:
+        session.info[_PENDING] = [(segment, "stale") for segment in {op[0] for op in operations}]
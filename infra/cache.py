@@ -0,0 +1,84 @@
+"""
+Cache LRU em memória, thread-safe, com expiração opcional por entrada.
+
+Usado para objetos caros de construir e baratos de guardar
+(validadores compilados, claims de token, usuários).
+
+Exemplo:
+    cache = LRUCache(maxsize=256)
+    cache.set(("form", 1, 3), validator)
+    cache.get(("form", 1, 3))          # hit → move para o fim (mais recente)
+    cache.set("token", claims, ttl=60) # expira em 60s
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Cache LRU limitado por quantidade de entradas.
+
+    - get/set são O(1) (OrderedDict)
+    - Ao exceder maxsize, remove a entrada usada há mais tempo
+    - ttl (segundos) opcional por entrada; entradas vencidas viram miss
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retorna o valor (ou default) e marca a entrada como recém-usada."""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Grava o valor; ttl em segundos (None = não expira)."""
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Any:
+        """Remove uma entrada (se existir) e retorna o valor."""
+        with self._lock:
+            item = self._data.pop(key, None)
+            return item[0] if item else None
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove todas as entradas cuja chave satisfaz o predicado."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
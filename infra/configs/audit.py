@@ -0,0 +1,111 @@
+"""
+Auditoria automática: created_by / updated_by / deleted_by.
+
+O usuário atual fica num contextvar, definido no início da requisição
+(api/dependencies.get_token_claims) ou explicitamente em jobs/scripts:
+
+    set_current_user(7)              # requisição (vale até o fim do contexto)
+    with acting_as(7): ...           # script/job/teste
+    current_user_id()                # 7 (None fora de requisição)
+
+Eventos da Session (valem para Session e AsyncSession, que usa uma
+Session por baixo; o contextvar acompanha tasks asyncio, threads do
+FastAPI e a thread do escritor do write_queue):
+
+    before_flush    objetos novos: created_by/updated_by
+                    objetos alterados: updated_by; active → INATIVO: deleted_by
+    do_orm_execute  UPDATE/INSERT em lote (query.update, update(Model),
+                    insert(Model)): acrescenta updated_by/created_by ao
+                    próprio statement — nada de UPDATE extra depois
+
+Valor passado explicitamente (update(updated_by=...), soft_delete(deleted_by=...))
+sempre prevalece. Sem usuário no contexto, nada é preenchido.
+"""
+import contextvars
+from contextlib import contextmanager
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from infra.configs.database import Base, Status
+
+_current_user: contextvars.ContextVar[int | None] = contextvars.ContextVar("audit_user_id", default=None)
+
+
+def set_current_user(user_id: int | None) -> contextvars.Token:
+    """Define o usuário do contexto atual (ex: no início da requisição)."""
+    return _current_user.set(user_id)
+
+
+def current_user_id() -> int | None:
+    """Usuário do contexto atual (None = sistema/anônimo)."""
+    return _current_user.get()
+
+
+@contextmanager
+def acting_as(user_id: int | None):
+    """Executa um bloco como `user_id` (jobs, scripts, testes)."""
+    token = _current_user.set(user_id)
+    try:
+        yield
+    finally:
+        _current_user.reset(token)
+
+
+# =========================================================================
+# EVENTOS
+# =========================================================================
+
+@event.listens_for(Session, "before_flush")
+def _stamp_flush(session, flush_context, instances):
+    user_id = _current_user.get()
+    if user_id is None:
+        return
+    for obj in session.new:
+        if isinstance(obj, Base):
+            if obj.created_by is None:
+                obj.created_by = user_id
+            if obj.updated_by is None:
+                obj.updated_by = user_id
+    for obj in session.dirty:
+        if not isinstance(obj, Base) or not session.is_modified(obj, include_collections=False):
+            continue
+        attrs = inspect(obj).attrs
+        if not attrs.updated_by.history.has_changes():
+            obj.updated_by = user_id
+        if (obj.active == Status.INATIVO and attrs.active.history.has_changes()
+                and obj.deleted_by is None):
+            obj.deleted_by = user_id
+
+
+def _keys(values) -> set[str]:
+    """Nomes das colunas em statement._values (chaves str, Column ou atributo ORM)."""
+    return {getattr(key, "key", key) for key in (values or {})}
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _stamp_bulk(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_insert):
+        return
+    user_id = _current_user.get()
+    mapper = orm_execute_state.bind_mapper
+    if user_id is None or mapper is None or not issubclass(mapper.class_, Base):
+        return
+
+    columns = ("updated_by",) if orm_execute_state.is_update else ("created_by", "updated_by")
+    statement = orm_execute_state.statement
+    parameters = orm_execute_state.parameters
+    if parameters:
+        # Executemany (bulk insert / bulk update por PK): um dict por linha.
+        # Os dicts são do chamador (que pode reenviá-los, ex: retry linha a
+        # linha do hr_sync) — invoke_statement mescla em cópias.
+        many = isinstance(parameters, (list, tuple))
+        missing = [{column: user_id for column in columns if column not in row}
+                   for row in (parameters if many else [parameters])]
+        if any(missing):
+            return orm_execute_state.invoke_statement(params=missing if many else missing[0])
+    elif getattr(statement, "_values", None) is not None:
+        present = _keys(statement._values)
+        missing = {column: user_id for column in columns if column not in present}
+        if missing:
+            orm_execute_state.statement = statement.values(missing)
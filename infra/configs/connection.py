@@ -6,11 +6,49 @@ Uso com Context Manager:
         db.session.query(User).all()
         # commit automático se não houver exceção
         # rollback automático se houver exceção
+
+Engine único por URL:
+    O engine (e o pool de conexões) é criado uma vez por processo e
+    reaproveitado por todos os DBConnectionHandler. Criar um engine por
+    requisição abria uma conexão nova a cada "with" (e, no SQLite,
+    reaplicaria os PRAGMAs toda vez).
+
+Réplicas de leitura:
+    DBConnectionHandler(read_only=True) usa uma réplica escolhida pelo
+    replica_router (ou o primário, se não houver réplicas ou se a sessão
+    escreveu há pouco — read-your-writes). Ver infra/configs/replicas.py.
 """
+import threading
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 
+from infra.configs.replicas import replica_router
 from infra.configs.settings import settings
+from infra.configs.sqlite import install_pragmas
+
+
+_engines: dict[str, tuple[Engine, sessionmaker]] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(url: str | None = None) -> tuple[Engine, sessionmaker]:
+    """Engine + sessionmaker da URL (criados na primeira chamada; DATABASE_URL por padrão)."""
+    url = url or settings.DATABASE_URL
+    cached = _engines.get(url)
+    if cached is None:
+        with _engines_lock:
+            cached = _engines.get(url)
+            if cached is None:
+                engine = create_engine(
+                    url,
+                    echo=settings.DEBUG,     # True = loga SQL (útil em dev)
+                    pool_pre_ping=True       # Verifica se conexão está viva
+                )
+                install_pragmas(engine)      # Perfil de PRAGMAs (só SQLite)
+                cached = _engines[url] = (engine, sessionmaker(bind=engine))
+    return cached
 
 
 class DBConnectionHandler:
@@ -21,15 +59,14 @@ class DBConnectionHandler:
     - Garante que conexão seja SEMPRE fechada
     - Commit/rollback automático baseado em exceções
     - Evita "connection leak" (conexões órfãs)
+
+    Args:
+        read_only: Leitura que pode ir para uma réplica (select_*, count, exists)
     """
 
-    def __init__(self):
-        self._engine = create_engine(
-            settings.DATABASE_URL,
-            echo=settings.DEBUG,     # True = loga SQL (útil em dev)
-            pool_pre_ping=True       # Verifica se conexão está viva
-        )
-        self._Session = sessionmaker(bind=self._engine)
+    def __init__(self, read_only: bool = False):
+        url = replica_router.read_url() if read_only else None
+        self._engine, self._Session = get_engine(url)
         self.session: Session | None = None
 
     def __enter__(self) -> "DBConnectionHandler":
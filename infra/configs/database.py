@@ -1,5 +1,5 @@
 
-from sqlalchemy import Integer, Boolean, DateTime, func, Enum
+from sqlalchemy import Integer, Boolean, DateTime, func, Enum, Index, literal_column, text
 from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass, Mapped, mapped_column
 from datetime import datetime
 from enum import Enum as PyEnum
@@ -25,6 +25,65 @@ class Status(PyEnum):
     INATIVO = "inativo"
 
 
+# =========================================================================
+# ÍNDICES PARCIAIS (só registros ativos)
+# =========================================================================
+# O Enum grava o NOME do membro ('ATIVO'), não o valor ("ativo").
+ACTIVE_WHERE = "active = 'ATIVO'"
+
+
+def active_index(name: str, *columns, unique: bool = False) -> Index:
+    """
+    Índice parcial WHERE active = 'ATIVO' (SQLite e PostgreSQL).
+
+    Registros soft-deleted ficam fora do índice: ele não cresce com o
+    lixo e, com unique=True, um nome/email de registro deletado pode
+    ser reutilizado.
+
+    O planner só usa o índice se a query tiver o MESMO predicado como
+    termo AND com a constante literal — use Base.active_clause(), não
+    `active != Status.INATIVO` nem um parâmetro (?).
+
+    Exemplo:
+        __table_args__ = (
+            active_index('ix_tickets_project', 'ticket_project_id'),
+        )
+    """
+    return Index(
+        name, *columns, unique=unique,
+        sqlite_where=text(ACTIVE_WHERE),
+        postgresql_where=text(ACTIVE_WHERE)
+    )
+
+
+def changes_index(table: str) -> Index:
+    """
+    Índice (updated_at, id) do feed de mudanças (infra/exports/change_feed.py).
+
+    NÃO é parcial: o feed também entrega os soft-deleted (soft delete
+    atualiza updated_at). Cada página é um range scan a partir da marca
+    d'água (updated_at, id) do consumidor.
+
+    Exemplo:
+        __table_args__ = (
+            changes_index('tickets'),      # ix_tickets_updated_id
+        )
+    """
+    return Index(f'ix_{table}_updated_id', 'updated_at', 'id')
+
+
+# =========================================================================
+# IDS NUNCA REAPROVEITADOS (tabelas com arquivo)
+# =========================================================================
+# INTEGER PRIMARY KEY no SQLite é o rowid: sem AUTOINCREMENT, o próximo id
+# é max(id) + 1, e o id de uma linha removida do topo volta a ser usado.
+# Tabelas cujas linhas vão para archive_* (mesmo id como PK lá) precisam
+# de ids monotônicos; no PostgreSQL a sequence já nunca volta atrás.
+# Último item de __table_args__:
+#     __table_args__ = (Index(...), MONOTONIC_IDS)
+MONOTONIC_IDS = {"sqlite_autoincrement": True}
+
+
 class Base(MappedAsDataclass, DeclarativeBase):
     """
     Classe base abstrata para todas as entidades do sistema.
@@ -136,6 +195,15 @@ class Base(MappedAsDataclass, DeclarativeBase):
     # MÉTODOS
     # =========================================================================
 
+    @classmethod
+    def active_clause(cls):
+        """
+        Filtro de registros ativos: `<tabela>.active = 'ATIVO'` com a
+        constante literal, igual ao predicado dos índices parciais
+        (active_index). Equivale a `active != Status.INATIVO`.
+        """
+        return cls.active == literal_column("'ATIVO'")
+
     def to_dict(self) -> dict:
         """
         Converte entidade para dicionário.
@@ -143,6 +211,8 @@ class Base(MappedAsDataclass, DeclarativeBase):
         - Converte Enums para seus valores (.value)
         - Converte datetime para ISO format
         - Ignora relationships (apenas colunas)
+        - Ignora colunas adiadas (deferred) que não foram carregadas,
+          em vez de disparar uma query por coluna
 
         Para serialização completa com relacionamentos,
         use os Pydantic Schemas.
@@ -152,8 +222,11 @@ class Base(MappedAsDataclass, DeclarativeBase):
 
         result = {}
         mapper = inspect(self.__class__)
+        unloaded = inspect(self).unloaded
 
         for column in mapper.columns:
+            if column.key in unloaded and mapper.column_attrs[column.key].deferred:
+                continue
             value = getattr(self, column.key)
 
             # Converter Enums para string
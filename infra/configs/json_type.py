@@ -0,0 +1,120 @@
+"""
+Tipo JSON nativo e expressões JSON portáveis (SQLite JSON1 / PostgreSQL JSONB).
+
+Por que um módulo próprio?
+    As colunas JSON (anexos, preferências, marcos, tarefas, campos de
+    formulário) precisam ser consultadas e alteradas por sub-campo, sem
+    ler o documento inteiro para a aplicação. Cada banco tem sua sintaxe:
+
+        Operação              SQLite (JSON1)                  PostgreSQL (JSONB)
+        ler chave             json_extract(col, '$.k')        col ->> 'k'
+        alterar caminho       json_set(col, '$.a.b', v)       jsonb_set(col, '{a,b}', v)
+        remover caminho       json_remove(col, '$.a')         col #- '{a}'
+        append em array       json_insert(col, '$[#]', v)     col || jsonb_build_array(v)
+        array contém objeto   EXISTS (json_each ...)          col @> '[{"k": v}]'
+
+Chaves e caminhos são renderizados como LITERAIS (não bind params):
+é o que permite ao planner casar a expressão com os índices de
+expressão criados na migration (ex: ix_users_pref_email).
+"""
+import json
+import re
+from typing import Any
+
+from sqlalchemy import JSON, cast, exists, func, literal_column, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+
+# JSON no SQLite (JSON1), JSONB no PostgreSQL
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+_KEY_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _check_key(key: str | int) -> str | int:
+    """Valida chave/índice de caminho (são renderizados literalmente no SQL)."""
+    if isinstance(key, int) or _KEY_PATTERN.match(key):
+        return key
+    raise ValueError(f"Chave JSON inválida: {key!r}")
+
+
+def _sqlite_path(path: tuple) -> str:
+    parts = ["$"]
+    for key in map(_check_key, path):
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "".join(parts)
+
+
+def _pg_path(path: tuple) -> str:
+    return "{" + ",".join(str(_check_key(key)) for key in path) + "}"
+
+
+def _sqlite_json(value: Any):
+    # json() marca o valor como JSON (senão json_set grava como string)
+    return func.json(json.dumps(value))
+
+
+def _pg_json(value: Any):
+    return cast(json.dumps(value), JSONB)
+
+
+# =========================================================================
+# LEITURA
+# =========================================================================
+
+def json_key(column, key: str, dialect: str):
+    """Valor escalar de uma chave de primeiro nível (expressão indexável)."""
+    key = _check_key(key)
+    if dialect == "postgresql":
+        return type_coerce(column, JSONB).op("->>")(literal_column(f"'{key}'"))
+    return func.json_extract(column, literal_column(f"'$.{key}'"))
+
+
+def json_key_equals(column, key: str, value: Any, dialect: str):
+    """Filtro `documento[key] == value` (usa o índice de expressão, se houver)."""
+    if dialect == "postgresql":
+        value = json.dumps(value) if isinstance(value, bool) else str(value)
+    elif isinstance(value, bool):
+        value = int(value)  # json_extract devolve true/false como 1/0
+    return json_key(column, key, dialect) == value
+
+
+def json_array_contains(column, key: str, value: Any, dialect: str):
+    """Filtro "array contém um objeto com key == value" (ex: anexo por sha256)."""
+    key = _check_key(key)
+    if dialect == "postgresql":
+        return type_coerce(column, JSONB).op("@>")(_pg_json([{key: value}]))
+    items = func.json_each(column).table_valued("value").alias("items")
+    return exists(
+        select(literal_column("1"))
+        .select_from(items)
+        .where(func.json_extract(items.c.value, literal_column(f"'$.{key}'")) == value)
+    )
+
+
+# =========================================================================
+# ESCRITA (patch no banco, sem read-modify-write na aplicação)
+# =========================================================================
+
+def json_set(column, path: tuple, value: Any, dialect: str):
+    """Documento com `path` definido como `value` (cria chaves ausentes)."""
+    if dialect == "postgresql":
+        base = func.coalesce(type_coerce(column, JSONB), _pg_json({}))
+        return func.jsonb_set(base, literal_column(f"'{_pg_path(path)}'"), _pg_json(value), True)
+    base = func.coalesce(column, "{}")
+    return func.json_set(base, literal_column(f"'{_sqlite_path(path)}'"), _sqlite_json(value))
+
+
+def json_remove(column, path: tuple, dialect: str):
+    """Documento sem o `path`."""
+    if dialect == "postgresql":
+        return type_coerce(column, JSONB).op("#-")(literal_column(f"'{_pg_path(path)}'"))
+    return func.json_remove(column, literal_column(f"'{_sqlite_path(path)}'"))
+
+
+def json_append(column, value: Any, dialect: str):
+    """Array com `value` adicionado ao final (NULL vira array vazio)."""
+    if dialect == "postgresql":
+        base = func.coalesce(type_coerce(column, JSONB), _pg_json([]))
+        return base.op("||")(func.jsonb_build_array(_pg_json(value)))
+    base = func.coalesce(column, "[]")
+    return func.json_insert(base, literal_column("'$[#]'"), _sqlite_json(value))
@@ -0,0 +1,72 @@
+"""
+Paginação por keyset (cursor) em vez de OFFSET.
+
+    página 1:  ORDER BY updated_at DESC, id DESC LIMIT 50
+    página 2:  ... WHERE (updated_at, id) < (:ultimo_updated_at, :ultimo_id) ...
+
+O custo de cada página é o mesmo (OFFSET relê tudo o que pulou) e
+inserções entre uma página e outra não duplicam/pulam itens.
+
+Datetimes no SQLite:
+    O SQLite guarda datetime como TEXTO, em formatos diferentes conforme
+    a origem: CURRENT_TIMESTAMP grava '2026-10-19 10:00:00' e o SQLAlchemy
+    grava '2026-10-19 10:00:00.000000'. Comparar a coluna com um datetime
+    do Python (sempre com microssegundos) erra no mesmo segundo. Por isso,
+    no SQLite, as colunas DateTime da chave são lidas e comparadas como o
+    texto cru gravado (type_coerce para String): a ordem do ORDER BY e a
+    do filtro são exatamente a mesma.
+"""
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, and_, or_, type_coerce
+
+
+def keyset_columns(columns: list, dialect: str) -> list:
+    """Expressões da chave de ordenação (DateTime vira texto cru no SQLite)."""
+    if dialect != "sqlite":
+        return list(columns)
+    return [
+        type_coerce(column, String) if isinstance(column.type, DateTime) else column
+        for column in columns
+    ]
+
+
+def keyset_filter(columns: list, values: list, descending: bool = True):
+    """
+    Filtro "depois do cursor" expandido em OR/AND (usa o índice da chave):
+        a < va OR (a = va AND b < vb) OR ...
+    """
+    conditions = []
+    for position, column in enumerate(columns):
+        equal = [columns[i] == values[i] for i in range(position)]
+        after = column < values[position] if descending else column > values[position]
+        conditions.append(and_(*equal, after))
+    return or_(*conditions)
+
+
+def encode_cursor(values: list) -> str:
+    """Serializa os valores da chave da última linha da página."""
+    payload = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    """
+    Raises:
+        ValueError: Cursor malformado
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as error:
+        raise ValueError("Cursor inválido") from error
+    if not isinstance(payload, list):
+        raise ValueError("Cursor inválido")
+    return [
+        datetime.fromisoformat(value["dt"]) if isinstance(value, dict) and "dt" in value else value
+        for value in payload
+    ]
@@ -0,0 +1,77 @@
+"""
+Inspeção do plano de execução (EXPLAIN) de queries do SQLAlchemy.
+
+Uso:
+    with DBConnectionHandler() as db:
+        query = TicketRepository()._base_query(db.session).filter(Ticket.ticket_project_id == 1)
+        plan = explain(db.session, query)
+        # ['SEARCH tickets USING INDEX ix_tickets_project (ticket_project_id=?)']
+        used_indexes(plan)       # {'ix_tickets_project'}
+        full_scans(plan)         # set() — nenhuma tabela lida inteira
+
+SQLite: EXPLAIN QUERY PLAN (uma linha por passo, "SCAN" = leitura inteira,
+"SEARCH ... USING INDEX" = busca pelo índice).
+PostgreSQL: EXPLAIN (sem ANALYZE, não executa a query); "Seq Scan on" é a
+leitura inteira.
+
+A query é compilada com os parâmetros como literais: assim o planner vê
+as mesmas constantes que veria em produção (necessário para casar o
+predicado dos índices parciais).
+
+Harness (todos os métodos de leitura dos repositories, base grande):
+    python -m tests.query_plans
+"""
+import re
+
+from sqlalchemy.orm import Query, Session
+
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?! USING (?:COVERING )?INDEX)(?:\s|$)")
+_SQLITE_INDEX = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+_PG_SCAN = re.compile(r"Seq Scan on (\w+)")
+_PG_INDEX = re.compile(r"Index (?:Only )?Scan (?:Backward )?using (\w+)")
+
+
+def explain(session: Session, statement) -> list[str]:
+    """Linhas do plano de execução de uma Query/Select no banco da sessão."""
+    if isinstance(statement, Query):
+        statement = statement.statement
+    dialect = session.get_bind().dialect
+    sql = str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    return explain_sql(session.connection().connection, dialect.name, sql)
+
+
+def explain_sql(dbapi_connection, dialect: str, sql: str, parameters=None) -> list[str]:
+    """
+    Plano de um SQL já compilado, com os parâmetros do driver (como chegam
+    ao cursor: tupla no SQLite, dict no psycopg2). Usado para explicar os
+    statements capturados em before_cursor_execute.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        if dialect == "sqlite":
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", parameters or ())
+            return [row[-1] for row in cursor.fetchall()]
+        cursor.execute(f"EXPLAIN {sql}", parameters or None)
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def full_scans(plan: list[str]) -> set[str]:
+    """Tabelas lidas inteiras (sem índice) no plano."""
+    tables = set()
+    for line in plan:
+        line = line.strip()
+        match = _SQLITE_SCAN.match(line) or _PG_SCAN.search(line)
+        if match:
+            tables.add(match.group(1))
+    return tables
+
+
+def used_indexes(plan: list[str]) -> set[str]:
+    """Índices usados no plano."""
+    indexes = set()
+    for line in plan:
+        indexes.update(_SQLITE_INDEX.findall(line))
+        indexes.update(_PG_INDEX.findall(line))
+    return indexes
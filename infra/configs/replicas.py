@@ -0,0 +1,158 @@
+"""
+Roteamento de leituras para réplicas, com read-your-writes.
+
+    DATABASE_URL            primário: escritas e leituras de unidade de trabalho
+    DATABASE_REPLICA_URLS   réplicas: select_*/count/exists dos repositories
+                            (round-robin entre as réplicas)
+
+Read-your-writes:
+    A réplica pode estar atrasada. Depois de uma escrita, as leituras da
+    MESMA sessão vão para o primário durante READ_YOUR_WRITES_SECONDS.
+    A sessão é identificada por bind_session(chave) (a API usa o usuário
+    do token); sem chave, vale o contexto atual (contextvars).
+
+Replicação no SQLite (só para desenvolvimento/teste local):
+    O SQLite não replica. SQLiteReplicator copia o arquivo primário para
+    cada réplica com a API de backup do sqlite3 (cópia consistente, com
+    o primário em uso) a cada SQLITE_REPLICA_SYNC_SECONDS — um atraso de
+    replicação de verdade, para exercitar o roteamento.
+"""
+import contextvars
+import itertools
+import logging
+import sqlite3
+import threading
+import time
+
+from sqlalchemy.engine import make_url
+
+from infra.configs.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_session_key: contextvars.ContextVar[str | None] = contextvars.ContextVar("db_session_key", default=None)
+_last_write_local: contextvars.ContextVar[float | None] = contextvars.ContextVar("db_last_write", default=None)
+
+
+class ReplicaRouter:
+    """
+    Uso:
+        url = replica_router.read_url()    # None = primário
+        replica_router.mark_write()        # após cada escrita (BaseRepository._run_write)
+        replica_router.bind_session(key)   # no início da requisição
+    """
+
+    def __init__(self, replica_urls: list[str], stickiness_seconds: float = 5):
+        self.replica_urls = list(replica_urls)
+        self.stickiness_seconds = stickiness_seconds
+        self._cycle = itertools.cycle(self.replica_urls) if self.replica_urls else None
+        self._last_write: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def bind_session(key: str | None) -> None:
+        """Identifica a sessão atual (ex: "user:7") para o read-your-writes."""
+        _session_key.set(key)
+
+    def mark_write(self) -> None:
+        """Registra que a sessão atual escreveu agora."""
+        now = time.monotonic()
+        _last_write_local.set(now)
+        key = _session_key.get()
+        if key is None:
+            return
+        with self._lock:
+            self._last_write[key] = now
+            if len(self._last_write) > 10000:
+                limit = now - self.stickiness_seconds
+                self._last_write = {k: t for k, t in self._last_write.items() if t > limit}
+
+    def _recently_wrote(self) -> bool:
+        last = _last_write_local.get()
+        key = _session_key.get()
+        if key is not None:
+            with self._lock:
+                keyed = self._last_write.get(key)
+            last = max(last or 0, keyed or 0) or None
+        return last is not None and time.monotonic() - last < self.stickiness_seconds
+
+    def read_url(self) -> str | None:
+        """URL de uma réplica para esta leitura, ou None para ler do primário."""
+        if self._cycle is None or self._recently_wrote():
+            return None
+        with self._lock:
+            return next(self._cycle)
+
+
+class SQLiteReplicator:
+    """
+    Stand-in de replicação para SQLite: backup periódico primário → réplicas.
+
+    Uso:
+        sqlite_replicator.start()     # no startup (só se houver réplicas SQLite)
+        sqlite_replicator.sync()      # cópia imediata (ex: em testes)
+        sqlite_replicator.stop()
+    """
+
+    def __init__(self, primary_url: str, replica_urls: list[str], interval_seconds: float | None = None):
+        self.primary_url = primary_url
+        self.replica_urls = [url for url in replica_urls if make_url(url).get_backend_name() == "sqlite"]
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _path(url: str) -> str:
+        return make_url(url).database
+
+    def sync(self) -> int:
+        """Copia o primário para cada réplica. Retorna quantas réplicas foram atualizadas."""
+        if make_url(self.primary_url).get_backend_name() != "sqlite":
+            return 0
+        source = sqlite3.connect(self._path(self.primary_url))
+        try:
+            for url in self.replica_urls:
+                target = sqlite3.connect(self._path(url), timeout=settings.SQLITE_BUSY_TIMEOUT_MS / 1000)
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+        finally:
+            source.close()
+        return len(self.replica_urls)
+
+    def start(self) -> None:
+        """Inicia a cópia periódica (ignorado sem intervalo ou sem réplicas SQLite)."""
+        if not self.interval_seconds or not self.replica_urls or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sqlite-replicator", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.sync()
+            except Exception:
+                logger.exception("Falha ao copiar o SQLite primário para as réplicas")
+
+
+# =========================================================================
+# INSTÂNCIAS GLOBAIS - Importe assim:
+# from infra.configs.replicas import replica_router, sqlite_replicator
+# =========================================================================
+replica_router = ReplicaRouter(
+    replica_urls=settings.DATABASE_REPLICA_URLS,
+    stickiness_seconds=settings.READ_YOUR_WRITES_SECONDS
+)
+sqlite_replicator = SQLiteReplicator(
+    primary_url=settings.DATABASE_URL,
+    replica_urls=settings.DATABASE_REPLICA_URLS,
+    interval_seconds=settings.SQLITE_REPLICA_SYNC_SECONDS
+)
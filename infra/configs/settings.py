@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from functools import lru_cache
+from typing import Literal
 
 
 class Settings(BaseSettings):
@@ -28,12 +29,126 @@ class Settings(BaseSettings):
         ...,description="URL de conexão com o banco"
     )
 
+    DATABASE_REPLICA_URLS: list[str] = Field(
+        default_factory=list, description="Réplicas de leitura (JSON: [\"url1\", \"url2\"])"
+    )
+    READ_YOUR_WRITES_SECONDS: float = Field(
+        5, description="Após uma escrita, as leituras da sessão vão ao primário por este tempo"
+    )
+    SQLITE_REPLICA_SYNC_SECONDS: float | None = Field(
+        None, description="Cópia periódica primário → réplicas SQLite (só dev/teste; None = desligado)"
+    )
+
+    # SQLite (perfil de PRAGMAs aplicado a cada conexão; ignorado em outros bancos)
+    SQLITE_JOURNAL_MODE: str = Field("WAL", description="journal_mode (WAL = leitores não bloqueiam o escritor)")
+    SQLITE_SYNCHRONOUS: str = Field("NORMAL", description="synchronous (NORMAL é seguro com WAL)")
+    SQLITE_MMAP_SIZE: int = Field(256 * 1024 * 1024, description="mmap_size em bytes (0 = desligado)")
+    SQLITE_CACHE_SIZE: int = Field(-64000, description="cache_size (negativo = KiB por conexão)")
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(5000, description="Espera pelo lock antes de 'database is locked'")
+    SQLITE_TEMP_STORE: str = Field("MEMORY", description="temp_store (MEMORY, FILE ou DEFAULT)")
+    SQLITE_FOREIGN_KEYS: bool = Field(True, description="Aplicar as FOREIGN KEYs (PRAGMA foreign_keys)")
+    SQLITE_CHECKPOINT_SECONDS: float = Field(300, description="Intervalo do wal_checkpoint(TRUNCATE)")
+    SQLITE_OPTIMIZE_SECONDS: float = Field(3600, description="Intervalo do PRAGMA optimize")
+
+    # Escritas: direct = transação por chamada; queue = escritor único com group commit
+    DB_WRITE_MODE: Literal["direct", "queue"] = Field("direct", description="Modo de escrita dos repositories")
+    DB_WRITE_BATCH_SIZE: int = Field(100, description="Operações por commit no modo queue")
+    DB_WRITE_MAX_PENDING: int = Field(10000, description="Escritas enfileiradas antes de bloquear quem enfileira")
+
+    # Arquivo de tickets (infra/jobs/ticket_archive.py)
+    ARCHIVE_TICKETS_AFTER_DAYS: int = Field(
+        180, description="Tickets encerrados/cancelados há mais dias que isso vão para o arquivo"
+    )
+    ARCHIVE_CHUNK_SIZE: int = Field(500, description="Tickets movidos por transação")
+    ARCHIVE_PAUSE_SECONDS: float = Field(0.05, description="Pausa entre lotes (libera o lock de escrita)")
+
+    # Retenção de soft delete (infra/jobs/soft_delete_purge.py)
+    PURGE_AFTER_DAYS: int = Field(365, description="Linhas INATIVAS há mais dias que isso são removidas/arquivadas")
+    PURGE_CHUNK_SIZE: int = Field(1000, description="Linhas removidas por transação")
+    PURGE_PAUSE_SECONDS: float = Field(0.05, description="Pausa entre lotes (libera o lock de escrita)")
+
+    # Exportações para BI (infra/exports)
+    EXPORT_CHUNK_SIZE: int = Field(5000, description="Linhas lidas/escritas por lote nas exportações")
+
+    # Feed de mudanças (infra/exports/change_feed.py)
+    CDC_PAGE_SIZE: int = Field(500, description="Linhas por página do feed de mudanças")
+    CDC_SETTLE_SECONDS: int = Field(
+        10, description="Linhas alteradas há menos que isso ainda não saem no feed (transações em andamento)"
+    )
+
+    # Sincronização do RH (infra/jobs/hr_sync.py)
+    HR_SYNC_BATCH_SIZE: int = Field(1000, description="Registros do RH por transação")
+    HR_SYNC_MAX_DEPARTURE_RATIO: float = Field(
+        0.1, description="Fração máxima de usuários sincronizados desligados numa execução (acima: não aplica)"
+    )
+
     # Segurança
     SECRET_KEY: str = Field(
         ..., min_length=32,description="Secret Key JWT"
     )
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(...)
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(...)
+    TOKEN_ALGORITHM: str = Field("HS256", description="Algoritmo de assinatura JWT")
+    TOKEN_CACHE_SIZE: int = Field(
+        10000, description="Tokens com claims já verificados mantidos em cache (LRU)"
+    )
+    USER_CACHE_SIZE: int = Field(1000, description="Usuários autenticados mantidos em cache (LRU)")
+    USER_CACHE_TTL_SECONDS: float = Field(60, description="Validade de um usuário no cache")
+
+    # Índice de visibilidade (relatórios/projetos)
+    VISIBILITY_CHECK_SECONDS: float = Field(
+        1, description="Intervalo mínimo entre conferências do índice com o banco (escritas de outros processos)"
+    )
+    VISIBILITY_MAX_AGE_SECONDS: float = Field(
+        300, description="Recarga completa de um segmento do índice após este tempo"
+    )
+
+    # Senhas (bcrypt em pool de processos)
+    PASSWORD_BCRYPT_ROUNDS: int = Field(
+        12, description="Custo do bcrypt (hashes com outro custo são regravados no login)"
+    )
+    PASSWORD_HASH_WORKERS: int | None = Field(
+        None, description="Processos do pool de hash (None = nº de CPUs)"
+    )
+    PASSWORD_VERIFY_PER_USER: int = Field(
+        2, description="Verificações de senha simultâneas por usuário"
+    )
+
+    # Notificações
+    NOTIFICATION_DIGEST_SECONDS: float = Field(
+        60, description="Janela de agrupamento (digest) dos eventos de notificação"
+    )
+    NOTIFICATION_BATCH_SIZE: int = Field(
+        500, description="Linhas por INSERT em lote de notificações"
+    )
+    NOTIFICATION_MAX_BUFFER: int = Field(
+        10000, description="Eventos pendentes que forçam flush antes da janela (acima disso, descarta os mais antigos)"
+    )
+
+    # E-mail (SMTP + outbox)
+    SMTP_HOST: str = Field("localhost", description="Servidor SMTP")
+    SMTP_PORT: int = Field(1025, description="Porta SMTP (1025 = aiosmtpd local)")
+    SMTP_USERNAME: str | None = Field(None, description="Usuário SMTP (None = sem AUTH)")
+    SMTP_PASSWORD: str | None = Field(None, description="Senha SMTP")
+    SMTP_STARTTLS: bool = Field(False, description="Usar STARTTLS na conexão")
+    SMTP_FROM: str = Field("portal@localhost", description="Remetente dos e-mails")
+    OUTBOX_BATCH_SIZE: int = Field(50, description="E-mails enviados por conexão SMTP")
+    OUTBOX_CONCURRENCY: int = Field(4, description="Conexões SMTP simultâneas")
+    OUTBOX_MAX_ATTEMPTS: int = Field(5, description="Tentativas antes de marcar FALHOU")
+    OUTBOX_BACKOFF_SECONDS: float = Field(30, description="Espera base do backoff exponencial")
+    OUTBOX_POLL_SECONDS: float = Field(5, description="Intervalo de polling com a outbox vazia")
+
+    # Formulários
+    FORM_VALIDATOR_CACHE_SIZE: int = Field(
+        256, description="Validadores de formulário compilados mantidos em cache (LRU)"
+    )
+
+    # Anexos
+    ATTACHMENTS_DIR: str = Field(
+        "storage/attachments", description="Diretório do store de anexos (endereçado por SHA-256)"
+    )
+    ATTACHMENT_CHUNK_SIZE: int = Field(1024 * 1024, description="Bytes por chunk no upload")
+    ATTACHMENT_MAX_SIZE: int = Field(50 * 1024 * 1024, description="Tamanho máximo de um anexo (bytes)")
 
     class Config:
         env_file = ".env" # Arquivo de onde lê as variáveis
@@ -0,0 +1,164 @@
+"""
+Soft delete / restore em cascata, por conjunto (set-based).
+
+Regras declaradas nas entidades, como nomes de relationships
+um-para-muitos cujos filhos "pertencem" ao pai:
+
+    class Ticket(Base):
+        __soft_cascade__ = ("chat", "attendants", "teams", "followers")
+
+Soft delete de um Ticket inativa também chat, atendentes, times e
+seguidores; as regras de Chat (mensagens, ponteiros) valem em seguida,
+e assim por diante. Cada tabela do subgrafo recebe UM UPDATE, com os
+filhos selecionados por subquery (nenhuma linha é carregada no Python),
+todos na transação do chamador e com o MESMO deleted_at/deleted_by.
+
+O carimbo (deleted_at) delimita o subgrafo:
+    - delete (pais → filhos): desce só por pais carimbados NESTA operação;
+      filho que já estava inativo mantém o próprio carimbo
+    - restore (filhos → pais): reativa só o que tem o carimbo da raiz, ou
+      seja, o que foi apagado junto com ela; o que já estava apagado antes
+      continua apagado
+
+Os UPDATEs são ORM (update(Model)): passam pelo do_orm_execute, e o
+índice de visibilidade marca os segmentos afetados como desatualizados.
+
+Uso (BaseRepository.soft_delete/restore já usam):
+    counts = soft_delete_cascade(session, Project, [project_id], deleted_by=user_id)
+    counts = restore_cascade(session, Project, [project_id])
+    # {"projects": 1, "tickets": 10000, "chats": 10000, "messages": ...}
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import Column, and_, inspect, or_, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import ONETOMANY
+
+from infra.configs.audit import current_user_id
+from infra.configs.database import Base, Status
+
+
+@dataclass(frozen=True)
+class CascadeStep:
+    """Um nó do plano: `model` alcançado a partir de `parent` pela FK child_column."""
+    model: type[Base]
+    depth: int
+    parent: "CascadeStep | None" = None
+    parent_column: Column | None = None
+    child_column: Column | None = None
+
+
+@lru_cache(maxsize=None)
+def cascade_plan(model: type[Base]) -> tuple[CascadeStep, ...]:
+    """
+    Passos da cascata a partir de `model` (a raiz é o primeiro), seguindo
+    __soft_cascade__ recursivamente. Um modelo já presente no caminho não
+    é visitado de novo (evita ciclos).
+    """
+    root = CascadeStep(model, 0)
+    steps = [root]
+
+    def visit(step: CascadeStep, path: tuple) -> None:
+        for name in getattr(step.model, "__soft_cascade__", ()):
+            relationship = inspect(step.model).relationships[name]
+            if relationship.direction is not ONETOMANY:
+                raise ValueError(f"{step.model.__name__}.{name}: cascata só em relationships um-para-muitos")
+            child = relationship.mapper.class_
+            if child in path:
+                continue
+            (parent_column, child_column), = relationship.local_remote_pairs
+            child_step = CascadeStep(child, step.depth + 1, step, parent_column, child_column)
+            steps.append(child_step)
+            visit(child_step, path + (child,))
+
+    visit(root, (model,))
+    return tuple(steps)
+
+
+def _tables(model: type[Base]) -> list[tuple[type[Base], list[CascadeStep]]]:
+    """Passos agrupados por entidade (um UPDATE por tabela), pais antes dos filhos."""
+    grouped: dict[type[Base], list[CascadeStep]] = {}
+    for step in cascade_plan(model):
+        grouped.setdefault(step.model, []).append(step)
+    return sorted(grouped.items(), key=lambda item: max(step.depth for step in item[1]))
+
+
+def _rows(step: CascadeStep, ids: list[int], stamp):
+    """Linhas do passo: raiz por id; filho por FK IN (pais com o carimbo)."""
+    if step.parent is None:
+        return step.model.id.in_(ids)
+    parents = select(step.parent_column).where(
+        _rows(step.parent, ids, stamp), step.parent.model.deleted_at == stamp
+    )
+    return step.child_column.in_(parents)
+
+
+def soft_delete_cascade(session: Session, model: type[Base], ids: list[int],
+                        deleted_by: int | None = None, stamp: datetime | None = None) -> dict[str, int]:
+    """
+    Soft delete das raízes `ids` e de todo o subgrafo declarado.
+    deleted_by=None: usuário do contexto (infra/configs/audit.py).
+
+    Returns:
+        {tabela: linhas inativadas} (raiz com 0 = não existia ou já inativa)
+    """
+    stamp = stamp or datetime.now()
+    if deleted_by is None:
+        deleted_by = current_user_id()
+    counts = {}
+    for entity, steps in _tables(model):
+        result = session.execute(
+            update(entity)
+            .where(or_(*[_rows(step, ids, stamp) for step in steps]), entity.active_clause())
+            .values(active=Status.INATIVO, deleted_at=stamp, deleted_by=deleted_by),
+            execution_options={"synchronize_session": False}
+        )
+        counts[entity.__tablename__] = result.rowcount
+    return counts
+
+
+def _restored_rows(step: CascadeStep, ids: list[int], row: type[Base]):
+    """
+    Linhas do passo apagadas junto com alguma raiz de `ids`.
+
+    `row` é o modelo da linha do nível de baixo (o do UPDATE, ou o da
+    subquery que envolve esta): o pai é buscado pela FK dela (PK do pai,
+    busca por índice) e precisa ter o MESMO deleted_at, e assim por diante
+    até a raiz. Cada raiz delimita o próprio subgrafo pelo próprio carimbo.
+    """
+    if step.parent is None:
+        # Raiz inativa sem carimbo não foi apagada por cascata: fica como está
+        return and_(step.model.id.in_(ids), step.model.active == Status.INATIVO, step.model.deleted_at.is_not(None))
+    parent = step.parent.model
+    return select(parent.id).where(
+        step.parent_column == step.child_column,
+        parent.deleted_at == row.deleted_at,
+        _restored_rows(step.parent, ids, parent)
+    ).exists()
+
+
+def restore_cascade(session: Session, model: type[Base], ids: list[int]) -> dict[str, int]:
+    """
+    Restaura as raízes `ids` e o que foi inativado junto com cada uma
+    (mesmo deleted_at da própria raiz). Um UPDATE por tabela para todas as
+    raízes, filhos primeiro: as raízes mantêm o carimbo até o fim e servem
+    de referência.
+
+    Returns:
+        {tabela: linhas restauradas}
+    """
+    counts = {}
+    for entity, steps in reversed(_tables(model)):
+        result = session.execute(
+            update(entity)
+            .where(
+                entity.active == Status.INATIVO,
+                or_(*[_restored_rows(step, ids, entity) for step in steps])
+            )
+            .values(active=Status.ATIVO, deleted_at=None, deleted_by=None),
+            execution_options={"synchronize_session": False}
+        )
+        counts[entity.__tablename__] = result.rowcount
+    return counts
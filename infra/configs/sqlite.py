@@ -0,0 +1,132 @@
+"""
+Perfil de PRAGMAs do SQLite e manutenção periódica.
+
+Aplicado em TODA conexão nova do pool (evento "connect" do engine):
+
+    journal_mode=WAL        leitores não bloqueiam o escritor (e vice-versa)
+    synchronous=NORMAL      fsync só no checkpoint (seguro com WAL; pode perder
+                            a última transação numa queda de energia, não corrompe)
+    mmap_size               leitura das páginas por memória mapeada
+    cache_size              cache de páginas por conexão (negativo = KiB)
+    busy_timeout            espera o lock em vez de falhar com "database is locked"
+    temp_store=MEMORY       tabelas temporárias (ORDER BY/GROUP BY grandes) em RAM
+    foreign_keys=ON         o SQLite só aplica os FKs (RESTRICT, SET NULL) com isso
+
+Manutenção (SQLiteMaintenance, thread em background):
+    - PRAGMA wal_checkpoint(TRUNCATE): impede o arquivo -wal de crescer sem limite
+    - PRAGMA optimize: atualiza estatísticas do planner quando vale a pena
+
+Em outros bancos (PostgreSQL) nada disso é aplicado.
+"""
+import logging
+import threading
+import time
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from infra.configs.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def pragma_profile() -> dict:
+    """PRAGMAs configurados em Settings (SQLITE_*), na ordem em que são aplicados."""
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "foreign_keys": "ON" if settings.SQLITE_FOREIGN_KEYS else "OFF",
+    }
+
+
+def install_pragmas(engine: Engine, pragmas: dict | None = None) -> None:
+    """Registra o evento que aplica os PRAGMAs a cada conexão nova do engine."""
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = pragma_profile() if pragmas is None else pragmas
+
+    @event.listens_for(engine, "connect")
+    def _apply(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                if value is not None:
+                    cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+class SQLiteMaintenance:
+    """
+    Checkpoint do WAL e PRAGMA optimize em intervalos fixos.
+
+    Uso:
+        sqlite_maintenance.start(engine)   # no startup da API
+        sqlite_maintenance.stop()          # no shutdown (faz um último checkpoint)
+    """
+
+    def __init__(self, checkpoint_seconds: float = 300, optimize_seconds: float = 3600):
+        self.checkpoint_seconds = checkpoint_seconds
+        self.optimize_seconds = optimize_seconds
+        self._engine: Engine | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, engine: Engine) -> None:
+        """Inicia a thread de manutenção (ignorado fora do SQLite)."""
+        if engine.dialect.name != "sqlite" or (self._thread and self._thread.is_alive()):
+            return
+        self._engine = engine
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sqlite-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Para a thread e faz checkpoint + optimize finais."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+            self.run_once(optimize=True)
+
+    def run_once(self, optimize: bool = False) -> tuple | None:
+        """
+        Executa um checkpoint (e o optimize, se pedido).
+
+        Returns:
+            (busy, páginas no WAL, páginas copiadas) do wal_checkpoint
+        """
+        if self._engine is None:
+            return None
+        with self._engine.connect() as connection:
+            result = connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)").first()
+            if optimize:
+                connection.execute(text("PRAGMA optimize"))
+            connection.commit()
+        return tuple(result) if result else None
+
+    def _run(self) -> None:
+        last_optimize = time.monotonic()
+        while not self._stop.wait(self.checkpoint_seconds):
+            optimize = time.monotonic() - last_optimize >= self.optimize_seconds
+            try:
+                self.run_once(optimize=optimize)
+            except Exception:
+                logger.exception("Falha na manutenção do SQLite; nova tentativa no próximo intervalo")
+                continue
+            if optimize:
+                last_optimize = time.monotonic()
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.configs.sqlite import sqlite_maintenance
+# =========================================================================
+sqlite_maintenance = SQLiteMaintenance(
+    checkpoint_seconds=settings.SQLITE_CHECKPOINT_SECONDS,
+    optimize_seconds=settings.SQLITE_OPTIMIZE_SECONDS
+)
@@ -0,0 +1,87 @@
+"""
+Controle de concorrência otimista (coluna version), sem locks.
+
+Entidades com edição concorrente herdam o mixin Versioned:
+
+    class Ticket(Versioned, Base):
+        ...
+
+    - version começa em 1 e sobe a cada UPDATE da linha
+    - select_by_id()/to_dict() devolvem a versão lida
+    - update(..., expected_version=v) vira UM UPDATE condicional:
+          UPDATE tickets SET ..., version = version + 1
+          WHERE id = :id AND active = 'ATIVO' AND version = :v
+      0 linhas e o registro existe → VersionConflictError (alguém gravou
+      antes); nenhuma linha fica bloqueada entre a leitura e a escrita
+
+Todo UPDATE em lote de uma entidade versionada (query.update,
+update(Model): update_status, json_set, soft delete em cascata...) ganha
+`version = version + 1` no próprio statement (do_orm_execute). Flush de
+objetos ORM usa o version_id_col do mapper (StaleDataError no conflito).
+
+Escritas de sistema que não mudam o que o usuário edita (ticket_mail_sent_at
+do outbox, append de anexo) não devem invalidar a versão que um atendente
+tem na tela; elas marcam o statement com SKIP_VERSION_BUMP:
+
+    session.execute(update(Ticket).where(...).values(...),
+                    execution_options=SKIP_VERSION_BUMP)
+    query.execution_options(**SKIP_VERSION_BUMP).update(...)
+
+Uso:
+    ticket = repo.select_by_id(7)                      # {"version": 3, ...}
+    try:
+        repo.update_status(7, TicketStatus.PAUSADO, expected_version=ticket["version"])
+    except VersionConflictError as conflict:
+        ...                                            # 409: recarregar e tentar de novo
+"""
+from sqlalchemy import Integer, event
+from sqlalchemy.orm import Mapped, MappedAsDataclass, Session, declared_attr, mapped_column
+
+# execution_options de UPDATEs em lote que não sobem a versão
+SKIP_VERSION_BUMP = {"skip_version_bump": True}
+
+
+class VersionConflictError(ValueError):
+    """O registro mudou desde a leitura (a versão esperada não é mais a atual)."""
+
+    def __init__(self, entity: str, id: int, expected: int, current: int):
+        super().__init__(f"{entity} #{id}: versão {expected} esperada, atual é {current}")
+        self.entity = entity
+        self.id = id
+        self.expected = expected
+        self.current = current
+
+
+class Versioned(MappedAsDataclass):
+    """
+    Mixin: coluna version como version_id_col do mapper.
+
+    Colocar ANTES de Base na herança: class Project(Versioned, Base).
+    """
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="1",
+        init=False,
+        doc="Versão da linha (controle de concorrência otimista)"
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        return {"version_id_col": cls.__table__.c.version}
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_bulk(orm_execute_state):
+    if not orm_execute_state.is_update or orm_execute_state.execution_options.get("skip_version_bump"):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.version_id_col is None:
+        return
+    statement = orm_execute_state.statement
+    if getattr(statement, "_values", None) is None:
+        return
+    present = {getattr(key, "key", key) for key in statement._values}
+    column = mapper.version_id_col
+    if column.key not in present:
+        orm_execute_state.statement = statement.values({column.key: column + 1})
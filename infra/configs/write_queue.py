@@ -0,0 +1,186 @@
+"""
+Fila de escrita com um único escritor (modo DB_WRITE_MODE=queue).
+
+O SQLite aceita UM escritor por vez. Com várias threads/tarefas gravando,
+cada uma disputa o lock e, sob carga, algumas desistem com
+"database is locked". Neste modo:
+
+    repository.insert(...)          # thread da requisição
+        → write_queue.submit(fn)    # enfileira fn(session) e devolve um Future
+        → thread "db-writer"        # dona da conexão de escrita
+              BEGIN IMMEDIATE
+              SAVEPOINT → fn₁(session) → RELEASE   (falha: ROLLBACK TO, só fn₁ falha)
+              SAVEPOINT → fn₂(session) → RELEASE
+              ...
+              COMMIT                              # group commit: 1 fsync para o lote
+        → Future resolvido DEPOIS do commit (o chamador só vê dado durável)
+
+Leituras continuam indo direto ao banco (WAL: não esperam o escritor).
+
+O contexto (contextvars) de quem enfileirou é copiado no submit e a
+operação roda dentro dele: usuário da requisição, auditoria etc. valem
+também na thread do escritor.
+"""
+import asyncio
+import contextvars
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from infra.configs.connection import get_engine
+from infra.configs.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _WriteOperation:
+    fn: Callable[[Session], Any]
+    context: contextvars.Context
+    future: Future = field(default_factory=Future)
+
+
+class WriteQueue:
+    """
+    Uso:
+        future = write_queue.submit(lambda session: ...)   # Future
+        result = future.result()
+        result = await write_queue.submit_async(fn)        # em rotas async
+
+    Normalmente usado via BaseRepository._run_write / submit_write.
+    """
+
+    def __init__(self, batch_size: int = 100, max_pending: int = 10000):
+        self.batch_size = batch_size
+        self._queue: queue.Queue[_WriteOperation | None] = queue.Queue(maxsize=max_pending)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._session: Session | None = None
+        self.batches = 0
+        self.operations = 0
+
+    # =========================================================================
+    # API
+    # =========================================================================
+
+    def submit(self, fn: Callable[[Session], Any]) -> Future:
+        """
+        Enfileira fn(session) para o escritor.
+
+        Chamado de dentro de uma operação que já está no escritor (ex: um
+        repository que chama outro), roda na hora, na mesma transação.
+        """
+        if self._in_writer():
+            future = Future()
+            try:
+                future.set_result(fn(self._session))
+            except Exception as error:
+                future.set_exception(error)
+            return future
+
+        self.start()
+        operation = _WriteOperation(fn=fn, context=contextvars.copy_context())
+        self._queue.put(operation)
+        return operation.future
+
+    async def submit_async(self, fn: Callable[[Session], Any]) -> Any:
+        """submit() aguardável (não bloqueia o event loop)."""
+        return await asyncio.wrap_future(self.submit(fn))
+
+    # =========================================================================
+    # WORKER
+    # =========================================================================
+
+    def start(self) -> None:
+        """Inicia a thread do escritor (também é iniciada no primeiro submit)."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Processa o que já está na fila e encerra o escritor."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread:
+            self._queue.put(None)
+            thread.join()
+
+    def _in_writer(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    operation = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if operation is None:
+                    stop = True
+                    break
+                batch.append(operation)
+            self._apply(batch)
+            if stop:
+                return
+
+    @staticmethod
+    def _savepoint(fn: Callable[[Session], Any], session: Session) -> Any:
+        with session.begin_nested():
+            return fn(session)
+
+    def _apply(self, batch: list[_WriteOperation]) -> None:
+        """Aplica o lote numa transação; cada operação no seu SAVEPOINT."""
+        engine, session_factory = get_engine()
+        session = session_factory()
+        self._session = session
+        results: list[tuple[_WriteOperation, Any, BaseException | None]] = []
+        try:
+            if engine.dialect.name == "sqlite":
+                # Pega o lock de escrita já no início (sem upgrade de leitura → escrita)
+                session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+            for operation in batch:
+                try:
+                    # SAVEPOINT dentro do contexto: o flush do RELEASE (e os
+                    # eventos before_flush, ex. auditoria) veem o contexto de quem enfileirou
+                    result = operation.context.run(self._savepoint, operation.fn, session)
+                    results.append((operation, result, None))
+                except Exception as error:
+                    results.append((operation, None, error))
+            session.commit()
+        except Exception as error:
+            logger.exception("Falha no commit do lote de escrita (%d operações)", len(batch))
+            session.rollback()
+            results = [(operation, None, error) for operation in batch]
+        finally:
+            self._session = None
+            session.close()
+
+        self.batches += 1
+        self.operations += len(batch)
+        for operation, result, error in results:
+            if error is not None:
+                operation.future.set_exception(error)
+            else:
+                operation.future.set_result(result)
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.configs.write_queue import write_queue
+# =========================================================================
+write_queue = WriteQueue(
+    batch_size=settings.DB_WRITE_BATCH_SIZE,
+    max_pending=settings.DB_WRITE_MAX_PENDING
+)
@@ -7,6 +7,9 @@ from .ticket import Ticket
 from .form import Form
 from .chat import Chat
 from .message import Message
+from .chat_read_pointer import ChatReadPointer
+from .notification import Notification
+from .outbox import OutboxMessage
 
 # Tabelas de associação N-N
 from .associations import (
@@ -35,6 +38,9 @@ __all__ = [
     'Form',
     'Chat',
     'Message',
+    'ChatReadPointer',
+    'Notification',
+    'OutboxMessage',
     # Enums de associação
     'ApprovalStatus',
     # Tabelas de associação
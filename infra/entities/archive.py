@@ -0,0 +1,62 @@
+"""
+Tabelas de arquivo (archive_*) para tickets encerrados/cancelados.
+
+Tickets fechados há muito tempo, com chat, mensagens, ponteiros de leitura
+e associações, saem das tabelas quentes para cópias frias no MESMO banco:
+
+    tickets              →  archive_tickets
+    chats                →  archive_chats
+    messages             →  archive_messages
+    chat_read_pointers   →  archive_chat_read_pointers
+    ticket_attendants    →  archive_ticket_attendants
+    ticket_teams         →  archive_ticket_teams
+    user_ticket_follows  →  archive_user_ticket_follows
+
+Cada tabela de arquivo tem as MESMAS colunas (mesmos tipos, então Enums e
+JSON voltam convertidos na leitura) mais archived_at. Sem FKs: o arquivo
+não impede purgar usuários/times depois. Mesmo banco = a cópia e a remoção
+de um lote acontecem na mesma transação (ver ArchiveRepository).
+
+Não são entidades ORM (nada de relationships/lazy loads): são Tables Core
+em archive_metadata, criadas pela migração e lidas por ArchiveRepository.
+
+IMPORTANTE: coluna nova numa tabela quente = mesma coluna na archive_*,
+na mesma migração (o INSERT ... SELECT do arquivamento copia coluna a coluna).
+"""
+from sqlalchemy import Column, DateTime, Index, MetaData, Table, func
+
+from infra.configs.database import Base
+from infra.entities.associations import TicketAttendant, TicketTeam, UserTicketFollow
+from infra.entities.chat import Chat
+from infra.entities.chat_read_pointer import ChatReadPointer
+from infra.entities.message import Message
+from infra.entities.ticket import Ticket
+
+archive_metadata = MetaData()
+
+
+def _archive_table(model: type[Base], *indexes: tuple[str, ...]) -> Table:
+    """Cópia das colunas de `model` (sem FKs/constraints) + archived_at."""
+    name = f"archive_{model.__tablename__}"
+    columns = [
+        Column(column.name, column.type, primary_key=column.primary_key,
+               autoincrement=False, nullable=column.nullable)
+        for column in model.__table__.columns
+    ]
+    return Table(
+        name, archive_metadata, *columns,
+        Column("archived_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+        *[Index(f"ix_{name}_{index_columns[0]}", *index_columns) for index_columns in indexes]
+    )
+
+
+# tabela quente -> tabela de arquivo (na ordem pai → filho)
+ARCHIVE_TABLES: dict[str, Table] = {
+    "tickets": _archive_table(Ticket),
+    "chats": _archive_table(Chat, ("chat_ticket_id",)),
+    "messages": _archive_table(Message, ("message_chat_id", "created_at")),
+    "chat_read_pointers": _archive_table(ChatReadPointer, ("pointer_chat_id",)),
+    "ticket_attendants": _archive_table(TicketAttendant, ("ticket_id",)),
+    "ticket_teams": _archive_table(TicketTeam, ("ticket_id",)),
+    "user_ticket_follows": _archive_table(UserTicketFollow, ("ticket_id",)),
+}
@@ -13,12 +13,12 @@ Organização:
 6. Tabelas de Follow (user follows report/project/ticket)
 """
 
-from sqlalchemy import ForeignKey, Integer, String, DateTime, Enum, func
+from sqlalchemy import ForeignKey, Integer, String, DateTime, Enum, func, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from infra.configs.database import Base
+from infra.configs.database import MONOTONIC_IDS, Base
 
 
 # =============================================================================
@@ -47,6 +47,12 @@ class ProjectApproval(Base):
         - Aprovação do próximo só é liberada após anterior aprovar
     """
     __tablename__ = "project_approvals"
+    __table_args__ = (
+        # Fila de aprovação do projeto (em ordem)
+        Index('ix_project_approvals_project', 'project_id', 'approval_order'),
+        # Aprovações pendentes de um aprovador
+        Index('ix_project_approvals_approver', 'approver_id', 'project_id'),
+    )
 
     # Identificação do projeto e aprovador
     project_id: Mapped[int] = mapped_column(
@@ -105,6 +111,12 @@ class ProjectApproval(Base):
 class ProjectAnalyst(Base):
     """Analistas atribuídos a um projeto"""
     __tablename__ = "project_analysts"
+    __table_args__ = (
+        # Pessoas do projeto
+        Index('ix_project_analysts_project', 'project_id', 'user_id'),
+        # Projetos da pessoa
+        Index('ix_project_analysts_user', 'user_id', 'project_id'),
+    )
 
     project_id: Mapped[int] = mapped_column(
         ForeignKey("projects.id", ondelete="RESTRICT"),
@@ -139,6 +151,12 @@ class ProjectAnalyst(Base):
 class ProjectSponsor(Base):
     """Patrocinadores de um projeto"""
     __tablename__ = "project_sponsors"
+    __table_args__ = (
+        # Pessoas do projeto
+        Index('ix_project_sponsors_project', 'project_id', 'user_id'),
+        # Projetos da pessoa
+        Index('ix_project_sponsors_user', 'user_id', 'project_id'),
+    )
 
     project_id: Mapped[int] = mapped_column(
         ForeignKey("projects.id", ondelete="RESTRICT"),
@@ -167,6 +185,12 @@ class ProjectSponsor(Base):
 class ProjectOwner(Base):
     """Donos/responsáveis de um projeto"""
     __tablename__ = "project_owners"
+    __table_args__ = (
+        # Pessoas do projeto
+        Index('ix_project_owners_project', 'project_id', 'user_id'),
+        # Projetos da pessoa
+        Index('ix_project_owners_user', 'user_id', 'project_id'),
+    )
 
     project_id: Mapped[int] = mapped_column(
         ForeignKey("projects.id", ondelete="RESTRICT"),
@@ -195,6 +219,12 @@ class ProjectOwner(Base):
 class ProjectClient(Base):
     """Clientes de um projeto"""
     __tablename__ = "project_clients"
+    __table_args__ = (
+        # Pessoas do projeto
+        Index('ix_project_clients_project', 'project_id', 'user_id'),
+        # Projetos da pessoa
+        Index('ix_project_clients_user', 'user_id', 'project_id'),
+    )
 
     project_id: Mapped[int] = mapped_column(
         ForeignKey("projects.id", ondelete="RESTRICT"),
@@ -223,6 +253,12 @@ class ProjectClient(Base):
 class ProjectAllowedUser(Base):
     """Usuários com permissão de acesso a um projeto (além dos públicos)"""
     __tablename__ = "project_allowed_users"
+    __table_args__ = (
+        # Pessoas do projeto
+        Index('ix_project_allowed_users_project', 'project_id', 'user_id'),
+        # Projetos da pessoa
+        Index('ix_project_allowed_users_user', 'user_id', 'project_id'),
+    )
 
     project_id: Mapped[int] = mapped_column(
         ForeignKey("projects.id", ondelete="RESTRICT"),
@@ -255,6 +291,13 @@ class ProjectAllowedUser(Base):
 class TicketAttendant(Base):
     """Atendentes/responsáveis atribuídos a um ticket"""
     __tablename__ = "ticket_attendants"
+    __table_args__ = (
+        # Caixa de entrada: "tickets que eu atendo"
+        Index('ix_ticket_attendants_user', 'user_id', 'ticket_id'),
+        # Atendentes do ticket
+        Index('ix_ticket_attendants_ticket', 'ticket_id', 'user_id'),
+        MONOTONIC_IDS,
+    )
 
     ticket_id: Mapped[int] = mapped_column(
         ForeignKey("tickets.id", ondelete="RESTRICT"),
@@ -289,6 +332,13 @@ class TicketAttendant(Base):
 class TicketTeam(Base):
     """Times atribuídos a um ticket"""
     __tablename__ = "ticket_teams"
+    __table_args__ = (
+        # Caixa de entrada: "tickets do meu time"
+        Index('ix_ticket_teams_team', 'team_id', 'ticket_id'),
+        # Times do ticket
+        Index('ix_ticket_teams_ticket', 'ticket_id', 'team_id'),
+        MONOTONIC_IDS,
+    )
 
     ticket_id: Mapped[int] = mapped_column(
         ForeignKey("tickets.id", ondelete="RESTRICT"),
@@ -327,6 +377,12 @@ class TicketTeam(Base):
 class ReportAllowedUser(Base):
     """Usuários com permissão de acesso a um relatório (além dos públicos)"""
     __tablename__ = "report_allowed_users"
+    __table_args__ = (
+        # Pessoas com acesso ao relatório
+        Index('ix_report_allowed_users_report', 'report_id', 'user_id'),
+        # Relatórios liberados para a pessoa
+        Index('ix_report_allowed_users_user', 'user_id', 'report_id'),
+    )
 
     report_id: Mapped[int] = mapped_column(
         ForeignKey("reports.id", ondelete="RESTRICT"),
@@ -359,6 +415,12 @@ class ReportAllowedUser(Base):
 class UserReportFollow(Base):
     """Usuário segue um relatório para receber notificações"""
     __tablename__ = "user_report_follows"
+    __table_args__ = (
+        # Seguidores do relatório (notificações)
+        Index('ix_user_report_follows_report', 'report_id', 'user_id'),
+        # Relatórios que a pessoa segue
+        Index('ix_user_report_follows_user', 'user_id', 'report_id'),
+    )
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"),
@@ -393,6 +455,12 @@ class UserReportFollow(Base):
 class UserProjectFollow(Base):
     """Usuário segue um projeto para receber notificações"""
     __tablename__ = "user_project_follows"
+    __table_args__ = (
+        # Seguidores do projeto (notificações)
+        Index('ix_user_project_follows_project', 'project_id', 'user_id'),
+        # Projetos que a pessoa segue
+        Index('ix_user_project_follows_user', 'user_id', 'project_id'),
+    )
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"),
@@ -427,6 +495,13 @@ class UserProjectFollow(Base):
 class UserTicketFollow(Base):
     """Usuário segue um ticket para receber notificações"""
     __tablename__ = "user_ticket_follows"
+    __table_args__ = (
+        # Caixa de entrada: "tickets que eu sigo"
+        Index('ix_user_ticket_follows_user', 'user_id', 'ticket_id'),
+        # Seguidores do ticket (notificações)
+        Index('ix_user_ticket_follows_ticket', 'ticket_id', 'user_id'),
+        MONOTONIC_IDS,
+    )
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"),
@@ -1,12 +1,13 @@
 from sqlalchemy import ForeignKey, String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from infra.configs.database import Base
+from infra.configs.database import MONOTONIC_IDS, Base
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from infra.entities.ticket import Ticket
     from infra.entities.message import Message
+    from infra.entities.chat_read_pointer import ChatReadPointer
 
 
 class Chat(Base):
@@ -22,6 +23,7 @@ class Chat(Base):
 
         1-N (Chat possui muitos):
             - messages: Mensagens do chat
+            - read_pointers: Ponteiros de leitura dos participantes
 
     Índices:
         - ix_chats_ticket: Índice único pelo ticket_id
@@ -42,8 +44,12 @@ class Chat(Base):
     # O índice único já está no campo (unique=True)
     __table_args__ = (
         Index('ix_chats_ticket', 'chat_ticket_id', unique=True),
+        MONOTONIC_IDS,
     )
 
+    # Soft delete/restore em cascata (infra/configs/soft_cascade.py)
+    __soft_cascade__ = ("messages", "read_pointers")
+
     # =========================================================================
     # FOREIGN KEYS
     # =========================================================================
@@ -81,5 +87,13 @@ class Chat(Base):
         default_factory=list
     )
 
+    # 1 - N (Ponteiros de leitura por usuário)
+    read_pointers: Mapped[list["ChatReadPointer"]] = relationship(
+        back_populates="chat",
+        lazy="raise",
+        init=False,
+        default_factory=list
+    )
+
     def __repr__(self) -> str:
         return f"<Chat(id={self.id}, chat_ticket_id={self.chat_ticket_id})>"
@@ -0,0 +1,115 @@
+from sqlalchemy import ForeignKey, Integer, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
+
+from infra.configs.database import MONOTONIC_IDS, Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from infra.entities.chat import Chat
+    from infra.entities.user import User
+
+
+class ChatReadPointer(Base):
+    """
+    Ponteiro de leitura de um usuário em um chat (badge de não lidas).
+
+    Guarda até qual mensagem o usuário leu e um contador de não lidas
+    mantido na escrita: MessageRepository.create incrementa, na MESMA
+    transação da mensagem, o contador de cada participante que pode ver
+    a mensagem (mensagens internas não contam para SOLICITANTE).
+    A leitura zera o contador. Assim o badge é uma leitura de coluna,
+    nunca um COUNT(*) sobre messages.
+
+    Participantes: cliente do ticket, atendentes e seguidores (o ponteiro
+    é criado na primeira mensagem depois que a pessoa entra) e qualquer
+    usuário que marcou o chat como lido.
+
+    Relacionamentos:
+        N-1 (ChatReadPointer pertence a):
+            - chat: Chat lido
+            - user: Usuário dono do ponteiro
+
+    Índices:
+        - ux_chat_read_pointers_user_chat: Um ponteiro por (usuário, chat);
+          atende a consulta de badges (usuário + lista de chats)
+        - ix_chat_read_pointers_chat: Incremento por chat a cada mensagem
+
+    Exemplo de Instanciação (Template Construtor):
+        ```python
+        # Campos OBRIGATÓRIOS no construtor:
+        pointer = ChatReadPointer(
+            pointer_chat_id=1,     # FK para Chat
+            pointer_user_id=1      # FK para User
+        )
+
+        # Campos OPCIONAIS (têm init=False):
+        # - pointer_last_read_message_id: Última mensagem lida (None = nenhuma)
+        # - pointer_last_read_at: Data/hora da última leitura
+        # - pointer_unread_count: 0 por padrão
+        ```
+    """
+    __tablename__ = "chat_read_pointers"
+
+    # Índices compostos para queries frequentes
+    __table_args__ = (
+        Index('ux_chat_read_pointers_user_chat', 'pointer_user_id', 'pointer_chat_id',
+              unique=True),
+        Index('ix_chat_read_pointers_chat', 'pointer_chat_id'),
+        # FK com SET NULL: sem índice, cada DELETE em messages varre a tabela
+        Index('ix_chat_read_pointers_last_message', 'pointer_last_read_message_id'),
+        MONOTONIC_IDS,
+    )
+
+    # =========================================================================
+    # FOREIGN KEYS
+    # =========================================================================
+    pointer_chat_id: Mapped[int] = mapped_column(
+        ForeignKey("chats.id", ondelete="RESTRICT"),
+        nullable=False,
+        doc="FK para Chat lido"
+    )
+    pointer_user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="RESTRICT"),
+        nullable=False,
+        doc="FK para User dono do ponteiro"
+    )
+
+    # =========================================================================
+    # LEITURA
+    # =========================================================================
+    pointer_last_read_message_id: Mapped[int | None] = mapped_column(
+        ForeignKey("messages.id", ondelete="SET NULL"),
+        nullable=True,
+        init=False,
+        doc="Última mensagem lida (None se nunca leu)"
+    )
+    pointer_last_read_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        init=False,
+        doc="Data/hora da última leitura"
+    )
+    pointer_unread_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", init=False,
+        doc="Mensagens visíveis ao usuário depois da última leitura"
+    )
+
+    # =========================================================================
+    # RELATIONSHIPS
+    # =========================================================================
+
+    # N - 1 (Ponteiro pertence a um Chat e a um User)
+    chat: Mapped["Chat"] = relationship(
+        back_populates="read_pointers",
+        lazy="raise",
+        init=False
+    )
+    user: Mapped["User"] = relationship(
+        back_populates="chat_read_pointers",
+        lazy="raise",
+        init=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<ChatReadPointer(pointer_chat_id={self.pointer_chat_id}, pointer_user_id={self.pointer_user_id}, pointer_unread_count={self.pointer_unread_count})>"
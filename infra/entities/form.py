@@ -3,6 +3,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum as PyEnum
 
 from infra.configs.database import Base
+from infra.configs.json_type import JSONType
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -59,7 +60,7 @@ class Form(Base):
             form_name="Bug em Relatório",
             form_ticket_class=FormClasse.RELATORIO,
             form_type=FormTipo.BUG,
-            form_fields='{"campos": [...]}'  # JSON com definição
+            form_fields={"campos": [...]}  # JSON com definição
         )
 
         # Campos OPCIONAIS (têm init=False):
@@ -104,8 +105,8 @@ class Form(Base):
     # =========================================================================
     # CONFIGURAÇÕES
     # =========================================================================
-    form_fields: Mapped[str] = mapped_column(
-        String, nullable=False,
+    form_fields: Mapped[dict] = mapped_column(
+        JSONType, nullable=False,
         doc="JSON com definição dos campos do formulário"
     )
     form_is_default: Mapped[bool] = mapped_column(
@@ -2,7 +2,8 @@ from sqlalchemy import ForeignKey, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 
-from infra.configs.database import Base
+from infra.configs.database import MONOTONIC_IDS, Base, changes_index
+from infra.configs.json_type import JSONType
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -23,8 +24,12 @@ class Message(Base):
             - user: Usuário que enviou a mensagem
 
     Índices:
-        - ix_messages_chat: Mensagens de um chat (ordenadas por created_at)
+        - ix_messages_chat_created: Mensagens de um chat já ordenadas por created_at
         - ix_messages_user: Mensagens de um usuário
+        - ix_messages_updated_id: Feed de mudanças (updated_at, id)
+
+    Colunas adiadas (deferred, fora das listagens):
+        - content: message_content (carregada pelas consultas do chat)
 
     Exemplo de Instanciação (Template Construtor):
         ```python
@@ -46,8 +51,11 @@ class Message(Base):
 
     # Índices compostos para queries frequentes
     __table_args__ = (
-        Index('ix_messages_chat', 'message_chat_id'),
+        # Histórico do chat já na ordem (sem sort): chat_id + created_at
+        Index('ix_messages_chat_created', 'message_chat_id', 'created_at'),
         Index('ix_messages_user', 'message_user_id'),
+        changes_index('messages'),
+        MONOTONIC_IDS,
     )
 
     # =========================================================================
@@ -69,6 +77,7 @@ class Message(Base):
     # =========================================================================
     message_content: Mapped[str] = mapped_column(
         String, nullable=False,
+        deferred=True, deferred_group="content",
         doc="Conteúdo da mensagem (texto ou descrição do arquivo)"
     )
     message_type: Mapped[str] = mapped_column(
@@ -76,8 +85,8 @@ class Message(Base):
         init=False,
         doc="Tipo: 'text', 'file', 'system', 'status_change'"
     )
-    message_attachments: Mapped[str | None] = mapped_column(
-        String,
+    message_attachments: Mapped[list | None] = mapped_column(
+        JSONType,
         nullable=True,
         init=False,
         doc="JSON array com URLs/paths dos arquivos anexados"
@@ -0,0 +1,147 @@
+from sqlalchemy import ForeignKey, Integer, String, DateTime, Enum, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
+from enum import Enum as PyEnum
+
+from infra.configs.database import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from infra.entities.user import User
+
+
+class NotificationTipo(PyEnum):
+    """
+    Tipo de evento que gerou a notificação.
+
+    - STATUS_CHANGE: Mudança de status (ticket, projeto ou relatório)
+    - NEW_MESSAGE: Nova mensagem pública no chat do ticket
+    - APPROVAL: Aprovação de projeto
+    - DIGEST: Resumo de vários eventos agrupados na mesma janela
+    """
+    STATUS_CHANGE = "status_change"
+    NEW_MESSAGE = "new_message"
+    APPROVAL = "approval"
+    DIGEST = "digest"
+
+
+class NotificationEntidade(PyEnum):
+    """
+    Entidade seguida que originou a notificação.
+
+    Corresponde às tabelas de follow:
+    - TICKET: UserTicketFollow
+    - PROJECT: UserProjectFollow
+    - REPORT: UserReportFollow
+    """
+    TICKET = "ticket"
+    PROJECT = "project"
+    REPORT = "report"
+
+
+class Notification(Base):
+    """
+    Notificação entregue a um seguidor (in-app).
+
+    Gerada em lote pelo NotificationPipeline a partir dos eventos
+    publicados pelos repositories. Vários eventos da mesma entidade
+    dentro da janela de digest viram UMA notificação por seguidor
+    (notification_event_count guarda quantos eventos foram agrupados).
+
+    Relacionamentos:
+        N-1 (Notification pertence a):
+            - user: Usuário que recebe a notificação
+
+    Índices:
+        - ix_notifications_user_read: Caixa de notificações (não lidas primeiro)
+        - ix_notifications_entity: Notificações de uma entidade
+
+    Exemplo de Instanciação (Template Construtor):
+        ```python
+        # Campos OBRIGATÓRIOS no construtor:
+        notification = Notification(
+            notification_user_id=1,
+            notification_type=NotificationTipo.STATUS_CHANGE,
+            notification_entity_type=NotificationEntidade.TICKET,
+            notification_entity_id=10,
+            notification_title="Ticket #10 mudou para ATIVO"
+        )
+
+        # Campos OPCIONAIS (têm init=False):
+        # - notification_content: Texto do digest (um evento por linha)
+        # - notification_event_count: 1 por padrão
+        # - notification_read_at: None enquanto não lida
+        ```
+    """
+    __tablename__ = "notifications"
+
+    # Índices compostos para queries frequentes
+    __table_args__ = (
+        Index('ix_notifications_user_read', 'notification_user_id', 'notification_read_at'),
+        Index('ix_notifications_entity', 'notification_entity_type', 'notification_entity_id'),
+    )
+
+    # =========================================================================
+    # FOREIGN KEYS
+    # =========================================================================
+    notification_user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="RESTRICT"),
+        nullable=False,
+        doc="FK para User que recebe a notificação"
+    )
+
+    # =========================================================================
+    # ORIGEM
+    # =========================================================================
+    notification_type: Mapped[NotificationTipo] = mapped_column(
+        Enum(NotificationTipo), nullable=False,
+        doc="Tipo do evento (ou DIGEST quando agrupa tipos diferentes)"
+    )
+    notification_entity_type: Mapped[NotificationEntidade] = mapped_column(
+        Enum(NotificationEntidade), nullable=False,
+        doc="Entidade seguida (TICKET, PROJECT ou REPORT)"
+    )
+    notification_entity_id: Mapped[int] = mapped_column(
+        Integer, nullable=False,
+        doc="ID da entidade seguida (sem FK: aponta para tabelas diferentes)"
+    )
+
+    # =========================================================================
+    # CONTEÚDO
+    # =========================================================================
+    notification_title: Mapped[str] = mapped_column(
+        String, nullable=False,
+        doc="Resumo exibido na lista de notificações"
+    )
+    notification_content: Mapped[str | None] = mapped_column(
+        String, nullable=True, init=False,
+        doc="Detalhe do digest (um evento por linha)"
+    )
+    notification_event_count: Mapped[int] = mapped_column(
+        Integer, default=1, init=False,
+        doc="Quantidade de eventos agrupados nesta notificação"
+    )
+
+    # =========================================================================
+    # DATAS
+    # =========================================================================
+    notification_read_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        init=False,
+        doc="Data/hora da leitura (None enquanto não lida)"
+    )
+
+    # =========================================================================
+    # RELATIONSHIPS
+    # =========================================================================
+
+    # N - 1 (Notificação pertence a um User)
+    user: Mapped["User"] = relationship(
+        back_populates="notifications",
+        lazy="raise",
+        init=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<Notification(id={self.id}, notification_user_id={self.notification_user_id}, notification_type='{self.notification_type}')>"
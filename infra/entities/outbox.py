@@ -0,0 +1,142 @@
+from sqlalchemy import ForeignKey, Integer, String, DateTime, Enum, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
+from enum import Enum as PyEnum
+
+from infra.configs.database import Base, active_index
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from infra.entities.ticket import Ticket
+
+
+class OutboxStatus(PyEnum):
+    """
+    Estado de entrega de um e-mail da outbox.
+
+    Workflow: PENDENTE → ENVIANDO → ENVIADO
+                               ↘ PENDENTE (retry com backoff) → ... → FALHOU
+    - PENDENTE: Aguardando envio (ou próxima tentativa)
+    - ENVIANDO: Reservado por um worker
+    - ENVIADO: Entregue ao servidor SMTP
+    - FALHOU: Esgotou as tentativas
+    """
+    PENDENTE = "pendente"
+    ENVIANDO = "enviando"
+    ENVIADO = "enviado"
+    FALHOU = "falhou"
+
+
+class OutboxMessage(Base):
+    """
+    E-mail pendente de envio (padrão Transactional Outbox).
+
+    O registro é gravado na MESMA transação da alteração de negócio
+    (ticket, chat, projeto). Se a transação der rollback, o e-mail
+    some junto; se der commit, o OutboxWorker garante a entrega,
+    fora do caminho da requisição.
+
+    Relacionamentos:
+        N-1 (OutboxMessage pertence a):
+            - ticket: Ticket relacionado (opcional)
+
+    Índices:
+        - ix_outbox_status: Fila do worker (parcial, só ativos; em ordem de id
+          dentro do status, a ordem do claim_due)
+
+    Exemplo de Instanciação (Template Construtor):
+        ```python
+        # Campos OBRIGATÓRIOS no construtor:
+        mail = OutboxMessage(
+            outbox_recipient="cliente@empresa.com",
+            outbox_subject="Ticket #10 encerrado",
+            outbox_body="Seu ticket foi encerrado..."
+        )
+
+        # Campos OPCIONAIS (têm init=False):
+        # - outbox_ticket_id / ticket: Ticket relacionado (atualiza ticket_mail_sent_at)
+        # - outbox_status: PENDENTE por padrão
+        # - outbox_attempts, outbox_next_attempt_at, outbox_last_error: Controle de retry
+        # - outbox_sent_at: Preenchido na entrega
+        ```
+    """
+    __tablename__ = "outbox_messages"
+
+    # Índices compostos para queries frequentes
+    __table_args__ = (
+        # Sem outbox_next_attempt_at na chave: com ela o ORDER BY id do claim_due
+        # precisaria de sort e o planner preferia varrer a tabela pela PK
+        active_index('ix_outbox_status', 'outbox_status'),
+        # FK com SET NULL: sem índice, cada DELETE em tickets varre a tabela
+        Index('ix_outbox_ticket', 'outbox_ticket_id'),
+    )
+
+    # =========================================================================
+    # CONTEÚDO
+    # =========================================================================
+    outbox_recipient: Mapped[str] = mapped_column(
+        String, nullable=False,
+        doc="E-mail do destinatário"
+    )
+    outbox_subject: Mapped[str] = mapped_column(
+        String, nullable=False,
+        doc="Assunto do e-mail"
+    )
+    outbox_body: Mapped[str] = mapped_column(
+        String, nullable=False,
+        doc="Corpo do e-mail (texto puro)"
+    )
+
+    # =========================================================================
+    # FOREIGN KEYS
+    # =========================================================================
+    outbox_ticket_id: Mapped[int | None] = mapped_column(
+        ForeignKey("tickets.id", ondelete="SET NULL"),
+        nullable=True,
+        init=False,
+        doc="FK para Ticket (entrega atualiza ticket_mail_sent_at)"
+    )
+
+    # =========================================================================
+    # ENTREGA
+    # =========================================================================
+    outbox_status: Mapped[OutboxStatus] = mapped_column(
+        Enum(OutboxStatus),
+        default=OutboxStatus.PENDENTE,
+        init=False,
+        doc="Estado de entrega"
+    )
+    outbox_attempts: Mapped[int] = mapped_column(
+        Integer, default=0, init=False,
+        doc="Tentativas de envio já realizadas"
+    )
+    outbox_next_attempt_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        init=False,
+        doc="Não enviar antes desta data/hora (None = imediato)"
+    )
+    outbox_sent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        init=False,
+        doc="Data/hora da entrega ao servidor SMTP"
+    )
+    outbox_last_error: Mapped[str | None] = mapped_column(
+        String, nullable=True, init=False,
+        doc="Último erro de envio (diagnóstico)"
+    )
+
+    # =========================================================================
+    # RELATIONSHIPS
+    # =========================================================================
+
+    # N - 1 (E-mail pode se referir a um Ticket)
+    ticket: Mapped["Ticket | None"] = relationship(
+        back_populates="outbox_messages",
+        lazy="raise",
+        init=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxMessage(id={self.id}, outbox_recipient='{self.outbox_recipient}', outbox_status='{self.outbox_status}')>"
@@ -3,7 +3,9 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, date
 from enum import Enum as PyEnum
 
-from infra.configs.database import Base
+from infra.configs.database import Base, active_index, changes_index
+from infra.configs.versioning import Versioned
+from infra.configs.json_type import JSONType
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -84,7 +86,7 @@ class ProjectRiskLevel(PyEnum):
     SEM_RISCO = "sem_risco"
 
 
-class Project(Base):
+class Project(Versioned, Base):
     """
     Entidade de Projeto.
 
@@ -113,6 +115,13 @@ class Project(Base):
         - ix_projects_team_status: Projetos por time e status
         - ix_projects_manager: Projetos de um gerente
         - ix_projects_dates: Projetos por período
+        - ux_projects_name: Nome do projeto (único entre ativos, índice parcial)
+        - ix_projects_updated_id: Feed de mudanças (updated_at, id)
+
+    Colunas adiadas (deferred, fora das listagens):
+        - detail: project_scope, project_expected_benefits, project_risks,
+          project_assumptions, project_constraints
+        - plan: project_milestones, project_tasks
 
     Exemplo de Instanciação (Template Construtor):
         ```python
@@ -147,13 +156,23 @@ class Project(Base):
         Index('ix_projects_team_status', 'project_team_responsible_id', 'project_status'),
         Index('ix_projects_manager', 'project_manager_id'),
         Index('ix_projects_dates', 'project_start_date', 'project_expected_end_date'),
+        # Nome único entre projetos ativos
+        active_index('ux_projects_name', 'project_name', unique=True),
+        changes_index('projects'),
+    )
+
+    # Soft delete/restore em cascata (infra/configs/soft_cascade.py):
+    # vínculos do projeto e os tickets dele (com chat, mensagens...)
+    __soft_cascade__ = (
+        "approvals", "analysts", "sponsors", "owners", "clients",
+        "allowed_users", "followers", "tickets",
     )
 
     # =========================================================================
     # IDENTIFICAÇÃO
     # =========================================================================
     project_name: Mapped[str] = mapped_column(
-        String, nullable=False, unique=True,
+        String, nullable=False,
         doc="Nome único do projeto"
     )
     project_directory: Mapped[str] = mapped_column(
@@ -291,30 +310,37 @@ class Project(Base):
     # =========================================================================
     project_scope: Mapped[str | None] = mapped_column(
         String, nullable=True, init=False,
+        deferred=True, deferred_group="detail",
         doc="JSON com definição de escopo (incluído/excluído)"
     )
     project_expected_benefits: Mapped[str | None] = mapped_column(
         String, nullable=True, init=False,
+        deferred=True, deferred_group="detail",
         doc="JSON com benefícios esperados"
     )
     project_risks: Mapped[str | None] = mapped_column(
         String, nullable=True, init=False,
+        deferred=True, deferred_group="detail",
         doc="JSON com riscos identificados e mitigações"
     )
     project_assumptions: Mapped[str | None] = mapped_column(
         String, nullable=True, init=False,
+        deferred=True, deferred_group="detail",
         doc="JSON com premissas do projeto"
     )
     project_constraints: Mapped[str | None] = mapped_column(
         String, nullable=True, init=False,
+        deferred=True, deferred_group="detail",
         doc="JSON com restrições e limitações"
     )
-    project_milestones: Mapped[str | None] = mapped_column(
-        String, nullable=True, init=False,
+    project_milestones: Mapped[list | None] = mapped_column(
+        JSONType, nullable=True, init=False,
+        deferred=True, deferred_group="plan",
         doc="JSON com marcos/entregas principais"
     )
-    project_tasks: Mapped[str | None] = mapped_column(
-        String, nullable=True, init=False,
+    project_tasks: Mapped[list | None] = mapped_column(
+        JSONType, nullable=True, init=False,
+        deferred=True, deferred_group="plan",
         doc="JSON com lista de tarefas/atividades"
     )
 
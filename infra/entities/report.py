@@ -3,7 +3,8 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from infra.configs.database import Base
+from infra.configs.database import Base, active_index, changes_index
+from infra.configs.versioning import Versioned
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -73,7 +74,7 @@ class ReportTags(PyEnum):
     QUALIDADE = "qualidade"
 
 
-class Report(Base):
+class Report(Versioned, Base):
     """
     Entidade de Relatório (Power BI).
 
@@ -97,6 +98,11 @@ class Report(Base):
         - ix_reports_team_status: Relatórios por time e status
         - ix_reports_owner: Relatórios de um dono
         - ix_reports_tags: Relatórios por tag/área
+        - ux_reports_name: Nome do relatório (único entre ativos, índice parcial)
+        - ix_reports_updated_id: Feed de mudanças (updated_at, id)
+
+    Colunas adiadas (deferred, fora das listagens):
+        - detail: report_description
 
     Exemplo de Instanciação (Template Construtor):
         ```python
@@ -128,13 +134,20 @@ class Report(Base):
         Index('ix_reports_team_status', 'report_team_responsible_id', 'report_status'),
         Index('ix_reports_owner', 'report_owner_id'),
         Index('ix_reports_tags', 'report_tags'),
+        # Nome único entre relatórios ativos
+        active_index('ux_reports_name', 'report_name', unique=True),
+        changes_index('reports'),
     )
 
+    # Soft delete/restore em cascata (infra/configs/soft_cascade.py)
+    # Tickets do relatório NÃO: são solicitações com histórico próprio
+    __soft_cascade__ = ("allowed_users", "followers")
+
     # =========================================================================
     # IDENTIFICAÇÃO
     # =========================================================================
     report_name: Mapped[str] = mapped_column(
-        String, unique=True, nullable=False,
+        String, nullable=False,
         doc="Nome único do relatório"
     )
     report_link: Mapped[str] = mapped_column(
@@ -143,6 +156,7 @@ class Report(Base):
     )
     report_description: Mapped[str] = mapped_column(
         String, nullable=False,
+        deferred=True, deferred_group="detail",
         doc="Descrição do propósito e conteúdo do relatório"
     )
 
@@ -2,7 +2,7 @@ from sqlalchemy import ForeignKey, Integer, String, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum as PyEnum
 
-from infra.configs.database import Base
+from infra.configs.database import Base, active_index, changes_index
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -63,8 +63,9 @@ class Team(Base):
             - assigned_tickets: Tickets atribuídos ao time (via TicketTeam)
 
     Índices:
-        - ix_teams_name: Nome do time (único)
+        - ux_teams_name: Nome do time (único entre ativos, índice parcial)
         - ix_teams_area_status: Filtro por área + status operacional
+        - ix_teams_updated_id: Feed de mudanças (updated_at, id)
 
     Exemplo de Instanciação (Template Construtor):
         ```python
@@ -90,13 +91,21 @@ class Team(Base):
     # Índices compostos para queries frequentes
     __table_args__ = (
         Index('ix_teams_area_status', 'team_area', 'team_status'),
+        # Nome único entre times ativos
+        active_index('ux_teams_name', 'team_name', unique=True),
+        changes_index('teams'),
     )
 
+    # Soft delete/restore em cascata (infra/configs/soft_cascade.py):
+    # só as atribuições de tickets; membros, projetos e relatórios do time
+    # continuam existindo (são realocados, não apagados)
+    __soft_cascade__ = ("assigned_tickets",)
+
     # =========================================================================
     # IDENTIFICAÇÃO
     # =========================================================================
     team_name: Mapped[str] = mapped_column(
-        String, unique=True, nullable=False,
+        String, nullable=False,
         doc="Nome único do time (ex: 'Analytics BI', 'Projetos TI')"
     )
     team_description: Mapped[str | None] = mapped_column(
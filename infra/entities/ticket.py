@@ -3,7 +3,9 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, date
 from enum import Enum as PyEnum
 
-from infra.configs.database import Base
+from infra.configs.database import MONOTONIC_IDS, Base, active_index, changes_index
+from infra.configs.versioning import Versioned
+from infra.configs.json_type import JSONType
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -12,6 +14,7 @@ if TYPE_CHECKING:
     from infra.entities.project import Project
     from infra.entities.report import Report
     from infra.entities.chat import Chat
+    from infra.entities.outbox import OutboxMessage
     from infra.entities.associations import TicketAttendant, TicketTeam, UserTicketFollow
 
 
@@ -113,7 +116,7 @@ class TicketImpacto(PyEnum):
     SEM_IMPACTO = "sem_impacto"
 
 
-class Ticket(Base):
+class Ticket(Versioned, Base):
     """
     Entidade de Ticket (Chamado).
 
@@ -138,12 +141,15 @@ class Ticket(Base):
             - teams: Times responsáveis (via TicketTeam)
             - followers: Usuários seguindo (via UserTicketFollow)
 
-    Índices:
+    Índices (parciais, WHERE active = 'ATIVO'):
         - ix_tickets_client_status: Busca tickets de um cliente por status
         - ix_tickets_project: Tickets de um projeto
         - ix_tickets_report: Tickets de um relatório
         - ix_tickets_status_priority: Fila de atendimento (status + prioridade)
 
+    Colunas adiadas (deferred, fora das listagens):
+        - detail: ticket_description, ticket_resolution_notes
+
     Exemplo de Instanciação (Template Construtor):
         ```python
         # Campos OBRIGATÓRIOS no construtor:
@@ -164,18 +170,24 @@ class Ticket(Base):
         # - ticket_status_changed_by_id, ticket_closed_by_id: Preenchidos no workflow
         # - ticket_estimated_hours, ticket_actual_hours: Para métricas
         # - ticket_satisfaction_rating: Avaliação do cliente (1-10)
+        # - ticket_form_data: Respostas do formulário (JSON validado)
         ```
     """
     __tablename__ = "tickets"
 
-    # Índices compostos para queries frequentes
+    # Índices compostos para queries frequentes (parciais: só tickets ativos)
     __table_args__ = (
-        Index('ix_tickets_client_status', 'ticket_client_id', 'ticket_status'),
-        Index('ix_tickets_project', 'ticket_project_id'),
-        Index('ix_tickets_report', 'ticket_report_id'),
-        Index('ix_tickets_status_priority', 'ticket_status', 'ticket_priority'),
+        active_index('ix_tickets_client_status', 'ticket_client_id', 'ticket_status'),
+        active_index('ix_tickets_project', 'ticket_project_id'),
+        active_index('ix_tickets_report', 'ticket_report_id'),
+        active_index('ix_tickets_status_priority', 'ticket_status', 'ticket_priority'),
+        changes_index('tickets'),
+        MONOTONIC_IDS,
     )
 
+    # Soft delete/restore em cascata (infra/configs/soft_cascade.py)
+    __soft_cascade__ = ("chat", "attendants", "teams", "followers")
+
     # =========================================================================
     # IDENTIFICAÇÃO
     # =========================================================================
@@ -185,6 +197,7 @@ class Ticket(Base):
     )
     ticket_description: Mapped[str] = mapped_column(
         String, nullable=False,
+        deferred=True, deferred_group="detail",
         doc="Descrição detalhada do problema ou solicitação"
     )
 
@@ -308,14 +321,19 @@ class Ticket(Base):
     # =========================================================================
     # EXTRAS
     # =========================================================================
-    ticket_attachments: Mapped[str | None] = mapped_column(
-        String, nullable=True, init=False,
-        doc="JSON array com URLs/paths dos anexos"
+    ticket_attachments: Mapped[list | None] = mapped_column(
+        JSONType, nullable=True, init=False,
+        doc="JSON array com metadados dos anexos"
     )
     ticket_resolution_notes: Mapped[str | None] = mapped_column(
         String, nullable=True, init=False,
+        deferred=True, deferred_group="detail",
         doc="Notas de resolução (preenchido pelo atendente no encerramento)"
     )
+    ticket_form_data: Mapped[dict | None] = mapped_column(
+        JSONType, nullable=True, init=False,
+        doc="JSON com as respostas do formulário (validadas contra form_fields)"
+    )
 
     # =========================================================================
     # RELATIONSHIPS
@@ -387,5 +405,13 @@ class Ticket(Base):
         default_factory=list
     )
 
+    # 1 - N (E-mails da outbox relacionados ao ticket)
+    outbox_messages: Mapped[list["OutboxMessage"]] = relationship(
+        back_populates="ticket",
+        lazy="raise",
+        init=False,
+        default_factory=list
+    )
+
     def __repr__(self) -> str:
         return f"<Ticket(id={self.id}, ticket_title='{self.ticket_title}', ticket_status='{self.ticket_status}')>"
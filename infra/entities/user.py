@@ -2,7 +2,8 @@ from sqlalchemy import ForeignKey, Integer, String, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum as PyEnum
 
-from infra.configs.database import Base, Status
+from infra.configs.database import Base, Status, active_index, changes_index
+from infra.configs.json_type import JSONType
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -11,6 +12,8 @@ if TYPE_CHECKING:
     from infra.entities.ticket import Ticket
     from infra.entities.report import Report
     from infra.entities.project import Project
+    from infra.entities.notification import Notification
+    from infra.entities.chat_read_pointer import ChatReadPointer
     from infra.entities.associations import (
         ProjectApproval, ProjectAnalyst, ProjectSponsor, ProjectOwner,
         ProjectClient, ProjectAllowedUser, TicketAttendant,
@@ -92,10 +95,11 @@ class User(Base):
             - followed_reports/projects/tickets: Entidades seguidas
 
     Índices:
-        - ix_users_email: Busca por email (único)
+        - ux_users_email: Busca por email (único entre ativos, índice parcial)
         - ix_users_corporative_id: Busca por ID corporativo (único)
         - ix_users_team_role: Busca por time + papel (listagem de equipe)
         - ix_users_status_active: Filtro por status operacional + soft delete
+        - ix_users_updated_id: Feed de mudanças (updated_at, id)
 
     Exemplo de Instanciação (Template Construtor):
         ```python
@@ -113,6 +117,7 @@ class User(Base):
         # Campos OPCIONAIS (têm init=False, preenchidos automaticamente ou depois):
         # - id: autoincrement
         # - user_photo: None por padrão
+        # - user_sync_hash: None (preenchido pela sincronização do RH)
         # - user_status: UserStatus.ATIVO por padrão
         # - user_notification_preferences: None por padrão
         # - created_at, updated_at: preenchidos pelo banco
@@ -125,6 +130,9 @@ class User(Base):
     __table_args__ = (
         Index('ix_users_team_role', 'user_team_id', 'user_role'),
         Index('ix_users_status_active', 'user_status', 'active'),
+        # Email único entre usuários ativos (deletado libera o email)
+        active_index('ux_users_email', 'user_email', unique=True),
+        changes_index('users'),
     )
 
     # =========================================================================
@@ -139,7 +147,7 @@ class User(Base):
         doc="Nome completo do usuário"
     )
     user_email: Mapped[str] = mapped_column(
-        String, unique=True, nullable=False,
+        String, nullable=False,
         doc="Email corporativo (usado para login)"
     )
     user_password: Mapped[str] = mapped_column(
@@ -150,6 +158,10 @@ class User(Base):
         String, nullable=True, init=False,
         doc="URL ou path da foto de perfil"
     )
+    user_sync_hash: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, init=False,
+        doc="SHA-256 do registro do RH aplicado por último (None = usuário local, fora da sincronização)"
+    )
 
     # =========================================================================
     # FOREIGN KEYS
@@ -181,8 +193,8 @@ class User(Base):
     # =========================================================================
     # CONFIGURAÇÕES
     # =========================================================================
-    user_notification_preferences: Mapped[str | None] = mapped_column(
-        String,
+    user_notification_preferences: Mapped[dict | None] = mapped_column(
+        JSONType,
         nullable=True,
         init=False,
         doc="JSON com preferências de notificação (email, push, etc.)"
@@ -355,6 +367,22 @@ class User(Base):
         default_factory=list
     )
 
+    # 1 - N (Notificações recebidas pelo usuário)
+    notifications: Mapped[list["Notification"]] = relationship(
+        back_populates="user",
+        lazy="raise",
+        init=False,
+        default_factory=list
+    )
+
+    # 1 - N (Ponteiros de leitura de chats)
+    chat_read_pointers: Mapped[list["ChatReadPointer"]] = relationship(
+        back_populates="user",
+        lazy="raise",
+        init=False,
+        default_factory=list
+    )
+
     def __repr__(self) -> str:
         return f"<User(id={self.id}, user_full_name='{self.user_full_name}', user_email='{self.user_email}')>"
 
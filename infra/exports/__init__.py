@@ -0,0 +1,17 @@
+from .change_feed import FEEDS, ChangeFeed, change_feed
+from .table_export import (
+    DATASETS, FORMATS, MEDIA_TYPES, ExportFilters, ExportFormatUnavailable, TableExporter, table_exporter
+)
+
+__all__ = [
+    'DATASETS',
+    'FORMATS',
+    'MEDIA_TYPES',
+    'ExportFilters',
+    'ExportFormatUnavailable',
+    'TableExporter',
+    'table_exporter',
+    'FEEDS',
+    'ChangeFeed',
+    'change_feed',
+]
@@ -0,0 +1,214 @@
+"""
+Feed de mudanças (CDC) por marca d'água (updated_at, id).
+
+Consumidores (BI, busca) guardam a marca d'água da última linha que
+processaram e pedem só o que mudou depois dela, em vez de recarregar tudo:
+
+    page = change_feed.changes("tickets", since=watermark, limit=500)
+    # {"items": [...], "watermark": "...", "has_more": True}
+
+Cada item traz as colunas da linha (valores como no to_dict()) e mais:
+    _deleted    True se a linha está soft-deleted (active = INATIVO)
+    _watermark  marca d'água até esta linha (checkpoint em qualquer ponto)
+
+Ordem (updated_at, id) crescente, por keyset sobre o índice
+ix_<tabela>_updated_id (changes_index). Cada página são dois range scans
+a partir da marca d'água (v, x):
+    1. updated_at = v AND id > x    resto do mesmo instante
+    2. updated_at > v               instantes seguintes (só se faltar linha)
+O OR do keyset_filter (ou o row value (a, b) > (v, x)) só delimita o
+range por updated_at: numa carga em lote (milhares de linhas no mesmo
+segundo do CURRENT_TIMESTAMP do SQLite) cada página releria o instante
+inteiro. Soft delete, restore, update em lote e upsert atualizam
+updated_at, então também aparecem.
+
+Janela de assentamento:
+    updated_at é o relógio do banco quando o statement rodou (PostgreSQL:
+    início da transação), não o do commit. Uma transação que comita
+    depois da leitura do consumidor pode ter updated_at ANTERIOR à marca
+    d'água que ele já avançou. O feed só entrega linhas com updated_at
+    mais antigo que settle_seconds (relógio do banco): as mudanças chegam
+    com esse atraso, mas sem buracos.
+
+Leitura no primário: uma réplica atrasada além da janela faria o
+consumidor avançar por cima de linhas ainda não replicadas.
+
+Fora do feed: linhas removidas de vez (purga de soft-deleted antigos,
+arquivamento de tickets encerrados). O consumidor já as recebeu antes,
+como inativas/encerradas.
+
+Uso:
+    page = change_feed.changes("users")                       # desde o início
+    for chunk in change_feed.stream("tickets", since=watermark):
+        ...                                                   # NDJSON até alcançar a janela
+"""
+import json
+from datetime import timedelta
+from typing import Iterator
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.database import Base, Status
+from infra.configs.keyset import decode_cursor, encode_cursor, keyset_columns
+from infra.configs.settings import settings
+from infra.entities.message import Message
+from infra.entities.project import Project
+from infra.entities.report import Report
+from infra.entities.team import Team
+from infra.entities.ticket import Ticket
+from infra.entities.user import User
+from infra.exports.table_export import column_converter
+
+FEEDS: dict[str, type[Base]] = {
+    "tickets": Ticket,
+    "projects": Project,
+    "reports": Report,
+    "messages": Message,
+    "teams": Team,
+    "users": User,
+}
+# Colunas que não saem do banco pelo feed
+EXCLUDED_COLUMNS = {
+    "users": ("user_password",),
+}
+
+
+class ChangeFeed:
+    """
+    Páginas/stream de linhas alteradas depois de uma marca d'água.
+
+    Uso:
+        page = change_feed.changes("projects", since=page["watermark"])
+        ChangeFeed(settle_seconds=0).changes("teams")      # testes: sem janela
+    """
+
+    def __init__(self, settle_seconds: int = 10, page_size: int = 500):
+        self.settle_seconds = settle_seconds
+        self.page_size = page_size
+
+    # =========================================================================
+    # CONSULTA
+    # =========================================================================
+
+    @staticmethod
+    def _model(entity: str) -> type[Base]:
+        model = FEEDS.get(entity)
+        if model is None:
+            raise ValueError(f"Entidade sem feed: {entity} (use {', '.join(FEEDS)})")
+        return model
+
+    @staticmethod
+    def _since(since: str | None) -> list | None:
+        """Marca d'água → [updated_at, id] (ValueError se malformada)."""
+        if since is None:
+            return None
+        values = decode_cursor(since)
+        if len(values) != 2:
+            raise ValueError("Marca d'água inválida")
+        return values
+
+    def _settled(self, updated_at, dialect: str):
+        """updated_at anterior à janela de assentamento, pelo relógio do banco."""
+        if dialect == "sqlite":
+            # Mesmo formato de texto do CURRENT_TIMESTAMP gravado (UTC)
+            return updated_at < func.datetime("now", f"-{int(self.settle_seconds)} seconds")
+        return updated_at < func.now() - timedelta(seconds=self.settle_seconds)
+
+    def _statements(self, model: type[Base], columns: list, since: list | None, dialect: str) -> list[Select]:
+        """Consultas da página, na ordem: as linhas de cada uma vêm antes das da seguinte."""
+        table = model.__table__
+        key = keyset_columns([table.c.updated_at, table.c.id], dialect)
+        base = (
+            select(*columns, key[0].label("_cdc_updated_at"))
+            .where(self._settled(key[0], dialect))
+            .order_by(*key)
+        )
+        if since is None:
+            return [base]
+        return [
+            base.where(key[0] == since[0], key[1] > since[1]),
+            base.where(key[0] > since[0]),
+        ]
+
+    def _page(self, session: Session, entity: str, since: list | None, limit: int) -> tuple[list[dict], list | None, bool]:
+        """(itens, [updated_at, id] do último, has_more) de uma página."""
+        model = FEEDS[entity]
+        excluded = EXCLUDED_COLUMNS.get(entity, ())
+        columns = [column for column in model.__table__.columns if column.name not in excluded]
+        names = [column.name for column in columns]
+        converters = [(position, fn) for position, column in enumerate(columns)
+                      if (fn := column_converter(column, "ndjson")) is not None]
+        active = names.index("active")
+
+        rows = []
+        for statement in self._statements(model, columns, since, session.get_bind().dialect.name):
+            rows += session.execute(statement.limit(limit + 1 - len(rows))).all()
+            if len(rows) > limit:
+                break
+        has_more = len(rows) > limit
+        items, last = [], since
+        for row in rows[:limit]:
+            values = list(row[:len(columns)])
+            deleted = values[active] == Status.INATIVO
+            for position, fn in converters:
+                if values[position] is not None:
+                    values[position] = fn(values[position])
+            last = [row._cdc_updated_at, row.id]
+            item = dict(zip(names, values))
+            item["_deleted"] = deleted
+            item["_watermark"] = encode_cursor(last)
+            items.append(item)
+        return items, last, has_more
+
+    # =========================================================================
+    # API
+    # =========================================================================
+
+    def changes(self, entity: str, since: str | None = None, limit: int | None = None) -> dict:
+        """
+        Uma página de mudanças depois de `since` (None = desde o início).
+
+        Returns:
+            {"items": [...], "watermark": marca d'água para a próxima chamada
+             (a mesma de `since` se nada mudou), "has_more": bool}
+
+        Raises:
+            ValueError: Entidade sem feed ou marca d'água inválida
+        """
+        self._model(entity)
+        values = self._since(since)
+        with DBConnectionHandler() as db:
+            items, last, has_more = self._page(db.session, entity, values, limit or self.page_size)
+        return {
+            "items": items,
+            "watermark": encode_cursor(last) if last is not None else None,
+            "has_more": has_more,
+        }
+
+    def stream(self, entity: str, since: str | None = None) -> Iterator[bytes]:
+        """
+        NDJSON de todas as mudanças depois de `since`, página a página (uma
+        transação curta por página), até alcançar a janela de assentamento.
+        Validação antes do primeiro chunk (ValueError).
+        """
+        self._model(entity)
+        values = self._since(since)
+
+        def pages() -> Iterator[bytes]:
+            last, has_more = values, True
+            while has_more:
+                with DBConnectionHandler() as db:
+                    items, last, has_more = self._page(db.session, entity, last, self.page_size)
+                if items:
+                    yield "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items).encode()
+
+        return pages()
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.exports import change_feed
+# =========================================================================
+change_feed = ChangeFeed(settle_seconds=settings.CDC_SETTLE_SECONDS, page_size=settings.CDC_PAGE_SIZE)
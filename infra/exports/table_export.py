@@ -0,0 +1,336 @@
+"""
+Exportação em streaming (NDJSON, CSV, Parquet) de tickets, projetos,
+relatórios e mensagens, para as equipes de BI.
+
+Nada de select_all(): um SELECT só das colunas (Core, sem objetos ORM)
+com yield_per, ou seja, cursor do lado do servidor no PostgreSQL
+(stream_results) e leitura incremental do cursor no SQLite. Cada lote de
+chunk_size linhas vira bytes e é entregue antes de o próximo ser lido:
+a memória não cresce com o tamanho da tabela.
+
+Formatos:
+    ndjson   um objeto JSON por linha (colunas JSON ficam aninhadas)
+    csv      cabeçalho + linhas; colunas JSON serializadas como texto
+    parquet  um row group por lote, tipos nativos (timestamp, date,
+             int64...). Exige pyarrow, dependência OPCIONAL
+             (pip install pyarrow); sem ele: ExportFormatUnavailable
+
+Valores como no to_dict(): Enum → .value, datetime/date → ISO 8601.
+
+Filtros (ExportFilters):
+    start/end         created_at em [start, end)
+    team_id           tickets: atribuídos ao time (ticket_teams)
+                      projetos/relatórios: time responsável
+                      mensagens: dos tickets atribuídos ao time
+    statuses          status do registro (valor ou nome; não vale para mensagens)
+    include_inactive  inclui os soft-deleted (coluna active diz qual é qual)
+
+Uso:
+    chunks = table_exporter.stream("tickets", "csv", ExportFilters(team_id=3))
+    for chunk in chunks:
+        out.write(chunk)
+
+    python -m infra.exports.table_export tickets --format parquet --from 2026-01-01 -o tickets.parquet
+"""
+import argparse
+import csv
+import io
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Callable, Iterator
+
+from sqlalchemy import JSON, Boolean, Date, DateTime, Float, Integer, Numeric, Select, select
+from sqlalchemy import Enum as SAEnum
+
+from infra.configs.database import Base
+from infra.configs.settings import settings
+from infra.entities.associations import TicketTeam
+from infra.entities.chat import Chat
+from infra.entities.message import Message
+from infra.entities.project import Project
+from infra.entities.report import Report
+from infra.entities.ticket import Ticket
+from infra.repositories.base_repository import BaseRepository
+
+DATASETS: dict[str, type[Base]] = {
+    "tickets": Ticket,
+    "projects": Project,
+    "reports": Report,
+    "messages": Message,
+}
+STATUS_COLUMNS = {
+    "tickets": Ticket.ticket_status,
+    "projects": Project.project_status,
+    "reports": Report.report_status,
+}
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+FORMATS = tuple(MEDIA_TYPES)
+
+
+class ExportFormatUnavailable(ValueError):
+    """Formato que depende de um pacote opcional não instalado (parquet → pyarrow)."""
+
+
+@dataclass(frozen=True)
+class ExportFilters:
+    """Filtros da exportação (todos opcionais)."""
+    start: datetime | None = None
+    end: datetime | None = None
+    team_id: int | None = None
+    statuses: tuple[str, ...] = ()
+    include_inactive: bool = False
+
+
+def _member(enum: type[Enum], text: str) -> Enum:
+    wanted = text.lower()
+    for member in enum:
+        if member.value == wanted or member.name.lower() == wanted:
+            return member
+    raise ValueError(f"Status inválido: {text} (use {', '.join(member.value for member in enum)})")
+
+
+def column_converter(column, fmt: str) -> Callable | None:
+    """Conversão do valor lido para o formato (None = usa como veio)."""
+    column_type = column.type
+    if isinstance(column_type, SAEnum) and column_type.enum_class is not None:
+        return lambda value: value.value
+    if isinstance(column_type, JSON) and fmt != "ndjson":
+        return lambda value: json.dumps(value, ensure_ascii=False)
+    if isinstance(column_type, Numeric) and column_type.asdecimal:
+        return float
+    if isinstance(column_type, (DateTime, Date)) and fmt != "parquet":
+        return lambda value: value.isoformat()
+    return None
+
+
+def _arrow_type(pa, column):
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, (Float, Numeric)):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC" if column_type.timezone else None)
+    if isinstance(column_type, Date):
+        return pa.date32()
+    # String, Text, Enum (.value) e JSON (serializado)
+    return pa.string()
+
+
+class _Drain(io.RawIOBase):
+    """Destino do ParquetWriter: acumula o que foi escrito até o próximo take()."""
+
+    def __init__(self):
+        super().__init__()
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def take(self) -> bytes:
+        data, self._parts = b"".join(self._parts), []
+        return data
+
+
+class TableExporter:
+    """
+    Gera os bytes de uma exportação, lote a lote.
+
+    Uso:
+        for chunk in table_exporter.stream("reports", "ndjson"):
+            ...
+        TableExporter(chunk_size=1000).export_to("messages", "parquet", "messages.parquet")
+    """
+
+    def __init__(self, chunk_size: int = 5000):
+        self.chunk_size = chunk_size
+
+    # =========================================================================
+    # CONSULTA
+    # =========================================================================
+
+    @staticmethod
+    def _team_tickets(team_id: int) -> Select:
+        return select(TicketTeam.ticket_id).where(TicketTeam.team_id == team_id, TicketTeam.active_clause())
+
+    def statement(self, dataset: str, filters: ExportFilters) -> Select:
+        """
+        SELECT das colunas do dataset com os filtros, em ordem de id.
+
+        Raises:
+            ValueError: Dataset desconhecido, status inválido ou status em mensagens
+        """
+        model = DATASETS.get(dataset)
+        if model is None:
+            raise ValueError(f"Dataset desconhecido: {dataset} (use {', '.join(DATASETS)})")
+        table = model.__table__
+        statement = select(*table.columns).order_by(table.c.id)
+
+        if not filters.include_inactive:
+            statement = statement.where(model.active_clause())
+        if filters.start is not None:
+            statement = statement.where(table.c.created_at >= filters.start)
+        if filters.end is not None:
+            statement = statement.where(table.c.created_at < filters.end)
+        if filters.statuses:
+            column = STATUS_COLUMNS.get(dataset)
+            if column is None:
+                raise ValueError(f"{dataset} não tem status para filtrar")
+            enum = column.type.enum_class
+            statement = statement.where(column.in_([_member(enum, status) for status in filters.statuses]))
+        if filters.team_id is not None:
+            if model is Ticket:
+                condition = Ticket.id.in_(self._team_tickets(filters.team_id))
+            elif model is Message:
+                condition = Message.message_chat_id.in_(
+                    select(Chat.id).where(Chat.chat_ticket_id.in_(self._team_tickets(filters.team_id)))
+                )
+            elif model is Project:
+                condition = Project.project_team_responsible_id == filters.team_id
+            else:
+                condition = Report.report_team_responsible_id == filters.team_id
+            statement = statement.where(condition)
+        return statement
+
+    def _batches(self, statement: Select, converters: list) -> Iterator[list[list]]:
+        """Lotes de linhas já convertidas, lidos com yield_per (réplica de leitura)."""
+        convert = [(position, fn) for position, fn in enumerate(converters) if fn is not None]
+        with BaseRepository._read() as db:
+            result = db.session.execute(statement.execution_options(yield_per=self.chunk_size))
+            for partition in result.partitions():
+                rows = []
+                for row in partition:
+                    values = list(row)
+                    for position, fn in convert:
+                        if values[position] is not None:
+                            values[position] = fn(values[position])
+                    rows.append(values)
+                yield rows
+
+    # =========================================================================
+    # FORMATOS
+    # =========================================================================
+
+    def _ndjson(self, statement: Select, columns: list) -> Iterator[bytes]:
+        names = [column.name for column in columns]
+        for rows in self._batches(statement, [column_converter(column, "ndjson") for column in columns]):
+            yield "".join(
+                json.dumps(dict(zip(names, values)), ensure_ascii=False) + "\n" for values in rows
+            ).encode()
+
+    def _csv(self, statement: Select, columns: list) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([column.name for column in columns])
+        for rows in self._batches(statement, [column_converter(column, "csv") for column in columns]):
+            writer.writerows(rows)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    def _parquet(self, statement: Select, columns: list, pa, pq) -> Iterator[bytes]:
+        schema = pa.schema([pa.field(column.name, _arrow_type(pa, column)) for column in columns])
+        sink = _Drain()
+        with pq.ParquetWriter(sink, schema) as writer:
+            for rows in self._batches(statement, [column_converter(column, "parquet") for column in columns]):
+                arrays = [
+                    pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)
+                ]
+                writer.write_batch(pa.record_batch(arrays, schema=schema))
+                yield sink.take()
+        # Rodapé (metadados) só existe após o close
+        yield sink.take()
+
+    # =========================================================================
+    # API
+    # =========================================================================
+
+    def stream(self, dataset: str, fmt: str, filters: ExportFilters | None = None) -> Iterator[bytes]:
+        """
+        Iterador de bytes da exportação. A validação acontece AQUI (antes do
+        primeiro chunk), para a rota responder 400 em vez de cortar o corpo.
+
+        Raises:
+            ValueError: Dataset/formato/filtro inválido
+            ExportFormatUnavailable: parquet sem pyarrow
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato inválido: {fmt} (use {', '.join(FORMATS)})")
+        statement = self.statement(dataset, filters or ExportFilters())
+        columns = list(DATASETS[dataset].__table__.columns)
+        if fmt == "ndjson":
+            return self._ndjson(statement, columns)
+        if fmt == "csv":
+            return self._csv(statement, columns)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ExportFormatUnavailable("Exportação parquet requer o pacote pyarrow (pip install pyarrow)") from error
+        return self._parquet(statement, columns, pa, pq)
+
+    def export_to(self, dataset: str, fmt: str, path: str, filters: ExportFilters | None = None) -> int:
+        """Grava a exportação em `path` ("-" = stdout). Returns: bytes escritos."""
+        written = 0
+        output = sys.stdout.buffer if path == "-" else open(path, "wb")
+        try:
+            for chunk in self.stream(dataset, fmt, filters):
+                output.write(chunk)
+                written += len(chunk)
+        finally:
+            if output is not sys.stdout.buffer:
+                output.close()
+        return written
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.exports import table_exporter
+# =========================================================================
+table_exporter = TableExporter(chunk_size=settings.EXPORT_CHUNK_SIZE)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Exporta tickets/projetos/relatórios/mensagens em streaming")
+    parser.add_argument("dataset", choices=list(DATASETS))
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("-o", "--output", default="-", help="Arquivo de saída (padrão: stdout)")
+    parser.add_argument("--from", dest="start", type=datetime.fromisoformat, help="created_at >= (ISO 8601)")
+    parser.add_argument("--to", dest="end", type=datetime.fromisoformat, help="created_at < (ISO 8601)")
+    parser.add_argument("--team", type=int, help="ID do time")
+    parser.add_argument("--status", nargs="+", default=(), help="Status (valor ou nome)")
+    parser.add_argument("--include-inactive", action="store_true", help="Inclui registros soft-deleted")
+    parser.add_argument("--chunk", type=int, default=settings.EXPORT_CHUNK_SIZE, help="Linhas por lote")
+    args = parser.parse_args()
+
+    filters = ExportFilters(args.start, args.end, args.team, tuple(args.status), args.include_inactive)
+    try:
+        written = TableExporter(chunk_size=args.chunk).export_to(args.dataset, args.format, args.output, filters)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.output != "-":
+        print(f"{args.output}: {written} bytes")
+
+
+if __name__ == "__main__":
+    main()
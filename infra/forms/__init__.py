@@ -0,0 +1,8 @@
+from .form_compiler import compile_form, parse_form_fields, FormValidatorCache, form_validator_cache
+
+__all__ = [
+    'compile_form',
+    'parse_form_fields',
+    'FormValidatorCache',
+    'form_validator_cache',
+]
@@ -0,0 +1,174 @@
+"""
+Compilador de Form.form_fields → modelo Pydantic de validação.
+
+Por que compilar?
+    form_fields é um JSON com a definição dos campos do formulário.
+    Re-parsear o JSON e montar as regras a cada ticket enviado é
+    desperdício: o formulário só muda quando form_version incrementa.
+    Aqui o JSON vira UMA classe Pydantic (validação em Rust/pydantic-core),
+    guardada em cache por (form_id, form_version).
+
+Formato aceito de form_fields:
+    {"fields": [                      # ou "campos", ou a lista direto
+        {"name": "data_ocorrencia", "type": "date", "required": true},
+        {"name": "valor", "type": "number", "min": 0, "max": 1000},
+        {"name": "area", "type": "select", "options": ["EAB", "CIA"]},
+        {"name": "detalhes", "type": "textarea", "max_length": 2000}
+    ]}
+
+Tipos: text, textarea, email, url, number, integer, boolean,
+       date, datetime, select, multiselect
+Regras opcionais: required, default, label, min/max (number/integer),
+                  min_length/max_length, pattern
+
+Nomes de campo:
+    O "name" é escolha de quem monta o formulário e pode colidir com o
+    Pydantic ("_x" não vira campo, "model_dump" sobrescreve método,
+    "model_config" vira configuração). No modelo cada campo se chama
+    f0, f1, ... e o name original é o alias: é por ele que as respostas
+    entram (model_validate) e saem (model_dump(by_alias=True)).
+"""
+import json
+from datetime import date, datetime
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from pydantic_core import SchemaError
+
+from infra.cache import LRUCache
+from infra.configs.settings import settings
+
+
+# Tipo Python base de cada tipo de campo
+FIELD_TYPES: dict[str, type] = {
+    "text": str,
+    "textarea": str,
+    "email": str,
+    "url": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "date": date,
+    "datetime": datetime,
+}
+
+# Padrões para tipos textuais especiais (sem depender de email-validator)
+FIELD_PATTERNS: dict[str, str] = {
+    "email": r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+    "url": r"^https?://\S+$",
+}
+
+
+def parse_form_fields(form_fields: str | dict | list) -> list[dict]:
+    """Normaliza form_fields (JSON string, dict ou lista) para a lista de campos."""
+    if isinstance(form_fields, str):
+        form_fields = json.loads(form_fields) if form_fields.strip() else []
+    if isinstance(form_fields, dict):
+        form_fields = form_fields.get("fields", form_fields.get("campos", []))
+    if not isinstance(form_fields, list):
+        raise ValueError("form_fields deve ser uma lista de campos")
+    return form_fields
+
+
+def _field_annotation(spec: dict) -> Any:
+    field_type = spec.get("type", "text")
+    if field_type in ("select", "multiselect") and not spec.get("options"):
+        raise ValueError(f"Campo '{spec.get('name')}' do tipo {field_type} precisa de 'options'")
+    if field_type == "select":
+        return Literal[tuple(spec["options"])]
+    if field_type == "multiselect":
+        return list[Literal[tuple(spec["options"])]]
+    if field_type not in FIELD_TYPES:
+        raise ValueError(f"Tipo de campo desconhecido: '{field_type}' (campo '{spec.get('name')}')")
+    return FIELD_TYPES[field_type]
+
+
+def _field_constraints(spec: dict) -> dict:
+    constraints = {
+        "ge": spec.get("min"),
+        "le": spec.get("max"),
+        "min_length": spec.get("min_length"),
+        "max_length": spec.get("max_length"),
+        "pattern": spec.get("pattern") or FIELD_PATTERNS.get(spec.get("type", "text")),
+        "description": spec.get("label"),
+    }
+    return {key: value for key, value in constraints.items() if value is not None}
+
+
+def compile_form(form_fields: str | dict | list, model_name: str = "FormSubmission") -> type[BaseModel]:
+    """
+    Gera a classe Pydantic que valida as respostas de um formulário.
+
+    - Campos required=True são obrigatórios; os demais aceitam None
+    - Campos não declarados no formulário são rejeitados (extra="forbid")
+
+    Raises:
+        ValueError: Definição de formulário inválida
+    """
+    definitions = {}
+    names = set()
+    for position, spec in enumerate(parse_form_fields(form_fields)):
+        if not isinstance(spec, dict):
+            raise ValueError(f"Campo {position} do formulário não é um objeto")
+        name = spec.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("Todo campo do formulário precisa de 'name'")
+        if name in names:
+            raise ValueError(f"Campo '{name}' repetido no formulário")
+        names.add(name)
+
+        annotation = _field_annotation(spec)
+        constraints = _field_constraints(spec)
+        if spec.get("required", False):
+            definitions[f"f{position}"] = (annotation, Field(..., alias=name, **constraints))
+        else:
+            definitions[f"f{position}"] = (Optional[annotation], Field(spec.get("default"), alias=name, **constraints))
+
+    try:
+        return create_model(
+            model_name,
+            __config__=ConfigDict(extra="forbid", str_strip_whitespace=True),
+            **definitions
+        )
+    except (TypeError, SchemaError) as error:
+        # PydanticUserError (TypeError) / regra inválida, ex.: pattern que não compila
+        raise ValueError(f"Definição de formulário inválida: {error}") from error
+
+
+class FormValidatorCache:
+    """
+    Cache LRU de validadores compilados, chaveado por (form_id, form_version).
+
+    Uma nova versão do formulário gera uma chave nova; a versão antiga
+    deixa de ser usada e sai do cache por LRU (ou por invalidate()).
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def get(self, form_id: int, form_version: int) -> type[BaseModel] | None:
+        return self._cache.get((form_id, form_version))
+
+    def compile(self, form_id: int, form_version: int, form_fields: str | dict | list) -> type[BaseModel]:
+        """Compila e guarda no cache."""
+        model = compile_form(form_fields, model_name=f"Form{form_id}V{form_version}")
+        self._cache.set((form_id, form_version), model)
+        return model
+
+    def invalidate(self, form_id: int) -> int:
+        """Remove todas as versões de um formulário do cache."""
+        return self._cache.discard_where(lambda key: key[0] == form_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    @property
+    def stats(self) -> dict:
+        return {"size": len(self._cache), "hits": self._cache.hits, "misses": self._cache.misses}
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.forms import form_validator_cache
+# =========================================================================
+form_validator_cache = FormValidatorCache(maxsize=settings.FORM_VALIDATOR_CACHE_SIZE)
@@ -0,0 +1,17 @@
+from .hr_sync import HrSyncJob, HrSyncStats, hr_sync_job
+from .soft_delete_purge import PurgePolicy, PurgeStats, SoftDeletePurgeJob, default_policies, soft_delete_purge_job
+from .ticket_archive import ArchiveStats, TicketArchiveJob, ticket_archive_job
+
+__all__ = [
+    'ArchiveStats',
+    'TicketArchiveJob',
+    'ticket_archive_job',
+    'PurgePolicy',
+    'PurgeStats',
+    'SoftDeletePurgeJob',
+    'default_policies',
+    'soft_delete_purge_job',
+    'HrSyncJob',
+    'HrSyncStats',
+    'hr_sync_job',
+]
@@ -0,0 +1,412 @@
+"""
+Sincronização incremental do diretório do RH (usuários e times).
+
+Fonte: arquivo CSV (com cabeçalho) ou JSONL (um objeto por linha), lido
+em streaming, com os campos:
+
+    matricula  ID corporativo (users.user_corporative_id)
+    nome       Nome completo
+    email      Email corporativo
+    time       Nome do time (criado se não existir)
+    area       Área do time (Area: eab, projetos, cia, indicadores)
+    papel      UserRole, pelo valor ou nome ("atendente" ou "N1")
+    tipo       UserTipo, pelo valor ou nome
+
+Detecção de mudança: cada registro normalizado vira um SHA-256, gravado
+em users.user_sync_hash quando aplicado. Os hashes são carregados uma vez
+(uma query); registro com o mesmo hash de um usuário ATIVO não gera
+escrita. Execução sem mudanças = ler o arquivo + duas queries.
+
+Aplicação, em lotes de batch_size registros (uma transação cada):
+    - times que não existem: TeamRepository.upsert_many (time homônimo
+      inativo é reativado)
+    - usuários novos, alterados ou de volta: UserRepository.upsert_many
+      pela matrícula (reativa inativos). Usuário criado aqui não tem senha
+      local: o login falha até alguém definir uma
+    - desligados: usuários que vieram do RH (user_sync_hash preenchido),
+      ativos e ausentes do arquivo → soft delete
+    - times existentes cuja área mudou no RH → atualizados
+
+Usuários locais (user_sync_hash NULL e fora do arquivo) nunca são
+tocados. Edição local de um usuário sincronizado vale até o registro dele
+mudar no RH. Times não são inativados (podem ter usuários locais).
+
+Proteção: se os desligados passarem de max_departure_ratio dos usuários
+sincronizados ativos (arquivo truncado/errado), nenhum é inativado
+(departures_blocked); use force=True / --force quando for real.
+
+Uso:
+    python -m infra.jobs.hr_sync funcionarios.csv
+    python -m infra.jobs.hr_sync funcionarios.jsonl --dry-run     # só o diff
+
+    from infra.jobs import hr_sync_job
+    stats = hr_sync_job.run("funcionarios.csv")
+    print(stats.summary())
+"""
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.database import Status
+from infra.configs.settings import settings
+from infra.entities.team import Area, Team
+from infra.entities.user import User, UserRole, UserTipo
+from infra.repositories.team_repository import TeamRepository
+from infra.repositories.user_repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("matricula", "nome", "email", "time", "area", "papel", "tipo")
+# Campos do usuário no hash (area é do time: mudar a área não altera os usuários)
+HASHED_FIELDS = ("matricula", "nome", "email", "time", "papel", "tipo")
+# Senha de usuário criado pela sincronização: não é um hash válido, o login sempre falha
+UNUSABLE_PASSWORD = "!"
+CHANGE_KINDS = ("inserted", "updated", "reactivated", "departed")
+
+KEY = ("user_corporative_id",)
+UPDATE_COLUMNS = ["user_full_name", "user_email", "user_team_id", "user_role", "user_tipo", "user_sync_hash"]
+
+
+@dataclass
+class HrSyncStats:
+    """Diff de uma execução; changes guarda as matrículas de cada tipo de mudança."""
+    read: int = 0
+    unchanged: int = 0
+    changes: dict[str, list[int]] = field(default_factory=lambda: {kind: [] for kind in CHANGE_KINDS})
+    teams_created: list[str] = field(default_factory=list)
+    teams_updated: list[str] = field(default_factory=list)
+    departures_blocked: int = 0
+    errors: list[str] = field(default_factory=list)
+    batches: int = 0
+    seconds: float = 0.0
+    dry_run: bool = False
+
+    def count(self, kind: str) -> int:
+        return len(self.changes[kind])
+
+    def summary(self, sample: int = 10) -> str:
+        """Resumo legível (CLI/log): contagens + algumas matrículas de cada tipo."""
+        prefix = "[dry-run] " if self.dry_run else ""
+        lines = [f"{prefix}{self.read} registros lidos, {self.unchanged} sem mudança ({self.seconds:.1f}s)"]
+        for kind in CHANGE_KINDS:
+            ids = self.changes[kind]
+            if ids:
+                more = f" (+{len(ids) - sample})" if len(ids) > sample else ""
+                lines.append(f"  {kind}: {len(ids)} — {', '.join(map(str, ids[:sample]))}{more}")
+        if self.teams_created:
+            lines.append(f"  times criados/reativados: {', '.join(self.teams_created)}")
+        if self.teams_updated:
+            lines.append(f"  times com área alterada: {', '.join(self.teams_updated)}")
+        if self.departures_blocked:
+            lines.append(f"  {self.departures_blocked} desligamentos NÃO aplicados (acima do limite; use --force)")
+        for error in self.errors[:sample]:
+            lines.append(f"  erro: {error}")
+        if len(self.errors) > sample:
+            lines.append(f"  ... +{len(self.errors) - sample} erros")
+        return "\n".join(lines)
+
+
+# =========================================================================
+# LEITURA E NORMALIZAÇÃO
+# =========================================================================
+
+def read_records(path: str | Path) -> Iterator[tuple[int, dict]]:
+    """(linha, registro) de um .csv ou .jsonl/.ndjson, sem carregar o arquivo."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in (".csv", ".jsonl", ".ndjson"):
+        raise ValueError(f"Formato não suportado: {path.name} (use .csv ou .jsonl)")
+    with path.open(encoding="utf-8-sig", newline="") as source:
+        if suffix == ".csv":
+            reader = csv.DictReader(source)
+            for record in reader:
+                yield reader.line_num, record
+            return
+        for number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except json.JSONDecodeError as error:
+                yield number, {"__invalid__": f"JSON inválido ({error.msg})"}
+
+
+@lru_cache(maxsize=None)
+def _enum(enum: type[Enum], text: str) -> Enum:
+    """Membro pelo valor ou pelo nome, sem diferenciar maiúsculas (poucos textos distintos: cache)."""
+    wanted = text.lower()
+    for member in enum:
+        if member.value == wanted or member.name.lower() == wanted:
+            return member
+    raise ValueError(f"{enum.__name__} inválido: {text}")
+
+
+def normalize(record: dict) -> dict:
+    """
+    Registro do RH → valores canônicos (espaços colapsados, email em
+    minúsculas, enums resolvidos). ValueError com o motivo se inválido.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("registro não é um objeto")
+    if "__invalid__" in record:
+        raise ValueError(record["__invalid__"])
+    values = {name: " ".join(str(record.get(name) or "").split()) for name in FIELDS}
+    missing = [name for name, value in values.items() if not value]
+    if missing:
+        raise ValueError(f"campos vazios: {', '.join(missing)}")
+    if not values["matricula"].isdigit():
+        raise ValueError(f"matrícula inválida: {values['matricula']}")
+    values["matricula"] = int(values["matricula"])
+    values["email"] = values["email"].lower()
+    values["area"] = _enum(Area, values["area"])
+    values["papel"] = _enum(UserRole, values["papel"])
+    values["tipo"] = _enum(UserTipo, values["tipo"])
+    return values
+
+
+def record_hash(values: dict) -> str:
+    """SHA-256 dos campos do usuário, estável entre execuções (enums pelo nome)."""
+    canonical = [
+        values[name].name if isinstance(values[name], Enum) else values[name] for name in HASHED_FIELDS
+    ]
+    return hashlib.sha256(json.dumps(canonical, ensure_ascii=False).encode()).hexdigest()
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+# =========================================================================
+# JOB
+# =========================================================================
+
+class HrSyncJob:
+    """
+    Espelha o arquivo do RH em users/teams, escrevendo só o que mudou.
+
+    Uso:
+        stats = hr_sync_job.run("funcionarios.csv")
+        stats = HrSyncJob(batch_size=500).run("rh.jsonl", dry_run=True)
+    """
+
+    def __init__(self, batch_size: int = 1000, max_departure_ratio: float = 0.1,
+                 users: UserRepository | None = None, teams: TeamRepository | None = None):
+        self.batch_size = batch_size
+        self.max_departure_ratio = max_departure_ratio
+        self.users = users or UserRepository()
+        self.teams = teams or TeamRepository()
+
+    # =========================================================================
+    # ESTADO ATUAL (uma query por tabela, do primário)
+    # =========================================================================
+
+    @staticmethod
+    def _load_users() -> dict:
+        """matrícula → (id, user_sync_hash, active) de todos os usuários."""
+        with DBConnectionHandler() as db:
+            rows = db.session.execute(
+                select(User.user_corporative_id, User.id, User.user_sync_hash, User.active)
+            ).all()
+        return {row.user_corporative_id: row for row in rows}
+
+    @staticmethod
+    def _load_teams() -> dict:
+        """nome → (id, team_area) dos times ativos."""
+        with DBConnectionHandler() as db:
+            rows = db.session.execute(
+                select(Team.team_name, Team.id, Team.team_area).where(Team.active_clause())
+            ).all()
+        return {row.team_name: (row.id, row.team_area) for row in rows}
+
+    # =========================================================================
+    # APLICAÇÃO
+    # =========================================================================
+
+    def _ensure_teams(self, names: set[str], areas: dict, teams: dict, stats: HrSyncStats, dry_run: bool) -> None:
+        """Cria (ou reativa) os times ainda desconhecidos e registra os ids em `teams`."""
+        missing = sorted(name for name in names if name not in teams)
+        if not missing:
+            return
+        stats.teams_created.extend(missing)
+        if dry_run:
+            teams.update({name: (None, areas[name]) for name in missing})
+            return
+        self.teams.upsert_many(
+            [{"team_name": name, "team_area": areas[name]} for name in missing],
+            ("team_name",), update_columns=["team_area"], inactive="reactivate"
+        )
+        with DBConnectionHandler() as db:
+            rows = db.session.execute(
+                select(Team.team_name, Team.id, Team.team_area)
+                .where(Team.team_name.in_(missing), Team.active_clause())
+            ).all()
+        teams.update({row.team_name: (row.id, row.team_area) for row in rows})
+
+    def _upsert(self, rows: list[dict]) -> None:
+        self.users.upsert_many(rows, KEY, UPDATE_COLUMNS, inactive="reactivate", batch_size=len(rows))
+
+    def _apply(self, pending: list[tuple[dict, str, str]], teams: dict, stats: HrSyncStats, dry_run: bool) -> None:
+        """Grava um lote de registros alterados (novos, alterados e de volta)."""
+        applied = pending
+        if not dry_run:
+            rows = [{
+                "user_corporative_id": values["matricula"],
+                "user_full_name": values["nome"],
+                "user_email": values["email"],
+                "user_password": UNUSABLE_PASSWORD,
+                "user_team_id": teams[values["time"]][0],
+                "user_role": values["papel"],
+                "user_tipo": values["tipo"],
+                "user_sync_hash": digest,
+            } for values, digest, _kind in pending]
+            try:
+                self._upsert(rows)
+            except IntegrityError:
+                # Um registro (ex: email de outro usuário ativo) derrubou o lote: isola um a um
+                applied = []
+                for item, row in zip(pending, rows):
+                    try:
+                        self._upsert([row])
+                    except IntegrityError as error:
+                        stats.errors.append(f"matrícula {row['user_corporative_id']}: {error.orig}")
+                    else:
+                        applied.append(item)
+        for values, _digest, kind in applied:
+            stats.changes[kind].append(values["matricula"])
+
+    def _sync_team_areas(self, areas: dict, teams: dict, stats: HrSyncStats, dry_run: bool) -> None:
+        for name, area in areas.items():
+            team_id, current = teams[name]
+            if current == area:
+                continue
+            stats.teams_updated.append(name)
+            if not dry_run:
+                self.teams.update(team_id, team_area=area)
+
+    def _depart(self, users: dict, seen: set[int], stats: HrSyncStats, dry_run: bool, force: bool) -> None:
+        """Soft delete dos usuários sincronizados que saíram do arquivo."""
+        managed = {
+            corporative_id: row for corporative_id, row in users.items()
+            if row.user_sync_hash is not None and row.active == Status.ATIVO
+        }
+        departed = [corporative_id for corporative_id in managed if corporative_id not in seen]
+        if not departed:
+            return
+        if not force and len(departed) > self.max_departure_ratio * len(managed):
+            stats.departures_blocked = len(departed)
+            logger.warning("Sincronização RH: %d de %d usuários sumiram do arquivo; desligamentos não aplicados",
+                           len(departed), len(managed))
+            return
+        if not dry_run:
+            for chunk in _batched(departed, self.batch_size):
+                self.users.soft_delete_cascade([managed[corporative_id].id for corporative_id in chunk])
+        stats.changes["departed"] = departed
+
+    def run(self, path: str | Path, dry_run: bool = False, force: bool = False,
+            progress: Callable[[HrSyncStats], None] | None = None) -> HrSyncStats:
+        """
+        Sincroniza a partir do arquivo.
+
+        Args:
+            path: .csv ou .jsonl do RH (arquivo COMPLETO: quem não está nele é desligado)
+            dry_run: Só calcula o diff, sem escrever
+            force: Aplica os desligamentos mesmo acima de max_departure_ratio
+            progress: Chamado após cada lote com as estatísticas acumuladas
+        """
+        stats = HrSyncStats(dry_run=dry_run)
+        started = time.monotonic()
+        users = self._load_users()
+        teams = self._load_teams()
+        seen: set[int] = set()
+        areas: dict[str, Area] = {}
+
+        for batch in _batched(read_records(path), self.batch_size):
+            pending = []
+            for line, record in batch:
+                stats.read += 1
+                try:
+                    values = normalize(record)
+                except ValueError as error:
+                    stats.errors.append(f"linha {line}: {error}")
+                    continue
+                corporative_id = values["matricula"]
+                if corporative_id in seen:
+                    stats.errors.append(f"linha {line}: matrícula {corporative_id} repetida (vale a primeira)")
+                    continue
+                seen.add(corporative_id)
+                areas[values["time"]] = values["area"]
+
+                digest = record_hash(values)
+                current = users.get(corporative_id)
+                if current is None:
+                    kind = "inserted"
+                elif current.active != Status.ATIVO:
+                    kind = "reactivated"
+                elif current.user_sync_hash != digest:
+                    kind = "updated"
+                else:
+                    stats.unchanged += 1
+                    continue
+                pending.append((values, digest, kind))
+
+            if pending:
+                self._ensure_teams({values["time"] for values, _digest, _kind in pending}, areas, teams, stats, dry_run)
+                self._apply(pending, teams, stats, dry_run)
+            stats.batches += 1
+            stats.seconds = time.monotonic() - started
+            if progress:
+                progress(stats)
+
+        self._ensure_teams(set(areas), areas, teams, stats, dry_run)
+        self._sync_team_areas(areas, teams, stats, dry_run)
+        self._depart(users, seen, stats, dry_run, force)
+        stats.seconds = time.monotonic() - started
+        logger.info(
+            "Sincronização RH: %d lidos, %d sem mudança, %s, %d erros (%.1fs)",
+            stats.read, stats.unchanged,
+            ", ".join(f"{stats.count(kind)} {kind}" for kind in CHANGE_KINDS), len(stats.errors), stats.seconds
+        )
+        return stats
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.jobs import hr_sync_job
+# =========================================================================
+hr_sync_job = HrSyncJob(
+    batch_size=settings.HR_SYNC_BATCH_SIZE,
+    max_departure_ratio=settings.HR_SYNC_MAX_DEPARTURE_RATIO
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sincroniza usuários e times com o arquivo do RH")
+    parser.add_argument("path", help="Arquivo .csv ou .jsonl completo do RH")
+    parser.add_argument("--batch", type=int, default=settings.HR_SYNC_BATCH_SIZE, help="Registros por transação")
+    parser.add_argument("--dry-run", action="store_true", help="Só mostra o diff, sem gravar")
+    parser.add_argument("--force", action="store_true",
+                        help="Aplica os desligamentos mesmo acima de HR_SYNC_MAX_DEPARTURE_RATIO")
+    args = parser.parse_args()
+
+    job = HrSyncJob(batch_size=args.batch, max_departure_ratio=settings.HR_SYNC_MAX_DEPARTURE_RATIO)
+    stats = job.run(args.path, dry_run=args.dry_run, force=args.force)
+    print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Job de retenção: remove de vez (ou arquiva) linhas soft-deleted antigas.
+
+BaseRepository.soft_delete() só marca active=INATIVO + deleted_at; as
+linhas continuam ocupando tabela e índices. Este job, por política de
+entidade (PurgePolicy):
+
+    - "delete":  DELETE das linhas INATIVAS com deleted_at < agora - after_days
+    - "archive": o mesmo, copiando antes para a archive_* (só tabelas de
+                 infra/entities/archive.py)
+
+Grafo de FKs:
+    - Tabelas processadas dos filhos para os pais (ordem de
+      Base.metadata.sorted_tables invertida): mensagens antes de chats,
+      chats antes de tickets, associações antes de usuários...
+    - Linha ainda referenciada por uma FK RESTRICT (ex.: usuário inativo
+      que ainda é cliente de um ticket) NÃO é removida: o guard
+      (id NOT IN filhos) vai no SELECT do lote e no próprio DELETE (referência
+      criada entre os dois não estoura IntegrityError). Fica como
+      "blocked" nas estatísticas e volta a ser avaliada na próxima execução.
+    - FKs SET NULL/CASCADE não bloqueiam (o banco resolve).
+
+Lotes de chunk_size linhas por transação (paginação por id), com pausa
+de pause_seconds entre lotes para não segurar o lock de escrita.
+
+Uso:
+    python -m infra.jobs.soft_delete_purge                    # settings PURGE_*
+    python -m infra.jobs.soft_delete_purge --days 30 --only messages notifications
+    python -m infra.jobs.soft_delete_purge --dry-run          # só conta
+
+    from infra.jobs import soft_delete_purge_job
+    stats = soft_delete_purge_job.run()
+"""
+import argparse
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import Table, and_, delete, func, insert, select
+
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.database import Base, Status
+from infra.configs.settings import settings
+from infra.entities.archive import ARCHIVE_TABLES
+from infra.repositories.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+ACTIONS = ("delete", "archive")
+# ondelete que o banco resolve sozinho (não bloqueiam a remoção do pai)
+NON_BLOCKING_ONDELETE = ("CASCADE", "SET NULL")
+
+
+@dataclass(frozen=True)
+class PurgePolicy:
+    """Retenção de uma tabela: após after_days de soft delete, delete ou archive."""
+    table: str
+    after_days: int
+    action: str = "delete"
+
+    def __post_init__(self):
+        if self.action not in ACTIONS:
+            raise ValueError(f"Ação inválida para {self.table}: {self.action} (use {ACTIONS})")
+        if self.table not in Base.metadata.tables:
+            raise ValueError(f"Tabela desconhecida: {self.table}")
+        if self.action == "archive" and self.table not in ARCHIVE_TABLES:
+            raise ValueError(f"{self.table} não tem tabela de arquivo (archive_{self.table})")
+
+
+@dataclass
+class PurgeStats:
+    """Resultado de uma execução (por tabela)."""
+    removed: dict[str, int] = field(default_factory=dict)
+    archived: dict[str, int] = field(default_factory=dict)
+    blocked: dict[str, int] = field(default_factory=dict)
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return sum(self.removed.values())
+
+
+def default_policies(after_days: int) -> list[PurgePolicy]:
+    """
+    Uma política por tabela com soft delete.
+
+    Tickets, chats e mensagens vão para o arquivo (mesmo lugar do
+    TicketArchiveJob, lidos pelo read-through); o resto é removido.
+    """
+    archived = ("tickets", "chats", "messages")
+    return [
+        PurgePolicy(name, after_days, "archive" if name in archived else "delete")
+        for name, table in Base.metadata.tables.items()
+        if "deleted_at" in table.c
+    ]
+
+
+class SoftDeletePurgeJob:
+    """
+    Remove/arquiva em lotes as linhas soft-deleted mais antigas que a política.
+
+    Uso:
+        stats = soft_delete_purge_job.run()
+        job = SoftDeletePurgeJob([PurgePolicy("notifications", 30)], chunk_size=200)
+        stats = job.run(progress=lambda table, stats: print(table, stats.total))
+    """
+
+    def __init__(self, policies: list[PurgePolicy], chunk_size: int = 1000, pause_seconds: float = 0.05):
+        self.chunk_size = chunk_size
+        self.pause_seconds = pause_seconds
+        # Filhos antes dos pais: a ordem das dependências de FK invertida
+        order = {table.name: position for position, table in enumerate(reversed(Base.metadata.sorted_tables))}
+        self.policies = sorted(policies, key=lambda policy: order[policy.table])
+
+    # =========================================================================
+    # CONDIÇÕES
+    # =========================================================================
+
+    @staticmethod
+    def _guards(table: Table) -> list:
+        """
+        id NOT IN (filhos) para cada FK RESTRICT/NO ACTION que aponta para `table`.
+
+        Subquery não correlacionada: o banco monta o conjunto uma vez por
+        statement (várias FKs de tickets só têm índice parcial de ATIVOS,
+        um NOT EXISTS correlacionado varreria tickets por linha candidata).
+        IS NOT NULL: um NULL no conjunto faria o NOT IN nunca ser verdadeiro.
+        """
+        guards = []
+        for child in Base.metadata.tables.values():
+            for fk in child.foreign_keys:
+                if fk.column.table is not table or (fk.ondelete or "").upper() in NON_BLOCKING_ONDELETE:
+                    continue
+                guards.append(fk.column.not_in(select(fk.parent).where(fk.parent.isnot(None))))
+        return guards
+
+    @staticmethod
+    def _expired(table: Table, cutoff: datetime):
+        return and_(table.c.active == Status.INATIVO, table.c.deleted_at < cutoff)
+
+    # =========================================================================
+    # CONTAGEM
+    # =========================================================================
+
+    def count_eligible(self, now: datetime | None = None) -> dict[str, tuple[int, int]]:
+        """{tabela: (removíveis agora, vencidas mas ainda referenciadas)}."""
+        now = now or datetime.now()
+        result = {}
+        with BaseRepository._read() as db:
+            for policy in self.policies:
+                table = Base.metadata.tables[policy.table]
+                expired = self._expired(table, now - timedelta(days=policy.after_days))
+                total = db.session.execute(select(func.count()).select_from(table).where(expired)).scalar()
+                free = db.session.execute(
+                    select(func.count()).select_from(table).where(expired, *self._guards(table))
+                ).scalar()
+                result[policy.table] = (free, total - free)
+        return result
+
+    # =========================================================================
+    # EXECUÇÃO
+    # =========================================================================
+
+    def _purge_chunk(self, policy: PurgePolicy, table: Table, ids: list[int], cutoff: datetime) -> int:
+        """Um lote numa transação; as condições são reavaliadas no DELETE."""
+        condition = and_(table.c.id.in_(ids), self._expired(table, cutoff), *self._guards(table))
+
+        def write(session) -> int:
+            if policy.action == "archive":
+                session.execute(
+                    insert(ARCHIVE_TABLES[table.name]).from_select(
+                        [column.name for column in table.columns], select(*table.columns).where(condition)
+                    )
+                )
+            return session.execute(delete(table).where(condition)).rowcount
+
+        return BaseRepository._run_write(write)
+
+    def run(self, max_rows: int | None = None, now: datetime | None = None,
+            progress: Callable[[str, PurgeStats], None] | None = None) -> PurgeStats:
+        """
+        Processa as políticas em ordem (filhos → pais), em lotes.
+
+        Args:
+            max_rows: Limite de linhas removidas nesta execução (None = todas)
+            now: Referência para a idade (testes)
+            progress: Chamado após cada lote com (tabela, estatísticas acumuladas)
+        """
+        now = now or datetime.now()
+        stats = PurgeStats()
+        started = time.monotonic()
+        for policy in self.policies:
+            if max_rows is not None and stats.total >= max_rows:
+                break
+            table = Base.metadata.tables[policy.table]
+            cutoff = now - timedelta(days=policy.after_days)
+            eligible = select(table.c.id).where(self._expired(table, cutoff), *self._guards(table))
+            last_id = 0
+            while max_rows is None or stats.total < max_rows:
+                limit = self.chunk_size if max_rows is None else min(self.chunk_size, max_rows - stats.total)
+                # Primário: o próximo lote depende dos DELETEs anteriores
+                with DBConnectionHandler() as db:
+                    ids = list(db.session.execute(
+                        eligible.where(table.c.id > last_id).order_by(table.c.id).limit(limit)
+                    ).scalars())
+                if not ids:
+                    break
+                last_id = ids[-1]
+
+                removed = self._purge_chunk(policy, table, ids, cutoff)
+                stats.removed[policy.table] = stats.removed.get(policy.table, 0) + removed
+                if policy.action == "archive":
+                    stats.archived[policy.table] = stats.archived.get(policy.table, 0) + removed
+                stats.chunks += 1
+                stats.seconds = time.monotonic() - started
+                if progress:
+                    progress(policy.table, stats)
+                if self.pause_seconds:
+                    time.sleep(self.pause_seconds)
+
+            if max_rows is not None and stats.total >= max_rows:
+                break
+            # Esgotou os lotes: o que ainda venceu e ficou é referenciado (guard)
+            with DBConnectionHandler() as db:
+                blocked = db.session.execute(
+                    select(func.count()).select_from(table).where(self._expired(table, cutoff))
+                ).scalar()
+            if blocked:
+                stats.blocked[policy.table] = blocked
+
+        stats.seconds = time.monotonic() - started
+        logger.info("Purga: %d linhas em %d lotes (%.1fs), %d ainda referenciadas",
+                    stats.total, stats.chunks, stats.seconds, sum(stats.blocked.values()))
+        return stats
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.jobs import soft_delete_purge_job
+# =========================================================================
+soft_delete_purge_job = SoftDeletePurgeJob(
+    default_policies(settings.PURGE_AFTER_DAYS),
+    chunk_size=settings.PURGE_CHUNK_SIZE,
+    pause_seconds=settings.PURGE_PAUSE_SECONDS
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Remove/arquiva linhas soft-deleted antigas")
+    parser.add_argument("--days", type=int, default=settings.PURGE_AFTER_DAYS,
+                        help="Idade mínima do soft delete (dias)")
+    parser.add_argument("--chunk", type=int, default=settings.PURGE_CHUNK_SIZE, help="Linhas por transação")
+    parser.add_argument("--pause", type=float, default=settings.PURGE_PAUSE_SECONDS,
+                        help="Pausa entre lotes (segundos)")
+    parser.add_argument("--only", nargs="+", metavar="TABELA", help="Só estas tabelas")
+    parser.add_argument("--delete-only", action="store_true", help="Remove sem arquivar")
+    parser.add_argument("--max", type=int, default=None, help="Máximo de linhas nesta execução")
+    parser.add_argument("--dry-run", action="store_true", help="Só conta as linhas elegíveis")
+    args = parser.parse_args()
+
+    policies = default_policies(args.days)
+    if args.only:
+        unknown = set(args.only) - {policy.table for policy in policies}
+        if unknown:
+            parser.error(f"tabelas sem soft delete: {', '.join(sorted(unknown))}")
+        policies = [policy for policy in policies if policy.table in args.only]
+    if args.delete_only:
+        policies = [PurgePolicy(policy.table, policy.after_days) for policy in policies]
+
+    job = SoftDeletePurgeJob(policies, chunk_size=args.chunk, pause_seconds=args.pause)
+    if args.dry_run:
+        for table, (free, blocked) in job.count_eligible().items():
+            if free or blocked:
+                print(f"  {table}: {free} removíveis, {blocked} ainda referenciadas")
+        return
+
+    def progress(table: str, stats: PurgeStats) -> None:
+        print(f"  lote {stats.chunks}: {table} ({stats.removed[table]} linhas, {stats.seconds:.1f}s)")
+
+    stats = job.run(max_rows=args.max, progress=progress)
+    print(f"{stats.total} linhas removidas em {stats.chunks} lotes ({stats.seconds:.1f}s)")
+    for table, count in stats.removed.items():
+        archived = " (arquivadas)" if table in stats.archived else ""
+        print(f"  {table}: {count}{archived}")
+    for table, count in stats.blocked.items():
+        print(f"  {table}: {count} ainda referenciadas (mantidas)")
+
+
+if __name__ == "__main__":
+    main()
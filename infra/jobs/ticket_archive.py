@@ -0,0 +1,160 @@
+"""
+Job de arquivamento de tickets encerrados/cancelados.
+
+Fluxo:
+    1. Seleciona até chunk_size tickets ATIVOS com status ENCERRADO ou
+       CANCELADO fechados há mais de after_days dias
+       (ticket_closed_at; sem ele, updated_at)
+    2. ArchiveRepository.archive_tickets(lote): INSERT ... SELECT nas
+       archive_* e DELETE das tabelas quentes, numa transação
+    3. Pausa pause_seconds (deixa outras escritas pegarem o lock) e repete
+       até não sobrar ticket elegível (ou até max_tickets)
+
+Lotes pequenos = transações curtas: o lock de escrita do SQLite fica
+com o job por milissegundos, não pelo tempo da carga inteira.
+
+Uso:
+    python -m infra.jobs.ticket_archive                  # settings ARCHIVE_*
+    python -m infra.jobs.ticket_archive --days 90 --chunk 200
+    python -m infra.jobs.ticket_archive --dry-run        # só conta os elegíveis
+
+    from infra.jobs import ticket_archive_job
+    stats = ticket_archive_job.run()
+"""
+import argparse
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import func, select
+
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.settings import settings
+from infra.entities.ticket import Ticket, TicketStatus
+from infra.repositories.archive_repository import ArchiveRepository
+from infra.repositories.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+CLOSED_STATUSES = (TicketStatus.ENCERRADO, TicketStatus.CANCELADO)
+
+
+@dataclass
+class ArchiveStats:
+    """Resultado de uma execução."""
+    tickets: int = 0
+    chunks: int = 0
+    rows: dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+
+class TicketArchiveJob:
+    """
+    Move tickets fechados antigos (e dependentes) para as tabelas de arquivo.
+
+    Uso:
+        stats = ticket_archive_job.run()
+        stats = TicketArchiveJob(after_days=30, chunk_size=100).run(progress=print)
+    """
+
+    def __init__(self, after_days: int = 180, chunk_size: int = 500, pause_seconds: float = 0.05,
+                 repository: ArchiveRepository | None = None):
+        self.after_days = after_days
+        self.chunk_size = chunk_size
+        self.pause_seconds = pause_seconds
+        self.repository = repository or ArchiveRepository()
+
+    def _eligible(self, cutoff: datetime):
+        return select(Ticket.id).where(
+            Ticket.ticket_status.in_(CLOSED_STATUSES),
+            Ticket.active_clause(),
+            func.coalesce(Ticket.ticket_closed_at, Ticket.updated_at) < cutoff
+        )
+
+    def count_eligible(self, now: datetime | None = None) -> int:
+        """Tickets que seriam arquivados agora."""
+        cutoff = (now or datetime.now()) - timedelta(days=self.after_days)
+        with BaseRepository._read() as db:
+            return db.session.execute(
+                select(func.count()).select_from(self._eligible(cutoff).subquery())
+            ).scalar()
+
+    def run(self, max_tickets: int | None = None, now: datetime | None = None,
+            progress: Callable[[ArchiveStats], None] | None = None) -> ArchiveStats:
+        """
+        Arquiva em lotes até esgotar os elegíveis.
+
+        Args:
+            max_tickets: Limite de tickets nesta execução (None = todos)
+            now: Referência para a idade (testes)
+            progress: Chamado após cada lote com as estatísticas acumuladas
+        """
+        cutoff = (now or datetime.now()) - timedelta(days=self.after_days)
+        stats = ArchiveStats()
+        started = time.monotonic()
+        while max_tickets is None or stats.tickets < max_tickets:
+            limit = self.chunk_size if max_tickets is None else min(self.chunk_size, max_tickets - stats.tickets)
+            # Lê do primário: o lote seguinte depende do DELETE do anterior
+            with DBConnectionHandler() as db:
+                ids = list(db.session.execute(
+                    self._eligible(cutoff).order_by(Ticket.id).limit(limit)
+                ).scalars())
+            if not ids:
+                break
+
+            moved = self.repository.archive_tickets(ids)
+            stats.tickets += moved.get("tickets", 0)
+            stats.chunks += 1
+            for table, count in moved.items():
+                stats.rows[table] = stats.rows.get(table, 0) + count
+            stats.seconds = time.monotonic() - started
+            if progress:
+                progress(stats)
+            if self.pause_seconds:
+                time.sleep(self.pause_seconds)
+
+        stats.seconds = time.monotonic() - started
+        logger.info("Arquivamento: %d tickets em %d lotes (%.1fs)", stats.tickets, stats.chunks, stats.seconds)
+        return stats
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.jobs import ticket_archive_job
+# =========================================================================
+ticket_archive_job = TicketArchiveJob(
+    after_days=settings.ARCHIVE_TICKETS_AFTER_DAYS,
+    chunk_size=settings.ARCHIVE_CHUNK_SIZE,
+    pause_seconds=settings.ARCHIVE_PAUSE_SECONDS
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Arquiva tickets encerrados/cancelados antigos")
+    parser.add_argument("--days", type=int, default=settings.ARCHIVE_TICKETS_AFTER_DAYS,
+                        help="Idade mínima (dias desde o encerramento)")
+    parser.add_argument("--chunk", type=int, default=settings.ARCHIVE_CHUNK_SIZE, help="Tickets por transação")
+    parser.add_argument("--pause", type=float, default=settings.ARCHIVE_PAUSE_SECONDS,
+                        help="Pausa entre lotes (segundos)")
+    parser.add_argument("--max", type=int, default=None, help="Máximo de tickets nesta execução")
+    parser.add_argument("--dry-run", action="store_true", help="Só conta os tickets elegíveis")
+    args = parser.parse_args()
+
+    job = TicketArchiveJob(after_days=args.days, chunk_size=args.chunk, pause_seconds=args.pause)
+    if args.dry_run:
+        print(f"{job.count_eligible()} tickets elegíveis (fechados há mais de {args.days} dias)")
+        return
+
+    def progress(stats: ArchiveStats) -> None:
+        print(f"  lote {stats.chunks}: {stats.tickets} tickets arquivados ({stats.seconds:.1f}s)")
+
+    stats = job.run(max_tickets=args.max, progress=progress)
+    print(f"{stats.tickets} tickets arquivados em {stats.chunks} lotes ({stats.seconds:.1f}s)")
+    for table, count in stats.rows.items():
+        print(f"  {table}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+from .smtp_mailer import SMTPMailer
+from .outbox_worker import OutboxWorker, outbox_worker
+
+__all__ = [
+    'SMTPMailer',
+    'OutboxWorker',
+    'outbox_worker',
+]
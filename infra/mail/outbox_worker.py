@@ -0,0 +1,146 @@
+"""
+Worker assíncrono que drena a outbox de e-mails.
+
+Fluxo de cada ciclo:
+    1. Reserva até batch_size * concurrency e-mails vencidos (PENDENTE → ENVIANDO)
+    2. Divide em lotes de batch_size (um lote = uma conexão SMTP)
+    3. Envia os lotes em paralelo, limitado por um Semaphore(concurrency)
+    4. Sucesso → ENVIADO + ticket_mail_sent_at dos tickets
+       Falha   → retry com backoff exponencial (+ jitter) ou FALHOU
+
+smtplib e o acesso ao banco são bloqueantes: rodam em threads
+(asyncio.to_thread) para não travar o event loop da API.
+"""
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta
+
+from infra.configs.settings import settings
+from infra.mail.smtp_mailer import SMTPMailer
+from infra.repositories.outbox_repository import OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    """
+    Entrega os e-mails da outbox com concorrência limitada e retries.
+
+    Uso (lifespan do FastAPI):
+        outbox_worker.start()      # cria a task no event loop atual
+        await outbox_worker.stop()
+
+    Uso pontual (scripts/testes com aiosmtpd):
+        await OutboxWorker(mailer=SMTPMailer(port=1025)).drain_once()
+    """
+
+    def __init__(self, mailer: SMTPMailer | None = None, repository: OutboxRepository | None = None,
+                 batch_size: int = 50, concurrency: int = 4, max_attempts: int = 5,
+                 backoff_seconds: float = 30, max_backoff_seconds: float = 3600,
+                 poll_seconds: float = 5):
+        self.mailer = mailer or SMTPMailer()
+        self.repository = repository or OutboxRepository()
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.poll_seconds = poll_seconds
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    # =========================================================================
+    # CICLO DE ENVIO
+    # =========================================================================
+
+    async def drain_once(self) -> int:
+        """
+        Executa um ciclo de envio.
+
+        Returns:
+            Quantidade de e-mails entregues
+        """
+        claimed = await asyncio.to_thread(self.repository.claim_due, self.batch_size * self.concurrency)
+        if not claimed:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        batches = [claimed[i:i + self.batch_size] for i in range(0, len(claimed), self.batch_size)]
+        delivered = await asyncio.gather(*(self._send_batch(batch, semaphore) for batch in batches))
+        return sum(delivered)
+
+    async def _send_batch(self, batch: list[dict], semaphore: asyncio.Semaphore) -> int:
+        async with semaphore:
+            errors = await asyncio.to_thread(self.mailer.send_batch, batch)
+
+        sent = [mail for mail in batch if mail['id'] not in errors]
+        if sent:
+            ticket_ids = {mail['outbox_ticket_id'] for mail in sent if mail['outbox_ticket_id']}
+            await asyncio.to_thread(self.repository.mark_sent, [mail['id'] for mail in sent], ticket_ids)
+
+        for mail in batch:
+            if mail['id'] in errors:
+                next_attempt_at = self._next_attempt_at(mail['outbox_attempts'] + 1)
+                await asyncio.to_thread(self.repository.mark_failed, mail['id'], errors[mail['id']], next_attempt_at)
+                if next_attempt_at is None:
+                    logger.error("E-mail %s descartado após %s tentativas: %s",
+                                 mail['id'], self.max_attempts, errors[mail['id']])
+        return len(sent)
+
+    def _next_attempt_at(self, attempts: int) -> datetime | None:
+        """Backoff exponencial com jitter; None quando esgotou as tentativas."""
+        if attempts >= self.max_attempts:
+            return None
+        delay = min(self.backoff_seconds * (2 ** (attempts - 1)), self.max_backoff_seconds)
+        delay *= random.uniform(1.0, 1.2)
+        return datetime.now() + timedelta(seconds=delay)
+
+    # =========================================================================
+    # LOOP EM BACKGROUND
+    # =========================================================================
+
+    async def run(self) -> None:
+        """Drena a outbox até stop(); dorme poll_seconds quando está vazia."""
+        # E-mails presos em ENVIANDO por um worker que morreu voltam para a fila
+        stuck_before = datetime.now() - timedelta(minutes=10)
+        await asyncio.to_thread(self.repository.release_stuck, stuck_before)
+
+        while not self._stopping.is_set():
+            try:
+                delivered = await self.drain_once()
+            except Exception:
+                logger.exception("Falha no ciclo da outbox")
+                delivered = 0
+            if delivered == 0:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """Cria a task do worker no event loop atual."""
+        if self._task and not self._task.done():
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self.run(), name="outbox-worker")
+
+    async def stop(self) -> None:
+        """Sinaliza parada e aguarda o ciclo atual terminar."""
+        self._stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.mail import outbox_worker
+# =========================================================================
+outbox_worker = OutboxWorker(
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    concurrency=settings.OUTBOX_CONCURRENCY,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    backoff_seconds=settings.OUTBOX_BACKOFF_SECONDS,
+    poll_seconds=settings.OUTBOX_POLL_SECONDS
+)
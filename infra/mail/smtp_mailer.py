@@ -0,0 +1,73 @@
+"""
+Cliente SMTP que envia um LOTE de e-mails por conexão.
+
+Abrir conexão + STARTTLS + AUTH custa mais que o envio em si;
+por isso cada lote reaproveita a mesma conexão.
+
+Servidor local para desenvolvimento/testes (aiosmtpd):
+    python -m aiosmtpd -n -l localhost:1025
+"""
+import smtplib
+from email.message import EmailMessage
+
+from infra.configs.settings import settings
+
+
+class SMTPMailer:
+    """
+    Envia lotes de e-mails da outbox via smtplib.
+
+    Uso:
+        mailer = SMTPMailer()
+        errors = mailer.send_batch([{'id': 1, 'outbox_recipient': ..., ...}])
+        # errors = {outbox_id: "mensagem de erro"} apenas para os que falharam
+    """
+
+    def __init__(self, host: str | None = None, port: int | None = None,
+                 username: str | None = None, password: str | None = None,
+                 starttls: bool | None = None, sender: str | None = None,
+                 timeout: float = 30):
+        self.host = host or settings.SMTP_HOST
+        self.port = port or settings.SMTP_PORT
+        self.username = username if username is not None else settings.SMTP_USERNAME
+        self.password = password if password is not None else settings.SMTP_PASSWORD
+        self.starttls = settings.SMTP_STARTTLS if starttls is None else starttls
+        self.sender = sender or settings.SMTP_FROM
+        self.timeout = timeout
+
+    def send_batch(self, mails: list[dict]) -> dict[int, str]:
+        """
+        Envia os e-mails usando UMA conexão SMTP.
+
+        Args:
+            mails: Dicts de OutboxMessage (to_dict)
+
+        Returns:
+            Dict {outbox_id: erro} dos e-mails que falharam.
+            Se a conexão falhar, todos do lote falham.
+        """
+        errors: dict[int, str] = {}
+        try:
+            with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+                if self.starttls:
+                    smtp.starttls()
+                if self.username:
+                    smtp.login(self.username, self.password or "")
+
+                for mail in mails:
+                    try:
+                        smtp.send_message(self._build_message(mail))
+                    except smtplib.SMTPException as exc:
+                        errors[mail['id']] = f"{type(exc).__name__}: {exc}"
+        except (OSError, smtplib.SMTPException) as exc:
+            for mail in mails:
+                errors.setdefault(mail['id'], f"{type(exc).__name__}: {exc}")
+        return errors
+
+    def _build_message(self, mail: dict) -> EmailMessage:
+        message = EmailMessage()
+        message['From'] = self.sender
+        message['To'] = mail['outbox_recipient']
+        message['Subject'] = mail['outbox_subject']
+        message.set_content(mail['outbox_body'])
+        return message
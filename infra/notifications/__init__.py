@@ -0,0 +1,8 @@
+from .pipeline import NotificationEvent, NotificationPipeline, notification_pipeline, accepts
+
+__all__ = [
+    'NotificationEvent',
+    'NotificationPipeline',
+    'notification_pipeline',
+    'accepts',
+]
@@ -0,0 +1,298 @@
+"""
+Pipeline de notificações para seguidores (fan-out em lote).
+
+Fluxo:
+    Repository (update_status, create de mensagem, approve)
+        → notification_pipeline.publish(evento)      # só enfileira, O(1)
+        → worker em background acorda a cada janela de digest
+        → flush(): agrupa eventos por entidade, resolve seguidores e
+          preferências em lote e grava as notificações com executemany
+        → seguidores que aceitam e-mail recebem o digest via outbox
+          (mesma transação); o OutboxWorker entrega e registra
+          ticket_mail_sent_at
+
+Por que não gravar dentro da requisição?
+    Um ticket com 200 seguidores geraria 200 INSERTs síncronos a cada
+    mudança de status. Aqui a requisição só faz um append em memória;
+    o custo de gravação é pago em lote e fora do caminho da requisição.
+
+Digest:
+    Vários eventos da MESMA entidade dentro da janela viram UMA
+    notificação por seguidor (notification_event_count = quantidade).
+
+Entrega no máximo uma vez (at-most-once):
+    O buffer vive só na memória do processo. Eventos ainda não gravados
+    se perdem se o processo morrer (kill, OOM, deploy sem stop()), e com o
+    banco fora do ar o buffer fica limitado a max_buffer: acima disso os
+    eventos MAIS ANTIGOS são descartados (com log de aviso). Notificação é
+    aviso, não registro: o estado real continua na entidade. O e-mail, depois
+    de gravado no outbox junto com as notificações, tem entrega garantida.
+"""
+import logging
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from infra.configs.settings import settings
+from infra.entities.notification import NotificationTipo, NotificationEntidade
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from infra.repositories.notification_repository import NotificationRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class NotificationEvent:
+    """
+    Evento de domínio que interessa aos seguidores de uma entidade.
+
+    Attributes:
+        event_type: Tipo do evento (STATUS_CHANGE, NEW_MESSAGE, APPROVAL)
+        entity_type: Entidade seguida (TICKET, PROJECT, REPORT)
+        entity_id: ID da entidade
+        summary: Texto curto do evento (vira título/linha do digest)
+        actor_id: Usuário que causou o evento (não é notificado)
+        occurred_at: Momento do evento
+    """
+    event_type: NotificationTipo
+    entity_type: NotificationEntidade
+    entity_id: int
+    summary: str
+    actor_id: int | None = None
+    occurred_at: datetime = field(default_factory=datetime.now)
+
+
+def accepts(preferences: dict, event_type: NotificationTipo, channel: str) -> bool:
+    """
+    Verifica se as preferências do usuário aceitam o evento no canal.
+
+    Formato de user_notification_preferences (tudo opcional, default = habilitado):
+        {"in_app": true, "email": false, "events": {"new_message": false}}
+    """
+    if preferences.get(channel) is False:
+        return False
+    events = preferences.get("events") or {}
+    return events.get(event_type.value, True) is not False
+
+
+class NotificationPipeline:
+    """
+    Buffer de eventos + worker que grava notificações em lote.
+
+    Uso:
+        notification_pipeline.publish(NotificationEvent(...))  # na requisição
+        notification_pipeline.start()                          # no startup da API
+        notification_pipeline.stop()                           # no shutdown (faz flush final)
+    """
+
+    def __init__(self, digest_window_seconds: float = 60, batch_size: int = 500,
+                 max_buffer: int = 10000, repository: "NotificationRepository | None" = None):
+        self.digest_window_seconds = digest_window_seconds
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self._repository = repository
+        self._buffer: deque[NotificationEvent] = deque()
+        self._dropped = 0
+        self._reported = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def repository(self) -> "NotificationRepository":
+        """
+        Repository criado sob demanda.
+
+        Import tardio: os repositories publicam eventos neste módulo,
+        então importá-los no topo criaria import circular.
+        """
+        if self._repository is None:
+            from infra.repositories.notification_repository import NotificationRepository
+            self._repository = NotificationRepository()
+        return self._repository
+
+    # =========================================================================
+    # PUBLICAÇÃO (caminho da requisição)
+    # =========================================================================
+
+    def publish(self, event: NotificationEvent) -> None:
+        """
+        Enfileira um evento. Acorda o worker se o buffer encheu.
+
+        Com o buffer cheio (worker atrasado ou banco fora do ar) o evento
+        mais antigo é descartado para abrir espaço.
+        """
+        with self._lock:
+            self._buffer.append(event)
+            self._trim()
+            full = len(self._buffer) >= self.max_buffer
+        if full:
+            self._wake.set()
+
+    def _trim(self) -> None:
+        """Descarta os eventos mais antigos acima de max_buffer (chamar com o lock)."""
+        while len(self._buffer) > self.max_buffer:
+            self._buffer.popleft()
+            self._dropped += 1
+
+    def pending(self) -> int:
+        """Quantidade de eventos aguardando flush."""
+        with self._lock:
+            return len(self._buffer)
+
+    def dropped(self) -> int:
+        """Eventos descartados por buffer cheio desde o início do processo."""
+        with self._lock:
+            return self._dropped
+
+    # =========================================================================
+    # FLUSH (worker)
+    # =========================================================================
+
+    def flush(self) -> int:
+        """
+        Processa todos os eventos pendentes.
+
+        Returns:
+            Quantidade de notificações gravadas
+        """
+        with self._lock:
+            events, self._buffer = list(self._buffer), deque()
+            dropped, self._reported = self._dropped - self._reported, self._dropped
+        if dropped:
+            logger.warning("%d evento(s) de notificação descartado(s): buffer cheio (max_buffer=%d)",
+                           dropped, self.max_buffer)
+        if not events:
+            return 0
+
+        try:
+            return self._process(events)
+        except Exception:
+            # Devolve os eventos ao buffer para a próxima janela, antes dos
+            # publicados durante o flush; o excedente sai pelos mais antigos
+            with self._lock:
+                self._buffer.extendleft(reversed(events))
+                self._trim()
+            raise
+
+    def _process(self, events: list[NotificationEvent]) -> int:
+        grouped: dict[tuple[NotificationEntidade, int], list[NotificationEvent]] = defaultdict(list)
+        for event in events:
+            grouped[(event.entity_type, event.entity_id)].append(event)
+
+        # Uma query de seguidores por TIPO de entidade (não por entidade)
+        followers: dict[tuple[NotificationEntidade, int], set[int]] = {}
+        for entity_type in {key[0] for key in grouped}:
+            entity_ids = [entity_id for (kind, entity_id) in grouped if kind == entity_type]
+            for entity_id, user_ids in self.repository.select_followers(entity_type, entity_ids).items():
+                followers[(entity_type, entity_id)] = user_ids
+
+        all_users = set().union(*followers.values()) if followers else set()
+        recipients = self.repository.select_recipients(all_users)
+
+        rows = []
+        mails = []
+        for (entity_type, entity_id), group in grouped.items():
+            for user_id in followers.get((entity_type, entity_id), ()):
+                if user_id not in recipients:
+                    continue
+                email, user_preferences = recipients[user_id]
+                # Ninguém é notificado da própria ação
+                visible = [event for event in group if event.actor_id != user_id]
+
+                in_app = [event for event in visible
+                          if accepts(user_preferences, event.event_type, "in_app")]
+                if in_app:
+                    rows.append(self._build_row(user_id, entity_type, entity_id, in_app))
+
+                by_email = [event for event in visible
+                            if accepts(user_preferences, event.event_type, "email")]
+                if by_email:
+                    mails.append(self._build_mail(email, entity_type, entity_id, by_email))
+
+        if not rows and not mails:
+            return 0
+        return self.repository.insert_many(rows, self.batch_size, mails)
+
+    @staticmethod
+    def _build_row(user_id: int, entity_type: NotificationEntidade, entity_id: int,
+                   events: list[NotificationEvent]) -> dict:
+        """Monta a linha de Notification (evento único ou digest)."""
+        if len(events) == 1:
+            return {
+                'notification_user_id': user_id,
+                'notification_type': events[0].event_type,
+                'notification_entity_type': entity_type,
+                'notification_entity_id': entity_id,
+                'notification_title': events[0].summary,
+                'notification_content': None,
+                'notification_event_count': 1,
+            }
+
+        types = {event.event_type for event in events}
+        return {
+            'notification_user_id': user_id,
+            'notification_type': types.pop() if len(types) == 1 else NotificationTipo.DIGEST,
+            'notification_entity_type': entity_type,
+            'notification_entity_id': entity_id,
+            'notification_title': f"{len(events)} atualizações em {entity_type.value} #{entity_id}",
+            'notification_content': "\n".join(event.summary for event in events),
+            'notification_event_count': len(events),
+        }
+
+    @classmethod
+    def _build_mail(cls, email: str, entity_type: NotificationEntidade, entity_id: int,
+                    events: list[NotificationEvent]) -> dict:
+        """Monta a linha de OutboxMessage com o digest do seguidor."""
+        row = cls._build_row(0, entity_type, entity_id, events)
+        return {
+            'outbox_recipient': email,
+            'outbox_subject': row['notification_title'],
+            'outbox_body': row['notification_content'] or row['notification_title'],
+            'outbox_ticket_id': entity_id if entity_type == NotificationEntidade.TICKET else None,
+        }
+
+    # =========================================================================
+    # WORKER EM BACKGROUND
+    # =========================================================================
+
+    def start(self) -> None:
+        """Inicia a thread que faz flush a cada janela de digest."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="notification-pipeline", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Para o worker e grava o que ainda estiver no buffer."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.digest_window_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Falha ao gravar notificações; eventos mantidos para a próxima janela")
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.notifications import notification_pipeline
+# =========================================================================
+notification_pipeline = NotificationPipeline(
+    digest_window_seconds=settings.NOTIFICATION_DIGEST_SECONDS,
+    batch_size=settings.NOTIFICATION_BATCH_SIZE,
+    max_buffer=settings.NOTIFICATION_MAX_BUFFER
+)
@@ -1,4 +1,4 @@
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, VersionConflictError
 from .team_repository import TeamRepository
 from .user_repository import UserRepository
 from .report_repository import ReportRepository
@@ -7,3 +7,7 @@ from .ticket_repository import TicketRepository
 from .form_repository import FormRepository
 from .chat_repository import ChatRepository
 from .message_repository import MessageRepository
+from .chat_read_pointer_repository import ChatReadPointerRepository
+from .notification_repository import NotificationRepository
+from .outbox_repository import OutboxRepository
+from .archive_repository import ArchiveRepository
@@ -0,0 +1,130 @@
+from datetime import datetime
+from enum import Enum as PyEnum
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from infra.configs.database import Status
+from infra.entities.archive import ARCHIVE_TABLES
+from infra.entities.associations import TicketAttendant, TicketTeam, UserTicketFollow
+from infra.entities.chat import Chat
+from infra.entities.chat_read_pointer import ChatReadPointer
+from infra.entities.message import Message
+from infra.entities.ticket import Ticket
+from infra.repositories.base_repository import BaseRepository
+
+
+class ArchiveRepository:
+    """
+    Repositório do arquivo de tickets (tabelas archive_*).
+
+    Não herda de BaseRepository: não há entidade ORM por trás, só as
+    Tables de infra/entities/archive.py. Escritas e leituras seguem o
+    mesmo caminho dos outros repositories (_run_write / _read).
+
+    Escrita: archive_tickets() move um lote de tickets com todo o grafo
+    dependente numa transação (INSERT ... SELECT + DELETE por tabela).
+    Leitura: select_ticket(), select_chat_by_ticket(), select_messages_by_chat()
+    devolvem dicts no formato de to_dict() + archived_at — é o que os
+    repositories de Ticket/Chat/Message usam no read-through.
+    """
+
+    # tabela quente -> (entidade, filtro pelo lote de tickets), filhos primeiro
+    @staticmethod
+    def _graph(ticket_ids: list[int]) -> list[tuple[type, object]]:
+        chat_ids = select(Chat.id).where(Chat.chat_ticket_id.in_(ticket_ids))
+        return [
+            (ChatReadPointer, ChatReadPointer.pointer_chat_id.in_(chat_ids)),
+            (Message, Message.message_chat_id.in_(chat_ids)),
+            (Chat, Chat.chat_ticket_id.in_(ticket_ids)),
+            (TicketAttendant, TicketAttendant.ticket_id.in_(ticket_ids)),
+            (TicketTeam, TicketTeam.ticket_id.in_(ticket_ids)),
+            (UserTicketFollow, UserTicketFollow.ticket_id.in_(ticket_ids)),
+            (Ticket, Ticket.id.in_(ticket_ids)),
+        ]
+
+    # =========================================================================
+    # ARQUIVAMENTO
+    # =========================================================================
+
+    def archive_tickets(self, ticket_ids: list[int]) -> dict[str, int]:
+        """
+        Move os tickets e seus dependentes para as tabelas de arquivo.
+
+        Uma transação por chamada: se algo falhar, nada sai das tabelas
+        quentes. Chamado em lotes pequenos por TicketArchiveJob.
+
+        Returns:
+            {tabela: linhas movidas}
+        """
+        if not ticket_ids:
+            return {}
+
+        def write(session: Session) -> dict[str, int]:
+            moved = {}
+            for model, condition in self._graph(ticket_ids):
+                table = model.__table__
+                columns = [column.name for column in table.columns]
+                session.execute(
+                    insert(ARCHIVE_TABLES[table.name]).from_select(
+                        columns, select(*table.columns).where(condition)
+                    )
+                )
+                result = session.execute(
+                    delete(table).where(condition),
+                    execution_options={"synchronize_session": False}
+                )
+                moved[table.name] = result.rowcount
+            return moved
+
+        return BaseRepository._run_write(write)
+
+    # =========================================================================
+    # LEITURA (read-through)
+    # =========================================================================
+
+    @staticmethod
+    def _to_dict(row) -> dict:
+        """Mesmo formato de Base.to_dict() (Enum → value, datetime → ISO)."""
+        result = {}
+        for key, value in row._mapping.items():
+            if isinstance(value, PyEnum):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            result[key] = value
+        return result
+
+    def select_ticket(self, ticket_id: int) -> dict | None:
+        """Ticket arquivado pelo ID (None se não está no arquivo)."""
+        table = ARCHIVE_TABLES["tickets"]
+        with BaseRepository._read() as db:
+            row = db.session.execute(select(table).where(table.c.id == ticket_id)).first()
+            return self._to_dict(row) if row else None
+
+    def select_chat_by_ticket(self, ticket_id: int) -> dict | None:
+        """Chat arquivado de um ticket."""
+        table = ARCHIVE_TABLES["chats"]
+        with BaseRepository._read() as db:
+            row = db.session.execute(select(table).where(table.c.chat_ticket_id == ticket_id)).first()
+            return self._to_dict(row) if row else None
+
+    def select_messages_by_chat(self, chat_id: int, include_internal: bool = True) -> list[dict]:
+        """Mensagens arquivadas de um chat, em ordem (ativas, como _base_query)."""
+        table = ARCHIVE_TABLES["messages"]
+        query = select(table).where(
+            table.c.message_chat_id == chat_id, table.c.active == Status.ATIVO
+        )
+        if not include_internal:
+            query = query.where(table.c.message_is_internal == False)
+        with BaseRepository._read() as db:
+            rows = db.session.execute(query.order_by(table.c.created_at)).all()
+            return [self._to_dict(row) for row in rows]
+
+    def count(self) -> dict[str, int]:
+        """Linhas em cada tabela de arquivo."""
+        with BaseRepository._read() as db:
+            return {
+                name: db.session.execute(select(func.count()).select_from(table)).scalar()
+                for name, table in ARCHIVE_TABLES.items()
+            }
@@ -10,14 +10,48 @@ Regra de Ouro:
 - NUNCA execute DELETE real no banco
 - Use soft_delete() que marca active=INATIVO
 - Todas as queries filtram por active != INATIVO automaticamente
+- soft_delete()/restore() seguem as regras __soft_cascade__ da entidade
+  (dependentes inativados/restaurados juntos, um UPDATE por tabela)
+
+Colunas adiadas (deferred_group nas entidades):
+- Listagens trazem só as colunas de resumo; to_dict() omite as adiadas
+- select_by_id() carrega todos os grupos (detalhe)
+- Para uma listagem com um grupo: select_all(groups=("detail",))
+
+Escritas (_run_write):
+- DB_WRITE_MODE=direct: cada escrita abre sua própria transação
+- DB_WRITE_MODE=queue: a escrita vai para a fila do escritor único
+  (write_queue), com group commit; leituras continuam diretas
+
+Auditoria (infra/configs/audit.py):
+- created_by/updated_by/deleted_by vêm do usuário do contexto (requisição
+  autenticada ou acting_as); os parâmetros updated_by/deleted_by só são
+  necessários para sobrescrever
+
+Concorrência otimista (infra/configs/versioning.py):
+- Entidades Versioned têm a coluna version; update(..., expected_version=v)
+  é um UPDATE condicional e levanta VersionConflictError se alguém gravou antes
+
+Leituras (_read):
+- select_*, count e exists usam DBConnectionHandler(read_only=True):
+  réplica, ou o primário logo após uma escrita da sessão (read-your-writes)
 """
-from datetime import datetime
-from typing import TypeVar, Generic, Type, List, Optional, Any
+from concurrent.futures import Future
+from typing import TypeVar, Generic, Type, List, Optional, Any, Callable
 
-from sqlalchemy.orm import Session
+from sqlalchemy import UniqueConstraint, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, undefer_group
 
 from infra.configs.connection import DBConnectionHandler
+from infra.configs.replicas import replica_router
+from infra.configs.settings import settings
+from infra.configs.write_queue import write_queue
 from infra.configs.database import Base, Status
+from infra.configs.versioning import SKIP_VERSION_BUMP, VersionConflictError, Versioned
+from infra.configs import audit, json_type, soft_cascade  # noqa: F401 (audit: eventos da Session)
+from infra.entities.outbox import OutboxMessage
 
 # Generic type para a entidade
 T = TypeVar("T", bound=Base)
@@ -43,55 +77,110 @@ class BaseRepository(Generic[T]):
     # =========================================================================
 
     def _base_query(self, session: Session):
-        """Query base que filtra registros soft-deleted."""
-        return session.query(self.model).filter(self.model.active != Status.INATIVO)
+        """Query base que filtra registros soft-deleted (predicado dos índices parciais)."""
+        return session.query(self.model).filter(self.model.active_clause())
 
     def _base_query_all(self, session: Session):
         """Query que inclui TODOS os registros (inclusive soft-deleted)."""
         return session.query(self.model)
 
+    def _deferred_groups(self) -> set[str]:
+        """Grupos de colunas adiadas declarados na entidade."""
+        return {
+            prop.group for prop in self.model.__mapper__.column_attrs
+            if prop.deferred and prop.group
+        }
+
+    def _load_groups(self, query, groups=None):
+        """Carrega grupos adiados na mesma query (None = todos os grupos da entidade)."""
+        if groups is None:
+            groups = self._deferred_groups()
+        return query.options(*[undefer_group(group) for group in groups]) if groups else query
+
+    # =========================================================================
+    # EXECUÇÃO DE ESCRITAS
+    # =========================================================================
+
+    @staticmethod
+    def _read() -> DBConnectionHandler:
+        """Conexão para leitura (pode ser uma réplica)."""
+        return DBConnectionHandler(read_only=True)
+
+    @staticmethod
+    def _run_write(fn: Callable[[Session], Any]) -> Any:
+        """Executa fn(session) numa transação de escrita e devolve o resultado."""
+        try:
+            if settings.DB_WRITE_MODE == "queue":
+                return write_queue.submit(fn).result()
+            with DBConnectionHandler() as db:
+                return fn(db.session)
+        finally:
+            replica_router.mark_write()
+
+    @staticmethod
+    def submit_write(fn: Callable[[Session], Any]) -> Future:
+        """
+        Como _run_write, mas devolve um Future (no modo queue não bloqueia).
+        Em rotas async: await asyncio.wrap_future(repository.submit_write(fn))
+        """
+        replica_router.mark_write()
+        if settings.DB_WRITE_MODE == "queue":
+            return write_queue.submit(fn)
+        future = Future()
+        try:
+            with DBConnectionHandler() as db:
+                result = fn(db.session)
+            future.set_result(result)
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
     # =========================================================================
     # SELECT
     # =========================================================================
 
-    def select_all(self, include_inactive: bool = False) -> List[dict]:
+    def select_all(self, include_inactive: bool = False, groups: tuple = ()) -> List[dict]:
         """
-        Retorna todos os registros ativos.
+        Retorna todos os registros ativos (só colunas de resumo).
 
         Args:
             include_inactive: Se True, inclui registros soft-deleted
+            groups: Grupos de colunas adiadas a incluir (ex: ("detail",))
         """
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             if include_inactive:
-                data = self._base_query_all(db.session).all()
+                query = self._base_query_all(db.session)
             else:
-                data = self._base_query(db.session).all()
+                query = self._base_query(db.session)
+            data = self._load_groups(query, groups).all()
             return [item.to_dict() for item in data]
 
-    def select_by_id(self, id: int, include_inactive: bool = False) -> Optional[dict]:
+    def select_by_id(self, id: int, include_inactive: bool = False,
+                     groups: tuple | None = None) -> Optional[dict]:
         """
-        Retorna registro por ID.
+        Retorna registro por ID (detalhe: todas as colunas).
 
         Args:
             id: ID do registro
             include_inactive: Se True, inclui registros soft-deleted
+            groups: Grupos adiados a carregar (None = todos, () = só resumo)
         """
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             if include_inactive:
                 query = self._base_query_all(db.session)
             else:
                 query = self._base_query(db.session)
-            data = query.filter(self.model.id == id).first()
+            data = self._load_groups(query, groups).filter(self.model.id == id).first()
             return data.to_dict() if data else None
 
     def exists(self, id: int) -> bool:
         """Verifica se registro existe (e está ativo)."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             return self._base_query(db.session).filter(self.model.id == id).first() is not None
 
     def count(self, include_inactive: bool = False) -> int:
         """Conta registros."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             if include_inactive:
                 return self._base_query_all(db.session).count()
             return self._base_query(db.session).count()
@@ -100,48 +189,292 @@ class BaseRepository(Generic[T]):
     # INSERT
     # =========================================================================
 
-    def insert(self, entity: T) -> int:
+    def insert(self, entity: T, outbox: Optional[List[OutboxMessage]] = None) -> int:
         """
         Insere uma nova entidade.
 
         Args:
             entity: Instância da entidade a ser inserida
+            outbox: E-mails gravados na MESMA transação (entregues pelo OutboxWorker)
 
         Returns:
             ID do registro criado
         """
-        with DBConnectionHandler() as db:
-            db.session.add(entity)
-            db.session.flush()
-            db.session.refresh(entity)
+        def write(session: Session) -> int:
+            session.add(entity)
+            if outbox:
+                session.add_all(outbox)
+            session.flush()
+            session.refresh(entity)
             return entity.id
 
+        return self._run_write(write)
+
     # =========================================================================
     # UPDATE
     # =========================================================================
 
-    def update(self, id: int, updated_by: Optional[int] = None, **kwargs) -> bool:
+    def update(self, id: int, updated_by: Optional[int] = None,
+               outbox: Optional[List[OutboxMessage]] = None,
+               expected_version: Optional[int] = None, **kwargs) -> bool:
         """
-        Atualiza campos específicos de um registro.
+        Atualiza campos específicos de um registro (um único UPDATE).
 
         Args:
             id: ID do registro
-            updated_by: ID do usuário que está atualizando
+            updated_by: ID do usuário que está atualizando (padrão: usuário do contexto)
+            outbox: E-mails gravados na MESMA transação (só se o registro existir)
+            expected_version: Versão lida antes (entidades Versioned); se o
+                registro mudou desde então, levanta VersionConflictError
             **kwargs: Campos a serem atualizados
 
         Returns:
             True se atualizou, False se não encontrou
+
+        Raises:
+            VersionConflictError: expected_version diferente da versão atual
         """
-        with DBConnectionHandler() as db:
-            query = self._base_query(db.session).filter(self.model.id == id)
-            if query.first() is None:
+        if updated_by:
+            kwargs['updated_by'] = updated_by
+        if expected_version is not None and not issubclass(self.model, Versioned):
+            raise ValueError(f"{self.model.__name__} não tem coluna version")
+
+        def write(session: Session) -> bool:
+            query = self._base_query(session).filter(self.model.id == id)
+            if expected_version is not None:
+                query = query.filter(self.model.version == expected_version)
+            if query.update(kwargs, synchronize_session=False) == 0:
+                if expected_version is not None:
+                    self._raise_conflict(session, id, expected_version)
                 return False
 
+            if outbox:
+                session.add_all(outbox)
+            return True
+
+        return self._run_write(write)
+
+    def _raise_conflict(self, session: Session, id: int, expected_version: int) -> None:
+        """Após um UPDATE condicional sem linhas: conflito se o registro existe."""
+        current = session.execute(
+            select(self.model.version).where(self.model.id == id, self.model.active_clause())
+        ).scalar()
+        if current is not None:
+            raise VersionConflictError(self.model.__name__, id, expected_version, current)
+
+    # =========================================================================
+    # UPSERT (ingestão em lote: sincronizações RH, catálogo de relatórios)
+    # =========================================================================
+
+    def _conflict_target(self, columns: tuple, dialect: str) -> tuple[list, Any]:
+        """
+        Índice/constraint UNIQUE com exatamente `columns` → (index_elements, index_where).
+        Índice parcial (active_index) precisa do mesmo WHERE no ON CONFLICT,
+        o declarado para o dialeto da sessão (sqlite_where/postgresql_where).
+        """
+        table = self.model.__table__
+        wanted = set(columns)
+        for index in table.indexes:
+            if index.unique and {column.name for column in index.columns} == wanted:
+                return list(columns), index.dialect_options[dialect]["where"]
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint) and {column.name for column in constraint.columns} == wanted:
+                return list(columns), None
+        raise ValueError(f"{table.name}: nenhum índice UNIQUE em {columns} (ON CONFLICT precisa de um)")
+
+    def upsert_many(self, rows: List[dict], conflict_columns: tuple | list,
+                    update_columns: Optional[list] = None, inactive: str = "skip",
+                    batch_size: int = 500) -> dict[str, int]:
+        """
+        INSERT ... ON CONFLICT DO UPDATE em lotes (SQLite e PostgreSQL).
+
+        Por lote (uma transação cada): um SELECT das chaves existentes, um
+        INSERT ... ON CONFLICT para novas + ativas e, se for o caso, um
+        UPDATE em lote das inativas reativadas. Nada de select_by_* por linha.
+
+        Args:
+            rows: Dicts coluna → valor (todos com as mesmas chaves)
+            conflict_columns: Chave natural, com índice UNIQUE (ex: ("user_corporative_id",))
+            update_columns: Colunas atualizadas quando a chave já existe
+                (padrão: todas as de `rows` menos a chave)
+            inactive: Chave que só existe em registro soft-deleted:
+                "skip" = ignora (foi apagado de propósito);
+                "reactivate" = atualiza e volta para ATIVO
+            batch_size: Linhas por transação
+
+        Returns:
+            {"inserted", "updated", "reactivated", "skipped"}
+        """
+        if inactive not in ("skip", "reactivate"):
+            raise ValueError(f"inactive inválido: {inactive} (use 'skip' ou 'reactivate')")
+        conflict_columns = tuple(conflict_columns)
+        if update_columns is None:
+            update_columns = [key for key in (rows[0] if rows else {}) if key not in conflict_columns]
+        keys = [getattr(self.model, column) for column in conflict_columns]
+        versioned = issubclass(self.model, Versioned)
+        counts = {"inserted": 0, "updated": 0, "reactivated": 0, "skipped": 0}
+
+        def write(session: Session, batch: list[dict]) -> None:
+            index_elements, index_where = self._conflict_target(conflict_columns, self._dialect(session))
+            # Última ocorrência de cada chave vence (ON CONFLICT não afeta a mesma linha duas vezes)
+            by_key = {tuple(row[column] for column in conflict_columns): row for row in batch}
+            key_filter = keys[0].in_([key[0] for key in by_key]) if len(keys) == 1 else tuple_(*keys).in_(list(by_key))
+            state = [self.model.id, self.model.active] + ([self.model.version] if versioned else [])
+            existing = session.execute(select(*state, *keys).where(key_filter)).all()
+            active_keys = {tuple(row[len(state):]) for row in existing if row.active == Status.ATIVO}
+            inactive_rows = {tuple(row[len(state):]): row for row in existing if row.active != Status.ATIVO}
+
+            upsert_rows, reactivate_rows = [], []
+            for key, row in by_key.items():
+                if key in active_keys or key not in inactive_rows:
+                    upsert_rows.append(row)
+                    counts["updated" if key in active_keys else "inserted"] += 1
+                elif inactive == "reactivate":
+                    current = inactive_rows[key]
+                    reactivate_rows.append({
+                        **{column: row[column] for column in update_columns},
+                        "id": current.id, "active": Status.ATIVO, "deleted_at": None, "deleted_by": None,
+                        # UPDATE por PK de entidade Versioned: versão lida (o ORM confere e incrementa)
+                        **({"version": current.version} if versioned else {})
+                    })
+                    counts["reactivated"] += 1
+                else:
+                    counts["skipped"] += 1
+
+            if upsert_rows:
+                statement = self._dialect_insert(session)(self.model)
+                excluded = statement.excluded
+                set_ = {column: excluded[column] for column in update_columns}
+                set_["updated_at"] = func.now()
+                # Sem usuário no contexto (job do sistema) o autor da última edição fica
+                set_["updated_by"] = func.coalesce(excluded.updated_by, self.model.updated_by)
+                if versioned:
+                    set_["version"] = self.model.version + 1
+                session.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=index_elements,
+                        index_where=index_where,
+                        set_=set_,
+                        # Chave UNIQUE cheia + registro inativo: não mexe (tratado acima)
+                        where=self.model.active_clause()
+                    ),
+                    upsert_rows
+                )
+            if reactivate_rows:
+                session.execute(update(self.model), reactivate_rows)
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            self._run_write(lambda session: write(session, batch))
+        return counts
+
+    @staticmethod
+    def _dialect_insert(session: Session):
+        """insert() com on_conflict_do_update do dialeto."""
+        dialect = session.get_bind().dialect.name
+        if dialect == "sqlite":
+            return sqlite_insert
+        if dialect == "postgresql":
+            return postgresql_insert
+        raise NotImplementedError(f"upsert_many não suporta o dialeto {dialect}")
+
+    # =========================================================================
+    # COLUNAS JSON (consulta/patch por sub-campo, direto no banco)
+    # =========================================================================
+
+    @staticmethod
+    def _dialect(session: Session) -> str:
+        return session.get_bind().dialect.name
+
+    def select_by_json_key(self, column: str, key: str, value: Any) -> List[dict]:
+        """
+        Registros cujo documento JSON tem `key == value` (chave de 1º nível).
+
+        Ex: UserRepository().select_by_json_key("user_notification_preferences", "email", False)
+        """
+        with self._read() as db:
+            condition = json_type.json_key_equals(
+                getattr(self.model, column), key, value, self._dialect(db.session)
+            )
+            return [item.to_dict() for item in self._base_query(db.session).filter(condition).all()]
+
+    def select_by_json_item(self, column: str, key: str, value: Any) -> List[dict]:
+        """
+        Registros cujo array JSON contém um objeto com `key == value`.
+
+        Ex: ProjectRepository().select_by_json_item("project_tasks", "status", "pendente")
+        """
+        with self._read() as db:
+            condition = json_type.json_array_contains(
+                getattr(self.model, column), key, value, self._dialect(db.session)
+            )
+            return [item.to_dict() for item in self._base_query(db.session).filter(condition).all()]
+
+    def select_json_item(self, id: int, column: str, key: str, value: Any) -> Optional[dict]:
+        """
+        Primeiro objeto do array JSON de um registro com `key == value`
+        (lê só a coluna JSON, não a entidade inteira).
+        """
+        with self._read() as db:
+            items = self._base_query(db.session).filter(
+                self.model.id == id
+            ).with_entities(getattr(self.model, column)).scalar()
+        for item in items or []:
+            if isinstance(item, dict) and item.get(key) == value:
+                return item
+        return None
+
+    def _json_patch(self, id: int, column: str, build, updated_by: Optional[int],
+                    bump_version: bool = True) -> bool:
+        def write(session: Session) -> bool:
+            attr = getattr(self.model, column)
+            values = {attr: build(attr, self._dialect(session))}
             if updated_by:
-                kwargs['updated_by'] = updated_by
+                values[self.model.updated_by] = updated_by
+            query = self._base_query(session).filter(self.model.id == id)
+            if not bump_version:
+                query = query.execution_options(**SKIP_VERSION_BUMP)
+            rowcount = query.update(values, synchronize_session=False)
+            return rowcount > 0
 
-            query.update(kwargs)
-            return True
+        return self._run_write(write)
+
+    def json_set(self, id: int, column: str, path: tuple, value: Any,
+                 updated_by: Optional[int] = None) -> bool:
+        """
+        Define um sub-campo do documento JSON num único UPDATE.
+
+        Ex: UserRepository().json_set(1, "user_notification_preferences", ("events", "new_message"), False)
+
+        Returns:
+            True se atualizou, False se não encontrou
+        """
+        return self._json_patch(
+            id, column, lambda attr, dialect: json_type.json_set(attr, path, value, dialect), updated_by
+        )
+
+    def json_remove(self, id: int, column: str, path: tuple,
+                    updated_by: Optional[int] = None) -> bool:
+        """Remove um sub-campo do documento JSON num único UPDATE."""
+        return self._json_patch(
+            id, column, lambda attr, dialect: json_type.json_remove(attr, path, dialect), updated_by
+        )
+
+    def json_append(self, id: int, column: str, value: Any,
+                    updated_by: Optional[int] = None, bump_version: bool = True) -> bool:
+        """
+        Adiciona um item ao final de um array JSON num único UPDATE
+        (sem ler o array inteiro; appends concorrentes não se sobrescrevem).
+
+        bump_version=False: não sobe a versão de entidades Versioned
+        (append que não conflita com a edição de quem leu a versão atual).
+
+        Ex: TicketRepository().json_append(7, "ticket_attachments", {"sha256": "...", "name": "a.pdf"})
+        """
+        return self._json_patch(
+            id, column, lambda attr, dialect: json_type.json_append(attr, value, dialect), updated_by,
+            bump_version
+        )
 
     # =========================================================================
     # SOFT DELETE
@@ -149,30 +482,21 @@ class BaseRepository(Generic[T]):
 
     def soft_delete(self, id: int, deleted_by: Optional[int] = None) -> bool:
         """
-        Marca registro como inativo (soft delete).
+        Marca registro como inativo (soft delete), em cascata pelas regras
+        __soft_cascade__ da entidade (ver soft_delete_cascade).
 
         Args:
             id: ID do registro
-            deleted_by: ID do usuário que está deletando
+            deleted_by: ID do usuário que está deletando (padrão: usuário do contexto)
 
         Returns:
             True se deletou, False se não encontrou
         """
-        with DBConnectionHandler() as db:
-            query = self._base_query(db.session).filter(self.model.id == id)
-            if query.first() is None:
-                return False
-
-            query.update({
-                self.model.active: Status.INATIVO,
-                self.model.deleted_at: datetime.now(),
-                self.model.deleted_by: deleted_by
-            })
-            return True
+        return self.soft_delete_cascade([id], deleted_by=deleted_by)[self.model.__tablename__] > 0
 
     def restore(self, id: int) -> bool:
         """
-        Restaura registro soft-deleted.
+        Restaura registro soft-deleted e o que foi inativado junto com ele.
 
         Args:
             id: ID do registro
@@ -180,20 +504,30 @@ class BaseRepository(Generic[T]):
         Returns:
             True se restaurou, False se não encontrou
         """
-        with DBConnectionHandler() as db:
-            query = self._base_query_all(db.session).filter(
-                self.model.id == id,
-                self.model.active == Status.INATIVO
-            )
-            if query.first() is None:
-                return False
+        return self.restore_cascade([id])[self.model.__tablename__] > 0
 
-            query.update({
-                self.model.active: Status.ATIVO,
-                self.model.deleted_at: None,
-                self.model.deleted_by: None
-            })
-            return True
+    def soft_delete_cascade(self, ids: List[int], deleted_by: Optional[int] = None) -> dict[str, int]:
+        """
+        Soft delete de vários registros e de todo o subgrafo declarado em
+        __soft_cascade__: um UPDATE por tabela, numa transação, com o mesmo
+        deleted_at/deleted_by.
+
+        Returns:
+            {tabela: linhas inativadas}
+        """
+        return self._run_write(
+            lambda session: soft_cascade.soft_delete_cascade(session, self.model, ids, deleted_by=deleted_by)
+        )
+
+    def restore_cascade(self, ids: List[int]) -> dict[str, int]:
+        """
+        Restaura vários registros e, de cada um, o que foi inativado na
+        mesma cascata (mesmo deleted_at).
+
+        Returns:
+            {tabela: linhas restauradas}
+        """
+        return self._run_write(lambda session: soft_cascade.restore_cascade(session, self.model, ids))
 
     # =========================================================================
     # HARD DELETE (usar com cautela!)
@@ -212,13 +546,15 @@ class BaseRepository(Generic[T]):
         Returns:
             True se deletou, False se não encontrou
         """
-        with DBConnectionHandler() as db:
-            query = db.session.query(self.model).filter(self.model.id == id)
+        def write(session: Session) -> bool:
+            query = session.query(self.model).filter(self.model.id == id)
             if query.first() is None:
                 return False
             query.delete()
             return True
 
+        return self._run_write(write)
+
     # =========================================================================
     # MÉTODOS DE RELACIONAMENTO (para subclasses)
     # =========================================================================
@@ -0,0 +1,192 @@
+from datetime import datetime
+
+from sqlalchemy import func, insert, literal, select, union, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.database import Status
+from infra.entities.associations import TicketAttendant, UserTicketFollow
+from infra.entities.chat import Chat
+from infra.entities.chat_read_pointer import ChatReadPointer
+from infra.entities.message import Message
+from infra.entities.ticket import Ticket
+from infra.entities.user import User, UserTipo
+from infra.repositories.base_repository import BaseRepository
+
+
+class ChatReadPointerRepository(BaseRepository[ChatReadPointer]):
+    """
+    Repositório para ponteiros de leitura e badges de não lidas.
+
+    Herda de BaseRepository:
+    - select_all(), select_by_id()
+    - insert(), update()
+    - soft_delete(), restore()
+    - count(), exists()
+
+    Escrita: register_message() roda dentro da transação de
+    MessageRepository.create (3 statements, independente do tamanho do chat).
+    Leitura: select_badges() devolve os contadores de N tickets em UMA query.
+    """
+
+    def __init__(self):
+        super().__init__(ChatReadPointer)
+
+    # =========================================================================
+    # MANUTENÇÃO NA ESCRITA (mesma transação da mensagem)
+    # =========================================================================
+
+    @classmethod
+    def register_message(cls, session: Session, message: Message, ticket_id: int | None) -> None:
+        """
+        Atualiza os ponteiros do chat para uma mensagem recém-inserida (flush feito).
+
+        1. Cria ponteiros (zerados) para participantes que ainda não têm
+        2. Incrementa o contador de quem pode ver a mensagem, exceto o autor
+           (mensagem interna não conta para SOLICITANTE)
+        3. Avança o ponteiro do autor até a própria mensagem
+        """
+        chat_id = message.message_chat_id
+        sender_id = message.message_user_id
+        if ticket_id is not None:
+            cls._ensure_participants(session, chat_id, ticket_id, sender_id)
+
+        increment = update(ChatReadPointer).where(
+            ChatReadPointer.pointer_chat_id == chat_id,
+            ChatReadPointer.pointer_user_id != sender_id,
+            ChatReadPointer.active_clause()
+        ).values(pointer_unread_count=ChatReadPointer.pointer_unread_count + 1)
+        if message.message_is_internal:
+            staff = select(User.id).where(User.user_tipo != UserTipo.SOLICITANTE)
+            increment = increment.where(ChatReadPointer.pointer_user_id.in_(staff))
+        session.execute(increment, execution_options={"synchronize_session": False})
+
+        session.execute(update(ChatReadPointer).where(
+            ChatReadPointer.pointer_chat_id == chat_id,
+            ChatReadPointer.pointer_user_id == sender_id
+        ).values(
+            pointer_last_read_message_id=message.id,
+            pointer_last_read_at=datetime.now(),
+            pointer_unread_count=0
+        ), execution_options={"synchronize_session": False})
+
+    @staticmethod
+    def _ensure_participants(session: Session, chat_id: int, ticket_id: int, sender_id: int) -> None:
+        """INSERT ... SELECT dos participantes sem ponteiro (cliente, atendentes, seguidores, autor)."""
+        participants = union(
+            select(Ticket.ticket_client_id.label("user_id")).where(Ticket.id == ticket_id),
+            select(TicketAttendant.user_id).where(
+                TicketAttendant.ticket_id == ticket_id, TicketAttendant.active_clause()
+            ),
+            select(UserTicketFollow.user_id).where(
+                UserTicketFollow.ticket_id == ticket_id, UserTicketFollow.active_clause()
+            ),
+            select(literal(sender_id).label("user_id")),
+        ).subquery("participants")
+
+        existing = select(ChatReadPointer.id).where(
+            ChatReadPointer.pointer_chat_id == chat_id,
+            ChatReadPointer.pointer_user_id == participants.c.user_id
+        ).exists()
+        rows = select(
+            literal(chat_id), participants.c.user_id, literal(0),
+            literal(Status.ATIVO, ChatReadPointer.__table__.c.active.type)
+        ).where(~existing)
+
+        columns = ["pointer_chat_id", "pointer_user_id", "pointer_unread_count", "active"]
+        dialect = session.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            # Corrida com outra mensagem no mesmo chat: o índice único decide
+            dialect_insert = (sqlite if dialect == "sqlite" else postgresql).insert
+            statement = dialect_insert(ChatReadPointer).from_select(columns, rows).on_conflict_do_nothing()
+        else:
+            statement = insert(ChatReadPointer).from_select(columns, rows)
+        session.execute(statement)
+
+    # =========================================================================
+    # LEITURA
+    # =========================================================================
+
+    def mark_read(self, user_id: int, chat_id: int) -> bool:
+        """Zera o contador do usuário no chat e avança o ponteiro até a última mensagem."""
+        def write(session: Session) -> bool:
+            last_message_id = session.query(func.max(Message.id)).filter(
+                Message.message_chat_id == chat_id
+            ).scalar()
+            pointer = session.query(ChatReadPointer).filter(
+                ChatReadPointer.pointer_user_id == user_id,
+                ChatReadPointer.pointer_chat_id == chat_id
+            ).first()
+            if pointer is None:
+                pointer = ChatReadPointer(pointer_chat_id=chat_id, pointer_user_id=user_id)
+                session.add(pointer)
+            pointer.pointer_last_read_message_id = last_message_id
+            pointer.pointer_last_read_at = datetime.now()
+            pointer.pointer_unread_count = 0
+            pointer.active = Status.ATIVO
+            return True
+
+        return self._run_write(write)
+
+    def mark_ticket_read(self, user_id: int, ticket_id: int) -> bool:
+        """mark_read pelo ID do ticket (False se o ticket não tem chat)."""
+        with DBConnectionHandler() as db:
+            chat_id = db.session.query(Chat.id).filter(Chat.chat_ticket_id == ticket_id).scalar()
+        return self.mark_read(user_id, chat_id) if chat_id is not None else False
+
+    def select_badges(self, user_id: int, ticket_ids: list[int]) -> dict[int, int]:
+        """
+        Não lidas por ticket para uma lista de tickets, em UMA query indexada
+        (chats pelo índice único de ticket + ponteiros por (usuário, chat)).
+
+        Returns:
+            {ticket_id: não lidas} só para tickets com contador > 0
+        """
+        if not ticket_ids:
+            return {}
+        with self._read() as db:
+            rows = db.session.query(
+                Chat.chat_ticket_id, ChatReadPointer.pointer_unread_count
+            ).join(
+                ChatReadPointer, ChatReadPointer.pointer_chat_id == Chat.id
+            ).filter(
+                ChatReadPointer.pointer_user_id == user_id,
+                Chat.chat_ticket_id.in_(ticket_ids),
+                ChatReadPointer.pointer_unread_count > 0,
+                ChatReadPointer.active_clause()
+            ).all()
+            return {ticket_id: count for ticket_id, count in rows}
+
+    # =========================================================================
+    # REPARO
+    # =========================================================================
+
+    def rebuild(self, chat_id: int) -> int:
+        """
+        Recalcula os contadores do chat a partir das mensagens depois de cada
+        ponteiro (ex: após soft delete de mensagens). Retorna ponteiros ajustados.
+        """
+        def write(session: Session) -> int:
+            pointers = self._base_query(session).filter(
+                ChatReadPointer.pointer_chat_id == chat_id
+            ).all()
+            staff = {
+                user_id for (user_id,) in session.query(User.id).filter(
+                    User.id.in_([p.pointer_user_id for p in pointers]),
+                    User.user_tipo != UserTipo.SOLICITANTE
+                )
+            }
+            for pointer in pointers:
+                query = session.query(func.count(Message.id)).filter(
+                    Message.message_chat_id == chat_id,
+                    Message.message_user_id != pointer.pointer_user_id,
+                    Message.id > (pointer.pointer_last_read_message_id or 0),
+                    Message.active_clause()
+                )
+                if pointer.pointer_user_id not in staff:
+                    query = query.filter(Message.message_is_internal == False)
+                pointer.pointer_unread_count = query.scalar()
+            return len(pointers)
+
+        return self._run_write(write)
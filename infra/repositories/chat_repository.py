@@ -1,5 +1,6 @@
-from infra.configs.connection import DBConnectionHandler
 from infra.entities.chat import Chat
+from infra.entities.outbox import OutboxMessage
+from infra.repositories.archive_repository import ArchiveRepository
 from infra.repositories.base_repository import BaseRepository
 
 
@@ -21,26 +22,31 @@ class ChatRepository(BaseRepository[Chat]):
     # MÉTODOS ESPECÍFICOS DE CHAT
     # =========================================================================
 
-    def create(self, chat_ticket_id: int) -> int:
+    def create(self, chat_ticket_id: int, outbox: list[OutboxMessage] | None = None) -> int:
         """
         Cria um novo chat para um ticket.
 
         Args:
             chat_ticket_id: ID do ticket (obrigatório, único)
+            outbox: E-mails gravados na mesma transação (vinculados ao ticket)
 
         Returns:
             ID do chat criado
         """
         chat = Chat(chat_ticket_id=chat_ticket_id)
-        return self.insert(chat)
+        for mail in outbox or []:
+            mail.outbox_ticket_id = chat_ticket_id
+        return self.insert(chat, outbox=outbox)
 
     def select_by_ticket_id(self, ticket_id: int) -> dict | None:
-        """Busca chat pelo ID do ticket."""
-        with DBConnectionHandler() as db:
+        """Busca chat pelo ID do ticket (no arquivo, se o ticket foi arquivado)."""
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Chat.chat_ticket_id == ticket_id
             ).first()
-            return data.to_dict() if data else None
+            if data is not None:
+                return data.to_dict()
+        return ArchiveRepository().select_chat_by_ticket(ticket_id)
 
     def update_title(self, chat_id: int, chat_title: str) -> bool:
         """Atualiza o título do chat."""
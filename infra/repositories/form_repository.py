@@ -1,5 +1,10 @@
+import json
+
+from pydantic import BaseModel
+
 from infra.configs.connection import DBConnectionHandler
 from infra.entities.form import Form
+from infra.forms import compile_form, form_validator_cache
 from infra.repositories.base_repository import BaseRepository
 
 
@@ -21,7 +26,7 @@ class FormRepository(BaseRepository[Form]):
     # MÉTODOS ESPECÍFICOS DE FORM
     # =========================================================================
 
-    def create(self, form_name: str, form_ticket_class, form_type, form_fields: str) -> int:
+    def create(self, form_name: str, form_ticket_class, form_type, form_fields: dict | list | str) -> int:
         """
         Cria um novo formulário.
 
@@ -29,11 +34,16 @@ class FormRepository(BaseRepository[Form]):
             form_name: Nome do formulário
             form_ticket_class: Classe de ticket (PROJETO ou RELATORIO)
             form_type: Tipo de ticket (enum FormTipo)
-            form_fields: JSON com definição dos campos
+            form_fields: Definição dos campos (dict/list, ou string JSON)
 
         Returns:
             ID do formulário criado
+
+        Raises:
+            ValueError: Definição de campos inválida
         """
+        form_fields = self._load_fields(form_fields)
+        compile_form(form_fields)
         form = Form(
             form_name=form_name,
             form_ticket_class=form_ticket_class,
@@ -44,7 +54,7 @@ class FormRepository(BaseRepository[Form]):
 
     def select_by_class(self, form_ticket_class) -> list[dict]:
         """Retorna formulários de uma classe específica."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Form.form_ticket_class == form_ticket_class
             ).all()
@@ -52,7 +62,7 @@ class FormRepository(BaseRepository[Form]):
 
     def select_by_type(self, form_type) -> list[dict]:
         """Retorna formulários de um tipo específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Form.form_type == form_type
             ).all()
@@ -60,7 +70,7 @@ class FormRepository(BaseRepository[Form]):
 
     def select_default(self, form_ticket_class, form_type) -> dict | None:
         """Retorna o formulário padrão para uma classe/tipo."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Form.form_ticket_class == form_ticket_class,
                 Form.form_type == form_type,
@@ -68,9 +78,71 @@ class FormRepository(BaseRepository[Form]):
             ).first()
             return data.to_dict() if data else None
 
-    def update_fields(self, form_id: int, form_fields: str) -> bool:
-        """Atualiza os campos do formulário."""
-        return self.update(form_id, form_fields=form_fields)
+    def update_fields(self, form_id: int, form_fields: dict | list | str) -> bool:
+        """
+        Atualiza os campos do formulário (incrementa form_version).
+
+        Raises:
+            ValueError: Definição de campos inválida (nada é gravado)
+        """
+        form_fields = self._load_fields(form_fields)
+        compile_form(form_fields)
+        updated = self.update(form_id, form_fields=form_fields, form_version=Form.form_version + 1)
+        form_validator_cache.invalidate(form_id)
+        return updated
+
+    @staticmethod
+    def _load_fields(form_fields: dict | list | str) -> dict | list:
+        """form_fields é coluna JSON: strings JSON são convertidas antes de gravar."""
+        return json.loads(form_fields) if isinstance(form_fields, str) else form_fields
+
+    # =========================================================================
+    # VALIDAÇÃO DE RESPOSTAS (validador compilado + cache)
+    # =========================================================================
+
+    def get_validator(self, form_id: int) -> type[BaseModel] | None:
+        """
+        Retorna o modelo Pydantic compilado do formulário.
+
+        Caminho rápido: busca só form_version (query por PK) e usa o cache.
+        form_fields só é lido e compilado quando a versão não está em cache.
+
+        Returns:
+            Classe Pydantic ou None se o formulário não existe
+        """
+        with DBConnectionHandler() as db:
+            form_version = self._base_query(db.session).with_entities(Form.form_version).filter(
+                Form.id == form_id
+            ).scalar()
+            if form_version is None:
+                return None
+
+            validator = form_validator_cache.get(form_id, form_version)
+            if validator is not None:
+                return validator
+
+            form_fields = db.session.query(Form.form_fields).filter(Form.id == form_id).scalar()
+            return form_validator_cache.compile(form_id, form_version, form_fields)
+
+    def validate_submission(self, form_id: int, data: dict) -> dict:
+        """
+        Valida as respostas de um ticket contra o formulário.
+
+        Args:
+            form_id: ID do formulário
+            data: Respostas enviadas ({nome_do_campo: valor})
+
+        Returns:
+            Respostas normalizadas (JSON-serializáveis)
+
+        Raises:
+            ValueError: Formulário não encontrado
+            pydantic.ValidationError: Respostas inválidas
+        """
+        validator = self.get_validator(form_id)
+        if validator is None:
+            raise ValueError(f"Formulário {form_id} não encontrado")
+        return validator.model_validate(data).model_dump(mode="json", by_alias=True)
 
     def set_as_default(self, form_id: int) -> bool:
         """Marca um formulário como padrão."""
@@ -1,8 +1,13 @@
 from datetime import datetime
 
 from infra.configs.connection import DBConnectionHandler
+from infra.entities.chat import Chat
 from infra.entities.message import Message
+from infra.entities.notification import NotificationTipo, NotificationEntidade
+from infra.notifications import NotificationEvent, notification_pipeline
+from infra.repositories.archive_repository import ArchiveRepository
 from infra.repositories.base_repository import BaseRepository
+from infra.repositories.chat_read_pointer_repository import ChatReadPointerRepository
 
 
 class MessageRepository(BaseRepository[Message]):
@@ -37,6 +42,9 @@ class MessageRepository(BaseRepository[Message]):
 
         Returns:
             ID da mensagem criada
+
+        Mensagens públicas geram evento NEW_MESSAGE para os seguidores do ticket.
+        Os contadores de não lidas (ChatReadPointer) são atualizados na mesma transação.
         """
         message = Message(
             message_chat_id=message_chat_id,
@@ -46,32 +54,66 @@ class MessageRepository(BaseRepository[Message]):
         # Campos com init=False precisam ser setados após criação
         message.message_type = message_type
         message.message_is_internal = message_is_internal
-        return self.insert(message)
+
+        def write(session) -> tuple[int, int | None]:
+            session.add(message)
+            session.flush()
+            ticket_id = session.query(Chat.chat_ticket_id).filter(
+                Chat.id == message_chat_id
+            ).scalar()
+            ChatReadPointerRepository.register_message(session, message, ticket_id)
+            return message.id, ticket_id
+
+        message_id, ticket_id = self._run_write(write)
+
+        if not message_is_internal and ticket_id is not None:
+            notification_pipeline.publish(NotificationEvent(
+                event_type=NotificationTipo.NEW_MESSAGE,
+                entity_type=NotificationEntidade.TICKET,
+                entity_id=ticket_id,
+                summary=f"Nova mensagem no ticket #{ticket_id}",
+                actor_id=message_user_id
+            ))
+        return message_id
 
     def select_by_chat_id(self, chat_id: int) -> list[dict]:
-        """Retorna mensagens de um chat específico."""
-        with DBConnectionHandler() as db:
-            data = self._base_query(db.session).filter(
+        """Retorna mensagens de um chat específico (com o conteúdo; chat arquivado → arquivo)."""
+        with self._read() as db:
+            data = self._load_groups(self._base_query(db.session), ("content",)).filter(
                 Message.message_chat_id == chat_id
             ).order_by(Message.created_at).all()
-            return [item.to_dict() for item in data]
+            if data or self._chat_is_hot(db.session, chat_id):
+                return [item.to_dict() for item in data]
+        return ArchiveRepository().select_messages_by_chat(chat_id)
 
     def select_by_user_id(self, user_id: int) -> list[dict]:
         """Retorna mensagens de um usuário específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Message.message_user_id == user_id
             ).all()
             return [item.to_dict() for item in data]
 
     def select_public_by_chat_id(self, chat_id: int) -> list[dict]:
-        """Retorna apenas mensagens públicas de um chat."""
-        with DBConnectionHandler() as db:
-            data = self._base_query(db.session).filter(
+        """Retorna apenas mensagens públicas de um chat (com o conteúdo; chat arquivado → arquivo)."""
+        with self._read() as db:
+            data = self._load_groups(self._base_query(db.session), ("content",)).filter(
                 Message.message_chat_id == chat_id,
                 Message.message_is_internal == False
             ).order_by(Message.created_at).all()
-            return [item.to_dict() for item in data]
+            if data or self._chat_is_hot(db.session, chat_id):
+                return [item.to_dict() for item in data]
+        return ArchiveRepository().select_messages_by_chat(chat_id, include_internal=False)
+
+    @staticmethod
+    def _chat_is_hot(session, chat_id: int) -> bool:
+        """
+        Chat ainda está na tabela chats (em qualquer status).
+
+        O arquivamento tira a linha de chats; um chat novo (ou só com
+        mensagens internas/inativas) continua aqui e não consulta o arquivo.
+        """
+        return session.query(Chat.id).filter(Chat.id == chat_id).first() is not None
 
     def update_content(self, message_id: int, message_content: str) -> bool:
         """Atualiza o conteúdo da mensagem."""
@@ -80,3 +122,27 @@ class MessageRepository(BaseRepository[Message]):
             message_content=message_content,
             message_edited_at=datetime.now()
         )
+
+    def add_attachment(self, message_id: int, attachment: dict, updated_by: int | None = None) -> bool:
+        """Adiciona os metadados de um anexo (AttachmentStore) à mensagem."""
+        return self.json_append(message_id, "message_attachments", attachment, updated_by=updated_by)
+
+    def get_attachment(self, message_id: int, sha256: str) -> dict | None:
+        """Metadados de um anexo da mensagem (None se a mensagem não tem esse arquivo)."""
+        return self.select_json_item(message_id, "message_attachments", "sha256", sha256)
+
+    def select_scope(self, message_id: int) -> dict | None:
+        """
+        Ticket da mensagem e se ela é interna, para checar acesso.
+
+        Returns:
+            {"ticket_id": int, "message_is_internal": bool} ou None se a
+            mensagem não existe (ou está inativa)
+        """
+        with DBConnectionHandler() as db:
+            row = self._base_query(db.session).join(Chat, Chat.id == Message.message_chat_id).with_entities(
+                Chat.chat_ticket_id, Message.message_is_internal
+            ).filter(Message.id == message_id).first()
+        if row is None:
+            return None
+        return {"ticket_id": row.chat_ticket_id, "message_is_internal": row.message_is_internal}
@@ -0,0 +1,178 @@
+from datetime import datetime
+
+from sqlalchemy import func, insert
+
+from infra.configs.connection import DBConnectionHandler
+from infra.entities.notification import Notification, NotificationEntidade
+from infra.entities.associations import UserTicketFollow, UserProjectFollow, UserReportFollow
+from infra.entities.outbox import OutboxMessage
+from infra.entities.user import User
+from infra.repositories.base_repository import BaseRepository
+
+
+# Tabela de follow + coluna da entidade seguida, por tipo de entidade
+FOLLOW_TABLES = {
+    NotificationEntidade.TICKET: (UserTicketFollow, UserTicketFollow.ticket_id),
+    NotificationEntidade.PROJECT: (UserProjectFollow, UserProjectFollow.project_id),
+    NotificationEntidade.REPORT: (UserReportFollow, UserReportFollow.report_id),
+}
+
+
+class NotificationRepository(BaseRepository[Notification]):
+    """
+    Repositório para operações com Notification.
+
+    Herda de BaseRepository:
+    - select_all(), select_by_id()
+    - insert(), update()
+    - soft_delete(), restore()
+    - count(), exists()
+
+    Os métodos em lote (select_followers, select_recipients, insert_many)
+    são usados pelo NotificationPipeline: uma query por tipo de entidade,
+    nunca uma query por seguidor.
+    """
+
+    def __init__(self):
+        super().__init__(Notification)
+
+    # =========================================================================
+    # RESOLUÇÃO EM LOTE (usado pelo pipeline)
+    # =========================================================================
+
+    def select_followers(self, entity_type: NotificationEntidade,
+                         entity_ids: list[int]) -> dict[int, set[int]]:
+        """
+        Retorna os seguidores ativos de várias entidades em UMA query.
+
+        Args:
+            entity_type: Tipo da entidade (TICKET, PROJECT ou REPORT)
+            entity_ids: IDs das entidades
+
+        Returns:
+            Dict {entity_id: {user_id, ...}}
+        """
+        follow_model, entity_column = FOLLOW_TABLES[entity_type]
+        followers: dict[int, set[int]] = {entity_id: set() for entity_id in entity_ids}
+        if not entity_ids:
+            return followers
+
+        with DBConnectionHandler() as db:
+            rows = db.session.query(entity_column, follow_model.user_id).join(
+                User, User.id == follow_model.user_id
+            ).filter(
+                entity_column.in_(entity_ids),
+                follow_model.active_clause(),
+                User.active_clause()
+            ).all()
+
+        for entity_id, user_id in rows:
+            followers[entity_id].add(user_id)
+        return followers
+
+    def select_recipients(self, user_ids: set[int]) -> dict[int, tuple[str, dict]]:
+        """
+        Retorna e-mail e preferências de notificação (JSON já decodificado) de vários usuários.
+
+        Usuários sem preferências (ou com JSON inválido) recebem dict vazio,
+        o que significa "tudo habilitado".
+
+        Returns:
+            Dict {user_id: (user_email, preferences)}
+        """
+        if not user_ids:
+            return {}
+
+        with DBConnectionHandler() as db:
+            rows = db.session.query(
+                User.id, User.user_email, User.user_notification_preferences
+            ).filter(User.id.in_(user_ids)).all()
+
+        return {
+            user_id: (email, preferences if isinstance(preferences, dict) else {})
+            for user_id, email, preferences in rows
+        }
+
+    def insert_many(self, rows: list[dict], batch_size: int = 500,
+                    mails: list[dict] | None = None) -> int:
+        """
+        Insere notificações em lote (executemany) numa única transação.
+
+        Args:
+            rows: Dicts com as colunas de Notification
+            batch_size: Quantidade de linhas por INSERT
+            mails: Dicts com as colunas de OutboxMessage (digest por e-mail),
+                gravados na mesma transação e entregues pelo OutboxWorker
+
+        Returns:
+            Quantidade de notificações inseridas
+        """
+        def write(session) -> None:
+            for start in range(0, len(rows), batch_size):
+                session.execute(insert(Notification), rows[start:start + batch_size])
+
+            for start in range(0, len(mails or []), batch_size):
+                session.execute(insert(OutboxMessage), mails[start:start + batch_size])
+
+        self._run_write(write)
+        return len(rows)
+
+    # =========================================================================
+    # CAIXA DE NOTIFICAÇÕES DO USUÁRIO
+    # =========================================================================
+
+    def select_unread_by_user(self, user_id: int) -> list[dict]:
+        """Retorna notificações não lidas de um usuário (mais recentes primeiro)."""
+        with self._read() as db:
+            data = self._base_query(db.session).filter(
+                Notification.notification_user_id == user_id,
+                Notification.notification_read_at.is_(None)
+            ).order_by(Notification.id.desc()).all()
+            return [item.to_dict() for item in data]
+
+    def mark_read(self, notification_id: int, user_id: int) -> bool:
+        """Marca uma notificação do usuário como lida."""
+        return self._run_write(lambda session: self._base_query(session).filter(
+            Notification.id == notification_id,
+            Notification.notification_user_id == user_id
+        ).update({Notification.notification_read_at: datetime.now()}) > 0)
+
+    def count_unread(self, user_id: int, entity_type: NotificationEntidade | None = None) -> int:
+        """Total de eventos não lidos (digests contam todos os eventos agrupados)."""
+        with self._read() as db:
+            query = db.session.query(
+                func.coalesce(func.sum(Notification.notification_event_count), 0)
+            ).filter(
+                Notification.notification_user_id == user_id,
+                Notification.notification_read_at.is_(None),
+                Notification.active_clause()
+            )
+            if entity_type is not None:
+                query = query.filter(Notification.notification_entity_type == entity_type)
+            return int(query.scalar())
+
+    def count_unread_by_entity(self, user_id: int, entity_type: NotificationEntidade,
+                               entity_ids: list[int]) -> dict[int, int]:
+        """Eventos não lidos por entidade: {entity_id: quantidade} (só as que têm)."""
+        if not entity_ids:
+            return {}
+        with self._read() as db:
+            rows = db.session.query(
+                Notification.notification_entity_id, func.sum(Notification.notification_event_count)
+            ).filter(
+                Notification.notification_user_id == user_id,
+                Notification.notification_read_at.is_(None),
+                Notification.notification_entity_type == entity_type,
+                Notification.notification_entity_id.in_(entity_ids),
+                Notification.active_clause()
+            ).group_by(Notification.notification_entity_id).all()
+            return {entity_id: int(count) for entity_id, count in rows}
+
+    def mark_entity_read(self, user_id: int, entity_type: NotificationEntidade, entity_id: int) -> int:
+        """Marca como lidas todas as notificações do usuário sobre uma entidade."""
+        return self._run_write(lambda session: self._base_query(session).filter(
+            Notification.notification_user_id == user_id,
+            Notification.notification_entity_type == entity_type,
+            Notification.notification_entity_id == entity_id,
+            Notification.notification_read_at.is_(None)
+        ).update({Notification.notification_read_at: datetime.now()}))
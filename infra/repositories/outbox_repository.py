@@ -0,0 +1,114 @@
+from datetime import datetime
+
+from sqlalchemy import or_, update
+
+from infra.configs.versioning import SKIP_VERSION_BUMP
+from infra.entities.outbox import OutboxMessage, OutboxStatus
+from infra.entities.ticket import Ticket
+from infra.repositories.base_repository import BaseRepository
+
+
+class OutboxRepository(BaseRepository[OutboxMessage]):
+    """
+    Repositório para operações com OutboxMessage.
+
+    Herda de BaseRepository:
+    - select_all(), select_by_id()
+    - insert(), update()
+    - soft_delete(), restore()
+    - count(), exists()
+
+    A gravação de e-mails NÃO passa por aqui: os repositories de negócio
+    recebem `outbox=[OutboxMessage(...)]` e gravam na própria transação.
+    Este repositório atende o OutboxWorker (reserva, entrega e retry).
+    """
+
+    def __init__(self):
+        super().__init__(OutboxMessage)
+
+    # =========================================================================
+    # MÉTODOS DO WORKER
+    # =========================================================================
+
+    def claim_due(self, limit: int) -> list[dict]:
+        """
+        Reserva (PENDENTE → ENVIANDO) até `limit` e-mails prontos para envio.
+
+        No PostgreSQL usa FOR UPDATE SKIP LOCKED, permitindo vários workers;
+        no SQLite o lock de escrita já serializa a reserva.
+
+        Returns:
+            E-mails reservados (dicts)
+        """
+        now = datetime.now()
+
+        def write(session) -> list[dict]:
+            data = self._base_query(session).filter(
+                OutboxMessage.outbox_status == OutboxStatus.PENDENTE,
+                or_(
+                    OutboxMessage.outbox_next_attempt_at.is_(None),
+                    OutboxMessage.outbox_next_attempt_at <= now
+                )
+            ).order_by(OutboxMessage.id).limit(limit).with_for_update(skip_locked=True).all()
+
+            for item in data:
+                item.outbox_status = OutboxStatus.ENVIANDO
+            return [item.to_dict() for item in data]
+
+        return self._run_write(write)
+
+    def mark_sent(self, outbox_ids: list[int], ticket_ids: set[int]) -> None:
+        """
+        Marca e-mails como ENVIADO e registra ticket_mail_sent_at dos tickets,
+        na mesma transação.
+        """
+        now = datetime.now()
+
+        def write(session) -> None:
+            session.execute(
+                update(OutboxMessage)
+                .where(OutboxMessage.id.in_(outbox_ids))
+                .values(outbox_status=OutboxStatus.ENVIADO, outbox_sent_at=now, outbox_last_error=None)
+            )
+            if ticket_ids:
+                # Escrita do sistema: não conflita com quem editou o ticket (versão intacta)
+                session.execute(
+                    update(Ticket)
+                    .where(Ticket.id.in_(ticket_ids))
+                    .values(ticket_mail_sent_at=now),
+                    execution_options=SKIP_VERSION_BUMP
+                )
+
+        self._run_write(write)
+
+    def mark_failed(self, outbox_id: int, error: str, next_attempt_at: datetime | None) -> None:
+        """
+        Registra falha de envio.
+
+        Args:
+            outbox_id: ID do e-mail
+            error: Mensagem de erro
+            next_attempt_at: Próxima tentativa (None = desistir, status FALHOU)
+        """
+        self._run_write(lambda session: session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id == outbox_id)
+            .values(
+                outbox_status=OutboxStatus.PENDENTE if next_attempt_at else OutboxStatus.FALHOU,
+                outbox_attempts=OutboxMessage.outbox_attempts + 1,
+                outbox_next_attempt_at=next_attempt_at,
+                outbox_last_error=error[:1000]
+            )
+        ))
+
+    def release_stuck(self, older_than: datetime) -> int:
+        """
+        Devolve para PENDENTE e-mails presos em ENVIANDO (worker morreu no meio).
+
+        Returns:
+            Quantidade de e-mails liberados
+        """
+        return self._run_write(lambda session: self._base_query(session).filter(
+            OutboxMessage.outbox_status == OutboxStatus.ENVIANDO,
+            OutboxMessage.updated_at < older_than
+        ).update({OutboxMessage.outbox_status: OutboxStatus.PENDENTE}))
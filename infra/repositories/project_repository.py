@@ -1,7 +1,10 @@
 from datetime import date, datetime
 
-from infra.configs.connection import DBConnectionHandler
-from infra.entities.project import Project
+from infra.authorization import PROJECT, visibility_index
+from infra.entities.notification import NotificationTipo, NotificationEntidade
+from infra.entities.outbox import OutboxMessage
+from infra.entities.project import Project, ProjectStatus
+from infra.notifications import NotificationEvent, notification_pipeline
 from infra.repositories.base_repository import BaseRepository
 
 
@@ -65,7 +68,7 @@ class ProjectRepository(BaseRepository[Project]):
 
     def select_by_team(self, team_id: int) -> list[dict]:
         """Retorna projetos de um time específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Project.project_team_responsible_id == team_id
             ).all()
@@ -73,28 +76,68 @@ class ProjectRepository(BaseRepository[Project]):
 
     def select_by_manager(self, manager_id: int) -> list[dict]:
         """Retorna projetos de um gerente específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Project.project_manager_id == manager_id
             ).all()
             return [item.to_dict() for item in data]
 
-    def update_status(self, project_id: int, project_status, changed_by_id: int | None = None) -> bool:
-        """Atualiza o status operacional do projeto."""
-        return self.update(
+    def select_visible(self, user_id: int) -> list[dict]:
+        """Retorna os projetos que o usuário pode ver (índice de visibilidade)."""
+        with self._read() as db:
+            data = self._base_query(db.session).filter(
+                visibility_index.clause(PROJECT, user_id, Project.id)
+            ).all()
+            return [item.to_dict() for item in data]
+
+    def search_visible(self, user_id: int, term: str) -> list[dict]:
+        """Busca projetos por nome, já filtrando pela visibilidade do usuário."""
+        with self._read() as db:
+            data = self._base_query(db.session).filter(
+                Project.project_name.ilike(f"%{term}%"),
+                visibility_index.clause(PROJECT, user_id, Project.id)
+            ).all()
+            return [item.to_dict() for item in data]
+
+    def update_status(self, project_id: int, project_status, changed_by_id: int | None = None,
+                      outbox: list[OutboxMessage] | None = None, expected_version: int | None = None) -> bool:
+        """Atualiza o status operacional do projeto (e notifica os seguidores); ver expected_version em update()."""
+        updated = self.update(
             project_id,
+            outbox=outbox,
+            expected_version=expected_version,
             project_status=project_status,
             project_status_changed_by_id=changed_by_id,
             project_status_changed_at=datetime.now()
         )
+        if updated:
+            notification_pipeline.publish(NotificationEvent(
+                event_type=NotificationTipo.STATUS_CHANGE,
+                entity_type=NotificationEntidade.PROJECT,
+                entity_id=project_id,
+                summary=f"Projeto #{project_id} mudou para {ProjectStatus(project_status).value}",
+                actor_id=changed_by_id
+            ))
+        return updated
 
-    def approve(self, project_id: int, approved_budget: float) -> bool:
-        """Marca projeto como aprovado."""
-        return self.update(
+    def approve(self, project_id: int, approved_budget: float, approved_by_id: int | None = None,
+                outbox: list[OutboxMessage] | None = None) -> bool:
+        """Marca projeto como aprovado (e notifica os seguidores)."""
+        updated = self.update(
             project_id,
+            outbox=outbox,
             project_approved_at=date.today(),
             project_approved_budget=approved_budget
         )
+        if updated:
+            notification_pipeline.publish(NotificationEvent(
+                event_type=NotificationTipo.APPROVAL,
+                entity_type=NotificationEntidade.PROJECT,
+                entity_id=project_id,
+                summary=f"Projeto #{project_id} aprovado (orçamento {approved_budget:,.2f})",
+                actor_id=approved_by_id
+            ))
+        return updated
 
     def complete(self, project_id: int, final_budget: float) -> bool:
         """Marca projeto como concluído."""
@@ -1,7 +1,9 @@
 from datetime import datetime
 
-from infra.configs.connection import DBConnectionHandler
-from infra.entities.report import Report
+from infra.authorization import REPORT, visibility_index
+from infra.entities.notification import NotificationTipo, NotificationEntidade
+from infra.entities.report import Report, ReportStatus
+from infra.notifications import NotificationEvent, notification_pipeline
 from infra.repositories.base_repository import BaseRepository
 
 
@@ -58,7 +60,7 @@ class ReportRepository(BaseRepository[Report]):
 
     def select_by_team(self, team_id: int) -> list[dict]:
         """Retorna relatórios de um time específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Report.report_team_responsible_id == team_id
             ).all()
@@ -66,17 +68,45 @@ class ReportRepository(BaseRepository[Report]):
 
     def select_by_owner(self, owner_id: int) -> list[dict]:
         """Retorna relatórios de um owner específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Report.report_owner_id == owner_id
             ).all()
             return [item.to_dict() for item in data]
 
-    def update_status(self, report_id: int, report_status, changed_by_id: int | None = None) -> bool:
-        """Atualiza o status operacional do relatório."""
-        return self.update(
+    def select_visible(self, user_id: int) -> list[dict]:
+        """Retorna os relatórios que o usuário pode ver (índice de visibilidade)."""
+        with self._read() as db:
+            data = self._base_query(db.session).filter(
+                visibility_index.clause(REPORT, user_id, Report.id)
+            ).all()
+            return [item.to_dict() for item in data]
+
+    def search_visible(self, user_id: int, term: str) -> list[dict]:
+        """Busca relatórios por nome, já filtrando pela visibilidade do usuário."""
+        with self._read() as db:
+            data = self._base_query(db.session).filter(
+                Report.report_name.ilike(f"%{term}%"),
+                visibility_index.clause(REPORT, user_id, Report.id)
+            ).all()
+            return [item.to_dict() for item in data]
+
+    def update_status(self, report_id: int, report_status, changed_by_id: int | None = None,
+                      expected_version: int | None = None) -> bool:
+        """Atualiza o status operacional do relatório (e notifica os seguidores); ver expected_version em update()."""
+        updated = self.update(
             report_id,
+            expected_version=expected_version,
             report_status=report_status,
             report_status_changed_by_id=changed_by_id,
             report_status_changed_at=datetime.now()
         )
+        if updated:
+            notification_pipeline.publish(NotificationEvent(
+                event_type=NotificationTipo.STATUS_CHANGE,
+                entity_type=NotificationEntidade.REPORT,
+                entity_id=report_id,
+                summary=f"Relatório #{report_id} mudou para {ReportStatus(report_status).value}",
+                actor_id=changed_by_id
+            ))
+        return updated
@@ -1,4 +1,3 @@
-from infra.configs.connection import DBConnectionHandler
 from infra.entities.team import Team
 from infra.repositories.base_repository import BaseRepository
 
@@ -53,12 +52,12 @@ class TeamRepository(BaseRepository[Team]):
 
     def select_by_area(self, area) -> list[dict]:
         """Retorna times de uma área específica."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(Team.team_area == area).all()
             return [item.to_dict() for item in data]
 
     def select_by_name(self, team_name: str) -> dict | None:
         """Busca time pelo nome."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(Team.team_name == team_name).first()
             return data.to_dict() if data else None
@@ -1,8 +1,24 @@
 from datetime import datetime
 
+from sqlalchemy import exists, func, literal, select, union_all
+
 from infra.configs.connection import DBConnectionHandler
-from infra.entities.ticket import Ticket
+
+from infra.configs.keyset import decode_cursor, encode_cursor, keyset_columns, keyset_filter
+from infra.entities.associations import TicketAttendant, TicketTeam, UserTicketFollow
+from infra.entities.notification import NotificationTipo, NotificationEntidade
+from infra.entities.outbox import OutboxMessage
+from infra.entities.ticket import Ticket, TicketStatus
+from infra.entities.user import User
+from infra.notifications import NotificationEvent, notification_pipeline
+from infra.repositories.archive_repository import ArchiveRepository
 from infra.repositories.base_repository import BaseRepository
+from infra.repositories.chat_read_pointer_repository import ChatReadPointerRepository
+from infra.repositories.form_repository import FormRepository
+from infra.repositories.notification_repository import NotificationRepository
+
+
+INBOX_ROLES = ("client", "attendant", "follower", "team")
 
 
 class TicketRepository(BaseRepository[Ticket]):
@@ -14,6 +30,9 @@ class TicketRepository(BaseRepository[Ticket]):
     - insert(), update()
     - soft_delete(), restore()
     - count(), exists()
+
+    Tickets encerrados antigos ficam no arquivo (TicketArchiveJob):
+    select_by_id() os encontra lá quando não estão na tabela quente.
     """
 
     def __init__(self):
@@ -25,7 +44,9 @@ class TicketRepository(BaseRepository[Ticket]):
 
     def create(self, ticket_title: str, ticket_class, ticket_type,
                ticket_client_id: int, ticket_description: str,
-               ticket_form_id: int, ticket_status) -> int:
+               ticket_form_id: int, ticket_status,
+               ticket_form_data: dict | None = None,
+               outbox: list[OutboxMessage] | None = None) -> int:
         """
         Cria um novo ticket.
 
@@ -37,10 +58,18 @@ class TicketRepository(BaseRepository[Ticket]):
             ticket_description: Descrição do problema
             ticket_form_id: ID do formulário usado
             ticket_status: Status inicial (enum TicketStatus)
+            ticket_form_data: Respostas do formulário (validadas contra form_fields)
+            outbox: E-mails gravados na mesma transação (vinculados ao ticket)
 
         Returns:
             ID do ticket criado
+
+        Raises:
+            pydantic.ValidationError: Respostas não batem com o formulário
         """
+        if ticket_form_data is not None:
+            ticket_form_data = FormRepository().validate_submission(ticket_form_id, ticket_form_data)
+
         ticket = Ticket(
             ticket_title=ticket_title,
             ticket_class=ticket_class,
@@ -50,11 +79,23 @@ class TicketRepository(BaseRepository[Ticket]):
             ticket_form_id=ticket_form_id,
             ticket_status=ticket_status
         )
-        return self.insert(ticket)
+        if ticket_form_data is not None:
+            ticket.ticket_form_data = ticket_form_data
+        for mail in outbox or []:
+            mail.ticket = ticket
+        return self.insert(ticket, outbox=outbox)
+
+    def select_by_id(self, id: int, include_inactive: bool = False,
+                     groups: tuple | None = None) -> dict | None:
+        """Ticket por ID; se não está na tabela quente, busca no arquivo (read-through)."""
+        data = super().select_by_id(id, include_inactive, groups)
+        if data is None:
+            data = ArchiveRepository().select_ticket(id)
+        return data
 
     def select_by_client(self, client_id: int) -> list[dict]:
         """Retorna tickets de um cliente específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Ticket.ticket_client_id == client_id
             ).all()
@@ -62,7 +103,7 @@ class TicketRepository(BaseRepository[Ticket]):
 
     def select_by_project(self, project_id: int) -> list[dict]:
         """Retorna tickets de um projeto específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Ticket.ticket_project_id == project_id
             ).all()
@@ -70,25 +111,46 @@ class TicketRepository(BaseRepository[Ticket]):
 
     def select_by_report(self, report_id: int) -> list[dict]:
         """Retorna tickets de um relatório específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(
                 Ticket.ticket_report_id == report_id
             ).all()
             return [item.to_dict() for item in data]
 
-    def update_status(self, ticket_id: int, ticket_status, changed_by_id: int | None = None) -> bool:
-        """Atualiza o status operacional do ticket."""
-        return self.update(
+    def update_status(self, ticket_id: int, ticket_status, changed_by_id: int | None = None,
+                      outbox: list[OutboxMessage] | None = None, expected_version: int | None = None) -> bool:
+        """
+        Atualiza o status operacional do ticket (e notifica os seguidores).
+
+        expected_version: versão lida pelo atendente; se outro gravou antes,
+        levanta VersionConflictError em vez de sobrescrever.
+        """
+        self._link_outbox(ticket_id, outbox)
+        updated = self.update(
             ticket_id,
+            outbox=outbox,
+            expected_version=expected_version,
             ticket_status=ticket_status,
             ticket_status_changed_by_id=changed_by_id,
             ticket_status_changed_at=datetime.now()
         )
+        if updated:
+            notification_pipeline.publish(NotificationEvent(
+                event_type=NotificationTipo.STATUS_CHANGE,
+                entity_type=NotificationEntidade.TICKET,
+                entity_id=ticket_id,
+                summary=f"Ticket #{ticket_id} mudou para {TicketStatus(ticket_status).value}",
+                actor_id=changed_by_id
+            ))
+        return updated
 
-    def close(self, ticket_id: int, closed_by_id: int, resolution_notes: str | None = None) -> bool:
+    def close(self, ticket_id: int, closed_by_id: int, resolution_notes: str | None = None,
+              outbox: list[OutboxMessage] | None = None) -> bool:
         """Fecha um ticket."""
+        self._link_outbox(ticket_id, outbox)
         return self.update(
             ticket_id,
+            outbox=outbox,
             ticket_closed_by_id=closed_by_id,
             ticket_closed_at=datetime.now(),
             ticket_resolution_notes=resolution_notes
@@ -101,3 +163,156 @@ class TicketRepository(BaseRepository[Ticket]):
     def assign_to_report(self, ticket_id: int, report_id: int) -> bool:
         """Associa ticket a um relatório."""
         return self.update(ticket_id, ticket_report_id=report_id)
+
+    def add_attachment(self, ticket_id: int, attachment: dict, updated_by: int | None = None) -> bool:
+        """
+        Adiciona os metadados de um anexo (AttachmentStore) ao ticket.
+
+        Não sobe a versão: anexar não invalida o update_status de quem está com o ticket aberto.
+        """
+        return self.json_append(ticket_id, "ticket_attachments", attachment, updated_by=updated_by,
+                                bump_version=False)
+
+    def get_attachment(self, ticket_id: int, sha256: str) -> dict | None:
+        """Metadados de um anexo do ticket (None se o ticket não tem esse arquivo)."""
+        return self.select_json_item(ticket_id, "ticket_attachments", "sha256", sha256)
+
+    def select_participation(self, ticket_id: int, user_id: int) -> set[str]:
+        """
+        Papéis do usuário no ticket: "client" (abriu), "attendant" (atende)
+        e/ou "team" (o time dele está atribuído). Vazio = não participa.
+
+        Decide acesso (anexos), então lê do primário: numa réplica
+        atrasada, um atendente recém-removido ainda apareceria.
+        """
+        user_team = select(User.user_team_id).where(User.id == user_id).scalar_subquery()
+        checks = {
+            "client": exists().where(
+                Ticket.id == ticket_id, Ticket.ticket_client_id == user_id, Ticket.active_clause()
+            ),
+            "attendant": exists().where(
+                TicketAttendant.ticket_id == ticket_id, TicketAttendant.user_id == user_id,
+                TicketAttendant.active_clause()
+            ),
+            "team": exists().where(
+                TicketTeam.ticket_id == ticket_id, TicketTeam.team_id == user_team,
+                TicketTeam.active_clause()
+            ),
+        }
+        with DBConnectionHandler() as db:
+            row = db.session.execute(select(*[check.label(role) for role, check in checks.items()])).one()
+        return {role for role in checks if row._mapping[role]}
+
+    # =========================================================================
+    # CAIXA DE ENTRADA ("meu trabalho")
+    # =========================================================================
+
+    def select_inbox(self, user_id: int, statuses: list | None = None,
+                     priorities: list | None = None, roles: list[str] | None = None,
+                     limit: int = 50, cursor: str | None = None) -> dict:
+        """
+        Tickets em que o usuário está envolvido, numa única consulta:
+        abriu (client), atende (attendant), segue (follower) ou o time dele
+        está atribuído (team).
+
+        Cada papel é um ramo do UNION ALL que lê só o índice "por usuário"
+        da sua tabela; o GROUP BY junta os papéis de um mesmo ticket.
+        Paginação por keyset em (updated_at DESC, id DESC).
+
+        Args:
+            user_id: Dono da caixa de entrada
+            statuses: Filtra por TicketStatus (None = todos)
+            priorities: Filtra por TicketPriority (None = todas)
+            roles: Subconjunto de INBOX_ROLES (None = todos)
+            limit: Itens por página
+            cursor: next_cursor da página anterior
+
+        Returns:
+            {"items": [ticket + inbox_roles + unread + unread_messages],
+             "next_cursor": str | None,
+             "unread_total": int}
+
+        Raises:
+            ValueError: Papel desconhecido ou cursor inválido
+        """
+        roles = list(roles or INBOX_ROLES)
+        unknown = set(roles) - set(INBOX_ROLES)
+        if unknown:
+            raise ValueError(f"Papéis desconhecidos: {sorted(unknown)}")
+        after = decode_cursor(cursor) if cursor else None
+
+        with self._read() as db:
+            inbox = self._inbox_union(user_id, roles).subquery("inbox")
+            flags = [func.max(inbox.c[role]).label(role) for role in INBOX_ROLES]
+            grouped = select(inbox.c.ticket_id, *flags).group_by(inbox.c.ticket_id).subquery("grouped")
+
+            keys = keyset_columns([Ticket.updated_at, Ticket.id], self._dialect(db.session))
+            query = self._base_query(db.session).add_columns(
+                *[grouped.c[role] for role in INBOX_ROLES], *keys
+            ).join(grouped, grouped.c.ticket_id == Ticket.id)
+            if statuses:
+                query = query.filter(Ticket.ticket_status.in_(statuses))
+            if priorities:
+                query = query.filter(Ticket.ticket_priority.in_(priorities))
+            if after is not None:
+                query = query.filter(keyset_filter(keys, after))
+            rows = query.order_by(*[key.desc() for key in keys]).limit(limit + 1).all()
+
+            page = rows[:limit]
+            items = []
+            for row in page:
+                item = row[0].to_dict()
+                item["inbox_roles"] = [role for role in INBOX_ROLES if getattr(row, role)]
+                items.append(item)
+            next_cursor = encode_cursor(list(page[-1][-len(keys):])) if len(rows) > limit else None
+
+        notifications = NotificationRepository()
+        unread = notifications.count_unread_by_entity(
+            user_id, NotificationEntidade.TICKET, [item["id"] for item in items]
+        )
+        badges = ChatReadPointerRepository().select_badges(user_id, [item["id"] for item in items])
+        for item in items:
+            item["unread"] = unread.get(item["id"], 0)
+            item["unread_messages"] = badges.get(item["id"], 0)
+        return {
+            "items": items,
+            "next_cursor": next_cursor,
+            "unread_total": notifications.count_unread(user_id, NotificationEntidade.TICKET),
+        }
+
+    def mark_inbox_read(self, user_id: int, ticket_id: int) -> int:
+        """Zera as notificações e as mensagens não lidas do ticket para o usuário."""
+        ChatReadPointerRepository().mark_ticket_read(user_id, ticket_id)
+        return NotificationRepository().mark_entity_read(user_id, NotificationEntidade.TICKET, ticket_id)
+
+    @staticmethod
+    def _inbox_union(user_id: int, roles: list[str]):
+        """UNION ALL dos ramos selecionados: (ticket_id, client, attendant, follower, team)."""
+        def branch(ticket_id, role):
+            return select(
+                ticket_id.label("ticket_id"),
+                *[literal(int(name == role)).label(name) for name in INBOX_ROLES]
+            )
+
+        user_team = select(User.user_team_id).where(User.id == user_id).scalar_subquery()
+        branches = {
+            "client": lambda: branch(Ticket.id, "client").where(
+                Ticket.ticket_client_id == user_id, Ticket.active_clause()
+            ),
+            "attendant": lambda: branch(TicketAttendant.ticket_id, "attendant").where(
+                TicketAttendant.user_id == user_id, TicketAttendant.active_clause()
+            ),
+            "follower": lambda: branch(UserTicketFollow.ticket_id, "follower").where(
+                UserTicketFollow.user_id == user_id, UserTicketFollow.active_clause()
+            ),
+            "team": lambda: branch(TicketTeam.ticket_id, "team").where(
+                TicketTeam.team_id == user_team, TicketTeam.active_clause()
+            ),
+        }
+        return union_all(*[branches[role]() for role in roles])
+
+    @staticmethod
+    def _link_outbox(ticket_id: int, outbox: list[OutboxMessage] | None) -> None:
+        """Vincula os e-mails ao ticket (a entrega atualiza ticket_mail_sent_at)."""
+        for mail in outbox or []:
+            mail.outbox_ticket_id = ticket_id
@@ -1,8 +1,17 @@
+from typing import Optional
+
+from infra.cache import LRUCache
 from infra.configs.connection import DBConnectionHandler
+from infra.configs.settings import settings
 from infra.entities.user import User
 from infra.repositories.base_repository import BaseRepository
 
 
+# Usuários resolvidos por token (get_current_user), por id.
+# Invalidado em toda escrita feita por este repositório.
+user_cache = LRUCache(maxsize=settings.USER_CACHE_SIZE)
+
+
 class UserRepository(BaseRepository[User]):
     """
     Repositório para operações com User.
@@ -51,19 +60,19 @@ class UserRepository(BaseRepository[User]):
 
     def select_by_email(self, user_email: str) -> dict | None:
         """Busca usuário pelo email."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(User.user_email == user_email).first()
             return data.to_dict() if data else None
 
     def select_by_corporative_id(self, corporative_id: int) -> dict | None:
         """Busca usuário pelo ID corporativo."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(User.user_corporative_id == corporative_id).first()
             return data.to_dict() if data else None
 
     def select_by_team(self, team_id: int) -> list[dict]:
         """Retorna usuários de um time específico."""
-        with DBConnectionHandler() as db:
+        with self._read() as db:
             data = self._base_query(db.session).filter(User.user_team_id == team_id).all()
             return [item.to_dict() for item in data]
 
@@ -74,3 +83,82 @@ class UserRepository(BaseRepository[User]):
     def update_status(self, user_id: int, user_status) -> bool:
         """Atualiza o status operacional do usuário."""
         return self.update(user_id, user_status=user_status)
+
+    # =========================================================================
+    # CACHE DE USUÁRIOS
+    # =========================================================================
+
+    def select_for_auth(self, user_id: int) -> dict | None:
+        """
+        Usuário ativo lido do PRIMÁRIO, sem user_password.
+
+        Decide acesso: numa réplica atrasada, um usuário recém-desativado
+        ainda apareceria ativo (e iria para o cache por USER_CACHE_TTL_SECONDS).
+        """
+        with DBConnectionHandler() as db:
+            data = self._base_query(db.session).filter(User.id == user_id).first()
+            user = data.to_dict() if data else None
+        if user is not None:
+            user.pop("user_password", None)
+        return user
+
+    def select_cached(self, user_id: int) -> dict | None:
+        """
+        select_for_auth() com cache (ttl USER_CACHE_TTL_SECONDS).
+
+        Usado na resolução do usuário autenticado, a cada requisição.
+        """
+        user = user_cache.get(user_id)
+        if user is None:
+            user = self.select_for_auth(user_id)
+            if user is None:
+                return None
+            user_cache.set(user_id, user, ttl=settings.USER_CACHE_TTL_SECONDS)
+        return user
+
+    # Invalidação APÓS o commit (senão uma leitura concorrente recoloca o valor antigo)
+    def update(self, id: int, updated_by: Optional[int] = None, outbox=None, **kwargs) -> bool:
+        updated = super().update(id, updated_by=updated_by, outbox=outbox, **kwargs)
+        user_cache.pop(id)
+        return updated
+
+    def soft_delete(self, id: int, deleted_by: Optional[int] = None) -> bool:
+        deleted = super().soft_delete(id, deleted_by=deleted_by)
+        user_cache.pop(id)
+        return deleted
+
+    def restore(self, id: int) -> bool:
+        restored = super().restore(id)
+        user_cache.pop(id)
+        return restored
+
+    def hard_delete(self, id: int) -> bool:
+        deleted = super().hard_delete(id)
+        user_cache.pop(id)
+        return deleted
+
+    def _json_patch(self, id: int, column: str, build, updated_by: Optional[int],
+                    bump_version: bool = True) -> bool:
+        updated = super()._json_patch(id, column, build, updated_by, bump_version)
+        user_cache.pop(id)
+        return updated
+
+    # Escritas em lote (sincronização do RH): ids afetados não são conhecidos um a um
+    def upsert_many(self, rows: list[dict], conflict_columns, update_columns=None,
+                    inactive: str = "skip", batch_size: int = 500) -> dict[str, int]:
+        counts = super().upsert_many(rows, conflict_columns, update_columns, inactive, batch_size)
+        if counts["updated"] or counts["reactivated"]:
+            user_cache.clear()
+        return counts
+
+    def soft_delete_cascade(self, ids: list[int], deleted_by: Optional[int] = None) -> dict[str, int]:
+        counts = super().soft_delete_cascade(ids, deleted_by=deleted_by)
+        for id in ids:
+            user_cache.pop(id)
+        return counts
+
+    def restore_cascade(self, ids: list[int]) -> dict[str, int]:
+        counts = super().restore_cascade(ids)
+        for id in ids:
+            user_cache.pop(id)
+        return counts
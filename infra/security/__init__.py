@@ -0,0 +1,13 @@
+from .password_hasher import PasswordHasher, password_hasher
+from .auth_service import AuthService, auth_service
+from .token_service import TokenService, InvalidTokenError, token_service
+
+__all__ = [
+    'PasswordHasher',
+    'password_hasher',
+    'AuthService',
+    'auth_service',
+    'TokenService',
+    'InvalidTokenError',
+    'token_service',
+]
@@ -0,0 +1,88 @@
+"""
+Serviço de autenticação por e-mail e senha.
+
+O bcrypt roda no PasswordHasher (pool de processos); o acesso ao banco
+roda em threads (asyncio.to_thread). Nada de CPU pesada ou I/O
+bloqueante no event loop.
+"""
+import asyncio
+
+from infra.configs.connection import DBConnectionHandler
+from infra.entities.user import User
+from infra.repositories.user_repository import UserRepository
+from infra.security.password_hasher import PasswordHasher, password_hasher
+
+
+class AuthService:
+    """
+    Login, cadastro de senha e troca de senha.
+
+    Uso:
+        user = await auth_service.authenticate("joao@empresa.com", "senha")
+        if user is None: ...  # credenciais inválidas
+    """
+
+    def __init__(self, hasher: PasswordHasher | None = None, repository: UserRepository | None = None):
+        self.hasher = hasher or password_hasher
+        self.repository = repository or UserRepository()
+        self._dummy_hash: str | None = None
+
+    async def authenticate(self, user_email: str, password: str) -> dict | None:
+        """
+        Valida as credenciais.
+
+        - E-mail inexistente também executa um bcrypt (contra um hash fixo),
+          para o tempo de resposta não revelar quais e-mails existem
+        - Se o custo do bcrypt mudou, o hash é regravado com o custo atual
+
+        Returns:
+            Dict do usuário (sem user_password) ou None
+        """
+        row = await asyncio.to_thread(self._select_credentials, user_email)
+        if row is None:
+            await self.hasher.verify(password, await self._get_dummy_hash(), user_key=user_email)
+            return None
+
+        user_id, hashed = row
+        valid, new_hash = await self.hasher.verify(password, hashed, user_key=user_email)
+        if not valid:
+            return None
+        if new_hash:
+            await asyncio.to_thread(self.repository.update_password, user_id, new_hash)
+
+        return await asyncio.to_thread(self.repository.select_for_auth, user_id)
+
+    async def hash_password(self, password: str) -> str:
+        """Hash para gravar em User.user_password (ex: antes de UserRepository.create)."""
+        return await self.hasher.hash(password)
+
+    async def change_password(self, user_id: int, new_password: str) -> bool:
+        """Grava o hash da nova senha."""
+        hashed = await self.hasher.hash(new_password)
+        return await asyncio.to_thread(self.repository.update_password, user_id, hashed)
+
+    # =========================================================================
+    # AUXILIARES
+    # =========================================================================
+
+    @staticmethod
+    def _select_credentials(user_email: str) -> tuple[int, str] | None:
+        """Lê só id e hash (não a entidade inteira) de um usuário ativo."""
+        with DBConnectionHandler() as db:
+            row = db.session.query(User.id, User.user_password).filter(
+                User.user_email == user_email,
+                User.active_clause()
+            ).first()
+            return tuple(row) if row else None
+
+    async def _get_dummy_hash(self) -> str:
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.hasher.hash("senha-inexistente")
+        return self._dummy_hash
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.security import auth_service
+# =========================================================================
+auth_service = AuthService()
@@ -0,0 +1,174 @@
+"""
+Hash e verificação de senhas (bcrypt) fora do event loop.
+
+Por que um pool de PROCESSOS?
+    Um bcrypt com custo 12 gasta dezenas de ms de CPU pura. Rodando no
+    event loop (ou numa thread, que disputa o GIL com o loop), cada login
+    congela todas as outras requisições do worker. Num ProcessPoolExecutor
+    o custo vai para outros processos e o loop só espera o Future.
+
+Rehash transparente:
+    O custo (rounds) é fixado em min_rounds = max_rounds = rounds. Se o
+    hash gravado foi gerado com outro custo, verify() devolve o hash novo
+    (passlib verify_and_update), e quem chamou grava no lugar do antigo.
+
+Limite por usuário:
+    No máximo `per_user_limit` verificações simultâneas para a mesma
+    chave (ex: e-mail). Uma rajada de tentativas contra uma conta espera
+    na fila dela e não ocupa o pool inteiro.
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Hashable
+
+from passlib.context import CryptContext
+
+from infra.configs.settings import settings
+
+
+# =========================================================================
+# FUNÇÕES DOS PROCESSOS DO POOL (precisam ser importáveis: contexto spawn)
+# =========================================================================
+
+@lru_cache
+def _context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=["bcrypt"],
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds
+    )
+
+
+def _hash_password(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify_password(password: str, hashed: str, rounds: int) -> tuple[bool, str | None]:
+    try:
+        return _context(rounds).verify_and_update(password, hashed)
+    except ValueError:
+        # Hash malformado / desconhecido: trata como senha inválida
+        return False, None
+
+
+def _warmup() -> None:
+    _context(4)
+
+
+class PasswordHasher:
+    """
+    API assíncrona de hash/verify sobre um ProcessPoolExecutor limitado.
+
+    Uso:
+        hashed = await password_hasher.hash("senha")
+        ok, new_hash = await password_hasher.verify("senha", hashed, user_key=email)
+        if ok and new_hash:
+            ...  # custo mudou: gravar new_hash
+    """
+
+    def __init__(self, rounds: int = 12, max_workers: int | None = None, per_user_limit: int = 2):
+        self.rounds = rounds
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.per_user_limit = per_user_limit
+        self._executor: ProcessPoolExecutor | None = None
+        self._user_slots: dict[Hashable, tuple[asyncio.Semaphore, int]] = {}
+
+    # =========================================================================
+    # POOL
+    # =========================================================================
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Pool criado sob demanda (spawn: seguro com threads no processo pai)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def start(self) -> None:
+        """Sobe os processos do pool antes do primeiro login."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self.executor, _warmup) for _ in range(self.max_workers)
+        ))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    # =========================================================================
+    # HASH / VERIFY
+    # =========================================================================
+
+    async def hash(self, password: str) -> str:
+        """Gera o hash bcrypt de uma senha."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _hash_password, password, self.rounds)
+
+    async def verify(self, password: str, hashed: str,
+                     user_key: Hashable | None = None) -> tuple[bool, str | None]:
+        """
+        Verifica a senha contra o hash.
+
+        Args:
+            password: Senha em texto plano
+            hashed: Hash gravado
+            user_key: Chave do limite por usuário (None = sem limite)
+
+        Returns:
+            (senha_correta, novo_hash) - novo_hash só quando o custo mudou
+        """
+        loop = asyncio.get_running_loop()
+        if user_key is None:
+            return await loop.run_in_executor(self.executor, _verify_password, password, hashed, self.rounds)
+
+        semaphore = self._acquire_slot(user_key)
+        try:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    self.executor, _verify_password, password, hashed, self.rounds
+                )
+        finally:
+            self._release_slot(user_key)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True se o hash não usa o custo atual (checagem barata, sem bcrypt)."""
+        try:
+            return _context(self.rounds).needs_update(hashed)
+        except ValueError:
+            return True
+
+    # =========================================================================
+    # LIMITE POR USUÁRIO (semáforos removidos quando ninguém os usa)
+    # =========================================================================
+
+    def _acquire_slot(self, user_key: Hashable) -> asyncio.Semaphore:
+        semaphore, users = self._user_slots.get(user_key, (None, 0))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_user_limit)
+        self._user_slots[user_key] = (semaphore, users + 1)
+        return semaphore
+
+    def _release_slot(self, user_key: Hashable) -> None:
+        semaphore, users = self._user_slots[user_key]
+        if users <= 1:
+            del self._user_slots[user_key]
+        else:
+            self._user_slots[user_key] = (semaphore, users - 1)
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.security import password_hasher
+# =========================================================================
+password_hasher = PasswordHasher(
+    rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    per_user_limit=settings.PASSWORD_VERIFY_PER_USER
+)
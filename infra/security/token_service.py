@@ -0,0 +1,176 @@
+"""
+Emissão e verificação de tokens JWT (access + refresh).
+
+Cache de claims verificados:
+    Cada requisição autenticada traria um decode + verificação HMAC do
+    mesmo token. Os claims já verificados ficam num LRU chaveado pelo
+    SHA-256 do token, com ttl = tempo até o exp. O cache guarda só o
+    resultado de tokens VÁLIDOS; o token em si não é guardado.
+
+Revogação:
+    - revoke(token): o jti entra na lista de revogados (até o exp) e a
+      entrada do cache é removida
+    - revoke_user(user_id): tokens do usuário emitidos até agora deixam
+      de valer (logout global, usuário desativado)
+    A lista é consultada também nos hits de cache, então uma revogação
+    vale imediatamente. Ela fica em memória: com vários workers, cada
+    processo tem a sua (use um worker por instância ou compartilhe a lista).
+"""
+import hashlib
+import threading
+import time
+import uuid
+
+from jose import JWTError, jwt
+
+from infra.cache import LRUCache
+from infra.configs.settings import settings
+
+
+ACCESS = "access"
+REFRESH = "refresh"
+
+
+class InvalidTokenError(ValueError):
+    """Token malformado, com assinatura inválida, expirado, revogado ou do tipo errado."""
+
+
+class TokenService:
+    """
+    Uso:
+        pair = token_service.issue_pair(user_id)   # {"access_token", "refresh_token", ...}
+        claims = token_service.verify(access_token)
+        user_id = int(claims["sub"])
+        pair = token_service.refresh(refresh_token) # rotação: o refresh antigo é revogado
+    """
+
+    def __init__(self, secret_key: str, algorithm: str = "HS256", access_minutes: int = 30,
+                 refresh_days: int = 7, cache_size: int = 10000):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.access_seconds = access_minutes * 60
+        self.refresh_seconds = refresh_days * 86400
+        self._cache = LRUCache(maxsize=cache_size)
+        self._revoked_jti: dict[str, float] = {}         # jti -> exp
+        self._revoked_users: dict[str, float] = {}       # sub -> revogado em (epoch)
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # EMISSÃO
+    # =========================================================================
+
+    def issue(self, user_id: int, token_type: str = ACCESS) -> str:
+        """Gera um token assinado (sub, type, iat, exp, jti)."""
+        now = time.time()
+        lifetime = self.access_seconds if token_type == ACCESS else self.refresh_seconds
+        claims = {
+            "sub": str(user_id),
+            "type": token_type,
+            "iat": now,
+            "exp": int(now + lifetime),
+            "jti": uuid.uuid4().hex,
+        }
+        return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+    def issue_pair(self, user_id: int) -> dict:
+        """Access + refresh token (formato de resposta OAuth2)."""
+        return {
+            "access_token": self.issue(user_id, ACCESS),
+            "refresh_token": self.issue(user_id, REFRESH),
+            "token_type": "bearer",
+            "expires_in": self.access_seconds,
+        }
+
+    def refresh(self, refresh_token: str) -> dict:
+        """
+        Troca um refresh token por um novo par (o refresh usado é revogado).
+
+        Raises:
+            InvalidTokenError: refresh token inválido
+        """
+        claims = self.verify(refresh_token, token_type=REFRESH)
+        self.revoke(refresh_token)
+        return self.issue_pair(int(claims["sub"]))
+
+    # =========================================================================
+    # VERIFICAÇÃO
+    # =========================================================================
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def verify(self, token: str, token_type: str = ACCESS) -> dict:
+        """
+        Retorna os claims de um token válido.
+
+        Raises:
+            InvalidTokenError: Token inválido, expirado, revogado ou de outro tipo
+        """
+        digest = self._digest(token)
+        claims = self._cache.get(digest)
+        if claims is None:
+            try:
+                claims = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            except JWTError as error:
+                raise InvalidTokenError(str(error)) from error
+            ttl = claims.get("exp", 0) - time.time()
+            if ttl > 0:
+                self._cache.set(digest, claims, ttl=ttl)
+
+        if claims.get("type") != token_type:
+            raise InvalidTokenError(f"Esperado token do tipo '{token_type}'")
+        if self._is_revoked(claims):
+            self._cache.pop(digest)
+            raise InvalidTokenError("Token revogado")
+        return claims
+
+    # =========================================================================
+    # REVOGAÇÃO
+    # =========================================================================
+
+    def revoke(self, token: str) -> None:
+        """Revoga um token específico (logout)."""
+        try:
+            claims = jwt.decode(
+                token, self.secret_key, algorithms=[self.algorithm], options={"verify_exp": False}
+            )
+        except JWTError as error:
+            raise InvalidTokenError(str(error)) from error
+
+        now = time.time()
+        with self._lock:
+            self._revoked_jti[claims["jti"]] = claims.get("exp", now)
+            # Poda: jti expirado não precisa mais ficar na lista
+            self._revoked_jti = {jti: exp for jti, exp in self._revoked_jti.items() if exp > now}
+        self._cache.pop(self._digest(token))
+
+    def revoke_user(self, user_id: int) -> None:
+        """Revoga todos os tokens já emitidos para o usuário."""
+        with self._lock:
+            self._revoked_users[str(user_id)] = time.time()
+
+    def _is_revoked(self, claims: dict) -> bool:
+        with self._lock:
+            if claims.get("jti") in self._revoked_jti:
+                return True
+            revoked_at = self._revoked_users.get(claims.get("sub"))
+        return revoked_at is not None and claims.get("iat", 0) <= revoked_at
+
+    @property
+    def stats(self) -> dict:
+        return {"size": len(self._cache), "hits": self._cache.hits, "misses": self._cache.misses,
+                "revoked": len(self._revoked_jti)}
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.security import token_service
+# =========================================================================
+token_service = TokenService(
+    secret_key=settings.SECRET_KEY,
+    algorithm=settings.TOKEN_ALGORITHM,
+    access_minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
+    refresh_days=settings.REFRESH_TOKEN_EXPIRE_DAYS,
+    cache_size=settings.TOKEN_CACHE_SIZE
+)
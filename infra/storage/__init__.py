@@ -0,0 +1,8 @@
+from .attachment_store import AttachmentStore, AttachmentTooLarge, StoredFile, attachment_store
+
+__all__ = [
+    'AttachmentStore',
+    'AttachmentTooLarge',
+    'StoredFile',
+    'attachment_store',
+]
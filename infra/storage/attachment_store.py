@@ -0,0 +1,174 @@
+"""
+Armazenamento local de anexos, endereçado por conteúdo (SHA-256).
+
+Por que endereçar por conteúdo?
+    O mesmo arquivo (ex: um PDF de política anexado em vários tickets)
+    é gravado UMA vez. O caminho é derivado do hash, então não há tabela
+    de arquivos: os tickets/mensagens guardam só os metadados no array
+    JSON de anexos (ticket_attachments / message_attachments).
+
+Layout em disco:
+    ATTACHMENTS_DIR/
+        tmp/                          # uploads em andamento
+        ab/cd/abcd1234...ef           # arquivo final (sha256 completo)
+
+Upload:
+    Os chunks são gravados num arquivo temporário enquanto o hash é
+    calculado (nunca há o arquivo inteiro em memória). No fim, o arquivo
+    é movido com os.replace() (atômico no mesmo filesystem) para o caminho
+    do hash; se o hash já existe, o temporário é descartado.
+
+Metadados de um anexo (item do array JSON):
+    {"sha256": "...", "name": "contrato.pdf", "size": 18231,
+     "content_type": "application/pdf", "uploaded_at": "2026-..."}
+"""
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Iterable
+
+from infra.configs.settings import settings
+
+
+_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class AttachmentTooLarge(ValueError):
+    """Upload excedeu o tamanho máximo configurado (ATTACHMENT_MAX_SIZE)."""
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """Resultado de um upload: hash, tamanho e se o conteúdo já existia."""
+    sha256: str
+    size: int
+    deduplicated: bool
+
+
+class AttachmentStore:
+    """
+    Store de anexos em disco local.
+
+    Uso:
+        stored = attachment_store.save_stream(chunks)
+        metadata = attachment_store.metadata(stored, "contrato.pdf")
+        path = attachment_store.path_for(stored.sha256)
+    """
+
+    def __init__(self, root: str | Path, chunk_size: int = 1024 * 1024, max_size: int | None = None):
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        self.max_size = max_size
+
+    # =========================================================================
+    # CAMINHOS
+    # =========================================================================
+
+    def path_for(self, sha256: str) -> Path:
+        """
+        Caminho do arquivo de um hash.
+
+        Raises:
+            ValueError: sha256 inválido (protege contra path traversal)
+        """
+        if not _SHA256_PATTERN.match(sha256):
+            raise ValueError(f"sha256 inválido: {sha256!r}")
+        return self.root / sha256[:2] / sha256[2:4] / sha256
+
+    def exists(self, sha256: str) -> bool:
+        return self.path_for(sha256).is_file()
+
+    # =========================================================================
+    # GRAVAÇÃO
+    # =========================================================================
+
+    def save_stream(self, chunks: Iterable[bytes]) -> StoredFile:
+        """
+        Grava um arquivo a partir de chunks, calculando o SHA-256 no caminho.
+
+        Raises:
+            AttachmentTooLarge: Conteúdo maior que max_size (nada é gravado)
+        """
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                for chunk in chunks:
+                    size += len(chunk)
+                    if self.max_size is not None and size > self.max_size:
+                        raise AttachmentTooLarge(f"Anexo excede {self.max_size} bytes")
+                    digest.update(chunk)
+                    tmp.write(chunk)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+
+            sha256 = digest.hexdigest()
+            final_path = self.path_for(sha256)
+            if final_path.is_file():
+                os.unlink(tmp_path)
+                return StoredFile(sha256=sha256, size=size, deduplicated=True)
+
+            final_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, final_path)
+            return StoredFile(sha256=sha256, size=size, deduplicated=False)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def save_file(self, file: BinaryIO) -> StoredFile:
+        """Grava a partir de um file-like (lido em chunks de chunk_size)."""
+        return self.save_stream(iter(lambda: file.read(self.chunk_size), b""))
+
+    def delete(self, sha256: str) -> bool:
+        """
+        Remove o conteúdo do disco.
+
+        ATENÇÃO: o mesmo hash pode estar referenciado por vários
+        tickets/mensagens; só remova conteúdo sem referências.
+        """
+        try:
+            self.path_for(sha256).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    # =========================================================================
+    # METADADOS
+    # =========================================================================
+
+    @staticmethod
+    def metadata(stored: StoredFile, filename: str, content_type: str | None = None,
+                 uploaded_by: int | None = None) -> dict:
+        """Item do array JSON de anexos para um arquivo gravado."""
+        name = os.path.basename(filename or "") or stored.sha256
+        item = {
+            "sha256": stored.sha256,
+            "name": name,
+            "size": stored.size,
+            "content_type": content_type or mimetypes.guess_type(name)[0] or "application/octet-stream",
+            "uploaded_at": datetime.now().isoformat(),
+        }
+        if uploaded_by is not None:
+            item["uploaded_by"] = uploaded_by
+        return item
+
+
+# =========================================================================
+# INSTÂNCIA GLOBAL - Importe assim:
+# from infra.storage import attachment_store
+# =========================================================================
+attachment_store = AttachmentStore(
+    root=settings.ATTACHMENTS_DIR,
+    chunk_size=settings.ATTACHMENT_CHUNK_SIZE,
+    max_size=settings.ATTACHMENT_MAX_SIZE
+)
@@ -1,7 +1,43 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+
+from api.routes import attachment_router, auth_router, change_router, export_router, inbox_router
+from infra.configs.connection import get_engine
+from infra.configs.replicas import sqlite_replicator
 from infra.configs.settings import settings
+from infra.configs.sqlite import sqlite_maintenance
+from infra.configs.write_queue import write_queue
+from infra.mail import outbox_worker
+from infra.notifications import notification_pipeline
+from infra.security import password_hasher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Sobe/derruba os workers em background junto com a API."""
+    notification_pipeline.start()
+    outbox_worker.start()
+    await password_hasher.start()
+    sqlite_maintenance.start(get_engine()[0])
+    sqlite_replicator.start()
+    yield
+    notification_pipeline.stop()
+    await outbox_worker.stop()
+    password_hasher.shutdown()
+    write_queue.stop()
+    sqlite_replicator.stop()
+    sqlite_maintenance.stop()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
-    debug=settings.DEBUG
-)
\ No newline at end of file
+    debug=settings.DEBUG,
+    lifespan=lifespan
+)
+
+app.include_router(auth_router)
+app.include_router(attachment_router)
+app.include_router(inbox_router)
+app.include_router(export_router)
+app.include_router(change_router)
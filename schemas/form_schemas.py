@@ -8,7 +8,7 @@ class FormSchema(BaseModel):
     form_description: str
     form_ticket_class: str
     form_type: str
-    form_fields: str
+    form_fields: dict
     form_is_default: str
     form_version: str
     created_at: datetime
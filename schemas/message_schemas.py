@@ -8,7 +8,7 @@ class MessageSchema(BaseModel):
     message_user_id: int
     message_content: str
     message_type: str
-    message_attachments: str
+    message_attachments: list
     message_is_internal: bool
     message_edited_at: datetime
     created_at: datetime
@@ -10,7 +10,7 @@ class UserSchema(BaseModel):
     user_team_id: int
     user_role: str
     user_tipo: str
-    user_notification_preferences: str
+    user_notification_preferences: dict
     created_at: datetime
     updated_at: datetime
     created_by: str
@@ -33,8 +33,8 @@ class ProjectSchema(BaseModel):
     project_risks: str
     project_assumptions: str
     project_constraints: str
-    project_milestones: str
-    project_tasks: str 
+    project_milestones: list
+    project_tasks: list
     created_at: datetime
     updated_at: datetime
     created_by: int
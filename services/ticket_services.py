@@ -23,7 +23,7 @@ class TicketSchema(BaseModel):
     ticket_estimated_hours: int
     ticket_actual_hours:int
     ticket_satisfaction_rating: int
-    ticket_attachments: str
+    ticket_attachments: list
     ticket_resolution_notes: str
     created_at: datetime
     updated_at: datetime
@@ -0,0 +1,74 @@
+"""
+Configuração comum dos testes (pytest).
+
+O banco é um SQLite temporário por sessão de testes; a URL vai para o
+ambiente ANTES de qualquer import de infra (settings é lido uma vez).
+As variáveis obrigatórias que não vierem do ambiente recebem valores de teste.
+
+Uso:
+    python -m pytest -q tests/
+
+Fixtures:
+    database    tabelas recriadas do zero (inclusive as de arquivo) e
+                caches de processo (e o índice de visibilidade) limpos;
+                retorna o engine
+    seed        base mínima: um time, cinco atendentes, um formulário sem
+                campos, um ticket do primeiro atendente e o chat dele
+"""
+import os
+import tempfile
+
+TEST_DIR = tempfile.mkdtemp(prefix="tests_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TEST_DIR, 'app.db')}"
+os.environ["ATTACHMENTS_DIR"] = os.path.join(TEST_DIR, "attachments")
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+os.environ.setdefault("APP_NAME", "tests")
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("SECRET_KEY", "chave-de-teste-com-pelo-menos-32-caracteres")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
+
+import pytest  # noqa: E402
+
+import infra.entities  # noqa: E402,F401
+from infra.authorization import visibility_index  # noqa: E402
+from infra.configs.connection import get_engine  # noqa: E402
+from infra.configs.database import Base  # noqa: E402
+from infra.entities.archive import archive_metadata  # noqa: E402
+from infra.entities.form import FormClasse, FormTipo  # noqa: E402
+from infra.entities.team import Area  # noqa: E402
+from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo  # noqa: E402
+from infra.entities.user import UserRole, UserTipo  # noqa: E402
+from infra.forms import form_validator_cache  # noqa: E402
+from infra.repositories import (  # noqa: E402
+    ChatRepository, FormRepository, TeamRepository, TicketRepository, UserRepository
+)
+from infra.repositories.user_repository import user_cache  # noqa: E402
+
+
+@pytest.fixture
+def database():
+    engine, _ = get_engine()
+    for metadata in (archive_metadata, Base.metadata):
+        metadata.drop_all(engine)
+    for metadata in (Base.metadata, archive_metadata):
+        metadata.create_all(engine)
+    user_cache.clear()
+    form_validator_cache.clear()
+    visibility_index.invalidate()
+    yield engine
+
+
+@pytest.fixture
+def seed(database) -> dict:
+    team = TeamRepository().create("Time", Area.EAB)
+    users = [
+        UserRepository().create(number, f"Usuário {number}", f"u{number}@teste.com", "senha",
+                                team, UserRole.N1, UserTipo.ATENDENTE)
+        for number in range(1, 6)
+    ]
+    form = FormRepository().create("Formulário", FormClasse.RELATORIO, FormTipo.BUG, {"fields": []})
+    ticket = TicketRepository().create("Ticket", TicketClasse.RELATORIO, TicketTipo.BUG, users[0],
+                                       "descrição", form, TicketStatus.ABERTO)
+    chat = ChatRepository().create(ticket)
+    return {"team": team, "users": users, "form": form, "ticket": ticket, "chat": chat}
@@ -0,0 +1,131 @@
+"""
+Benchmark das colunas adiadas (load groups) nas listagens.
+
+Base temporária com `--rows` tickets (descrição de 3 KB e notas de 1 KB)
+e `--rows` mensagens (1 KB). Para cada listagem compara o resumo
+(padrão) com o grupo adiado carregado:
+    bytes      soma do tamanho dos valores que o driver devolve (os
+               SELECTs capturados são reexecutados no cursor DBAPI)
+    pico       memória Python no pico (tracemalloc), incluindo os dicts
+    tempo      parede da chamada do repository
+
+Uso:
+    python -m tests.deferred_columns_bench                 # 10k linhas
+    python -m tests.deferred_columns_bench --rows 50000
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+parser = argparse.ArgumentParser(description="Benchmark das colunas adiadas")
+parser.add_argument("--rows", type=int, default=10000, help="tickets (e mensagens) na base")
+parser.add_argument("--repeat", type=int, default=3, help="execuções por caminho (vale a mais rápida)")
+args = parser.parse_args()
+
+temp_dir = tempfile.mkdtemp(prefix="deferred_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+
+from sqlalchemy import event, insert  # noqa: E402
+
+import infra.entities  # noqa: E402,F401
+from infra.configs.connection import get_engine  # noqa: E402
+from infra.configs.database import Base  # noqa: E402
+from infra.entities import Chat, Form, Message, Team, Ticket, User  # noqa: E402
+from infra.entities.form import FormClasse, FormTipo  # noqa: E402
+from infra.entities.team import Area  # noqa: E402
+from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo  # noqa: E402
+from infra.entities.user import UserRole, UserTipo  # noqa: E402
+from infra.repositories import MessageRepository, TicketRepository  # noqa: E402
+
+
+def seed() -> None:
+    engine, session_factory = get_engine()
+    Base.metadata.create_all(engine)
+    with session_factory() as session:
+        session.execute(insert(Team), [{"team_name": "Bench", "team_area": Area.EAB}])
+        session.execute(insert(User), [{
+            "user_corporative_id": 1, "user_full_name": "Usuário", "user_email": "u@bench.com",
+            "user_password": "x", "user_team_id": 1, "user_role": UserRole.N1, "user_tipo": UserTipo.ATENDENTE
+        }])
+        session.execute(insert(Form), [{
+            "form_name": "Bench", "form_ticket_class": FormClasse.RELATORIO, "form_type": FormTipo.BUG,
+            "form_fields": []
+        }])
+        session.execute(insert(Ticket), [{
+            "ticket_title": f"Ticket {i}", "ticket_description": "d" * 3000, "ticket_resolution_notes": "n" * 1000,
+            "ticket_class": TicketClasse.RELATORIO, "ticket_type": TicketTipo.BUG, "ticket_client_id": 1,
+            "ticket_form_id": 1, "ticket_status": TicketStatus.ABERTO
+        } for i in range(args.rows)])
+        session.execute(insert(Chat), [{"chat_ticket_id": 1}])
+        session.execute(insert(Message), [{
+            "message_chat_id": 1, "message_user_id": 1, "message_content": "m" * 1000
+        } for _ in range(args.rows)])
+        session.commit()
+
+
+def driver_bytes(statements: list[tuple[str, tuple]]) -> int:
+    """Bytes dos valores devolvidos pelos SELECTs capturados."""
+    raw = get_engine()[0].raw_connection()
+    try:
+        cursor = raw.cursor()
+        total = 0
+        for sql, parameters in statements:
+            for row in cursor.execute(sql, parameters):
+                total += sum(len(value) if isinstance(value, (str, bytes)) else 8 for value in row if value is not None)
+        return total
+    finally:
+        raw.close()
+
+
+def measure(call) -> dict:
+    engine = get_engine()[0]
+    statements: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    tracemalloc.start()
+    rows = call()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    event.remove(engine, "before_cursor_execute", capture)
+    del rows
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return {"bytes": driver_bytes(statements), "peak": peak, "seconds": best}
+
+
+def main() -> None:
+    seed()
+    tickets, messages = TicketRepository(), MessageRepository()
+    cases = [
+        ("TicketRepository.select_all", lambda: tickets.select_all(), lambda: tickets.select_all(groups=("detail",))),
+        ("MessageRepository.select_all", lambda: messages.select_all(),
+         lambda: messages.select_all(groups=("content",))),
+    ]
+    print(f"{args.rows} linhas por tabela (ticket: 3 KB de descrição + 1 KB de notas; mensagem: 1 KB)")
+    print(f"{'listagem':<30} {'caminho':<9} {'bytes':>10} {'pico':>10} {'tempo':>9}")
+    for name, summary, full in cases:
+        for label, call in (("completo", full), ("resumo", summary)):
+            result = measure(call)
+            print(f"{name:<30} {label:<9} {result['bytes'] / 1e6:>8.2f}MB {result['peak'] / 1e6:>8.1f}MB "
+                  f"{result['seconds']:>8.3f}s")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        get_engine()[0].dispose()
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
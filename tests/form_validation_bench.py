@@ -0,0 +1,105 @@
+"""
+Benchmark da validação de respostas de formulário (form_fields grandes).
+
+Compara, por submissão:
+    sem cache    json.loads(form_fields) + compile_form + validar (o que
+                 cada requisição pagaria sem o compilador/cache)
+    compilado    model_validate + model_dump do modelo já compilado
+    repository   FormRepository.validate_submission (form_version por PK
+                 + cache), num SQLite temporário
+
+Uso:
+    python -m tests.form_validation_bench                     # 50, 100 e 200 campos
+    python -m tests.form_validation_bench --fields 60 --submissions 20000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+parser = argparse.ArgumentParser(description="Benchmark do validador compilado de formulários")
+parser.add_argument("--fields", type=int, nargs="+", default=[50, 100, 200], help="campos por formulário")
+parser.add_argument("--submissions", type=int, default=5000, help="submissões validadas por caminho")
+parser.add_argument("--uncached", type=int, default=200, help="submissões no caminho sem cache (é lento)")
+args = parser.parse_args()
+
+temp_dir = tempfile.mkdtemp(prefix="form_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+
+import infra.entities  # noqa: E402,F401
+from infra.configs.connection import get_engine  # noqa: E402
+from infra.configs.database import Base  # noqa: E402
+from infra.entities.form import FormClasse, FormTipo  # noqa: E402
+from infra.forms import compile_form  # noqa: E402
+from infra.repositories import FormRepository  # noqa: E402
+
+# Ciclo de tipos dos campos gerados (com a resposta válida de cada um)
+FIELD_CYCLE = [
+    ({"type": "text", "max_length": 200}, "texto livre"),
+    ({"type": "textarea", "max_length": 2000}, "x" * 300),
+    ({"type": "email"}, "pessoa@empresa.com"),
+    ({"type": "number", "min": 0, "max": 1000}, 12.5),
+    ({"type": "integer", "min": 1}, 7),
+    ({"type": "boolean"}, True),
+    ({"type": "date"}, "2026-03-01"),
+    ({"type": "datetime"}, "2026-03-01T10:00:00"),
+    ({"type": "select", "options": ["EAB", "CIA", "EFI", "OUTRO"]}, "CIA"),
+    ({"type": "multiselect", "options": ["a", "b", "c", "d"]}, ["a", "c"]),
+]
+
+
+def build_form(count: int) -> tuple[list[dict], dict]:
+    """(form_fields, respostas válidas) com `count` campos, metade obrigatórios."""
+    fields, answers = [], {}
+    for position in range(count):
+        spec, answer = FIELD_CYCLE[position % len(FIELD_CYCLE)]
+        name = f"campo_{position}"
+        fields.append({"name": name, "required": position % 2 == 0, "label": f"Campo {position}", **spec})
+        answers[name] = answer
+    return fields, answers
+
+
+def per_call(fn, repeat: int) -> float:
+    """Microssegundos por chamada."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    engine, _ = get_engine()
+    Base.metadata.create_all(engine)
+    repository = FormRepository()
+
+    print(f"{'campos':>7} {'compilar':>11} {'sem cache':>11} {'compilado':>11} {'repository':>11} {'ganho':>7}")
+    for count in args.fields:
+        fields, answers = build_form(count)
+        raw = json.dumps(fields)
+        form_id = repository.create(f"Bench {count}", FormClasse.RELATORIO, FormTipo.BUG, fields)
+        repository.validate_submission(form_id, answers)   # aquece o cache
+
+        compile_us = per_call(lambda: compile_form(json.loads(raw)), 20)
+        uncached_us = per_call(
+            lambda: compile_form(json.loads(raw)).model_validate(answers).model_dump(mode="json", by_alias=True),
+            args.uncached
+        )
+        model = compile_form(fields)
+        compiled_us = per_call(lambda: model.model_validate(answers).model_dump(mode="json", by_alias=True),
+                               args.submissions)
+        repository_us = per_call(lambda: repository.validate_submission(form_id, answers), args.submissions)
+
+        print(f"{count:>7} {compile_us:>9.0f}us {uncached_us:>9.0f}us {compiled_us:>9.1f}us "
+              f"{repository_us:>9.1f}us {uncached_us / repository_us:>6.0f}x")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        get_engine()[0].dispose()
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
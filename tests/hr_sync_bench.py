@@ -0,0 +1,100 @@
+"""
+Benchmark da sincronização do RH: carga inicial, execução sem mudanças e 1% alterado.
+
+Base e arquivo temporários com `--users` pessoas em `--teams` times. A
+meta é a execução sem mudanças (arquivo igual ao já aplicado) levar
+segundos: só lê o arquivo, carrega os hashes e não escreve nada.
+Comandos contados no driver por tipo (SELECT/INSERT/UPDATE).
+
+Uso:
+    python -m tests.hr_sync_bench                    # 50k usuários, CSV
+    python -m tests.hr_sync_bench --users 200000 --format jsonl
+"""
+import argparse
+import csv
+import json
+import os
+import tempfile
+import time
+
+parser = argparse.ArgumentParser(description="Benchmark da sincronização do RH")
+parser.add_argument("--users", type=int, default=50000, help="pessoas no arquivo")
+parser.add_argument("--teams", type=int, default=200, help="times")
+parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+parser.add_argument("--changed", type=float, default=0.01, help="fração alterada na última execução")
+args = parser.parse_args()
+
+temp_dir = tempfile.mkdtemp(prefix="hr_sync_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+
+from sqlalchemy import event  # noqa: E402
+
+import infra.entities  # noqa: E402,F401
+from infra.configs.connection import get_engine  # noqa: E402
+from infra.configs.database import Base  # noqa: E402
+from infra.jobs.hr_sync import FIELDS, HrSyncJob  # noqa: E402
+
+AREAS = ("eab", "projetos", "cia", "indicadores")
+
+
+def write_file(renamed: int = 0) -> str:
+    """Arquivo do RH; as primeiras `renamed` pessoas com nome novo."""
+    path = os.path.join(temp_dir, f"rh_{renamed}.{args.format}")
+    records = ({
+        "matricula": i, "nome": f"Pessoa {i}{' Renomeada' if i <= renamed else ''}",
+        "email": f"pessoa{i}@empresa.com", "time": f"Time {i % args.teams}",
+        "area": AREAS[(i % args.teams) % len(AREAS)], "papel": "atendente", "tipo": "atendente"
+    } for i in range(1, args.users + 1))
+    with open(path, "w", encoding="utf-8", newline="") as target:
+        if args.format == "csv":
+            writer = csv.DictWriter(target, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+        else:
+            target.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    return path
+
+
+def measure(path: str) -> tuple[object, float, dict]:
+    engine = get_engine()[0]
+    commands: dict[str, int] = {}
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        kind = statement.lstrip().split(None, 1)[0].upper()
+        commands[kind] = commands.get(kind, 0) + 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        start = time.perf_counter()
+        stats = HrSyncJob().run(path)
+        elapsed = time.perf_counter() - start
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return stats, elapsed, commands
+
+
+def main() -> None:
+    Base.metadata.create_all(get_engine()[0])
+    same = write_file()
+    runs = [("carga inicial", same), ("sem mudanças", same),
+            (f"{args.changed:.0%} alterado", write_file(int(args.users * args.changed)))]
+    print(f"{args.users} usuários em {args.teams} times ({args.format})")
+    print(f"{'execução':<14} {'tempo':>8} {'sem mudança':>12} {'gravados':>9}  comandos")
+    for label, path in runs:
+        stats, elapsed, commands = measure(path)
+        written = sum(stats.count(kind) for kind in ("inserted", "updated", "reactivated", "departed"))
+        print(f"{label:<14} {elapsed:>7.2f}s {stats.unchanged:>12} {written:>9}  "
+              + ", ".join(f"{kind} {n}" for kind, n in sorted(commands.items())))
+        if stats.errors:
+            raise SystemExit(f"erros na sincronização: {stats.errors[:3]}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        get_engine()[0].dispose()
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
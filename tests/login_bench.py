@@ -0,0 +1,146 @@
+"""
+Benchmark de logins concorrentes: bcrypt no pool de processos x no event loop.
+
+Roda AuthService.authenticate (SELECT das credenciais + bcrypt + SELECT
+do usuário) para `--logins` usuários distintos, com `--concurrency`
+logins em andamento ao mesmo tempo, num SQLite temporário. Em paralelo,
+uma tarefa "batimento" acorda a cada 10 ms: o atraso dela mostra o quanto
+as OUTRAS requisições do worker ficariam paradas.
+
+Modos:
+    inline    verify chamado direto no event loop (sem pool)
+    thread    verify em asyncio.to_thread
+    process   PasswordHasher (ProcessPoolExecutor), como na API
+
+Uso:
+    python -m tests.login_bench                               # custo 10, 200 logins, 32 simultâneos
+    python -m tests.login_bench --rounds 12 --logins 100 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+parser = argparse.ArgumentParser(description="Benchmark de logins concorrentes")
+parser.add_argument("--rounds", type=int, default=10, help="custo do bcrypt")
+parser.add_argument("--logins", type=int, default=200, help="logins por modo")
+parser.add_argument("--concurrency", type=int, default=32, help="logins simultâneos")
+parser.add_argument("--workers", type=int, default=None, help="processos do pool (padrão: CPUs)")
+parser.add_argument("--modes", nargs="+", default=["inline", "thread", "process"],
+                    choices=["inline", "thread", "process"])
+args = parser.parse_args()
+
+temp_dir = tempfile.mkdtemp(prefix="login_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+
+from sqlalchemy import insert  # noqa: E402
+
+import infra.entities  # noqa: E402,F401
+from infra.configs.connection import get_engine  # noqa: E402
+from infra.configs.database import Base  # noqa: E402
+from infra.entities import Team, User  # noqa: E402
+from infra.entities.team import Area  # noqa: E402
+from infra.entities.user import UserRole, UserTipo  # noqa: E402
+from infra.security import AuthService, PasswordHasher  # noqa: E402
+from infra.security.password_hasher import _hash_password, _verify_password  # noqa: E402
+
+HEARTBEAT_SECONDS = 0.01
+
+
+class InlineHasher(PasswordHasher):
+    """verify no próprio event loop (o que o pool evita)."""
+
+    async def verify(self, password, hashed, user_key=None):
+        return _verify_password(password, hashed, self.rounds)
+
+
+class ThreadHasher(PasswordHasher):
+    """verify numa thread do loop."""
+
+    async def verify(self, password, hashed, user_key=None):
+        return await asyncio.to_thread(_verify_password, password, hashed, self.rounds)
+
+
+def seed() -> None:
+    engine, session_factory = get_engine()
+    Base.metadata.create_all(engine)
+    hashed = _hash_password("senha", args.rounds)
+    with session_factory() as session:
+        session.execute(insert(Team), [{"team_name": "Bench", "team_area": Area.EAB}])
+        session.execute(insert(User), [{
+            "user_corporative_id": i, "user_full_name": f"Usuário {i}", "user_email": f"u{i}@bench.com",
+            "user_password": hashed, "user_team_id": 1, "user_role": UserRole.N1, "user_tipo": UserTipo.ATENDENTE
+        } for i in range(args.logins)])
+        session.commit()
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run(mode: str) -> dict:
+    hashers = {"inline": InlineHasher, "thread": ThreadHasher, "process": PasswordHasher}
+    hasher = hashers[mode](rounds=args.rounds, max_workers=args.workers)
+    if mode == "process":
+        await hasher.start()
+    service = AuthService(hasher=hasher)
+
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        while not done.is_set():
+            expected = time.perf_counter() + HEARTBEAT_SECONDS
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            lags.append(max(0.0, time.perf_counter() - expected))
+
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def login(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            user = await service.authenticate(f"u{i}@bench.com", "senha")
+            latencies.append(time.perf_counter() - start)
+            assert user is not None
+
+    beat = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    await asyncio.gather(*(login(i) for i in range(args.logins)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await beat
+    hasher.shutdown()
+    return {
+        "mode": mode,
+        "rate": args.logins / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": percentile(latencies, 0.95) * 1000,
+        "lag_p99": percentile(lags, 0.99) * 1000,
+        "lag_max": max(lags) * 1000,
+    }
+
+
+def main() -> None:
+    seed()
+    print(f"bcrypt custo {args.rounds}, {args.logins} logins, {args.concurrency} simultâneos, "
+          f"{os.cpu_count()} CPU(s)")
+    print(f"{'modo':>8} {'logins/s':>9} {'p50':>9} {'p95':>9} {'atraso p99':>11} {'atraso máx':>11}")
+    for mode in args.modes:
+        result = asyncio.run(run(mode))
+        print(f"{result['mode']:>8} {result['rate']:>9.1f} {result['p50']:>7.0f}ms {result['p95']:>7.0f}ms "
+              f"{result['lag_p99']:>9.1f}ms {result['lag_max']:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        get_engine()[0].dispose()
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
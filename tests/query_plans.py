@@ -0,0 +1,385 @@
+"""
+Harness de planos de execução dos repositories.
+
+Cria uma base NOVA e grande, chama cada método de leitura dos
+repositories (e os SELECTs do outbox, do arquivo, do feed de mudanças e
+das exportações), captura todo SELECT que chega ao driver e roda
+EXPLAIN QUERY PLAN (SQLite) / EXPLAIN (PostgreSQL) com os mesmos
+parâmetros. Falha (exit 1) se algum método lê inteira uma tabela grande.
+
+Uso:
+    python -m tests.query_plans                       # SQLite temporário, 20k tickets
+    python -m tests.query_plans --tickets 100000
+    python -m tests.query_plans --database sqlite:////tmp/plans.db --keep
+    python -m tests.query_plans --verbose             # imprime todos os planos
+
+No pytest (tests/test_query_plans.py) o mesmo seed()/calls()/check()
+roda numa base pequena a cada execução da suíte.
+
+A URL precisa apontar para um banco vazio (as tabelas são criadas com
+create_all). SCAN permitido só nos métodos de ALLOWED_SCANS (listagem
+completa por definição, ou busca em JSON sem índice no SQLite).
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+from datetime import date, datetime
+
+if __name__ == "__main__":
+    # A URL precisa estar no ambiente antes de importar infra (settings);
+    # no pytest quem faz isso é o conftest
+    parser = argparse.ArgumentParser(description="Verifica os planos de execução dos repositories")
+    parser.add_argument("--database", help="URL de um banco vazio (padrão: SQLite temporário)")
+    parser.add_argument("--tickets", type=int, default=20000, help="tickets na base (o resto é proporcional)")
+    parser.add_argument("--keep", action="store_true", help="não apaga o SQLite temporário")
+    parser.add_argument("--verbose", action="store_true", help="imprime o plano de todos os statements")
+    args = parser.parse_args()
+
+    temp_path = None
+    if args.database is None:
+        temp_path = os.path.join(tempfile.mkdtemp(prefix="query_plans_"), "plans.db")
+        args.database = f"sqlite:///{temp_path}"
+    os.environ["DATABASE_URL"] = args.database
+    os.environ["DATABASE_REPLICA_URLS"] = "[]"
+
+from sqlalchemy import event, insert, text  # noqa: E402
+
+import infra.entities  # noqa: E402,F401
+from infra.authorization import visibility_index  # noqa: E402
+from infra.configs.connection import get_engine  # noqa: E402
+from infra.configs.database import Base, Status  # noqa: E402
+from infra.configs.keyset import encode_cursor  # noqa: E402
+from infra.configs.query_plan import explain_sql, full_scans  # noqa: E402
+from infra.entities import (  # noqa: E402
+    Chat, ChatReadPointer, Form, Message, Notification, Project, Report, Team, Ticket, User
+)
+from infra.entities.archive import archive_metadata  # noqa: E402
+from infra.entities.outbox import OutboxMessage, OutboxStatus  # noqa: E402
+from infra.exports import FEEDS, ExportFilters, change_feed, table_exporter  # noqa: E402
+from infra.entities.associations import (  # noqa: E402
+    ProjectAllowedUser, ProjectClient, ReportAllowedUser, TicketAttendant, TicketTeam,
+    UserProjectFollow, UserReportFollow, UserTicketFollow
+)
+from infra.entities.form import FormClasse, FormTipo  # noqa: E402
+from infra.entities.notification import NotificationEntidade, NotificationTipo  # noqa: E402
+from infra.entities.project import ProjectStatus, ProjectTags  # noqa: E402
+from infra.entities.report import ReportFrequency, ReportStatus, ReportTags  # noqa: E402
+from infra.entities.team import Area  # noqa: E402
+from infra.entities.ticket import TicketClasse, TicketPriority, TicketStatus, TicketTipo  # noqa: E402
+from infra.entities.user import UserRole, UserTipo  # noqa: E402
+from infra.repositories import (  # noqa: E402
+    ArchiveRepository, ChatReadPointerRepository, ChatRepository, FormRepository, MessageRepository,
+    NotificationRepository, ProjectRepository, ReportRepository, TeamRepository,
+    TicketRepository, UserRepository
+)
+from infra.repositories.outbox_repository import OutboxRepository  # noqa: E402
+
+# Tabelas que crescem com o uso (SCAN nelas reprova o método)
+LARGE_TABLES = {
+    "users", "projects", "reports", "tickets", "chats", "messages", "notifications",
+    "chat_read_pointers", "ticket_attendants", "ticket_teams", "user_ticket_follows",
+    "user_project_follows", "user_report_follows", "project_allowed_users",
+    "project_clients", "report_allowed_users", "outbox_messages",
+    "archive_tickets", "archive_chats", "archive_messages",
+}
+
+# Métodos em que a leitura inteira é esperada
+ALLOWED_SCANS = {
+    "select_all", "count",
+    # JSON sem índice no SQLite (no PostgreSQL: GIN jsonb_path_ops)
+    "select_by_json_key", "select_by_json_item",
+    # Exportação da tabela inteira (o filtro só corta linhas da leitura em ordem de id)
+    "export",
+}
+
+ARCHIVED_EVERY = 10   # os primeiros tickets/10 vão para o arquivo
+
+INACTIVE_EVERY = 10   # 1 em cada 10 linhas soft-deleted
+
+
+def members(enum):
+    return list(enum)
+
+
+def seed(session, tickets: int) -> dict:
+    """Base proporcional a `tickets` (inserts em lote, sem ORM por linha)."""
+    teams = max(tickets // 1000, 5)
+    users = max(tickets // 20, 50)
+    projects = reports = max(tickets // 100, 10)
+
+    def active(i):
+        return Status.INATIVO if i % INACTIVE_EVERY == 0 else Status.ATIVO
+
+    def bulk(model, rows):
+        session.execute(insert(model), list(rows))
+
+    bulk(Form, ({
+        "form_name": f"Form {i}", "form_ticket_class": klass, "form_type": kind, "form_fields": []
+    } for i, (klass, kind) in enumerate((k, t) for k in members(FormClasse) for t in members(FormTipo))))
+    bulk(Team, ({
+        "team_name": f"Time {i}", "team_area": members(Area)[i % len(Area)]
+    } for i in range(1, teams + 1)))
+    bulk(User, ({
+        "user_corporative_id": i, "user_full_name": f"Usuário {i}", "user_email": f"u{i}@empresa.com",
+        "user_password": "x", "user_team_id": i % teams + 1,
+        "user_role": members(UserRole)[i % len(UserRole)],
+        "user_tipo": UserTipo.SOLICITANTE if i % 3 else UserTipo.ATENDENTE, "active": active(i)
+    } for i in range(1, users + 1)))
+    bulk(Project, ({
+        "project_name": f"Projeto {i}", "project_directory": f"/projetos/{i}",
+        "project_description": "x" * 200, "project_tags": members(ProjectTags)[i % len(ProjectTags)],
+        "project_team_responsible_id": i % teams + 1, "project_manager_id": i % users + 1,
+        "project_status": members(ProjectStatus)[i % len(ProjectStatus)],
+        "project_start_date": date(2026, 1, 1), "project_expected_end_date": date(2026, 12, 31),
+        "project_planned_budget": 1000.0, "project_public": i % 10 == 0, "active": active(i)
+    } for i in range(1, projects + 1)))
+    bulk(Report, ({
+        "report_name": f"Relatório {i}", "report_link": f"https://bi/{i}",
+        "report_description": "x" * 200,
+        "report_frequency": members(ReportFrequency)[i % len(ReportFrequency)],
+        "report_tags": members(ReportTags)[i % len(ReportTags)],
+        "report_team_responsible_id": i % teams + 1, "report_owner_id": i % users + 1,
+        "report_status": members(ReportStatus)[i % len(ReportStatus)], "report_public": i % 10 == 0,
+        "active": active(i)
+    } for i in range(1, reports + 1)))
+    bulk(Ticket, ({
+        "ticket_title": f"Ticket {i}", "ticket_description": "x" * 500,
+        "ticket_class": members(TicketClasse)[i % len(TicketClasse)],
+        "ticket_type": members(TicketTipo)[i % len(TicketTipo)],
+        "ticket_client_id": i % users + 1, "ticket_form_id": 1,
+        "ticket_status": members(TicketStatus)[i % len(TicketStatus)],
+        "ticket_priority": members(TicketPriority)[i % len(TicketPriority)],
+        "ticket_project_id": i % projects + 1 if i % 2 else None,
+        "ticket_report_id": i % reports + 1 if i % 2 == 0 else None,
+        "active": active(i)
+    } for i in range(1, tickets + 1)))
+    bulk(Chat, ({"chat_ticket_id": i} for i in range(1, tickets + 1)))
+    bulk(Message, ({
+        "message_chat_id": i % tickets + 1, "message_user_id": i % users + 1,
+        "message_content": "mensagem " * 20, "message_is_internal": i % 4 == 0, "active": active(i)
+    } for i in range(1, tickets * 5 + 1)))
+    bulk(TicketAttendant, ({
+        "ticket_id": i, "user_id": (i * 7) % users + 1, "active": active(i)
+    } for i in range(1, tickets + 1)))
+    bulk(TicketTeam, ({"ticket_id": i, "team_id": i % teams + 1} for i in range(1, tickets + 1)))
+    bulk(UserTicketFollow, ({
+        "user_id": (i * 13) % users + 1, "ticket_id": i, "active": active(i)
+    } for i in range(1, tickets + 1)))
+    for model, column, count in (
+        (UserProjectFollow, "project_id", projects), (ProjectAllowedUser, "project_id", projects),
+        (ProjectClient, "project_id", projects), (UserReportFollow, "report_id", reports),
+        (ReportAllowedUser, "report_id", reports),
+    ):
+        bulk(model, ({
+            "user_id": (i * 11) % users + 1, column: i % count + 1
+        } for i in range(1, count * 10 + 1)))
+    bulk(ChatReadPointer, ({
+        "pointer_chat_id": i % tickets + 1, "pointer_user_id": (i * 17 + i // tickets) % users + 1,
+        "pointer_unread_count": i % 5
+    } for i in range(1, tickets * 2 + 1)))
+    bulk(Notification, ({
+        "notification_user_id": i % users + 1,
+        "notification_type": members(NotificationTipo)[i % len(NotificationTipo)],
+        "notification_entity_type": NotificationEntidade.TICKET, "notification_entity_id": i % tickets + 1,
+        "notification_title": "Atualização", "notification_read_at": datetime.now() if i % 2 else None
+    } for i in range(1, tickets * 2 + 1)))
+    bulk(OutboxMessage, ({
+        "outbox_recipient": f"u{i % users + 1}@empresa.com", "outbox_subject": "Atualização",
+        "outbox_body": "corpo " * 20, "outbox_ticket_id": i % tickets + 1,
+        "outbox_status": OutboxStatus.PENDENTE if i % 50 == 0 else OutboxStatus.ENVIADO,
+        "outbox_sent_at": None if i % 50 == 0 else datetime.now()
+    } for i in range(1, tickets + 1)))
+    return {"teams": teams, "users": users, "projects": projects, "reports": reports, "tickets": tickets,
+            "archived": tickets // ARCHIVED_EVERY}
+
+
+def calls(sizes: dict) -> list[tuple[str, str, callable]]:
+    """(repository, método, chamada) — IDs do meio da base, não soft-deleted."""
+    user_id = sizes["users"] // 2 + 1
+    ticket_id = sizes["tickets"] // 2 + 1
+    project_id = sizes["projects"] // 2 + 1
+    report_id = sizes["reports"] // 2 + 1
+    team_id = sizes["teams"] // 2
+
+    teams, users, forms = TeamRepository(), UserRepository(), FormRepository()
+    projects, reports, tickets = ProjectRepository(), ReportRepository(), TicketRepository()
+    chats, messages = ChatRepository(), MessageRepository()
+    notifications, pointers = NotificationRepository(), ChatReadPointerRepository()
+    archive, outbox = ArchiveRepository(), OutboxRepository()
+    # Ticket arquivado (chat i é do ticket i no seed)
+    archived_id = sizes["archived"] // 2 + 1
+    # Marca d'água no meio da tabela (formato de updated_at do SQLite)
+    watermark = encode_cursor(["2000-01-01 00:00:00", ticket_id])
+    feeds = [
+        ("ChangeFeed", f"changes({entity}, since)", lambda entity=entity: change_feed.changes(entity, since=watermark))
+        for entity in FEEDS
+    ]
+    exports = [
+        ("TableExporter", "export", lambda dataset=dataset: b"".join(table_exporter.stream(dataset, "ndjson")))
+        for dataset in ("tickets", "projects", "reports", "messages")
+    ]
+    return [
+        ("TeamRepository", "select_all", lambda: teams.select_all()),
+        ("TeamRepository", "count", lambda: teams.count()),
+        ("TeamRepository", "select_by_area", lambda: teams.select_by_area(members(Area)[0])),
+        ("TeamRepository", "select_by_name", lambda: teams.select_by_name(f"Time {team_id}")),
+        ("UserRepository", "select_by_id", lambda: users.select_by_id(user_id)),
+        ("UserRepository", "exists", lambda: users.exists(user_id)),
+        ("UserRepository", "select_by_email", lambda: users.select_by_email(f"u{user_id}@empresa.com")),
+        ("UserRepository", "select_by_corporative_id", lambda: users.select_by_corporative_id(user_id)),
+        ("UserRepository", "select_by_team", lambda: users.select_by_team(team_id)),
+        ("UserRepository", "select_for_auth", lambda: users.select_for_auth(user_id)),
+        ("UserRepository", "select_by_json_key",
+         lambda: users.select_by_json_key("user_notification_preferences", "email", False)),
+        ("FormRepository", "select_by_class", lambda: forms.select_by_class(members(FormClasse)[0])),
+        ("FormRepository", "select_by_type", lambda: forms.select_by_type(members(FormTipo)[0])),
+        ("FormRepository", "select_default",
+         lambda: forms.select_default(members(FormClasse)[0], members(FormTipo)[0])),
+        ("ProjectRepository", "select_by_team", lambda: projects.select_by_team(team_id)),
+        ("ProjectRepository", "select_by_manager", lambda: projects.select_by_manager(user_id)),
+        ("ProjectRepository", "select_visible", lambda: projects.select_visible(user_id)),
+        ("ProjectRepository", "search_visible", lambda: projects.search_visible(user_id, "1")),
+        ("ReportRepository", "select_by_team", lambda: reports.select_by_team(team_id)),
+        ("ReportRepository", "select_by_owner", lambda: reports.select_by_owner(user_id)),
+        ("ReportRepository", "select_visible", lambda: reports.select_visible(user_id)),
+        ("ReportRepository", "search_visible", lambda: reports.search_visible(user_id, "1")),
+        ("TicketRepository", "select_by_id", lambda: tickets.select_by_id(ticket_id)),
+        ("TicketRepository", "select_by_client", lambda: tickets.select_by_client(user_id)),
+        ("TicketRepository", "select_by_project", lambda: tickets.select_by_project(project_id)),
+        ("TicketRepository", "select_by_report", lambda: tickets.select_by_report(report_id)),
+        ("TicketRepository", "get_attachment", lambda: tickets.get_attachment(ticket_id, "0" * 64)),
+        ("TicketRepository", "select_participation", lambda: tickets.select_participation(ticket_id, user_id)),
+        ("TicketRepository", "select_by_json_item",
+         lambda: tickets.select_by_json_item("ticket_attachments", "sha256", "0" * 64)),
+        ("TicketRepository", "select_inbox", lambda: tickets.select_inbox(user_id)),
+        ("TicketRepository", "select_inbox(status)",
+         lambda: tickets.select_inbox(user_id, statuses=[members(TicketStatus)[0]])),
+        ("TicketRepository", "select_by_id(arquivado)", lambda: tickets.select_by_id(archived_id)),
+        ("ChatRepository", "select_by_ticket_id", lambda: chats.select_by_ticket_id(ticket_id)),
+        ("ChatRepository", "select_by_ticket_id(arquivado)", lambda: chats.select_by_ticket_id(archived_id)),
+        ("MessageRepository", "select_by_chat_id", lambda: messages.select_by_chat_id(ticket_id)),
+        ("MessageRepository", "select_public_by_chat_id", lambda: messages.select_public_by_chat_id(ticket_id)),
+        ("MessageRepository", "select_by_chat_id(arquivado)", lambda: messages.select_by_chat_id(archived_id)),
+        ("MessageRepository", "select_public_by_chat_id(arquivado)",
+         lambda: messages.select_public_by_chat_id(archived_id)),
+        ("MessageRepository", "select_by_user_id", lambda: messages.select_by_user_id(user_id)),
+        ("MessageRepository", "get_attachment", lambda: messages.get_attachment(ticket_id, "0" * 64)),
+        ("MessageRepository", "select_scope", lambda: messages.select_scope(ticket_id)),
+        ("NotificationRepository", "select_followers",
+         lambda: notifications.select_followers(NotificationEntidade.TICKET, [ticket_id, ticket_id + 1])),
+        ("NotificationRepository", "select_followers(project)",
+         lambda: notifications.select_followers(NotificationEntidade.PROJECT, [project_id])),
+        ("NotificationRepository", "select_recipients", lambda: notifications.select_recipients({user_id})),
+        ("NotificationRepository", "select_unread_by_user", lambda: notifications.select_unread_by_user(user_id)),
+        ("NotificationRepository", "count_unread", lambda: notifications.count_unread(user_id)),
+        ("NotificationRepository", "count_unread_by_entity",
+         lambda: notifications.count_unread_by_entity(user_id, NotificationEntidade.TICKET, [ticket_id])),
+        ("ChatReadPointerRepository", "select_badges",
+         lambda: pointers.select_badges(user_id, [ticket_id, ticket_id + 1])),
+        ("ArchiveRepository", "select_ticket", lambda: archive.select_ticket(archived_id)),
+        ("ArchiveRepository", "select_chat_by_ticket", lambda: archive.select_chat_by_ticket(archived_id)),
+        ("ArchiveRepository", "select_messages_by_chat", lambda: archive.select_messages_by_chat(archived_id)),
+        ("ArchiveRepository", "select_messages_by_chat(públicas)",
+         lambda: archive.select_messages_by_chat(archived_id, include_internal=False)),
+        ("OutboxRepository", "claim_due", lambda: outbox.claim_due(10)),
+        ("ChangeFeed", "changes(tickets)", lambda: change_feed.changes("tickets")),
+        *feeds,
+        *exports,
+        ("TableExporter", "export(team)",
+         lambda: b"".join(table_exporter.stream("tickets", "csv", ExportFilters(team_id=team_id)))),
+        ("TableExporter", "export(messages, team)",
+         lambda: b"".join(table_exporter.stream("messages", "csv", ExportFilters(team_id=team_id)))),
+    ]
+
+
+def prepare(tickets: int) -> dict:
+    """Tabelas + seed() + ANALYZE + índice de visibilidade carregado; devolve os tamanhos."""
+    engine, session_factory = get_engine()
+    Base.metadata.create_all(engine)
+    archive_metadata.create_all(engine)
+    with session_factory() as session:
+        sizes = seed(session, tickets)
+        session.commit()
+    archived = list(range(1, sizes["archived"] + 1))
+    for start in range(0, len(archived), 500):
+        ArchiveRepository().archive_tickets(archived[start:start + 500])
+    with engine.connect() as connection:
+        connection.execute(text("ANALYZE"))
+        connection.commit()
+    visibility_index.invalidate()
+    visibility_index.is_admin(1)   # carga do índice de visibilidade fora da medição
+    visibility_index.check_seconds = float("inf")   # a conferência (count(*) por tabela) também
+    return sizes
+
+
+def check(sizes: dict) -> list[dict]:
+    """
+    Roda cada chamada de calls() e explica os SELECTs que ela fez.
+
+    Returns:
+        [{"repository", "method", "scanned" (tabelas grandes lidas inteiras),
+          "allowed", "statements", "plans"}]
+    """
+    engine = get_engine()[0]
+    captured: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((statement, parameters))
+
+    results = []
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        for repository, method, call in calls(sizes):
+            captured.clear()
+            call()
+            statements = list(captured)
+            raw = engine.raw_connection()
+            try:
+                plans = [explain_sql(raw, engine.dialect.name, sql, params) for sql, params in statements]
+            finally:
+                raw.close()
+            scanned = set()
+            for plan in plans:
+                scanned |= {re.sub(r"_\d+$", "", table) for table in full_scans(plan)} & LARGE_TABLES
+            results.append({
+                "repository": repository, "method": method, "scanned": scanned,
+                "allowed": method in ALLOWED_SCANS, "statements": statements, "plans": plans,
+            })
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return results
+
+
+def main() -> int:
+    sizes = prepare(args.tickets)
+    failures = 0
+    for result in check(sizes):
+        scanned, allowed = result["scanned"], result["allowed"]
+        status = "ok" if not scanned else ("scan permitido" if allowed else "FULL SCAN")
+        failures += bool(scanned) and not allowed
+        print(f"{status:15} {result['repository']}.{result['method']}"
+              + (f"  ({', '.join(sorted(scanned))})" if scanned else ""))
+        if args.verbose or (scanned and not allowed):
+            for (sql, _params), plan in zip(result["statements"], result["plans"]):
+                print("    " + " ".join(sql.split())[:160])
+                for line in plan:
+                    print(f"        {line}")
+
+    print(f"\n{failures} método(s) com full scan em tabela grande "
+          f"({sizes['tickets']} tickets, {sizes['tickets'] * 5} mensagens)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    try:
+        exit_code = main()
+    finally:
+        if temp_path and not args.keep:
+            get_engine()[0].dispose()
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(temp_path + suffix):
+                    os.remove(temp_path + suffix)
+    sys.exit(exit_code)
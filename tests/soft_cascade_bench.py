@@ -0,0 +1,132 @@
+"""
+Benchmark do restore em cascata: um UPDATE por tabela x um por tabela por raiz.
+
+Base temporária com `--tickets` tickets, cada um com chat, `--messages`
+mensagens e ponteiro de leitura. Os tickets são apagados em cascata em
+`--operations` operações (carimbos diferentes) e restaurados de uma vez:
+    conjunto   restore_cascade(session, Ticket, ids), o caminho atual
+    por raiz   restore_cascade(..., [id]) para cada id, o custo do laço
+               por raiz que existia antes
+Cada caminho roda numa base recém-criada; as contagens precisam bater.
+
+Uso:
+    python -m tests.soft_cascade_bench                  # 10k tickets
+    python -m tests.soft_cascade_bench --tickets 2000 --operations 10
+    python -m tests.soft_cascade_bench --tickets 100000 --paths conjunto
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+parser = argparse.ArgumentParser(description="Restore em cascata de muitos tickets")
+parser.add_argument("--tickets", type=int, default=10000, help="tickets apagados e restaurados")
+parser.add_argument("--messages", type=int, default=3, help="mensagens por chat")
+parser.add_argument("--operations", type=int, default=100, help="operações de delete (carimbos distintos)")
+parser.add_argument("--paths", nargs="+", default=["conjunto", "por raiz"], choices=["conjunto", "por raiz"],
+                    help="o laço por raiz é quadrático: em 10k tickets leva minutos")
+args = parser.parse_args()
+
+temp_dir = tempfile.mkdtemp(prefix="soft_cascade_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+
+from sqlalchemy import event, insert  # noqa: E402
+
+import infra.entities  # noqa: E402,F401
+from infra.configs.connection import get_engine  # noqa: E402
+from infra.configs.database import Base  # noqa: E402
+from infra.configs.soft_cascade import restore_cascade, soft_delete_cascade  # noqa: E402
+from infra.entities import Chat, ChatReadPointer, Form, Message, Team, Ticket, User  # noqa: E402
+from infra.entities.form import FormClasse, FormTipo  # noqa: E402
+from infra.entities.team import Area  # noqa: E402
+from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo  # noqa: E402
+from infra.entities.user import UserRole, UserTipo  # noqa: E402
+
+
+def seed() -> list[int]:
+    """Base nova com os tickets já apagados em cascata; devolve os ids."""
+    engine, session_factory = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    ids = list(range(1, args.tickets + 1))
+    with session_factory() as session:
+        session.execute(insert(Team), [{"team_name": "Bench", "team_area": Area.EAB}])
+        session.execute(insert(User), [{
+            "user_corporative_id": 1, "user_full_name": "Usuário", "user_email": "u@bench.com",
+            "user_password": "x", "user_team_id": 1, "user_role": UserRole.N1, "user_tipo": UserTipo.ATENDENTE
+        }])
+        session.execute(insert(Form), [{
+            "form_name": "Bench", "form_ticket_class": FormClasse.RELATORIO, "form_type": FormTipo.BUG,
+            "form_fields": []
+        }])
+        session.execute(insert(Ticket), [{
+            "id": i, "ticket_title": f"Ticket {i}", "ticket_description": "d", "ticket_class": TicketClasse.RELATORIO,
+            "ticket_type": TicketTipo.BUG, "ticket_client_id": 1, "ticket_form_id": 1,
+            "ticket_status": TicketStatus.ABERTO
+        } for i in ids])
+        session.execute(insert(Chat), [{"id": i, "chat_ticket_id": i} for i in ids])
+        session.execute(insert(Message), [{
+            "message_chat_id": i, "message_user_id": 1, "message_content": "m"
+        } for i in ids for _ in range(args.messages)])
+        session.execute(insert(ChatReadPointer), [{"pointer_chat_id": i, "pointer_user_id": 1} for i in ids])
+        per_operation = -(-len(ids) // args.operations)
+        start = datetime(2026, 1, 1)
+        for n, first in enumerate(range(0, len(ids), per_operation)):
+            soft_delete_cascade(session, Ticket, ids[first:first + per_operation], stamp=start + timedelta(minutes=n))
+        session.commit()
+    return ids
+
+
+def measure(restore) -> tuple[dict, float, int]:
+    ids = seed()
+    engine, session_factory = get_engine()
+    updates = [0]
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        updates[0] += statement.lstrip().upper().startswith("UPDATE")
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        with session_factory() as session:
+            start = time.perf_counter()
+            counts = restore(session, ids)
+            session.commit()
+            elapsed = time.perf_counter() - start
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return counts, elapsed, updates[0]
+
+
+def per_root(session, ids: list[int]) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for root_id in ids:
+        for table, rows in restore_cascade(session, Ticket, [root_id]).items():
+            totals[table] = totals.get(table, 0) + rows
+    return totals
+
+
+def main() -> None:
+    print(f"{args.tickets} tickets (chat + {args.messages} mensagens + ponteiro), "
+          f"apagados em {args.operations} operações")
+    print(f"{'caminho':<9} {'UPDATEs':>8} {'tempo':>9}  linhas restauradas")
+    results = {}
+    paths = {"conjunto": lambda session, ids: restore_cascade(session, Ticket, ids), "por raiz": per_root}
+    for label in args.paths:
+        counts, elapsed, updates = measure(paths[label])
+        results[label] = counts
+        restored = ", ".join(f"{table} {rows}" for table, rows in counts.items() if rows)
+        print(f"{label:<9} {updates:>8} {elapsed:>8.2f}s  {restored}")
+    if len(results) == 2 and results["conjunto"] != results["por raiz"]:
+        raise SystemExit("contagens diferentes entre os caminhos")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        get_engine()[0].dispose()
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
@@ -0,0 +1,135 @@
+"""
+Benchmark de escritas concorrentes no SQLite: PRAGMAs padrão x perfil SQLITE_*.
+
+Cada perfil roda num subprocesso com um banco novo (settings é lido uma
+vez por processo). `--writers` threads criam ticket + chat + mensagem
+pelos repositories enquanto `--readers` threads leem tickets por cliente.
+
+Perfis:
+    default   o que o SQLite faz sem configuração: journal DELETE,
+              synchronous FULL, sem mmap, cache de 2 MB, temp_store padrão
+              (busy_timeout de 5 s, o mesmo que o driver sqlite3 já aplica)
+    profile   valores padrão de Settings (WAL, NORMAL, mmap 256 MB, ...)
+
+Uso:
+    python -m tests.sqlite_pragma_bench
+    python -m tests.sqlite_pragma_bench --writers 16 --per-writer 100 --readers 8
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+PROFILES = {
+    "default": {
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_MMAP_SIZE": "0",
+        "SQLITE_CACHE_SIZE": "-2000",
+        "SQLITE_BUSY_TIMEOUT_MS": "5000",
+        "SQLITE_TEMP_STORE": "DEFAULT",
+    },
+    "profile": {},
+}
+
+parser = argparse.ArgumentParser(description="Escritas concorrentes por perfil de PRAGMAs")
+parser.add_argument("--writers", type=int, default=8, help="threads de escrita")
+parser.add_argument("--per-writer", type=int, default=60, help="tickets (+ chat + mensagem) por thread")
+parser.add_argument("--readers", type=int, default=4, help="threads de leitura simultâneas")
+parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+parser.add_argument("--run", choices=list(PROFILES), help=argparse.SUPPRESS)   # subprocesso
+args = parser.parse_args()
+
+
+def run_profile() -> dict:
+    """Executa no subprocesso (banco e PRAGMAs já no ambiente)."""
+    from sqlalchemy import text
+
+    import infra.entities  # noqa: F401
+    from infra.configs.connection import DBConnectionHandler, get_engine
+    from infra.configs.database import Base
+    from infra.entities.form import FormClasse, FormTipo
+    from infra.entities.team import Area
+    from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo
+    from infra.entities.user import UserRole, UserTipo
+    from infra.repositories import (
+        ChatRepository, FormRepository, MessageRepository, TeamRepository, TicketRepository, UserRepository
+    )
+
+    Base.metadata.create_all(get_engine()[0])
+    team = TeamRepository().create("Bench", Area.EAB)
+    users = [UserRepository().create(i, f"Usuário {i}", f"u{i}@bench.com", "x", team, UserRole.N1, UserTipo.ATENDENTE)
+             for i in range(1, 6)]
+    form = FormRepository().create("Bench", FormClasse.RELATORIO, FormTipo.BUG, [])
+    tickets, chats, messages = TicketRepository(), ChatRepository(), MessageRepository()
+
+    errors: list[str] = []
+    written = [0] * args.writers
+    reads = [0] * args.readers
+    stop = threading.Event()
+
+    def writer(index: int):
+        for n in range(args.per_writer):
+            try:
+                ticket = tickets.create(f"T{index}-{n}", TicketClasse.RELATORIO, TicketTipo.BUG,
+                                        users[index % 5], "d" * 500, form, TicketStatus.ABERTO)
+                messages.create(chats.create(ticket), users[(index + 1) % 5], "m" * 300)
+                written[index] += 1
+            except Exception as error:
+                errors.append(type(error).__name__)
+
+    def reader(index: int):
+        while not stop.is_set():
+            try:
+                tickets.select_by_client(users[0])
+                reads[index] += 1
+            except Exception as error:
+                errors.append(type(error).__name__)
+
+    with DBConnectionHandler() as db:
+        journal = db.session.execute(text("PRAGMA journal_mode")).scalar()
+
+    readers = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    writers = [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    for thread in readers:
+        thread.start()
+    start = time.perf_counter()
+    for thread in writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for thread in readers:
+        thread.join()
+    return {"journal": journal, "written": sum(written), "reads": sum(reads),
+            "elapsed": elapsed, "errors": len(errors), "error_types": sorted(set(errors))}
+
+
+def main() -> None:
+    print(f"{args.writers} escritores x {args.per_writer} (ticket + chat + mensagem), {args.readers} leitores")
+    print(f"{'perfil':>8} {'journal':>8} {'escritas/s':>11} {'leituras/s':>11} {'erros':>6}")
+    for profile in args.profiles:
+        with tempfile.TemporaryDirectory(prefix="pragma_bench_") as directory:
+            env = {**os.environ, **PROFILES[profile],
+                   "DATABASE_URL": f"sqlite:///{os.path.join(directory, 'bench.db')}",
+                   "DATABASE_REPLICA_URLS": "[]", "DB_WRITE_MODE": "direct"}
+            command = [sys.executable, "-m", "tests.sqlite_pragma_bench", "--run", profile,
+                       "--writers", str(args.writers), "--per-writer", str(args.per_writer),
+                       "--readers", str(args.readers)]
+            output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{profile:>8} {result['journal']:>8} {result['written'] / result['elapsed']:>11.0f} "
+              f"{result['reads'] / result['elapsed']:>11.0f} {result['errors']:>6}"
+              + (f"  {', '.join(result['error_types'])}" if result["errors"] else ""))
+
+
+if __name__ == "__main__":
+    if args.run:
+        print(json.dumps(run_profile()))
+    else:
+        main()
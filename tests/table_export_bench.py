@@ -0,0 +1,115 @@
+"""
+Benchmark da exportação em streaming: memória constante em 1M de linhas.
+
+Base temporária com `--rows` tickets (com JSON do formulário, enums e
+datas, as colunas que passam por conversão). Cada formato é exportado
+para um descarte, chunk a chunk, medindo:
+    pico 10%   memória Python no pico (tracemalloc) até 10% das linhas
+    pico 100%  o mesmo até o fim: igual ao de 10% = memória constante
+    tempo      parede da exportação (com tracemalloc ligado)
+Por último o RSS máximo do processo (inclui a carga da base).
+
+Uso:
+    python -m tests.table_export_bench                  # 1M tickets
+    python -m tests.table_export_bench --rows 200000 --formats csv
+"""
+import argparse
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+
+parser = argparse.ArgumentParser(description="Exportação em streaming com memória constante")
+parser.add_argument("--rows", type=int, default=1_000_000, help="tickets na base")
+parser.add_argument("--chunk", type=int, default=5000, help="linhas por lote (EXPORT_CHUNK_SIZE)")
+parser.add_argument("--formats", nargs="+", default=["ndjson", "csv", "parquet"], choices=["ndjson", "csv", "parquet"])
+args = parser.parse_args()
+
+temp_dir = tempfile.mkdtemp(prefix="table_export_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+
+from sqlalchemy import insert  # noqa: E402
+
+import infra.entities  # noqa: E402,F401
+from infra.configs.connection import get_engine  # noqa: E402
+from infra.configs.database import Base  # noqa: E402
+from infra.entities import Form, Team, Ticket, User  # noqa: E402
+from infra.entities.form import FormClasse, FormTipo  # noqa: E402
+from infra.entities.team import Area  # noqa: E402
+from infra.entities.ticket import TicketClasse, TicketPriority, TicketStatus, TicketTipo  # noqa: E402
+from infra.entities.user import UserRole, UserTipo  # noqa: E402
+from infra.exports import ExportFormatUnavailable, TableExporter  # noqa: E402
+
+STATUSES = list(TicketStatus)
+PRIORITIES = list(TicketPriority)
+
+
+def seed() -> None:
+    engine, session_factory = get_engine()
+    Base.metadata.create_all(engine)
+    with session_factory() as session:
+        session.execute(insert(Team), [{"team_name": "Bench", "team_area": Area.EAB}])
+        session.execute(insert(User), [{
+            "user_corporative_id": 1, "user_full_name": "Usuário", "user_email": "u@bench.com",
+            "user_password": "x", "user_team_id": 1, "user_role": UserRole.N1, "user_tipo": UserTipo.ATENDENTE
+        }])
+        session.execute(insert(Form), [{
+            "form_name": "Bench", "form_ticket_class": FormClasse.RELATORIO, "form_type": FormTipo.BUG,
+            "form_fields": []
+        }])
+        for first in range(0, args.rows, 50000):
+            session.execute(insert(Ticket), [{
+                "ticket_title": f"Ticket {i}", "ticket_description": "descrição " * 20,
+                "ticket_class": TicketClasse.RELATORIO, "ticket_type": TicketTipo.BUG, "ticket_client_id": 1,
+                "ticket_form_id": 1, "ticket_status": STATUSES[i % len(STATUSES)],
+                "ticket_priority": PRIORITIES[i % len(PRIORITIES)],
+                "ticket_form_data": {"sistema": "ERP", "linha": i, "urgente": i % 2 == 0},
+            } for i in range(first, min(first + 50000, args.rows))])
+        session.commit()
+
+
+def measure(exporter: TableExporter, fmt: str) -> dict:
+    """Exporta para o descarte; linhas contadas por lote (uma partição = chunk linhas)."""
+    checkpoint = args.rows // 10
+    tracemalloc.start()
+    start = time.perf_counter()
+    written, rows, peak_at_checkpoint = 0, 0, None
+    for chunk in exporter.stream("tickets", fmt):
+        written += len(chunk)
+        rows = min(rows + args.chunk, args.rows)
+        if peak_at_checkpoint is None and rows >= checkpoint:
+            peak_at_checkpoint = tracemalloc.get_traced_memory()[1]
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"bytes": written, "peak_10": peak_at_checkpoint or peak, "peak": peak, "seconds": elapsed}
+
+
+def main() -> None:
+    started = time.perf_counter()
+    seed()
+    print(f"{args.rows} tickets carregados em {time.perf_counter() - started:.0f}s; lotes de {args.chunk} linhas")
+    print(f"{'formato':<8} {'saída':>10} {'pico 10%':>10} {'pico 100%':>10} {'tempo':>8}")
+    exporter = TableExporter(chunk_size=args.chunk)
+    for fmt in args.formats:
+        try:
+            result = measure(exporter, fmt)
+        except ExportFormatUnavailable as error:
+            tracemalloc.stop()
+            print(f"{fmt:<8} {error}")
+            continue
+        print(f"{fmt:<8} {result['bytes'] / 1e6:>8.0f}MB {result['peak_10'] / 1e6:>8.1f}MB "
+              f"{result['peak'] / 1e6:>8.1f}MB {result['seconds']:>7.1f}s")
+    print(f"RSS máximo do processo: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f}MB")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        get_engine()[0].dispose()
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
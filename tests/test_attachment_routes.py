@@ -0,0 +1,89 @@
+"""Acesso aos anexos: só participantes do ticket; mensagens internas fora do alcance do cliente."""
+import pytest
+from fastapi.testclient import TestClient
+
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.settings import settings
+from infra.entities.associations import TicketAttendant, TicketTeam
+from infra.entities.team import Area
+from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo
+from infra.entities.user import UserRole, UserTipo
+from infra.repositories import ChatRepository, MessageRepository, TeamRepository, TicketRepository, UserRepository
+from infra.security import token_service
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def people(seed) -> dict:
+    users = UserRepository()
+    other_team = TeamRepository().create("Outro time", Area.CIA)
+    assigned_team = TeamRepository().create("Time atribuído", Area.CIA)
+    people = {
+        "requester": users.create(101, "Solicitante", "s@teste.com", "x", other_team, UserRole.USER, UserTipo.SOLICITANTE),
+        "stranger": users.create(102, "Estranho", "e@teste.com", "x", other_team, UserRole.USER, UserTipo.SOLICITANTE),
+        "attendant": seed["users"][1],
+        "team_member": users.create(103, "Membro", "m@teste.com", "x", assigned_team, UserRole.N2, UserTipo.ATENDENTE),
+        "outsider": users.create(104, "Atendente", "a@teste.com", "x", other_team, UserRole.N1, UserTipo.ATENDENTE),
+        "admin": users.create(105, "Admin", "adm@teste.com", "x", other_team, UserRole.ADMINISTRADOR, UserTipo.ADMINISTRADOR),
+    }
+    ticket = TicketRepository().create("T", TicketClasse.RELATORIO, TicketTipo.BUG, people["requester"], "d",
+                                       seed["form"], TicketStatus.ABERTO)
+    with DBConnectionHandler() as db:
+        db.session.add(TicketAttendant(ticket_id=ticket, user_id=people["attendant"]))
+        db.session.add(TicketTeam(ticket_id=ticket, team_id=assigned_team))
+    chat = ChatRepository().create(ticket)
+    people["ticket"] = ticket
+    people["public"] = MessageRepository().create(chat, people["attendant"], "pública")
+    people["internal"] = MessageRepository().create(chat, people["attendant"], "interna", message_is_internal=True)
+    return people
+
+
+def _as(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {token_service.issue(user_id)}"}
+
+
+def _upload(path: str, user_id: int) -> dict:
+    response = client.post(path, files={"file": ("a.txt", b"conteudo", "text/plain")}, headers=_as(user_id))
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+@pytest.mark.parametrize("who, expected", [
+    ("requester", 200), ("attendant", 200), ("team_member", 200), ("admin", 200),
+    ("stranger", 403), ("outsider", 403),
+])
+def test_ticket_attachment_requires_participation(people, who, expected):
+    sha256 = _upload(f"/tickets/{people['ticket']}/attachments", people["admin"])["sha256"]
+    response = client.get(f"/tickets/{people['ticket']}/attachments/{sha256}", headers=_as(people[who]))
+    assert response.status_code == expected
+    upload = client.post(f"/tickets/{people['ticket']}/attachments",
+                         files={"file": ("b.txt", b"x", "text/plain")}, headers=_as(people[who]))
+    assert upload.status_code == (201 if expected == 200 else expected)
+
+
+@pytest.mark.parametrize("who, public, internal", [
+    ("requester", 200, 404), ("attendant", 200, 200), ("team_member", 200, 200), ("admin", 200, 200),
+    ("stranger", 403, 403),
+])
+def test_internal_message_attachments_hidden_from_requesters(people, who, public, internal):
+    for kind, expected in (("public", public), ("internal", internal)):
+        path = f"/messages/{people[kind]}/attachments"
+        sha256 = _upload(path, people["attendant"])["sha256"]
+        assert client.get(f"{path}/{sha256}", headers=_as(people[who])).status_code == expected
+
+
+def test_oversized_upload_rejected_before_reading_body(people, monkeypatch):
+    def never(*args, **kwargs):
+        raise AssertionError("a rota não deveria ter rodado")
+
+    monkeypatch.setattr(TicketRepository, "exists", never)
+    response = client.post(
+        f"/tickets/{people['ticket']}/attachments",
+        content=b"x",
+        headers={**_as(people["admin"]), "Content-Length": str(settings.ATTACHMENT_MAX_SIZE * 2),
+                 "Content-Type": "multipart/form-data; boundary=b"}
+    )
+    assert response.status_code == 413
+    assert "excede" in response.json()["detail"]
@@ -0,0 +1,62 @@
+"""Escritas em lote: created_by/updated_by (dicts do chamador intactos, upsert sem usuário) e alvo do ON CONFLICT."""
+import copy
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+from infra.configs.audit import acting_as
+from infra.configs.connection import DBConnectionHandler
+from infra.entities import Team
+from infra.entities.team import Area
+from infra.repositories import TeamRepository
+
+
+def test_upsert_many_stamps_without_mutating_rows(seed):
+    author = seed["users"][1]
+    rows = [{"team_name": "Novo", "team_area": Area.CIA}, {"team_name": "Time", "team_area": Area.PROJETOS}]
+    sent = copy.deepcopy(rows)
+
+    with acting_as(author):
+        counts = TeamRepository().upsert_many(rows, ("team_name",), update_columns=["team_area"])
+    assert counts["inserted"] == 1 and counts["updated"] == 1
+    assert rows == sent
+
+    with DBConnectionHandler() as db:
+        stamped = db.session.execute(
+            select(Team.team_name, Team.created_by, Team.updated_by).order_by(Team.team_name)
+        ).all()
+    assert [tuple(row) for row in stamped] == [("Novo", author, author), ("Time", None, author)]
+
+
+def test_upsert_many_without_context_user_keeps_updated_by(seed):
+    author = seed["users"][1]
+    repository = TeamRepository()
+    with acting_as(author):
+        repository.upsert_many([{"team_name": "Time", "team_area": Area.CIA}], ("team_name",),
+                               update_columns=["team_area"])
+
+    counts = repository.upsert_many([{"team_name": "Time", "team_area": Area.PROJETOS}], ("team_name",),
+                                    update_columns=["team_area"])
+    assert counts["updated"] == 1
+
+    with DBConnectionHandler() as db:
+        row = db.session.execute(select(Team.team_area, Team.updated_by).where(Team.team_name == "Time")).one()
+    assert tuple(row) == (Area.PROJETOS, author)
+
+
+def test_conflict_target_uses_the_session_dialect_where():
+    """ON CONFLICT do índice parcial com o WHERE declarado para o dialeto em uso."""
+    repository = TeamRepository()
+    for dialect in ("sqlite", "postgresql"):
+        elements, where = repository._conflict_target(("team_name",), dialect)
+        index = next(index for index in Team.__table__.indexes if index.name == "ux_teams_name")
+        assert elements == ["team_name"] and where is index.dialect_options[dialect]["where"]
+
+    _elements, where = repository._conflict_target(("team_name",), "postgresql")
+    statement = postgresql_insert(Team).values(team_name="Time", team_area=Area.CIA).on_conflict_do_update(
+        index_elements=["team_name"], index_where=where, set_={"team_area": Area.CIA}
+    )
+    assert "ON CONFLICT (team_name) WHERE active = 'ATIVO' DO UPDATE" in str(
+        statement.compile(dialect=postgresql.dialect())
+    )
@@ -0,0 +1,58 @@
+"""Leituras de usuário: autenticação no primário, buscas do repository na réplica."""
+import asyncio
+
+import pytest
+
+from infra.configs.replicas import SQLiteReplicator, replica_router
+from infra.configs.settings import settings
+from infra.entities.user import UserRole, UserTipo
+from infra.repositories import UserRepository
+from infra.security import AuthService
+
+
+class _AcceptingHasher:
+    """verify sempre válido (o bcrypt não é o assunto aqui)."""
+
+    async def verify(self, password, hashed, user_key=None):
+        return True, None
+
+
+@pytest.fixture
+def stale_replica(seed, monkeypatch, tmp_path):
+    """Réplica parada no estado do seed; toda leitura read_only vai para ela."""
+    url = f"sqlite:///{tmp_path / 'replica.db'}"
+    SQLiteReplicator(settings.DATABASE_URL, [url]).sync()
+    monkeypatch.setattr(replica_router, "read_url", lambda: url)
+    return seed
+
+
+def test_deactivated_user_is_not_cached_from_stale_replica(stale_replica):
+    users = UserRepository()
+    user_id = stale_replica["users"][1]
+    users.soft_delete(user_id)
+
+    assert users.select_by_id(user_id) is not None   # a réplica ainda o vê ativo
+    assert users.select_cached(user_id) is None
+    assert users.select_cached(user_id) is None
+
+
+def test_login_returns_user_missing_from_replica(stale_replica):
+    user_id = UserRepository().create(50, "Novo", "novo@teste.com", "hash", stale_replica["team"],
+                                      UserRole.N1, UserTipo.ATENDENTE)
+    assert UserRepository().select_by_id(user_id) is None   # ainda não replicado
+
+    user = asyncio.run(AuthService(hasher=_AcceptingHasher()).authenticate("novo@teste.com", "senha"))
+    assert user["id"] == user_id
+    assert "user_password" not in user
+
+
+def test_user_lookups_are_routed_to_the_replica(stale_replica):
+    users = UserRepository()
+    user_id = users.create(51, "Só no primário", "primario@teste.com", "hash", stale_replica["team"],
+                           UserRole.N1, UserTipo.ATENDENTE)
+
+    assert users.select_by_email("primario@teste.com") is None
+    assert users.select_by_corporative_id(51) is None
+    assert users.select_by_email("u2@teste.com")["id"] == stale_replica["users"][1]
+    assert users.select_by_corporative_id(2)["id"] == stale_replica["users"][1]
+    assert users.select_for_auth(user_id)["user_email"] == "primario@teste.com"
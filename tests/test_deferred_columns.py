@@ -0,0 +1,48 @@
+"""Colunas adiadas: listagens não leem nem devolvem o texto grande, o detalhe sim."""
+import pytest
+from sqlalchemy import event
+
+from infra.repositories import MessageRepository, TicketRepository
+
+
+@pytest.fixture
+def statements(database):
+    """SELECTs que chegam ao driver durante o teste."""
+    captured: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append(statement)
+
+    event.listen(database, "before_cursor_execute", capture)
+    yield captured
+    event.remove(database, "before_cursor_execute", capture)
+
+
+def test_list_queries_leave_message_content_unloaded(seed, statements):
+    repository = MessageRepository()
+    message_id = repository.create(seed["chat"], seed["users"][1], "conteúdo grande " * 100)
+    statements.clear()
+
+    listed = [repository.select_all(), repository.select_by_user_id(seed["users"][1])]
+    assert all(rows and "message_content" not in rows[0] for rows in listed)
+    assert statements and not any("message_content" in sql for sql in statements)
+
+    statements.clear()
+    detail = repository.select_by_id(message_id)
+    assert detail["message_content"].startswith("conteúdo grande")
+    assert any("message_content" in sql for sql in statements)
+
+    # A conversa do chat é a exceção: a listagem carrega o grupo "content"
+    assert repository.select_by_chat_id(seed["chat"])[0]["message_content"] == detail["message_content"]
+
+
+def test_ticket_summary_and_detail(seed, statements):
+    repository = TicketRepository()
+    summary = repository.select_by_client(seed["users"][0])[0]
+    assert "ticket_description" not in summary and "ticket_resolution_notes" not in summary
+    assert not any("ticket_description" in sql for sql in statements)
+
+    assert repository.select_by_id(seed["ticket"])["ticket_description"] == "descrição"
+    assert "ticket_description" not in repository.select_by_id(seed["ticket"], groups=())
+    assert repository.select_all(groups=("detail",))[0]["ticket_description"] == "descrição"
@@ -0,0 +1,67 @@
+"""Compilação de form_fields: nomes de campo arbitrários e definições inválidas."""
+import pytest
+from pydantic import ValidationError
+
+from infra.entities.form import FormClasse, FormTipo
+from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo
+from infra.forms import compile_form
+from infra.repositories import FormRepository, TicketRepository
+
+# Nomes que colidem com o Pydantic se virarem nome de atributo
+RESERVED_NAMES = [
+    {"name": "_interno", "required": True},
+    {"name": "model_dump"},
+    {"name": "model_config", "type": "integer"},
+    {"name": "data da ocorrência", "type": "date"},
+]
+
+
+def test_reserved_names_round_trip():
+    model = compile_form(RESERVED_NAMES)
+    answers = {"_interno": " x ", "model_dump": "y", "model_config": "3", "data da ocorrência": "2026-01-02"}
+
+    assert model.model_validate(answers).model_dump(mode="json", by_alias=True) == {
+        "_interno": "x", "model_dump": "y", "model_config": 3, "data da ocorrência": "2026-01-02"
+    }
+    with pytest.raises(ValidationError):
+        model.model_validate({"_interno": "x", "desconhecido": 1})
+    with pytest.raises(ValidationError):
+        model.model_validate({"model_dump": "y"})
+
+
+@pytest.mark.parametrize("fields", [
+    [{"name": "a"}, {"name": "a"}],
+    [{"name": ""}],
+    [{"name": 10}],
+    ["texto"],
+    [{"name": "opcao", "type": "select"}],
+    [{"name": "codigo", "pattern": "("}],
+    [{"name": "x", "type": "desconhecido"}],
+])
+def test_invalid_definitions_raise_value_error(fields):
+    with pytest.raises(ValueError):
+        compile_form(fields)
+
+
+def test_repository_rejects_invalid_fields_on_save(database):
+    repository = FormRepository()
+    with pytest.raises(ValueError):
+        repository.create("F", FormClasse.RELATORIO, FormTipo.BUG, [{"name": "a"}, {"name": "a"}])
+
+    form_id = repository.create("F", FormClasse.RELATORIO, FormTipo.BUG, [{"name": "a"}])
+    with pytest.raises(ValueError):
+        repository.update_fields(form_id, [{"name": "p", "pattern": "["}])
+    form = repository.select_by_id(form_id)
+    assert form["form_version"] == 1
+    assert form["form_fields"] == [{"name": "a"}]
+
+
+def test_ticket_with_reserved_field_names(seed):
+    form_id = FormRepository().create("F", FormClasse.RELATORIO, FormTipo.BUG, {"fields": RESERVED_NAMES})
+    ticket_id = TicketRepository().create(
+        "T", TicketClasse.RELATORIO, TicketTipo.BUG, seed["users"][0], "d", form_id, TicketStatus.ABERTO,
+        ticket_form_data={"_interno": "sim", "model_config": 7}
+    )
+    assert TicketRepository().select_by_id(ticket_id)["ticket_form_data"] == {
+        "_interno": "sim", "model_dump": None, "model_config": 7, "data da ocorrência": None
+    }
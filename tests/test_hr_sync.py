@@ -0,0 +1,118 @@
+"""
+Sincronização do RH (infra/jobs/hr_sync.py) com os arquivos de tests/fixtures/hr_sync:
+
+    funcionarios.csv     10 pessoas (matrículas 101–110) em dois times
+    funcionarios.jsonl   o mesmo diretório um dia depois: 102 mudou de nome
+                         (email só muda de caixa), 110 saiu, 111 entrou num
+                         time novo, uma matrícula inválida e uma linha quebrada
+"""
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, select
+
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.database import Status
+from infra.entities import Team, User
+from infra.jobs.hr_sync import HrSyncJob
+
+FIXTURES = Path(__file__).parent / "fixtures" / "hr_sync"
+CSV, JSONL = FIXTURES / "funcionarios.csv", FIXTURES / "funcionarios.jsonl"
+
+
+@pytest.fixture
+def statements(database):
+    """Comandos que chegam ao driver, por tipo (SELECT, INSERT, UPDATE, DELETE)."""
+    captured: dict[str, int] = {}
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        kind = statement.lstrip().split(None, 1)[0].upper()
+        captured[kind] = captured.get(kind, 0) + 1
+
+    event.listen(database, "before_cursor_execute", capture)
+    yield captured
+    event.remove(database, "before_cursor_execute", capture)
+
+
+def _users() -> dict[int, tuple]:
+    """matrícula → (nome, email, ativo) dos usuários vindos do RH."""
+    with DBConnectionHandler() as db:
+        rows = db.session.execute(
+            select(User.user_corporative_id, User.user_full_name, User.user_email, User.active)
+            .where(User.user_sync_hash.is_not(None))
+        ).all()
+    return {row[0]: (row[1], row[2], row[3] == Status.ATIVO) for row in rows}
+
+
+def _partial(tmp_path: Path, *corporative_ids: int, extra: str = "") -> Path:
+    """CSV com só algumas linhas de funcionarios.csv (+ linhas extras)."""
+    header, *lines = CSV.read_text(encoding="utf-8").splitlines()
+    kept = [line for line in lines if int(line.split(",", 1)[0]) in corporative_ids]
+    path = tmp_path / "parcial.csv"
+    path.write_text("\n".join([header, *kept, *filter(None, [extra])]) + "\n", encoding="utf-8")
+    return path
+
+
+def test_insert_then_unchanged_run_writes_nothing(database, statements):
+    stats = HrSyncJob().run(CSV)
+    assert stats.changes["inserted"] == list(range(101, 111)) and not stats.errors
+    assert sorted(stats.teams_created) == ["Projetos", "Suporte"]
+    assert _users()[106] == ("Fábio Nunes", "fabio.nunes@empresa.com", True)
+
+    statements.clear()
+    again = HrSyncJob().run(CSV)
+    assert again.unchanged == 10 and not any(again.changes.values())
+    # Ler o arquivo + as duas cargas (usuários e times)
+    assert statements == {"SELECT": 2}
+
+
+def test_update_depart_and_reactivate(database):
+    HrSyncJob().run(CSV)
+
+    stats = HrSyncJob().run(JSONL)
+    assert stats.changes == {"inserted": [111], "updated": [102], "reactivated": [], "departed": [110]}
+    assert stats.teams_created == ["Dados"] and len(stats.errors) == 2
+    assert stats.errors[0].startswith("linha 11: matrícula inválida")
+    assert stats.errors[1].startswith("linha 12: JSON inválido")
+    users = _users()
+    assert users[102] == ("Bruno Lima Neto", "bruno.lima@empresa.com", True)
+    assert users[110][2] is False and users[111][2] is True
+
+    back = HrSyncJob().run(CSV)
+    assert back.changes == {"inserted": [], "updated": [102], "reactivated": [110], "departed": [111]}
+    users = _users()
+    assert users[102][0] == "Bruno Lima" and users[110][2] is True and users[111][2] is False
+
+
+def test_departure_ratio_guard_and_force(database, tmp_path):
+    HrSyncJob().run(CSV)
+    truncated = _partial(tmp_path, 101, 102, 103)
+
+    blocked = HrSyncJob(max_departure_ratio=0.5).run(truncated)
+    assert blocked.departures_blocked == 7 and blocked.changes["departed"] == []
+    assert all(active for _name, _email, active in _users().values())
+
+    forced = HrSyncJob(max_departure_ratio=0.5).run(truncated, force=True)
+    assert forced.changes["departed"] == list(range(104, 111))
+    assert sorted(id for id, (_name, _email, active) in _users().items() if active) == [101, 102, 103]
+
+
+def test_integrity_error_is_isolated_per_row(seed, tmp_path):
+    # Email de um usuário local ativo: o lote falha no índice único e cai para linha a linha
+    path = _partial(tmp_path, 101, 103, extra="112,Intruso,u1@teste.com,Suporte,eab,atendente,atendente")
+
+    stats = HrSyncJob().run(path)
+    assert stats.changes["inserted"] == [101, 103]
+    assert len(stats.errors) == 1 and stats.errors[0].startswith("matrícula 112:")
+    assert sorted(_users()) == [101, 103]
+
+
+def test_dry_run_reports_the_diff_without_writing(database, statements):
+    stats = HrSyncJob().run(CSV, dry_run=True)
+    assert stats.dry_run and stats.changes["inserted"] == list(range(101, 111))
+    assert sorted(stats.teams_created) == ["Projetos", "Suporte"]
+    assert set(statements) == {"SELECT"}
+
+    with DBConnectionHandler() as db:
+        assert db.session.scalars(select(User.id)).all() == []
+        assert db.session.scalars(select(Team.id)).all() == []
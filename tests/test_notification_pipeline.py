@@ -0,0 +1,46 @@
+"""Buffer do NotificationPipeline: teto de max_buffer com o banco indisponível."""
+import logging
+
+import pytest
+
+from infra.entities.notification import NotificationEntidade, NotificationTipo
+from infra.notifications import NotificationEvent, NotificationPipeline
+
+
+class _DatabaseDown:
+    """Repository fake que falha como um banco fora do ar."""
+
+    def select_followers(self, entity_type, entity_ids):
+        raise ConnectionError("banco fora do ar")
+
+
+def _event(entity_id: int) -> NotificationEvent:
+    return NotificationEvent(NotificationTipo.STATUS_CHANGE, NotificationEntidade.TICKET, entity_id, f"#{entity_id}")
+
+
+def _buffered_ids(pipeline: NotificationPipeline) -> list[int]:
+    return [event.entity_id for event in pipeline._buffer]
+
+
+def test_publish_discards_oldest_above_max_buffer():
+    pipeline = NotificationPipeline(max_buffer=3, repository=_DatabaseDown())
+    for entity_id in range(5):
+        pipeline.publish(_event(entity_id))
+
+    assert _buffered_ids(pipeline) == [2, 3, 4]
+    assert pipeline.dropped() == 2
+
+
+def test_failed_flushes_keep_buffer_bounded(caplog):
+    pipeline = NotificationPipeline(max_buffer=4, repository=_DatabaseDown())
+    for window in range(3):
+        for entity_id in range(window * 3, window * 3 + 3):
+            pipeline.publish(_event(entity_id))
+        with caplog.at_level(logging.WARNING), pytest.raises(ConnectionError):
+            pipeline.flush()
+        assert pipeline.pending() <= 4
+
+    # Sobram os mais recentes, na ordem de publicação
+    assert _buffered_ids(pipeline) == [5, 6, 7, 8]
+    assert pipeline.dropped() == 5
+    assert "descartado" in caplog.text
@@ -0,0 +1,88 @@
+"""OutboxWorker contra um servidor SMTP local (aiosmtpd)."""
+import asyncio
+import socket
+from datetime import datetime, timedelta
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from infra.entities.outbox import OutboxMessage, OutboxStatus
+from infra.mail import OutboxWorker, SMTPMailer
+from infra.repositories import TicketRepository
+from infra.repositories.outbox_repository import OutboxRepository
+
+REFUSED = "recusado@teste.com"
+
+
+class _Sink:
+    """Handler do aiosmtpd: guarda as mensagens e recusa um destinatário."""
+
+    def __init__(self):
+        self.delivered: list[str] = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address == REFUSED:
+            return "550 Caixa postal inexistente"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.delivered.extend(envelope.rcpt_tos)
+        return "250 Mensagem aceita"
+
+
+@pytest.fixture
+def smtp_sink():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    sink = _Sink()
+    controller = Controller(sink, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield sink, port
+    controller.stop()
+
+
+def _enqueue(recipient: str, ticket_id: int | None = None) -> int:
+    mail = OutboxMessage(outbox_recipient=recipient, outbox_subject="Atualização", outbox_body="Corpo")
+    mail.outbox_ticket_id = ticket_id
+    return OutboxRepository().insert(mail)
+
+
+def test_drain_once_delivers_and_retries_with_backoff(seed, smtp_sink):
+    sink, port = smtp_sink
+    repository = OutboxRepository()
+    worker = OutboxWorker(mailer=SMTPMailer(host="127.0.0.1", port=port, starttls=False),
+                          batch_size=2, concurrency=2, max_attempts=2, backoff_seconds=30)
+    delivered_ids = [_enqueue("a@teste.com", seed["ticket"]), _enqueue("b@teste.com")]
+    refused_id = _enqueue(REFUSED, seed["ticket"])
+
+    before = datetime.now()
+    assert asyncio.run(worker.drain_once()) == 2
+    assert sorted(sink.delivered) == ["a@teste.com", "b@teste.com"]
+
+    for outbox_id in delivered_ids:
+        mail = repository.select_by_id(outbox_id)
+        assert mail["outbox_status"] == OutboxStatus.ENVIADO.value
+        assert mail["outbox_sent_at"] is not None
+    assert TicketRepository().select_by_id(seed["ticket"])["ticket_mail_sent_at"] is not None
+
+    # Falha → volta para PENDENTE com a próxima tentativa no backoff (30s + jitter de até 20%)
+    refused = repository.select_by_id(refused_id)
+    assert refused["outbox_status"] == OutboxStatus.PENDENTE.value
+    assert refused["outbox_attempts"] == 1
+    assert "550" in refused["outbox_last_error"]
+    next_attempt_at = datetime.fromisoformat(refused["outbox_next_attempt_at"])
+    assert before + timedelta(seconds=30) <= next_attempt_at <= datetime.now() + timedelta(seconds=36)
+
+    # Antes do backoff vencer, nada é reenviado
+    assert asyncio.run(worker.drain_once()) == 0
+
+    # Vencido, a segunda tentativa esgota max_attempts → FALHOU
+    repository.update(refused_id, outbox_next_attempt_at=datetime.now() - timedelta(seconds=1))
+    assert asyncio.run(worker.drain_once()) == 0
+    refused = repository.select_by_id(refused_id)
+    assert refused["outbox_status"] == OutboxStatus.FALHOU.value
+    assert refused["outbox_attempts"] == 2
+    assert refused["outbox_next_attempt_at"] is None
+    assert sorted(sink.delivered) == ["a@teste.com", "b@teste.com"]
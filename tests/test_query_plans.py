@@ -0,0 +1,56 @@
+"""
+Planos de execução na suíte: índices parciais + active_clause() nas buscas.
+
+Base pequena do harness (tests/query_plans.py: seed() em lote + ANALYZE).
+Se um índice parcial sumir ou o predicado de soft delete deixar de casar
+com o do índice, o plano vira SCAN e o teste falha. O último teste roda
+todas as chamadas do harness (repositories, arquivo, outbox, change feed
+e exportação) e falha em qualquer full scan fora de ALLOWED_SCANS.
+"""
+import pytest
+
+from infra.authorization import visibility_index
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.query_plan import explain, full_scans, used_indexes
+from infra.entities import Ticket, User
+from infra.entities.ticket import TicketStatus
+from infra.repositories import TicketRepository, UserRepository
+from tests import query_plans
+
+TICKETS = 1000
+
+
+@pytest.fixture
+def planned(database, monkeypatch):
+    """Base do harness (os tamanhos de seed())."""
+    monkeypatch.setattr(visibility_index, "check_seconds", visibility_index.check_seconds)
+    return query_plans.prepare(TICKETS)
+
+
+LOOKUPS = [
+    (TicketRepository, lambda sizes: Ticket.ticket_client_id == sizes["users"] // 2, "ix_tickets_client_status"),
+    (TicketRepository, lambda sizes: Ticket.ticket_project_id == sizes["projects"] // 2, "ix_tickets_project"),
+    (TicketRepository, lambda sizes: Ticket.ticket_report_id == sizes["reports"] // 2, "ix_tickets_report"),
+    (TicketRepository, lambda sizes: Ticket.ticket_status == TicketStatus.ABERTO, "ix_tickets_status_priority"),
+    (UserRepository, lambda sizes: User.user_email == "u7@empresa.com", "ux_users_email"),
+    (UserRepository, lambda sizes: User.user_team_id == 2, "ix_users_team_role"),
+]
+
+
+@pytest.mark.parametrize("repository, condition, index", LOOKUPS,
+                         ids=[index for _repository, _condition, index in LOOKUPS])
+def test_base_query_lookup_uses_partial_index(planned, repository, condition, index):
+    with DBConnectionHandler() as db:
+        plan = explain(db.session, repository()._base_query(db.session).filter(condition(planned)))
+    assert full_scans(plan) == set(), plan
+    assert index in used_indexes(plan), plan
+
+
+def test_harness_has_no_unexpected_full_scans(planned):
+    results = query_plans.check(planned)
+    failures = {f"{result['repository']}.{result['method']}": sorted(result["scanned"])
+                for result in results if result["scanned"] and not result["allowed"]}
+    assert failures == {}
+    # As chamadas do arquivo realmente leram archive_* (fallback exercitado)
+    fallback = next(result for result in results if result["method"] == "select_by_ticket_id(arquivado)")
+    assert any("archive_chats" in sql for sql, _params in fallback["statements"])
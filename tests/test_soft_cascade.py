@@ -0,0 +1,66 @@
+"""Soft delete/restore em cascata: um UPDATE por tabela, cada raiz restaurada pelo próprio carimbo."""
+from datetime import datetime
+
+from sqlalchemy import event, select
+
+from infra.configs import soft_cascade
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.database import Status
+from infra.entities import Chat, Message, Ticket
+from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo
+from infra.repositories import ChatRepository, MessageRepository, TicketRepository
+from infra.repositories.base_repository import BaseRepository
+
+FIRST, SECOND, EARLIER = datetime(2026, 3, 1, 10), datetime(2026, 3, 2, 10), datetime(2026, 2, 1, 10)
+
+
+def _delete(model, ids, stamp):
+    return BaseRepository._run_write(
+        lambda session: soft_cascade.soft_delete_cascade(session, model, ids, stamp=stamp)
+    )
+
+
+def _active(model, ids) -> dict[int, bool]:
+    with DBConnectionHandler() as db:
+        rows = db.session.execute(select(model.id, model.active).where(model.id.in_(ids))).all()
+    return {row.id: row.active == Status.ATIVO for row in rows}
+
+
+def test_restore_many_roots_one_update_per_table(seed, database):
+    tickets, chats, messages = TicketRepository(), ChatRepository(), MessageRepository()
+    first, first_chat = seed["ticket"], seed["chat"]
+    second = tickets.create("Segundo", TicketClasse.RELATORIO, TicketTipo.BUG, seed["users"][1],
+                            "descrição", seed["form"], TicketStatus.ABERTO)
+    second_chat = chats.create(second)
+    untouched = tickets.create("Ativo", TicketClasse.RELATORIO, TicketTipo.BUG, seed["users"][1],
+                               "descrição", seed["form"], TicketStatus.ABERTO)
+
+    kept, old = messages.create(first_chat, seed["users"][1], "fica"), messages.create(first_chat, seed["users"][1], "antiga")
+    second_kept = messages.create(second_chat, seed["users"][2], "fica")
+    # Apagada sozinha com o carimbo da PRIMEIRA raiz: não pertence ao subgrafo da segunda
+    foreign = messages.create(second_chat, seed["users"][2], "carimbo de outra raiz")
+
+    _delete(Message, [old], EARLIER)
+    _delete(Message, [foreign], FIRST)
+    assert _delete(Ticket, [first], FIRST)["messages"] == 1
+    assert _delete(Ticket, [second], SECOND)["messages"] == 1
+
+    updates: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            updates.append(statement)
+
+    event.listen(database, "before_cursor_execute", capture)
+    try:
+        counts = tickets.restore_cascade([first, second, untouched])
+    finally:
+        event.remove(database, "before_cursor_execute", capture)
+
+    assert len(updates) == len(soft_cascade._tables(Ticket))
+    assert counts["tickets"] == 2 and counts["chats"] == 2 and counts["messages"] == 2
+    assert _active(Ticket, [first, second, untouched]) == {first: True, second: True, untouched: True}
+    assert _active(Chat, [first_chat, second_chat]) == {first_chat: True, second_chat: True}
+    assert _active(Message, [kept, old, second_kept, foreign]) == {
+        kept: True, old: False, second_kept: True, foreign: False
+    }
@@ -0,0 +1,128 @@
+"""Exportação em streaming: conversão de valores (NDJSON/CSV), filtros e a rota GET /exports/{dataset}."""
+import csv
+import io
+import json
+import sys
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from infra.configs.connection import DBConnectionHandler
+from infra.entities import Ticket
+from infra.entities.associations import TicketTeam
+from infra.entities.team import Area
+from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo
+from infra.entities.user import UserRole, UserTipo
+from infra.exports import ExportFilters, table_exporter
+from infra.repositories import ChatRepository, MessageRepository, TeamRepository, TicketRepository, UserRepository
+from infra.security import token_service
+from main import app
+
+client = TestClient(app)
+FORM_DATA = {"sistema": "ERP", "linhas": 3, "urgente": True}
+
+
+@pytest.fixture
+def exported(seed) -> dict:
+    """Três tickets em meses diferentes; o segundo e o terceiro atribuídos a um time, cada um com uma mensagem."""
+    tickets = TicketRepository()
+    team = TeamRepository().create("BI", Area.INDICADORES)
+    closed = tickets.create("Fechado", TicketClasse.RELATORIO, TicketTipo.BUG, seed["users"][1], "d",
+                            seed["form"], TicketStatus.ENCERRADO)
+    opened = tickets.create("Aberto", TicketClasse.RELATORIO, TicketTipo.BUG, seed["users"][1], "d",
+                            seed["form"], TicketStatus.ABERTO)
+    with DBConnectionHandler() as db:
+        for ticket_id, month in ((seed["ticket"], 1), (closed, 2), (opened, 3)):
+            db.session.execute(update(Ticket).where(Ticket.id == ticket_id).values(created_at=datetime(2026, month, 10)))
+        db.session.execute(update(Ticket).where(Ticket.id == closed).values(ticket_form_data=FORM_DATA))
+        db.session.add_all([TicketTeam(ticket_id=closed, team_id=team), TicketTeam(ticket_id=opened, team_id=team)])
+    messages = MessageRepository()
+    messages.create(seed["chat"], seed["users"][0], "fora do time")
+    messages.create(ChatRepository().create(closed), seed["users"][1], "do time")
+    return {"team": team, "first": seed["ticket"], "closed": closed, "opened": opened}
+
+
+def _ndjson(dataset: str, filters: ExportFilters | None = None) -> list[dict]:
+    body = b"".join(table_exporter.stream(dataset, "ndjson", filters)).decode()
+    return [json.loads(line) for line in body.splitlines()]
+
+
+def _ids(dataset: str, **filters) -> list[int]:
+    return [row["id"] for row in _ndjson(dataset, ExportFilters(**filters))]
+
+
+def test_ndjson_converts_enums_and_datetimes_and_nests_json(exported):
+    rows = {row["id"]: row for row in _ndjson("tickets")}
+    assert list(rows) == [exported["first"], exported["closed"], exported["opened"]]
+    closed = rows[exported["closed"]]
+    assert closed["ticket_status"] == "encerrado" and closed["ticket_class"] == TicketClasse.RELATORIO.value
+    assert closed["created_at"] == "2026-02-10T00:00:00"
+    assert closed["ticket_form_data"] == FORM_DATA and closed["ticket_deadline"] is None
+
+
+def test_csv_header_and_text_values(exported):
+    body = b"".join(table_exporter.stream("tickets", "csv")).decode()
+    reader = csv.DictReader(io.StringIO(body))
+    assert reader.fieldnames == [column.name for column in Ticket.__table__.columns]
+    closed = next(row for row in reader if row["id"] == str(exported["closed"]))
+    assert closed["ticket_status"] == "encerrado" and closed["created_at"] == "2026-02-10T00:00:00"
+    # JSON vira texto JSON; NULL vira campo vazio
+    assert json.loads(closed["ticket_form_data"]) == FORM_DATA and closed["ticket_deadline"] == ""
+
+
+def test_filters(exported):
+    assert _ids("tickets", start=datetime(2026, 2, 1), end=datetime(2026, 3, 10)) == [exported["closed"]]
+    assert _ids("tickets", team_id=exported["team"]) == [exported["closed"], exported["opened"]]
+    assert _ids("tickets", statuses=("ENCERRADO", "aberto")) == [exported["first"], exported["closed"], exported["opened"]]
+    assert _ids("tickets", team_id=exported["team"], statuses=("encerrado",)) == [exported["closed"]]
+    assert [row["message_content"] for row in _ndjson("messages", ExportFilters(team_id=exported["team"]))] == ["do time"]
+
+    TicketRepository().soft_delete(exported["opened"])
+    assert exported["opened"] not in _ids("tickets")
+    inactive = {row["id"]: row["active"] for row in _ndjson("tickets", ExportFilters(include_inactive=True))}
+    assert inactive[exported["opened"]] == "inativo"
+
+    with pytest.raises(ValueError, match="não tem status"):
+        table_exporter.stream("messages", "csv", ExportFilters(statuses=("aberto",)))
+    with pytest.raises(ValueError, match="Status inválido"):
+        table_exporter.stream("tickets", "csv", ExportFilters(statuses=("resolvido",)))
+
+
+@pytest.fixture
+def admin(seed) -> dict:
+    admin = UserRepository().create(900, "Admin", "admin@teste.com", "x", seed["team"],
+                                    UserRole.ADMINISTRADOR, UserTipo.ADMINISTRADOR)
+    return {"Authorization": f"Bearer {token_service.issue(admin)}"}
+
+
+def test_route_streams_csv_with_filters(exported, admin):
+    response = client.get("/exports/tickets", params={"format": "csv", "team_id": exported["team"],
+                                                      "status": "encerrado"}, headers=admin)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="tickets.csv"'
+    assert [row["id"] for row in csv.DictReader(io.StringIO(response.text))] == [str(exported["closed"])]
+
+
+@pytest.mark.parametrize("path, params", [
+    ("/exports/users", {}),
+    ("/exports/tickets", {"format": "xlsx"}),
+    ("/exports/messages", {"status": "aberto"}),
+    ("/exports/tickets", {"status": "resolvido"}),
+])
+def test_route_rejects_invalid_parameters(admin, path, params):
+    assert client.get(path, params=params, headers=admin).status_code == 400
+
+
+def test_route_requires_administrator(seed):
+    headers = {"Authorization": f"Bearer {token_service.issue(seed['users'][0])}"}
+    assert client.get("/exports/tickets", headers=headers).status_code == 403
+
+
+def test_route_parquet_without_pyarrow(admin, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+    response = client.get("/exports/tickets", params={"format": "parquet"}, headers=admin)
+    assert response.status_code == 501 and "pyarrow" in response.json()["detail"]
@@ -0,0 +1,53 @@
+"""Arquivamento de tickets: ids de linhas arquivadas nunca voltam para a tabela quente; fallback só para o que saiu."""
+from sqlalchemy import event
+
+from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo
+from infra.repositories import ArchiveRepository, ChatRepository, MessageRepository, TicketRepository
+
+
+def test_new_ticket_after_archiving_max_id(seed):
+    tickets, chats = TicketRepository(), ChatRepository()
+    MessageRepository().create(seed["chat"], seed["users"][1], "mensagem antiga")
+
+    moved = ArchiveRepository().archive_tickets([seed["ticket"]])
+    assert moved["tickets"] == 1 and moved["chats"] == 1 and moved["messages"] == 1
+
+    ticket = tickets.create("Novo", TicketClasse.RELATORIO, TicketTipo.BUG, seed["users"][2],
+                            "outra descrição", seed["form"], TicketStatus.ABERTO)
+    chat = chats.create(ticket)
+    assert ticket > seed["ticket"]
+    assert chat > seed["chat"]
+
+    assert tickets.select_by_id(seed["ticket"])["ticket_title"] == "Ticket"
+    assert tickets.select_by_id(ticket)["ticket_title"] == "Novo"
+    assert chats.select_by_ticket_id(seed["ticket"])["id"] == seed["chat"]
+    assert chats.select_by_ticket_id(ticket)["id"] == chat
+
+    assert ArchiveRepository().archive_tickets([ticket])["tickets"] == 1
+    assert tickets.select_by_id(ticket)["ticket_title"] == "Novo"
+
+
+def test_message_lists_read_archive_only_for_archived_chats(seed, database):
+    messages = MessageRepository()
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # Chat novo, sem mensagens (e um só com internas na lista pública): nada de archive_*
+    event.listen(database, "before_cursor_execute", capture)
+    try:
+        assert messages.select_by_chat_id(seed["chat"]) == []
+        assert messages.select_public_by_chat_id(seed["chat"]) == []
+        messages.create(seed["chat"], seed["users"][1], "só a equipe vê", message_is_internal=True)
+        statements.clear()
+        assert messages.select_public_by_chat_id(seed["chat"]) == []
+    finally:
+        event.remove(database, "before_cursor_execute", capture)
+    assert len(statements) == 2
+    assert not any("archive_" in sql for sql in statements)
+
+    messages.create(seed["chat"], seed["users"][2], "pública")
+    ArchiveRepository().archive_tickets([seed["ticket"]])
+    assert sorted(m["message_content"] for m in messages.select_by_chat_id(seed["chat"])) == ["pública", "só a equipe vê"]
+    assert [m["message_content"] for m in messages.select_public_by_chat_id(seed["chat"])] == ["pública"]
@@ -0,0 +1,33 @@
+"""Concorrência otimista: escritas de sistema não invalidam a versão lida pelo atendente."""
+import pytest
+
+from infra.configs.versioning import VersionConflictError
+from infra.entities.ticket import TicketStatus
+from infra.repositories import TicketRepository
+from infra.repositories.outbox_repository import OutboxRepository
+
+
+def test_system_writes_keep_version(seed):
+    tickets = TicketRepository()
+    read = tickets.select_by_id(seed["ticket"])
+
+    OutboxRepository().mark_sent([], {seed["ticket"]})
+    tickets.add_attachment(seed["ticket"], {"sha256": "abc", "name": "a.pdf"})
+    after = tickets.select_by_id(seed["ticket"])
+    assert after["ticket_mail_sent_at"] is not None
+    assert after["ticket_attachments"] == [{"sha256": "abc", "name": "a.pdf"}]
+    assert after["version"] == read["version"]
+
+    assert tickets.update_status(seed["ticket"], TicketStatus.PAUSADO, seed["users"][1],
+                                 expected_version=read["version"])
+    assert tickets.select_by_id(seed["ticket"])["version"] == read["version"] + 1
+
+
+def test_user_writes_still_bump_version(seed):
+    tickets = TicketRepository()
+    read = tickets.select_by_id(seed["ticket"])
+
+    tickets.close(seed["ticket"], seed["users"][1])
+    with pytest.raises(VersionConflictError):
+        tickets.update_status(seed["ticket"], TicketStatus.PAUSADO, seed["users"][1],
+                              expected_version=read["version"])
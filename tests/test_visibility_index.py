@@ -0,0 +1,180 @@
+"""
+Índice de visibilidade contra a avaliação ingênua das regras.
+
+Base aleatória (semente fixa), mutações pelo ORM (eventos de sessão deste
+processo) e por uma conexão Core sem Session — o que o índice vê de uma
+escrita feita por outro processo (hr_sync, purge, outro worker).
+"""
+import random
+from datetime import date
+
+import pytest
+from sqlalchemy import delete, insert, select, update
+
+from infra.authorization import PROJECT, REPORT, visibility_index
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.database import Status
+from infra.entities import Project, Report, Team, User
+from infra.entities.associations import (
+    ProjectAllowedUser, ProjectAnalyst, ProjectClient, ProjectOwner, ProjectSponsor, ReportAllowedUser
+)
+from infra.entities.project import ProjectStatus, ProjectTags
+from infra.entities.report import ReportFrequency, ReportStatus, ReportTags
+from infra.entities.team import Area
+from infra.entities.user import UserRole, UserTipo
+from infra.repositories import ProjectRepository
+
+TEAMS, USERS, ITEMS, LINKS = 4, 30, 40, 120
+PROJECT_LINKS = (ProjectAnalyst, ProjectSponsor, ProjectOwner, ProjectClient, ProjectAllowedUser)
+KIND_MODELS = {
+    REPORT: (Report, "report_public", "report_team_responsible_id", "report_owner_id", (ReportAllowedUser,), "report_id"),
+    PROJECT: (Project, "project_public", "project_team_responsible_id", "project_manager_id", PROJECT_LINKS,
+              "project_id"),
+}
+
+
+@pytest.fixture
+def checked_every_read(database, monkeypatch):
+    """Confere o banco em toda leitura (sem o intervalo de VISIBILITY_CHECK_SECONDS); retorna o engine."""
+    monkeypatch.setattr(visibility_index, "check_seconds", 0)
+    return database
+
+
+def _active(rng) -> Status:
+    return Status.ATIVO if rng.random() < 0.8 else Status.INATIVO
+
+
+def _seed(rng) -> None:
+    with DBConnectionHandler() as db:
+        session = db.session
+        session.execute(insert(Team), [{"team_name": f"Time {i}", "team_area": Area.EAB} for i in range(TEAMS)])
+        session.execute(insert(User), [{
+            "user_corporative_id": i, "user_full_name": f"Usuário {i}", "user_email": f"u{i}@teste.com",
+            "user_password": "x", "user_team_id": rng.randint(1, TEAMS),
+            "user_role": UserRole.ADMINISTRADOR if i % 10 == 0 else UserRole.N1,
+            "user_tipo": UserTipo.ATENDENTE, "active": _active(rng)
+        } for i in range(1, USERS + 1)])
+        session.execute(insert(Report), [{
+            "report_name": f"Relatório {i}", "report_link": f"https://bi/{i}", "report_description": "d",
+            "report_frequency": list(ReportFrequency)[0],
+            "report_tags": list(ReportTags)[0], "report_team_responsible_id": rng.randint(1, TEAMS),
+            "report_owner_id": rng.randint(1, USERS), "report_status": list(ReportStatus)[0],
+            "report_public": rng.random() < 0.1, "active": _active(rng)
+        } for i in range(ITEMS)])
+        session.execute(insert(Project), [{
+            "project_name": f"Projeto {i}", "project_directory": f"/p/{i}", "project_description": "d",
+            "project_tags": list(ProjectTags)[0], "project_team_responsible_id": rng.randint(1, TEAMS),
+            "project_manager_id": rng.randint(1, USERS), "project_status": list(ProjectStatus)[0],
+            "project_start_date": date(2026, 1, 1), "project_expected_end_date": date(2026, 12, 31),
+            "project_planned_budget": 1.0, "project_public": rng.random() < 0.1, "active": _active(rng)
+        } for i in range(ITEMS)])
+        for kind, (_model, _public, _team, _owner, links, item_column) in KIND_MODELS.items():
+            for link in links:
+                pairs = {(rng.randint(1, USERS), rng.randint(1, ITEMS)) for _ in range(LINKS // len(links))}
+                session.execute(insert(link), [
+                    {"user_id": user_id, item_column: item_id, "active": _active(rng)} for user_id, item_id in pairs
+                ])
+
+
+def _naive(kind: str) -> dict[int, list[int]]:
+    """IDs visíveis por usuário, avaliando as regras direto nas linhas do banco."""
+    model, public, team, owner, links, item_column = KIND_MODELS[kind]
+    with DBConnectionHandler() as db:
+        session = db.session
+        users = session.execute(select(User.id, User.user_team_id, User.user_role, User.active)).all()
+        items = session.execute(select(
+            model.id, model.active, getattr(model, public), getattr(model, team), getattr(model, owner)
+        )).all()
+        linked = {
+            (user_id, item_id)
+            for link in links
+            for user_id, item_id in session.execute(
+                select(link.user_id, getattr(link, item_column)).where(link.active == Status.ATIVO)
+            )
+        }
+    visible = {}
+    for user_id, user_team, role, user_active in users:
+        visible[user_id] = [] if user_active != Status.ATIVO else sorted(
+            item_id for item_id, active, is_public, item_team, item_owner in items
+            if active == Status.ATIVO and (
+                role == UserRole.ADMINISTRADOR or is_public or item_team == user_team
+                or item_owner == user_id or (user_id, item_id) in linked
+            )
+        )
+    return visible
+
+
+def _assert_matches() -> None:
+    for kind in (REPORT, PROJECT):
+        for user_id, expected in _naive(kind).items():
+            assert visibility_index.visible_ids(kind, user_id) == expected, (kind, user_id)
+
+
+def _mutate_orm(rng) -> None:
+    """Edições por objetos ORM (flush → after_commit aplica no índice)."""
+    with DBConnectionHandler() as db:
+        session = db.session
+        for kind, (model, public, team, _owner, links, item_column) in KIND_MODELS.items():
+            for item in session.scalars(select(model).where(model.id.in_(rng.sample(range(1, ITEMS + 1), 5)))):
+                setattr(item, public, not getattr(item, public))
+                setattr(item, team, rng.randint(1, TEAMS))
+            link = rng.choice(links)
+            for row in session.scalars(select(link).limit(3).offset(rng.randint(0, 5))):
+                row.active = Status.INATIVO if row.active == Status.ATIVO else Status.ATIVO
+            session.add(link(**{"user_id": rng.randint(1, USERS), item_column: rng.randint(1, ITEMS)}))
+        for user in session.scalars(select(User).where(User.id.in_(rng.sample(range(1, USERS + 1), 3)))):
+            user.user_team_id = rng.randint(1, TEAMS)
+
+
+def _mutate_external(engine, rng) -> None:
+    """Escritas Core sem Session (nenhum evento do índice dispara)."""
+    with engine.begin() as connection:
+        for kind, (model, public, _team, _owner, links, item_column) in KIND_MODELS.items():
+            table = rng.choice(links).__table__
+            ids = connection.scalars(select(table.c.id).where(table.c.active == Status.ATIVO)).all()
+            connection.execute(update(table).where(table.c.id.in_(rng.sample(ids, min(3, len(ids)))))
+                               .values(active=Status.INATIVO))
+            ids = connection.scalars(select(table.c.id)).all()
+            connection.execute(delete(table).where(table.c.id.in_(rng.sample(ids, min(2, len(ids))))))
+            connection.execute(update(model.__table__).where(model.__table__.c.id == rng.randint(1, ITEMS))
+                               .values({public: True}))
+        users = User.__table__
+        for user_id in rng.sample(range(1, USERS + 1), 3):
+            connection.execute(update(users).where(users.c.id == user_id).values(
+                user_team_id=rng.randint(1, TEAMS),
+                active=Status.INATIVO if rng.random() < 0.5 else Status.ATIVO
+            ))
+
+
+@pytest.mark.parametrize("seed_value", [1, 2, 3])
+def test_index_matches_naive_rules(checked_every_read, seed_value):
+    rng = random.Random(seed_value)
+    _seed(rng)
+    _assert_matches()
+    for _ in range(3):
+        _mutate_orm(rng)
+        _assert_matches()
+        _mutate_external(checked_every_read, rng)
+        _assert_matches()
+
+
+def test_removal_by_another_process_hides_project(checked_every_read, seed):
+    user_id = seed["users"][1]
+    other_team = Team(team_name="Outro", team_area=Area.EAB)
+    with DBConnectionHandler() as db:
+        db.session.add(other_team)
+        db.session.flush()
+        db.session.execute(insert(Project), [{
+            "project_name": "Restrito", "project_directory": "/r", "project_description": "d",
+            "project_tags": list(ProjectTags)[0], "project_team_responsible_id": other_team.id,
+            "project_manager_id": seed["users"][0], "project_status": list(ProjectStatus)[0],
+            "project_start_date": date(2026, 1, 1), "project_expected_end_date": date(2026, 12, 31),
+            "project_planned_budget": 1.0, "project_public": False
+        }])
+        project_id = db.session.scalar(select(Project.id).where(Project.project_name == "Restrito"))
+        db.session.add(ProjectAllowedUser(project_id=project_id, user_id=user_id))
+    assert [project["id"] for project in ProjectRepository().select_visible(user_id)] == [project_id]
+
+    with checked_every_read.begin() as connection:
+        connection.execute(delete(ProjectAllowedUser.__table__))
+    assert ProjectRepository().select_visible(user_id) == []
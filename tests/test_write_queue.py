@@ -0,0 +1,89 @@
+"""Modo DB_WRITE_MODE=queue: group commit, SAVEPOINT por operação, chamadas aninhadas e contexto."""
+import threading
+
+import pytest
+from sqlalchemy import insert, select
+
+from infra.configs.audit import acting_as, current_user_id
+from infra.configs.connection import DBConnectionHandler
+from infra.configs.settings import settings
+from infra.configs.write_queue import WriteQueue, write_queue
+from infra.entities import Team
+from infra.entities.team import Area
+from infra.repositories import TeamRepository
+from infra.repositories.base_repository import BaseRepository
+
+
+@pytest.fixture
+def queue_mode(database, monkeypatch):
+    monkeypatch.setattr(settings, "DB_WRITE_MODE", "queue")
+    yield write_queue
+    write_queue.stop()
+
+
+def _team_names() -> list[str]:
+    with DBConnectionHandler() as db:
+        return db.session.scalars(select(Team.team_name).order_by(Team.team_name)).all()
+
+
+def test_failed_operation_rolls_back_only_its_savepoint(database):
+    writer = WriteQueue(batch_size=10)
+    busy, release = threading.Event(), threading.Event()
+
+    def hold(session):
+        busy.set()
+        release.wait(5)
+
+    def create(name, fail=False):
+        def write(session):
+            session.execute(insert(Team), [{"team_name": name, "team_area": Area.EAB}])
+            if fail:
+                raise ValueError("falhou depois de inserir")
+            return name
+        return write
+
+    try:
+        writer.submit(hold)
+        assert busy.wait(5)
+        # Enfileiradas enquanto o escritor está ocupado: vão juntas no próximo lote
+        futures = [writer.submit(create("A")), writer.submit(create("B", fail=True)), writer.submit(create("C"))]
+        release.set()
+        assert futures[0].result(5) == "A" and futures[2].result(5) == "C"
+        with pytest.raises(ValueError):
+            futures[1].result(5)
+    finally:
+        writer.stop()
+
+    assert writer.batches == 2 and writer.operations == 4
+    assert _team_names() == ["A", "C"]
+
+
+def test_nested_run_write_runs_inline_in_writer(queue_mode):
+    seen = {}
+
+    def inner(session):
+        seen["inner"] = (threading.current_thread().name, session)
+        session.execute(insert(Team), [{"team_name": "Interno", "team_area": Area.EAB}])
+        return "interno"
+
+    def outer(session):
+        seen["outer"] = (threading.current_thread().name, session)
+        return BaseRepository._run_write(inner)
+
+    assert BaseRepository._run_write(outer) == "interno"
+    assert seen["outer"][0] == "db-writer"
+    assert seen["inner"] == seen["outer"]
+    assert _team_names() == ["Interno"]
+
+
+def test_audit_context_reaches_writer_thread(queue_mode, seed):
+    author = seed["users"][2]
+    with acting_as(author):
+        team_id = TeamRepository().create("Auditado", Area.CIA)
+        assert BaseRepository._run_write(lambda session: current_user_id()) == author
+    assert BaseRepository._run_write(lambda session: current_user_id()) is None
+
+    with DBConnectionHandler() as db:
+        stamped = db.session.execute(select(Team.created_by, Team.updated_by).where(Team.id == team_id)).one()
+    assert tuple(stamped) == (author, author)
+    assert queue_mode.operations >= 3
@@ -0,0 +1,113 @@
+"""
+Benchmark de escritas concorrentes: DB_WRITE_MODE direct x queue.
+
+Cada modo roda num subprocesso com um banco novo (settings é lido uma vez
+por processo). `--writers` threads criam ticket + chat + mensagem pelos
+repositories; no modo queue tudo passa pelo escritor único com group
+commit. Conta as escritas que falharam com "database is locked".
+
+Uso:
+    python -m tests.write_queue_bench
+    python -m tests.write_queue_bench --writers 32 --per-writer 50 --busy-timeout 100
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+MODES = ("direct", "queue")
+
+parser = argparse.ArgumentParser(description="Escritas concorrentes por modo de escrita")
+parser.add_argument("--writers", type=int, default=16, help="threads de escrita")
+parser.add_argument("--per-writer", type=int, default=50, help="tickets (+ chat + mensagem) por thread")
+parser.add_argument("--busy-timeout", type=int, default=5000, help="SQLITE_BUSY_TIMEOUT_MS")
+parser.add_argument("--batch-size", type=int, default=100, help="DB_WRITE_BATCH_SIZE (modo queue)")
+parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+parser.add_argument("--run", choices=MODES, help=argparse.SUPPRESS)   # subprocesso
+args = parser.parse_args()
+
+
+def run_mode() -> dict:
+    """Executa no subprocesso (banco e modo já no ambiente)."""
+    import infra.entities  # noqa: F401
+    from infra.configs.connection import get_engine
+    from infra.configs.database import Base
+    from infra.configs.write_queue import write_queue
+    from infra.entities.form import FormClasse, FormTipo
+    from infra.entities.team import Area
+    from infra.entities.ticket import TicketClasse, TicketStatus, TicketTipo
+    from infra.entities.user import UserRole, UserTipo
+    from infra.repositories import (
+        ChatRepository, FormRepository, MessageRepository, TeamRepository, TicketRepository, UserRepository
+    )
+
+    Base.metadata.create_all(get_engine()[0])
+    team = TeamRepository().create("Bench", Area.EAB)
+    users = [UserRepository().create(i, f"Usuário {i}", f"u{i}@bench.com", "x", team, UserRole.N1, UserTipo.ATENDENTE)
+             for i in range(1, 6)]
+    form = FormRepository().create("Bench", FormClasse.RELATORIO, FormTipo.BUG, [])
+    tickets, chats, messages = TicketRepository(), ChatRepository(), MessageRepository()
+    batches_before = write_queue.batches
+
+    errors: list[str] = []
+    written = [0] * args.writers
+    latencies: list[float] = []
+
+    def writer(index: int):
+        for n in range(args.per_writer):
+            start = time.perf_counter()
+            try:
+                ticket = tickets.create(f"T{index}-{n}", TicketClasse.RELATORIO, TicketTipo.BUG,
+                                        users[index % 5], "d" * 500, form, TicketStatus.ABERTO)
+                messages.create(chats.create(ticket), users[(index + 1) % 5], "m" * 300)
+                written[index] += 1
+                latencies.append(time.perf_counter() - start)
+            except Exception as error:
+                errors.append("database is locked" if "database is locked" in str(error) else type(error).__name__)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    write_queue.stop()
+    latencies.sort()
+    return {
+        "written": sum(written), "elapsed": elapsed, "errors": len(errors), "error_types": sorted(set(errors)),
+        "locked": errors.count("database is locked"), "batches": write_queue.batches - batches_before,
+        "p95": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+    }
+
+
+def main() -> None:
+    print(f"{args.writers} escritores x {args.per_writer} (ticket + chat + mensagem), "
+          f"busy_timeout {args.busy_timeout} ms")
+    print(f"{'modo':>7} {'escritas/s':>11} {'p95':>9} {'commits':>8} {'locked':>7} {'erros':>6}")
+    for mode in args.modes:
+        with tempfile.TemporaryDirectory(prefix="write_queue_bench_") as directory:
+            env = {**os.environ,
+                   "DATABASE_URL": f"sqlite:///{os.path.join(directory, 'bench.db')}",
+                   "DATABASE_REPLICA_URLS": "[]", "DB_WRITE_MODE": mode,
+                   "DB_WRITE_BATCH_SIZE": str(args.batch_size),
+                   "SQLITE_BUSY_TIMEOUT_MS": str(args.busy_timeout)}
+            command = [sys.executable, "-m", "tests.write_queue_bench", "--run", mode,
+                       "--writers", str(args.writers), "--per-writer", str(args.per_writer)]
+            output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        commits = result["batches"] if mode == "queue" else "-"
+        print(f"{mode:>7} {result['written'] / result['elapsed']:>11.0f} {result['p95']:>7.0f}ms {commits:>8} "
+              f"{result['locked']:>7} {result['errors']:>6}"
+              + (f"  {', '.join(result['error_types'])}" if result["errors"] else ""))
+
+
+if __name__ == "__main__":
+    if args.run:
+        print(json.dumps(run_mode()))
+    else:
+        main()